@@ -0,0 +1,136 @@
+"""
+Language detection benchmark.
+Compares the accuracy, coverage and latency of the local language detector with the provider's LLM detection.
+
+Usage (from the backend directory):
+    python -m benchmarks.language_detection          # local detector only
+    python -m benchmarks.language_detection --llm    # also call the configured provider
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+from llm_translate.core.language_detection import LocalLanguageDetector
+from llm_translate.core.service_selector import get_translation_service
+
+
+# Labelled samples: everyday sentences plus a few short inputs that should fall back to the LLM
+SAMPLES: List[Tuple[str, str]] = [
+    ("English", "Could you send me the report before the meeting tomorrow morning?"),
+    ("English", "I think we should go home now."),
+    ("Spanish", "¿Dónde está la estación de tren más cercana?"),
+    ("Spanish", "Me gustaría reservar una mesa para dos personas esta noche."),
+    ("French", "Je voudrais réserver une chambre pour deux nuits, s'il vous plaît."),
+    ("French", "Nous avons besoin de plus de temps pour terminer le travail."),
+    ("German", "Können Sie mir bitte sagen, wie spät es ist?"),
+    ("German", "Wir haben gestern den ganzen Tag im Garten gearbeitet."),
+    ("Italian", "Vorrei un caffè e un cornetto, per favore."),
+    ("Italian", "Domani andiamo al mare con gli amici."),
+    ("Portuguese", "Não sei se vou conseguir chegar a tempo para o jantar."),
+    ("Portuguese", "Você pode me ajudar com esta tarefa?"),
+    ("Dutch", "Ik weet niet of ik morgen naar het feest kan komen."),
+    ("Dutch", "Het is vandaag erg koud buiten."),
+    ("Swedish", "Jag vet inte om jag hinner komma till festen i kväll."),
+    ("Swedish", "Det är väldigt kallt ute i dag."),
+    ("Polish", "Nie wiem, czy zdążę przyjść na przyjęcie dziś wieczorem."),
+    ("Polish", "Dzisiaj jest bardzo zimno na dworze."),
+    ("Turkish", "Bu akşam partiye gelip gelemeyeceğimi bilmiyorum."),
+    ("Turkish", "Bugün dışarısı çok soğuk."),
+    ("Vietnamese", "Tôi không biết tối nay tôi có thể đến bữa tiệc không."),
+    ("Vietnamese", "Hôm nay trời rất lạnh."),
+    ("Indonesian", "Saya tidak tahu apakah saya bisa datang ke pesta malam ini."),
+    ("Indonesian", "Hari ini di luar sangat dingin."),
+    ("Russian", "Я не знаю, смогу ли я прийти на вечеринку сегодня."),
+    ("Greek", "Δεν ξέρω αν μπορώ να έρθω στο πάρτι απόψε."),
+    ("Hebrew", "אני לא יודע אם אוכל להגיע למסיבה הערב."),
+    ("Arabic", "لا أعرف إذا كنت أستطيع الحضور إلى الحفلة الليلة."),
+    ("Hindi", "मुझे नहीं पता कि मैं आज रात पार्टी में आ पाऊँगा या नहीं।"),
+    ("Thai", "ฉันไม่รู้ว่าคืนนี้จะไปงานปาร์ตี้ได้หรือเปล่า"),
+    ("Korean", "오늘 밤 파티에 갈 수 있을지 모르겠어요."),
+    ("Japanese", "今夜のパーティーに行けるかどうか分かりません。"),
+    ("Chinese", "我不知道今晚能不能去参加聚会。"),
+    ("English", "Hello"),
+    ("Spanish", "Hola"),
+    ("Japanese", "東京"),
+]
+
+
+def benchmark_local(min_confidence: float, repeat: int) -> Dict[str, float]:
+    """
+    Run the local detector over the samples.
+
+    Args:
+        min_confidence (float): Lowest confidence counted as an answer; below it the LLM would be asked.
+        repeat (int): Timed runs per sample.
+
+    Returns:
+        Dict[str, float]: Accuracy of confident answers, coverage and latency percentiles in microseconds.
+    """
+    detector = LocalLanguageDetector()
+    answered = correct = 0
+    latencies: List[float] = []
+    for expected, text in SAMPLES:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            detected, confidence = detector.detect(text)
+            latencies.append((time.perf_counter() - start) * 1e6)
+        confident = detected is not None and confidence >= min_confidence
+        answered += confident
+        correct += confident and detected == expected
+        marker = "ok " if detected == expected else "ERR"
+        print(f"  {marker} {expected:<11} -> {str(detected):<11} {confidence:.2f}{'' if confident else '  (LLM fallback)'}")
+    latencies.sort()
+    return {
+        "accuracy": correct / answered if answered else 0.0,
+        "coverage": answered / len(SAMPLES),
+        "p50_us": statistics.median(latencies),
+        "p99_us": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+async def benchmark_llm() -> Optional[Dict[str, float]]:
+    """
+    Run the configured provider's LLM detection over the samples.
+
+    Returns:
+        Optional[Dict[str, float]]: Accuracy and latency percentiles in milliseconds.
+    """
+    translator = get_translation_service()
+    correct = 0
+    latencies: List[float] = []
+    for expected, text in SAMPLES:
+        start = time.perf_counter()
+        detected = await translator._detect_language(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+        correct += detected.strip().lower() == expected.lower()
+    latencies.sort()
+    return {
+        "accuracy": correct / len(SAMPLES),
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[-1],
+    }
+
+
+def main() -> None:
+    """Parse arguments and print the benchmark results."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--llm", action="store_true", help="also benchmark the configured provider's LLM detection")
+    parser.add_argument("--min-confidence", type=float, default=0.2, help="local confidence threshold")
+    parser.add_argument("--repeat", type=int, default=200, help="timed local runs per sample")
+    args = parser.parse_args()
+
+    print(f"Local detector ({len(SAMPLES)} samples):")
+    local = benchmark_local(args.min_confidence, args.repeat)
+    print(f"  accuracy {local['accuracy']:.1%}, coverage {local['coverage']:.1%}, "
+          f"p50 {local['p50_us']:.0f} µs, p99 {local['p99_us']:.0f} µs")
+
+    if args.llm:
+        print("LLM detection:")
+        llm = asyncio.run(benchmark_llm())
+        print(f"  accuracy {llm['accuracy']:.1%}, p50 {llm['p50_ms']:.0f} ms, p99 {llm['p99_ms']:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 API models for request and response validation.
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class TranslationRequest(BaseModel):
@@ -12,6 +12,7 @@ class TranslationRequest(BaseModel):
     text: str = Field(..., description="Text to translate")
     from_lang: str = Field(..., description="Source language, e.g. English, Spanish, French, etc.")
     to_lang: str = Field(..., description="Target language, e.g. English, Spanish, French, etc.")
+    debug: bool = Field(False, description="Include the latency breakdown of the request in the response")
 
 
 class TranslationResponse(BaseModel):
@@ -20,9 +21,53 @@ class TranslationResponse(BaseModel):
     """
     translated_text: str = Field(..., description="Translated text")
     from_lang: str = Field(..., description="Source language, e.g. English, Spanish, French, etc.")
+    detected_lang: Optional[str] = Field(None, description="Detected source language when from_lang is Auto-detect")
     to_lang: str = Field(..., description="Target language, e.g. English, Spanish, French, etc.")
     service_used: str = Field(..., description="AI service provider used for translation")
     model_used: str = Field(..., description="Specific model used for translation")
+    timings: Optional[Dict[str, float]] = Field(
+        None, description="Milliseconds spent in each phase of the request so far, when debug is set"
+    )
+
+
+class BatchTranslationRequest(BaseModel):
+    """
+    Model for batch translation request validation.
+    """
+    texts: List[str] = Field(..., min_length=1, description="Texts to translate, all sharing the same language pair")
+    from_lang: str = Field(..., description="Source language, e.g. English, Spanish, French, etc.")
+    to_lang: str = Field(..., description="Target language, e.g. English, Spanish, French, etc.")
+
+
+class BatchTranslationResponse(BaseModel):
+    """
+    Model for batch translation response.
+    """
+    translations: List[str] = Field(..., description="Translated texts, in the same order as the request")
+    from_lang: str = Field(..., description="Source language, e.g. English, Spanish, French, etc.")
+    to_lang: str = Field(..., description="Target language, e.g. English, Spanish, French, etc.")
+    service_used: str = Field(..., description="AI service provider used for translation")
+    model_used: str = Field(..., description="Models used for translation, comma-separated if texts used several")
+
+
+class MultiTranslationRequest(BaseModel):
+    """
+    Model for one-to-many translation request validation.
+    """
+    text: str = Field(..., description="Text to translate")
+    from_lang: str = Field(..., description="Source language, e.g. English, Spanish, French, etc.")
+    to_langs: List[str] = Field(..., min_length=1, description="Target languages, e.g. [\"Spanish\", \"French\"]")
+
+
+class MultiTranslationResponse(BaseModel):
+    """
+    Model for one-to-many translation response.
+    """
+    translations: Dict[str, str] = Field(..., description="Translated text keyed by target language")
+    from_lang: str = Field(..., description="Source language, e.g. English, Spanish, French, etc.")
+    detected_lang: Optional[str] = Field(None, description="Detected source language when from_lang is Auto-detect")
+    service_used: str = Field(..., description="AI service provider used for translation")
+    model_used: str = Field(..., description="Models used for translation, comma-separated if targets used several")
 
 
 class SpeakRequest(BaseModel):
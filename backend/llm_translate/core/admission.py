@@ -0,0 +1,449 @@
+"""
+Admission control module.
+Bounds the number of concurrently served requests per endpoint and of concurrent calls per provider
+(bulkheads), queues a bounded number of requests beyond that, and sheds the rest immediately with a
+503 and Retry-After, so one overloaded endpoint or provider cannot starve the others.
+"""
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+from llm_translate.services.base_speaker import BaseSpeaker, SpeakerWrapper
+from llm_translate.services.base_translator import BaseTranslator, BatchPackingTranslator
+from llm_translate.utils.config import get_config
+from llm_translate.utils.exceptions import ErrorType, TranslationError
+from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.metrics import record_error, record_timing
+
+
+# Set up logger
+logger = setup_logger("llm_translate.admission")
+
+
+def parse_limits(value: Optional[str]) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse a bulkhead limits setting such as "/translate=64:128,/speak=8:16".
+
+    Args:
+        value (Optional[str]): Comma-separated name=concurrency:queue entries; the queue part is optional
+            and defaults to twice the concurrency.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Concurrency and queue length by name.
+
+    Raises:
+        ValueError: If an entry is malformed.
+    """
+    limits = {}
+    for entry in (value or "").split(","):
+        if not entry.strip():
+            continue
+        name, _, spec = entry.partition("=")
+        concurrency, _, queue = spec.partition(":")
+        if not name.strip() or not concurrency.strip():
+            raise ValueError(f"Invalid bulkhead limit: {entry.strip()}")
+        limits[name.strip().lower()] = (int(concurrency), int(queue) if queue.strip() else 2 * int(concurrency))
+    return limits
+
+
+class Bulkhead:
+    """
+    Concurrency limit with a bounded FIFO wait queue.
+
+    A released slot is handed directly to the oldest waiter. Requests arriving at a full queue, and
+    waiters not admitted within the maximum wait, are shed with an OVERLOADED error (503) whose
+    Retry-After estimates when a slot will be free.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, max_wait_seconds: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the bulkhead.
+
+        Args:
+            name (str): Endpoint path or provider name, for errors and stats.
+            max_concurrent (int): Requests served at once.
+            max_queue (int): Requests allowed to wait for a slot.
+            max_wait_seconds (float, optional): Longest a request waits for a slot. Defaults to 5.0.
+            clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+        """
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.max_wait_seconds = max_wait_seconds
+        self.clock = clock
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.shed = 0
+        self.timed_out = 0
+        self.queued = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        # Smoothed time a slot is held, for Retry-After estimates
+        self.hold_seconds = 1.0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Requests currently waiting for a slot.
+
+        Returns:
+            int: Queue depth.
+        """
+        return len(self._waiters)
+
+    def retry_after(self) -> float:
+        """
+        Estimate when a newly arriving request would get a slot.
+
+        Returns:
+            float: Seconds, at least 1.
+        """
+        return max(1.0, self.hold_seconds * (self.queue_depth + 1) / self.max_concurrent)
+
+    def _overloaded(self, reason: str) -> TranslationError:
+        """
+        Build the error for a shed request.
+
+        Args:
+            reason (str): Why the request is shed.
+
+        Returns:
+            TranslationError: Overloaded error with Retry-After.
+        """
+        logger.warning(f"Shedding request for {self.name}: {reason}")
+        return TranslationError(
+            f"Server is overloaded ({self.name}): {reason}. Please retry later.",
+            error_type=ErrorType.OVERLOADED,
+            status_code=503,
+            retry_after=math.ceil(self.retry_after())
+        )
+
+    async def acquire(self) -> float:
+        """
+        Take a slot, waiting in the queue if all slots are taken.
+
+        Returns:
+            float: Monotonic time the slot was taken, to pass to release().
+
+        Raises:
+            TranslationError: With OVERLOADED if the queue is full or no slot frees up in time.
+        """
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return self.clock()
+        if len(self._waiters) >= self.max_queue:
+            self.shed += 1
+            raise self._overloaded("queue is full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        queued_at = self.clock()
+        try:
+            await asyncio.wait_for(waiter, self.max_wait_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended; pass it on
+                self._release_slot()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.shed += 1
+            self.timed_out += 1
+            raise self._overloaded(f"no capacity within {self.max_wait_seconds:g}s")
+        waited = self.clock() - queued_at
+        record_timing("queue", waited)
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        self.admitted += 1
+        return self.clock()
+
+    def release(self, acquired_at: float) -> None:
+        """
+        Return a slot, handing it to the oldest waiter if there is one.
+
+        Args:
+            acquired_at (float): Value returned by acquire().
+        """
+        self.hold_seconds += 0.2 * ((self.clock() - acquired_at) - self.hold_seconds)
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        """Hand the slot to the next live waiter, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get bulkhead state and counters.
+
+        Returns:
+            Dict[str, Any]: Limits, requests in service and waiting, admitted, queued, shed and timed-out
+            counts, and total and maximum queue wait.
+        """
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queue_depth": self.queue_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+
+class AdmissionController:
+    """Bulkheads for the configured endpoints and providers."""
+
+    def __init__(self, endpoint_limits: Dict[str, Tuple[int, int]], provider_limits: Dict[str, Tuple[int, int]],
+                 max_wait_seconds: float = 5.0):
+        """
+        Initialize the admission controller.
+
+        Args:
+            endpoint_limits (Dict[str, Tuple[int, int]]): Concurrency and queue length by endpoint path.
+            provider_limits (Dict[str, Tuple[int, int]]): Concurrency and queue length by provider name.
+            max_wait_seconds (float, optional): Longest a request waits for a slot. Defaults to 5.0.
+        """
+        self.endpoints = {
+            path: Bulkhead(path, concurrency, queue, max_wait_seconds)
+            for path, (concurrency, queue) in endpoint_limits.items()
+        }
+        self.providers = {
+            provider: Bulkhead(provider, concurrency, queue, max_wait_seconds)
+            for provider, (concurrency, queue) in provider_limits.items()
+        }
+
+    def endpoint(self, path: str) -> Optional[Bulkhead]:
+        """
+        Get the bulkhead of an endpoint.
+
+        Args:
+            path (str): Request path.
+
+        Returns:
+            Optional[Bulkhead]: The endpoint's bulkhead, or None if the endpoint is not limited.
+        """
+        return self.endpoints.get(path.rstrip("/").lower() or "/")
+
+    def provider(self, provider: str) -> Optional[Bulkhead]:
+        """
+        Get the bulkhead of a provider.
+
+        Args:
+            provider (str): Provider name.
+
+        Returns:
+            Optional[Bulkhead]: The provider's bulkhead, or None if the provider is not limited.
+        """
+        return self.providers.get(provider)
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get the state of every bulkhead.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: Bulkhead stats by endpoint and by provider.
+        """
+        return {
+            "endpoints": {path: bulkhead.stats() for path, bulkhead in self.endpoints.items()},
+            "providers": {provider: bulkhead.stats() for provider, bulkhead in self.providers.items()},
+        }
+
+
+class BulkheadTranslator(BatchPackingTranslator):
+    """Translator wrapper that holds a slot of the provider's bulkhead during every call."""
+
+    def __init__(self, translator: BaseTranslator, bulkhead: Bulkhead):
+        """
+        Initialize the bulkhead translator.
+
+        Args:
+            translator (BaseTranslator): Provider translator.
+            bulkhead (Bulkhead): The provider's bulkhead.
+        """
+        super().__init__(translator)
+        self.bulkhead = bulkhead
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a call once the provider has capacity, holding a slot until it ends.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            TranslationError: With OVERLOADED if the provider's bulkhead sheds the call, or the provider's error.
+        """
+        acquired_at = await self.bulkhead.acquire()
+        try:
+            return await super()._call(method, *args)
+        finally:
+            self.bulkhead.release(acquired_at)
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation once the provider has capacity, holding the slot until the stream ends.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        acquired_at = await self.bulkhead.acquire()
+        try:
+            async for piece in self.translator.translate_stream(text, from_lang, to_lang, usage):
+                yield piece
+        finally:
+            self.bulkhead.release(acquired_at)
+
+
+class BulkheadSpeaker(SpeakerWrapper):
+    """Speaker wrapper that holds a slot of the provider's bulkhead during every call."""
+
+    def __init__(self, speaker: BaseSpeaker, bulkhead: Bulkhead):
+        """
+        Initialize the bulkhead speaker.
+
+        Args:
+            speaker (BaseSpeaker): Provider speaker.
+            bulkhead (Bulkhead): The provider's bulkhead.
+        """
+        super().__init__(speaker)
+        self.bulkhead = bulkhead
+
+    async def speak(self, text: str, lang: str, voice: Optional[str] = None,
+                    response_format: str = "mp3", instructions: Optional[str] = None) -> bytes:
+        """
+        Convert text to speech once the provider has capacity.
+
+        Args:
+            text (str): Text to convert to speech.
+            lang (str): Language of the text (e.g., "English", "Spanish").
+            voice (Optional[str], optional): Voice to use. Defaults to None.
+            response_format (str, optional): Format of the audio response. Defaults to "mp3".
+            instructions (Optional[str], optional): Additional instructions for the TTS service. Defaults to None.
+
+        Returns:
+            bytes: Audio content.
+
+        Raises:
+            TranslationError: With OVERLOADED if the provider's bulkhead sheds the call, or the provider's error.
+        """
+        acquired_at = await self.bulkhead.acquire()
+        try:
+            return await self.speaker.speak(
+                text=text, lang=lang, voice=voice, response_format=response_format, instructions=instructions
+            )
+        finally:
+            self.bulkhead.release(acquired_at)
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that holds a slot of the endpoint's bulkhead while a request is served, including
+    streaming its response body, and answers requests the bulkhead sheds with 503 and Retry-After.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (Callable[..., Awaitable[None]]): Wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Awaitable[Any]],
+                       send: Callable[..., Awaitable[None]]) -> None:
+        """
+        Serve a request within its endpoint's bulkhead.
+
+        Args:
+            scope (Dict[str, Any]): ASGI connection scope.
+            receive (Callable[..., Awaitable[Any]]): ASGI receive channel.
+            send (Callable[..., Awaitable[None]]): ASGI send channel.
+        """
+        bulkhead = None
+        # CORS preflights do no work, so they are never queued or shed
+        if scope["type"] == "http" and scope["method"] != "OPTIONS" and get_config().get("ADMISSION_ENABLED", True):
+            bulkhead = get_admission_controller().endpoint(scope["path"])
+        if bulkhead is None:
+            await self.app(scope, receive, send)
+            return
+        try:
+            acquired_at = await bulkhead.acquire()
+        except TranslationError as e:
+            record_error(scope["path"], e.error_type.value)
+            response = JSONResponse(status_code=e.status_code, content=e.to_dict(), headers=e.headers())
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            bulkhead.release(acquired_at)
+
+
+_admission_controller: Optional[AdmissionController] = None
+_admission_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    Get the process-wide admission controller, creating it from configuration on first use.
+
+    Returns:
+        AdmissionController: Shared admission controller.
+    """
+    global _admission_controller
+    if _admission_controller is None:
+        with _admission_controller_lock:
+            if _admission_controller is None:
+                config = get_config()
+                _admission_controller = AdmissionController(
+                    parse_limits(config.get("ADMISSION_ENDPOINT_LIMITS")),
+                    parse_limits(config.get("ADMISSION_PROVIDER_LIMITS")),
+                    max_wait_seconds=config.get("ADMISSION_MAX_WAIT_SECONDS", 5.0)
+                )
+                logger.info(
+                    f"Admission control initialized (endpoints={list(_admission_controller.endpoints)}, "
+                    f"providers={list(_admission_controller.providers)})"
+                )
+    return _admission_controller
+
+
+def reset_admission_controller() -> None:
+    """
+    Drop the process-wide admission controller so the next call rebuilds it from configuration.
+    """
+    global _admission_controller
+    with _admission_controller_lock:
+        _admission_controller = None
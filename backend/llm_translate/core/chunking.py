@@ -0,0 +1,289 @@
+"""
+Long document chunking module.
+Splits long texts into token-budgeted chunks at natural boundaries, translates them concurrently
+and reassembles the translations in order.
+"""
+import asyncio
+import re
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.tokens import estimate_tokens
+
+
+# Boundaries tried in order when a piece of text is over budget: paragraphs, lines, sentences, words
+_BOUNDARIES = (
+    re.compile(r"(\n\s*\n)"),
+    re.compile(r"(\n)"),
+    re.compile(r"((?<=[.!?;。！？])\s*)"),
+    re.compile(r"(\s+)"),
+)
+
+
+def _split_units(text: str, max_tokens: int, level: int = 0) -> List[str]:
+    """
+    Split text into consecutive pieces of at most max_tokens, preferring the coarsest boundary.
+
+    Args:
+        text (str): Text to split.
+        max_tokens (int): Token budget per piece.
+        level (int, optional): Index of the first boundary to try. Defaults to 0.
+
+    Returns:
+        List[str]: Pieces that concatenate back to text; separators stay attached to the preceding piece.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+    for index in range(level, len(_BOUNDARIES)):
+        parts = _BOUNDARIES[index].split(text)
+        pieces = [parts[i] + (parts[i + 1] if i + 1 < len(parts) else "") for i in range(0, len(parts), 2)]
+        pieces = [piece for piece in pieces if piece]
+        if len(pieces) > 1:
+            return [unit for piece in pieces for unit in _split_units(piece, max_tokens, index)]
+    # No boundary left (e.g. one very long word); cut by characters
+    size = max(1, len(text) * max_tokens // estimate_tokens(text))
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+
+def split_chunks(text: str, max_tokens: int) -> List[str]:
+    """
+    Split text into chunks of at most max_tokens estimated tokens at paragraph, line, sentence or
+    word boundaries, packing as many consecutive pieces into each chunk as fit.
+
+    Args:
+        text (str): Text to split.
+        max_tokens (int): Token budget per chunk.
+
+    Returns:
+        List[str]: Chunks that concatenate back to text.
+    """
+    chunks: List[str] = []
+    current = ""
+    current_tokens = 0
+    for unit in _split_units(text, max_tokens):
+        tokens = estimate_tokens(unit)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = "", 0
+        current += unit
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _split_whitespace(chunk: str) -> Tuple[str, str, str]:
+    """
+    Separate a chunk's surrounding whitespace from its content.
+
+    Args:
+        chunk (str): Chunk text.
+
+    Returns:
+        Tuple[str, str, str]: Leading whitespace, content, trailing whitespace.
+    """
+    content = chunk.strip()
+    if not content:
+        return chunk, "", ""
+    start = chunk.index(content)
+    return chunk[:start], content, chunk[start + len(content):]
+
+
+def context_tail(text: str, max_tokens: int) -> str:
+    """
+    Take the end of a text, up to max_tokens, starting at a sentence or word boundary.
+
+    Args:
+        text (str): Preceding chunk.
+        max_tokens (int): Token budget for the context.
+
+    Returns:
+        str: Tail of text, or an empty string if max_tokens is zero.
+    """
+    if max_tokens <= 0:
+        return ""
+    units = _split_units(text, max_tokens, level=2)
+    tail = ""
+    for unit in reversed(units):
+        if tail and estimate_tokens(unit + tail) > max_tokens:
+            break
+        tail = unit + tail
+    return tail.strip()
+
+
+class ChunkedTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that translates long texts in parallel chunks.
+
+    Texts within chunk_max_tokens are passed through. Longer texts are split into chunks, each
+    translated with the end of the previous chunk as read-only context, at most `concurrency` at a
+    time, and joined back in order with the original whitespace between them.
+    """
+
+    def __init__(self, translator: BaseTranslator, chunk_max_tokens: int = 1000,
+                 overlap_tokens: int = 64, concurrency: int = 4):
+        """
+        Initialize the chunked translator.
+
+        Args:
+            translator (BaseTranslator): Translator to delegate chunks to.
+            chunk_max_tokens (int, optional): Estimated tokens per chunk. Defaults to 1000.
+            overlap_tokens (int, optional): Estimated tokens of preceding text sent as context. Defaults to 64.
+            concurrency (int, optional): Maximum chunks translated at once per text. Defaults to 4.
+        """
+        super().__init__(translator)
+        if chunk_max_tokens <= 0:
+            raise ValueError("chunk_max_tokens must be greater than zero")
+        if concurrency <= 0:
+            raise ValueError("concurrency must be greater than zero")
+        self.chunk_max_tokens = chunk_max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.concurrency = concurrency
+
+    def is_long(self, text: str) -> bool:
+        """
+        Check whether a text is split into chunks.
+
+        Args:
+            text (str): Text to check.
+
+        Returns:
+            bool: True if the text is over the chunk budget.
+        """
+        return estimate_tokens(text) > self.chunk_max_tokens
+
+    async def _start_chunks(self, text: str, from_lang: str, to_lang: str) -> Optional[List[Tuple[str, "asyncio.Task[str]", str]]]:
+        """
+        Split a long text and start translating its chunks.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            Optional[List[Tuple[str, asyncio.Task, str]]]: Leading whitespace, translation task and trailing
+            whitespace per chunk, in order; None if source and target languages are the same.
+        """
+        chunks = split_chunks(text, self.chunk_max_tokens)
+        try:
+            if from_lang.lower() == "auto-detect":
+                # The opening chunk is enough to identify the language of the whole document
+                from_lang = await self.translator._detect_language(chunks[0])
+                self.logger.info(f"Detected language: {from_lang}")
+        except Exception as e:
+            raise self.translator._translation_error(e) from e
+        if from_lang.strip().lower() == to_lang.strip().lower():
+            return None
+
+        self.logger.debug(f"Translating {len(chunks)} chunks with concurrency {self.concurrency}: {from_lang} → {to_lang}")
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def translate_chunk(content: str, context: str) -> str:
+            async with semaphore:
+                if context:
+                    return await self.translator.translate_with_context(content, from_lang, to_lang, context)
+                return await self.translator.translate(text=content, from_lang=from_lang, to_lang=to_lang)
+
+        parts = []
+        previous = ""
+        for chunk in chunks:
+            leading, content, trailing = _split_whitespace(chunk)
+            if content:
+                task = asyncio.ensure_future(translate_chunk(content, context_tail(previous, self.overlap_tokens)))
+            else:
+                task = asyncio.ensure_future(asyncio.sleep(0, result=""))
+            parts.append((leading, task, trailing))
+            previous = content
+        return parts
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text, splitting long texts into chunks translated in parallel.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If any chunk fails to translate.
+        """
+        if not self.is_long(text):
+            return await self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
+
+        parts = await self._start_chunks(text, from_lang, to_lang)
+        if parts is None:
+            return text
+        try:
+            translations = await asyncio.gather(*(task for _, task, _ in parts))
+        except BaseException:
+            for _, task, _ in parts:
+                task.cancel()
+            raise
+        return "".join(leading + translated + trailing
+                       for (leading, _, trailing), translated in zip(parts, translations))
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation; long texts are yielded chunk by chunk, in order, as soon as each
+        chunk and all chunks before it are done.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage for short texts. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        if not self.is_long(text):
+            async for piece in self.translator.translate_stream(text, from_lang, to_lang, usage):
+                yield piece
+            return
+
+        parts = await self._start_chunks(text, from_lang, to_lang)
+        if parts is None:
+            yield text
+            return
+        try:
+            for leading, task, trailing in parts:
+                yield leading + await task + trailing
+        finally:
+            for _, task, _ in parts:
+                task.cancel()
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Translate a batch, sending long texts through chunking and the rest to the wrapped translator's packing.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+        """
+        long_indices = [index for index, text in enumerate(texts) if self.is_long(text)]
+        if not long_indices:
+            return await self.translator.translate_batch(texts, from_lang, to_lang)
+
+        short_indices = [index for index, text in enumerate(texts) if not self.is_long(text)]
+        short_results, long_results = await asyncio.gather(
+            self.translator.translate_batch([texts[index] for index in short_indices], from_lang, to_lang),
+            self._gather_limited([
+                lambda index=index: self.translate(texts[index], from_lang, to_lang) for index in long_indices
+            ])
+        )
+        results: List[str] = [""] * len(texts)
+        for index, translated in zip(short_indices, short_results):
+            results[index] = translated
+        for index, translated in zip(long_indices, long_results):
+            results[index] = translated
+        return results
@@ -0,0 +1,404 @@
+"""
+Circuit breaker module.
+Stops sending requests to a provider that keeps failing, so callers fail fast or fall back to the next
+provider instead of waiting for every request to time out, and probes the provider until it recovers.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from llm_translate.core.providers import provider_key
+from llm_translate.services.base_speaker import BaseSpeaker, SpeakerWrapper
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.config import get_config
+from llm_translate.utils.exceptions import ErrorType, TranslationError, is_local_rejection, is_provider_error
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.circuit_breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed, open and half-open state of one provider.
+
+    Closed: requests pass; consecutive provider errors (see utils.exceptions.PROVIDER_ERROR_TYPES) are
+    counted and the breaker opens at the threshold. Open: requests are rejected until the recovery time has
+    passed. Half-open: a limited number of probe requests pass; a success closes the breaker, a provider
+    error opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_seconds: float = 30.0, half_open_probes: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold (int, optional): Consecutive provider errors that open the breaker. Defaults to 5.
+            recovery_seconds (float, optional): Time an open breaker rejects requests before probing. Defaults to 30.0.
+            half_open_probes (int, optional): Concurrent probe requests allowed while half-open. Defaults to 1.
+            clock (Callable[[], float], optional): Monotonic clock, overridable for tests. Defaults to time.monotonic.
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_seconds = recovery_seconds
+        self.half_open_probes = max(1, half_open_probes)
+        self.clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """
+        Current state; an open breaker whose recovery time has passed reports half-open.
+
+        Returns:
+            str: "closed", "open" or "half_open".
+        """
+        if self._state == OPEN and self.clock() - self._opened_at >= self.recovery_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info("Circuit half-open, probing provider")
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent, taking a probe slot when half-open.
+
+        Returns:
+            bool: True if the request may be sent; every allowed request must be followed by record().
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes < self.half_open_probes:
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record(self, error: Optional[BaseException] = None) -> None:
+        """
+        Record the outcome of an allowed request.
+
+        Args:
+            error (Optional[BaseException], optional): Error the request failed with. Errors caused by the
+                request itself count as a response from a healthy provider; cancelled calls and calls
+                rejected locally before reaching the provider count as no outcome. Defaults to None.
+        """
+        half_open = self._state == HALF_OPEN
+        if half_open:
+            self._probes = max(0, self._probes - 1)
+        if isinstance(error, asyncio.CancelledError) or (error is not None and is_local_rejection(error)):
+            return
+        if error is not None and is_provider_error(error):
+            self._failures += 1
+            if half_open or self._failures >= self.failure_threshold:
+                self._open()
+        else:
+            if half_open:
+                logger.info("Circuit closed, provider recovered")
+            self._state = CLOSED
+            self._failures = 0
+
+    def _open(self) -> None:
+        """Open the breaker and start the recovery timer."""
+        if self._state != OPEN:
+            self.opened += 1
+            logger.warning(f"Circuit opened after {self._failures} consecutive provider errors")
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self._probes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get breaker state and counters.
+
+        Returns:
+            Dict[str, Any]: State, consecutive failures, times opened and requests rejected.
+        """
+        return {"state": self.state, "failures": self._failures, "opened": self.opened, "rejected": self.rejected}
+
+
+class CircuitBreakerRegistry:
+    """One circuit breaker per provider and model, created with shared settings on first use."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_seconds: float = 30.0, half_open_probes: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the registry.
+
+        Args:
+            failure_threshold (int, optional): Consecutive provider errors that open a breaker. Defaults to 5.
+            recovery_seconds (float, optional): Time an open breaker rejects requests before probing. Defaults to 30.0.
+            half_open_probes (int, optional): Concurrent probe requests allowed while half-open. Defaults to 1.
+            clock (Callable[[], float], optional): Monotonic clock, overridable for tests. Defaults to time.monotonic.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.half_open_probes = half_open_probes
+        self.clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """
+        Get the breaker of a provider.
+
+        Args:
+            key (str): Provider key ("provider/model").
+
+        Returns:
+            CircuitBreaker: The provider's breaker.
+        """
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(
+                self.failure_threshold, self.recovery_seconds, self.half_open_probes, self.clock
+            )
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every breaker.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Breaker stats by provider key.
+        """
+        return {key: breaker.stats() for key, breaker in self._breakers.items()}
+
+
+def circuit_open_error(keys: List[str]) -> TranslationError:
+    """
+    Build the error raised when every provider in a chain is rejected by its breaker.
+
+    Args:
+        keys (List[str]): Provider keys of the chain.
+
+    Returns:
+        TranslationError: Service-unavailable error.
+    """
+    return TranslationError(
+        f"Provider temporarily unavailable (circuit open): {', '.join(keys)}",
+        error_type=ErrorType.SERVICE_UNAVAILABLE,
+        status_code=503
+    )
+
+
+async def call_with_fallback(services: List[Any], breakers: CircuitBreakerRegistry,
+                             call: Callable[[Any, int], Awaitable[Any]]) -> Any:
+    """
+    Make a request against the first service in a chain whose breaker allows it, moving on after provider errors.
+
+    Args:
+        services (List[Any]): Translators or speakers, in fallback order.
+        breakers (CircuitBreakerRegistry): Breakers of the providers.
+        call (Callable[[Any, int], Awaitable[Any]]): The request to make against a service and its chain position.
+
+    Returns:
+        Any: The first successful result.
+
+    Raises:
+        TranslationError: The last provider error, or a service-unavailable error if every breaker is open.
+        Exception: Errors caused by the request itself are raised without trying further providers.
+    """
+    last_error: Optional[BaseException] = None
+    keys = [provider_key(service) for service in services]
+    for position, (service, key) in enumerate(zip(services, keys)):
+        breaker = breakers.breaker(key)
+        if not breaker.allow():
+            continue
+        try:
+            result = await call(service, position)
+        except BaseException as e:
+            breaker.record(e)
+            if not is_provider_error(e):
+                raise
+            last_error = e
+            if position + 1 < len(services):
+                logger.warning(f"{key} failed ({e}); falling back to the next provider")
+            continue
+        breaker.record()
+        return result
+    if last_error is not None:
+        raise last_error
+    raise circuit_open_error(keys)
+
+
+class FallbackTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that guards each provider translator with a circuit breaker and falls back along a chain.
+
+    The first translator is the primary: its provider and model identify the wrapper, e.g. in cache keys.
+    """
+
+    def __init__(self, translators: List[BaseTranslator], breakers: CircuitBreakerRegistry):
+        """
+        Initialize the fallback translator.
+
+        Args:
+            translators (List[BaseTranslator]): Provider translators, primary first, then fallbacks in order.
+            breakers (CircuitBreakerRegistry): Breakers shared across requests.
+
+        Raises:
+            ValueError: If no translators are given.
+        """
+        if not translators:
+            raise ValueError("At least one translator is required")
+        super().__init__(translators[0])
+        self.translators = translators
+        self.breakers = breakers
+        self.supports_batch = all(translator.supports_batch for translator in translators)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a call with the first available provider.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            TranslationError: If every provider fails or is unavailable.
+        """
+        return await call_with_fallback(
+            self.translators, self.breakers, lambda translator, _: getattr(translator, method)(*args)
+        )
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation from the first available provider. A provider that fails before its first
+        piece is skipped; once pieces have been sent, errors are raised.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        last_error: Optional[BaseException] = None
+        keys = [provider_key(translator) for translator in self.translators]
+        for translator, key in zip(self.translators, keys):
+            breaker = self.breakers.breaker(key)
+            if not breaker.allow():
+                continue
+            started = False
+            try:
+                async for piece in translator.translate_stream(text, from_lang, to_lang, usage):
+                    started = True
+                    yield piece
+            except BaseException as e:
+                breaker.record(e)
+                if started or not is_provider_error(e):
+                    raise
+                last_error = e
+                continue
+            breaker.record()
+            return
+        if last_error is not None:
+            raise last_error
+        raise circuit_open_error(keys)
+
+
+class FallbackSpeaker(SpeakerWrapper):
+    """
+    Speaker wrapper that guards each TTS provider with a circuit breaker and falls back along a chain.
+
+    Voices are provider-specific, so the requested voice is only passed to the primary speaker;
+    fallback speakers use their default voice.
+    """
+
+    def __init__(self, speakers: List[BaseSpeaker], breakers: CircuitBreakerRegistry):
+        """
+        Initialize the fallback speaker.
+
+        Args:
+            speakers (List[BaseSpeaker]): Speakers, primary first, then fallbacks in order.
+            breakers (CircuitBreakerRegistry): Breakers shared across requests.
+
+        Raises:
+            ValueError: If no speakers are given.
+        """
+        if not speakers:
+            raise ValueError("At least one speaker is required")
+        super().__init__(speakers[0])
+        self.speakers = speakers
+        self.breakers = breakers
+
+    async def speak(self, text: str, lang: str, voice: Optional[str] = None,
+                    response_format: str = "mp3", instructions: Optional[str] = None) -> bytes:
+        """
+        Convert text to speech with the first available provider.
+
+        Args:
+            text (str): Text to convert to speech.
+            lang (str): Language of the text (e.g., "English", "Spanish").
+            voice (Optional[str], optional): Voice to use with the primary speaker. Defaults to None.
+            response_format (str, optional): Format of the audio response. Defaults to "mp3".
+            instructions (Optional[str], optional): Additional instructions for the TTS service. Defaults to None.
+
+        Returns:
+            bytes: Audio content.
+
+        Raises:
+            TranslationError: If every provider fails or is unavailable.
+        """
+        return await call_with_fallback(self.speakers, self.breakers, lambda speaker, position: speaker.speak(
+            text=text,
+            lang=lang,
+            voice=voice if position == 0 else None,
+            response_format=response_format,
+            instructions=instructions
+        ))
+
+
+_circuit_breakers: Optional[CircuitBreakerRegistry] = None
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """
+    Get the process-wide circuit breaker registry, creating it from configuration on first use.
+
+    Returns:
+        CircuitBreakerRegistry: Shared registry.
+    """
+    global _circuit_breakers
+    if _circuit_breakers is None:
+        with _circuit_breakers_lock:
+            if _circuit_breakers is None:
+                config = get_config()
+                _circuit_breakers = CircuitBreakerRegistry(
+                    failure_threshold=config.get("CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5),
+                    recovery_seconds=config.get("CIRCUIT_BREAKER_RECOVERY_SECONDS", 30.0),
+                    half_open_probes=config.get("CIRCUIT_BREAKER_HALF_OPEN_PROBES", 1)
+                )
+                logger.info(
+                    f"Circuit breakers initialized (failure_threshold={_circuit_breakers.failure_threshold}, "
+                    f"recovery_seconds={_circuit_breakers.recovery_seconds})"
+                )
+    return _circuit_breakers
+
+
+def reset_circuit_breakers() -> None:
+    """
+    Drop the process-wide circuit breaker registry so the next call rebuilds it from configuration.
+    """
+    global _circuit_breakers
+    with _circuit_breakers_lock:
+        _circuit_breakers = None
@@ -0,0 +1,358 @@
+"""
+Persistent on-disk translation cache module.
+Stores translations in SQLite (WAL mode) so warm state survives worker restarts and redeploys.
+"""
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.disk_cache")
+
+# Sentinel that tells the writer thread to exit
+_STOP = object()
+
+# Keys per bulk lookup query, below SQLite's default limit on bound parameters
+_MAX_KEYS_PER_QUERY = 500
+
+
+class DiskTranslationCache:
+    """
+    SQLite-backed translation cache with size-based LRU eviction.
+
+    Reads are cheap indexed lookups and are offered both synchronously and via a worker thread.
+    Writes are queued and applied in batches by a dedicated writer thread so callers never block
+    on disk I/O; when the queue is full, writes are dropped rather than applying back-pressure.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, ttl_seconds: float = 604800.0,
+                 max_pending_writes: int = 10000, clock: Callable[[], float] = time.time):
+        """
+        Initialize the disk cache and start its writer thread.
+
+        Args:
+            path (str): Path of the SQLite database file. Parent directories are created if needed.
+            max_bytes (int, optional): Approximate maximum size of stored keys and values. Defaults to 256 MiB.
+            ttl_seconds (float, optional): Seconds an entry stays valid. Zero or less disables expiry. Defaults to 7 days.
+            max_pending_writes (int, optional): Capacity of the write queue. Defaults to 10000.
+            clock (Callable[[], float], optional): Wall clock, overridable for tests. Defaults to time.time.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.dropped_writes = 0
+        # Counters are updated from worker threads, so += needs a lock
+        self._stats_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Separate connections for readers and the writer; WAL lets them run concurrently
+        self._writer_conn = self._connect()
+        self._writer_conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._writer_conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translations_accessed_at ON translations (accessed_at)"
+        )
+        self._writer_conn.commit()
+        self._total_bytes = self._writer_conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM translations"
+        ).fetchone()[0]
+
+        self._reader_conn = self._connect()
+        self._reader_lock = threading.Lock()
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending_writes)
+        self._closed = False
+        self._writer = threading.Thread(target=self._run_writer, name="translation-disk-cache", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the cache database in WAL mode.
+
+        Returns:
+            sqlite3.Connection: Configured connection.
+        """
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached translation.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[str]: Cached translation, or None on a miss or an expired entry.
+        """
+        with self._reader_lock:
+            row = self._reader_conn.execute(
+                "SELECT value, created_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        now = self._clock()
+        if row is None or (self.ttl_seconds > 0 and row[1] + self.ttl_seconds <= now):
+            with self._stats_lock:
+                self.misses += 1
+            return None
+        with self._stats_lock:
+            self.hits += 1
+        self._enqueue(("touch", key, now))
+        return row[0]
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Look up several cached translations with as few queries as possible.
+
+        Args:
+            keys (List[str]): Cache keys.
+
+        Returns:
+            Dict[str, str]: Cached translations by key; misses and expired entries are left out.
+        """
+        keys = list(dict.fromkeys(keys))
+        rows = []
+        with self._reader_lock:
+            for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[start:start + _MAX_KEYS_PER_QUERY]
+                rows.extend(self._reader_conn.execute(
+                    f"SELECT key, value, created_at FROM translations WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall())
+        now = self._clock()
+        found = {
+            key: value for key, value, created_at in rows
+            if self.ttl_seconds <= 0 or created_at + self.ttl_seconds > now
+        }
+        with self._stats_lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        for key in found:
+            self._enqueue(("touch", key, now))
+        return found
+
+    async def aget(self, key: str) -> Optional[str]:
+        """
+        Look up a cached translation without blocking the event loop.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[str]: Cached translation, or None on a miss.
+        """
+        return await asyncio.to_thread(self.get, key)
+
+    async def aget_many(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Look up several cached translations in one worker thread call, without blocking the event loop.
+
+        Args:
+            keys (List[str]): Cache keys.
+
+        Returns:
+            Dict[str, str]: Cached translations by key; misses are left out.
+        """
+        return await asyncio.to_thread(self.get_many, keys)
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Queue a translation to be written to disk. Never blocks.
+
+        Args:
+            key (str): Cache key.
+            value (str): Translated text.
+        """
+        self._enqueue(("set", key, value, self._clock()))
+
+    def _enqueue(self, item: Any) -> None:
+        """
+        Put an operation on the write queue, dropping it if the queue is full or closed.
+
+        Args:
+            item (Any): Operation tuple for the writer thread.
+        """
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped_writes += 1
+
+    def _run_writer(self) -> None:
+        """
+        Apply queued writes in batches until the stop sentinel is received.
+        """
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while len(batch) < 256:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            try:
+                for op in batch:
+                    if op is _STOP:
+                        stop = True
+                    elif op[0] == "set":
+                        self._write(op[1], op[2], op[3])
+                    elif op[0] == "touch":
+                        self._writer_conn.execute(
+                            "UPDATE translations SET accessed_at = ? WHERE key = ?", (op[2], op[1])
+                        )
+                self._writer_conn.commit()
+                self._evict()
+            except sqlite3.Error as e:
+                logger.error(f"Error writing to translation disk cache: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, key: str, value: str, now: float) -> None:
+        """
+        Insert or replace a single entry. Runs on the writer thread.
+
+        Args:
+            key (str): Cache key.
+            value (str): Translated text.
+            now (float): Timestamp of the write.
+        """
+        size = len(key.encode("utf-8")) + len(value.encode("utf-8"))
+        previous = self._writer_conn.execute(
+            "SELECT size FROM translations WHERE key = ?", (key,)
+        ).fetchone()
+        self._writer_conn.execute(
+            "INSERT OR REPLACE INTO translations (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            (key, value, size, now, now)
+        )
+        self._total_bytes += size - (previous[0] if previous else 0)
+
+    def _evict(self) -> None:
+        """
+        Delete least recently accessed entries until the cache fits in max_bytes. Runs on the writer thread.
+        """
+        while self._total_bytes > self.max_bytes:
+            rows = self._writer_conn.execute(
+                "SELECT key, size FROM translations ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            freed = 0
+            removed = []
+            for key, size in rows:
+                removed.append((key,))
+                freed += size
+                if self._total_bytes - freed <= self.max_bytes:
+                    break
+            self._writer_conn.executemany("DELETE FROM translations WHERE key = ?", removed)
+            self._writer_conn.commit()
+            self._total_bytes -= freed
+            with self._stats_lock:
+                self.evictions += len(removed)
+
+    def flush(self) -> None:
+        """
+        Block until every queued write has been applied.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Flush pending writes, stop the writer thread and close the database.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join(timeout=10.0)
+        self._writer_conn.close()
+        with self._reader_lock:
+            self._reader_conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get disk cache counters.
+
+        Returns:
+            Dict[str, Any]: Hit, miss, eviction and dropped-write counts plus size information.
+        """
+        with self._reader_lock:
+            entries = self._reader_conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        with self._stats_lock:
+            return {
+                "path": self.path,
+                "entries": entries,
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "dropped_writes": self.dropped_writes,
+                "pending_writes": self._queue.qsize(),
+            }
+
+
+_disk_cache: Optional[DiskTranslationCache] = None
+_disk_cache_initialized = False
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_translation_cache() -> Optional[DiskTranslationCache]:
+    """
+    Get the process-wide disk cache, creating it from configuration on first use.
+
+    Returns:
+        Optional[DiskTranslationCache]: Shared disk cache, or None if it is disabled.
+    """
+    global _disk_cache, _disk_cache_initialized
+    if not _disk_cache_initialized:
+        with _disk_cache_lock:
+            if not _disk_cache_initialized:
+                config = get_config()
+                if config.get("TRANSLATION_DISK_CACHE_ENABLED", False):
+                    _disk_cache = DiskTranslationCache(
+                        path=config.get("TRANSLATION_DISK_CACHE_PATH", ".cache/translations.sqlite3"),
+                        max_bytes=config.get("TRANSLATION_DISK_CACHE_MAX_MB", 256) * 1024 * 1024,
+                        ttl_seconds=config.get("TRANSLATION_DISK_CACHE_TTL_SECONDS", 604800.0),
+                    )
+                    logger.info(f"Translation disk cache opened at {_disk_cache.path}")
+                _disk_cache_initialized = True
+    return _disk_cache
+
+
+def reset_disk_translation_cache() -> None:
+    """
+    Close the process-wide disk cache so the next call reopens it from configuration.
+    Called on application shutdown to flush pending writes.
+    """
+    global _disk_cache, _disk_cache_initialized
+    with _disk_cache_lock:
+        if _disk_cache is not None:
+            _disk_cache.close()
+        _disk_cache = None
+        _disk_cache_initialized = False
@@ -0,0 +1,431 @@
+"""
+Fuzzy translation memory module.
+Finds previously translated texts that are near-duplicates of a new text using a MinHash/LSH index
+over character n-grams, and reuses or adapts their translations.
+"""
+import re
+import string
+import threading
+import zlib
+from collections import deque
+from typing import Deque, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from llm_translate.core.translation_cache import normalize_lang
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.fuzzy_memory")
+
+_WHITESPACE = re.compile(r"\s+")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+_PUNCTUATION = str.maketrans("", "", string.punctuation + "¡¿«»“”‘’…。、！？")
+
+# Maximum number of LSH candidates verified per lookup
+_MAX_CANDIDATES = 8
+
+
+def normalize_for_matching(text: str) -> str:
+    """
+    Normalize text for near-duplicate matching.
+
+    Args:
+        text (str): Text to normalize.
+
+    Returns:
+        str: Case-folded text with punctuation removed and whitespace collapsed.
+    """
+    return _WHITESPACE.sub(" ", text.casefold().translate(_PUNCTUATION)).strip()
+
+
+def mask_numbers(text: str) -> str:
+    """
+    Replace every number in a text with a placeholder.
+
+    Args:
+        text (str): Text to mask.
+
+    Returns:
+        str: Text with numbers replaced by "#".
+    """
+    return _NUMBER.sub("#", text)
+
+
+class FuzzyMatch(NamedTuple):
+    """A previously translated text that is similar to a lookup."""
+    source: str
+    translation: str
+    similarity: float
+
+
+class NGramIndex:
+    """
+    Locality-sensitive index of translated texts.
+
+    Each text is reduced to a MinHash signature over its character n-grams using one-permutation
+    hashing, and the signature is split into bands that are used as hash-table keys. A lookup only
+    compares the few entries that share the most bands with it, so its cost does not grow with the
+    number of indexed texts. Candidates are verified with the exact n-gram Jaccard similarity.
+    Entries are partitioned (e.g. per provider, model and language pair) and evicted oldest-first.
+    """
+
+    def __init__(self, num_hashes: int = 64, bands: int = 16, ngram: int = 3, max_entries: int = 100000):
+        """
+        Initialize the index.
+
+        Args:
+            num_hashes (int, optional): Signature length. Defaults to 64.
+            bands (int, optional): Number of LSH bands; must divide num_hashes. Defaults to 16.
+            ngram (int, optional): Character n-gram size. Defaults to 3.
+            max_entries (int, optional): Maximum number of indexed texts. Defaults to 100000.
+        """
+        if num_hashes % bands:
+            raise ValueError("bands must divide num_hashes")
+        self.num_hashes = num_hashes
+        self.bands = bands
+        self.rows = num_hashes // bands
+        self.ngram = ngram
+        self.max_entries = max_entries
+        # Buckets are insertion-ordered dicts used as sets, so entries are removed in O(1)
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], Dict[int, None]] = {}
+        # entry id -> (partition, normalized source, source, translation, band keys)
+        self._entries: Dict[int, Tuple[str, str, str, str, List[Tuple[str, int, Tuple[int, ...]]]]] = {}
+        self._exact: Dict[Tuple[str, str], int] = {}
+        self._order: Deque[int] = deque()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _shingles(self, normalized: str) -> FrozenSet[str]:
+        """
+        Get the character n-grams of a normalized text.
+
+        Args:
+            normalized (str): Normalized text.
+
+        Returns:
+            FrozenSet[str]: Set of n-grams; short texts yield themselves.
+        """
+        n = self.ngram
+        if len(normalized) <= n:
+            return frozenset((normalized,))
+        return frozenset(normalized[i:i + n] for i in range(len(normalized) - n + 1))
+
+    def signature(self, shingles: FrozenSet[str]) -> List[int]:
+        """
+        Compute a one-permutation MinHash signature.
+
+        Args:
+            shingles (FrozenSet[str]): N-grams of the text.
+
+        Returns:
+            List[int]: Signature with num_hashes values.
+        """
+        k = self.num_hashes
+        empty = 1 << 32
+        sig = [empty] * k
+        for shingle in shingles:
+            h = (zlib.crc32(shingle.encode("utf-8")) * 2654435761) & 0xFFFFFFFF
+            b = h % k
+            v = h // k
+            if v < sig[b]:
+                sig[b] = v
+        # Densify: empty bins borrow the value of the next non-empty bin
+        if empty in sig:
+            filled = [i for i, v in enumerate(sig) if v != empty]
+            if filled:
+                for i in range(k):
+                    if sig[i] == empty:
+                        j = next((f for f in filled if f > i), filled[0])
+                        sig[i] = sig[j] + ((j - i) % k) * empty
+        return sig
+
+    def _band_keys(self, partition: str, sig: List[int]) -> List[Tuple[str, int, Tuple[int, ...]]]:
+        """
+        Split a signature into band keys.
+
+        Args:
+            partition (str): Partition name.
+            sig (List[int]): MinHash signature.
+
+        Returns:
+            List[Tuple[str, int, Tuple[int, ...]]]: One key per band.
+        """
+        rows = self.rows
+        return [(partition, band, tuple(sig[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def add(self, partition: str, source: str, translation: str) -> None:
+        """
+        Index a translated text.
+
+        Args:
+            partition (str): Partition name, e.g. provider, model and language pair.
+            source (str): Source text.
+            translation (str): Its translation.
+        """
+        normalized = normalize_for_matching(source)
+        if not normalized:
+            return
+        keys = self._band_keys(partition, self.signature(self._shingles(normalized)))
+        with self._lock:
+            existing = self._exact.get((partition, source))
+            if existing is not None:
+                self._remove(existing)
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (partition, normalized, source, translation, keys)
+            self._exact[(partition, source)] = entry_id
+            self._order.append(entry_id)
+            for key in keys:
+                self._buckets.setdefault(key, {})[entry_id] = None
+            while len(self._entries) > self.max_entries:
+                self._remove(self._order.popleft())
+            # Drop ids of replaced entries once they dominate the eviction queue
+            if len(self._order) > 2 * len(self._entries) + 1024:
+                self._order = deque(entry_id for entry_id in self._order if entry_id in self._entries)
+
+    def _remove(self, entry_id: int) -> None:
+        """
+        Remove an entry. Must be called with the lock held; stale ids left in the
+        eviction queue are skipped when they reach its head.
+
+        Args:
+            entry_id (int): Entry to remove.
+        """
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        partition, _, source, _, keys = entry
+        if self._exact.get((partition, source)) == entry_id:
+            del self._exact[(partition, source)]
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.pop(entry_id, None)
+                if not bucket:
+                    del self._buckets[key]
+
+    def query(self, partition: str, text: str, threshold: float) -> Optional[FuzzyMatch]:
+        """
+        Find the most similar indexed text.
+
+        Args:
+            partition (str): Partition to search.
+            text (str): Text to look up.
+            threshold (float): Minimum n-gram Jaccard similarity in [0, 1].
+
+        Returns:
+            Optional[FuzzyMatch]: Best match at or above the threshold, or None.
+        """
+        normalized = normalize_for_matching(text)
+        if not normalized:
+            return None
+        shingles = self._shingles(normalized)
+        keys = self._band_keys(partition, self.signature(shingles))
+        with self._lock:
+            # Rank candidates by the number of bands they share with the lookup
+            shared: Dict[int, int] = {}
+            for key in keys:
+                for entry_id in self._buckets.get(key, ()):
+                    shared[entry_id] = shared.get(entry_id, 0) + 1
+            candidates = sorted(shared, key=shared.__getitem__, reverse=True)[:_MAX_CANDIDATES]
+            entries = [self._entries[entry_id] for entry_id in candidates]
+
+        best: Optional[FuzzyMatch] = None
+        for _, candidate_normalized, source, translation, _ in entries:
+            other = self._shingles(candidate_normalized)
+            similarity = len(shingles & other) / len(shingles | other)
+            if similarity >= threshold and (best is None or similarity > best.similarity):
+                best = FuzzyMatch(source=source, translation=translation, similarity=similarity)
+        return best
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._buckets.clear()
+            self._entries.clear()
+            self._exact.clear()
+            self._order.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def adapt_match(match: FuzzyMatch, text: str) -> Optional[str]:
+    """
+    Reuse a match's translation directly when the texts differ only in leading and trailing whitespace
+    or numbers. Differences in case, punctuation or the whitespace between words (a line break, an
+    indent) can change the translation or its layout, so those matches are left to the model.
+
+    Numbers are substituted in the stored translation when each source number appears there
+    in the same order; otherwise the match cannot be reused verbatim.
+
+    Args:
+        match (FuzzyMatch): Near-duplicate found in the index.
+        text (str): Text being translated.
+
+    Returns:
+        Optional[str]: Translation for text, or None if the match needs to be adapted by the model.
+    """
+    old_text = match.source.strip()
+    new_text = text.strip()
+    if mask_numbers(old_text) != mask_numbers(new_text):
+        return None
+
+    old_numbers = _NUMBER.findall(old_text)
+    new_numbers = _NUMBER.findall(new_text)
+    if old_numbers == new_numbers:
+        return match.translation
+    if _NUMBER.findall(match.translation) != old_numbers:
+        return None
+    replacements = iter(new_numbers)
+    return _NUMBER.sub(lambda _: next(replacements), match.translation)
+
+
+class FuzzyMatchTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that reuses translations of near-duplicate texts.
+
+    Matches that differ only in surrounding whitespace or numbers are answered locally;
+    other matches above the threshold are sent to the model as a reference translation to edit.
+    """
+
+    def __init__(self, translator: BaseTranslator, index: NGramIndex, threshold: float = 0.8,
+                 max_chars: int = 2000):
+        """
+        Initialize the fuzzy match translator.
+
+        Args:
+            translator (BaseTranslator): Translator to delegate to.
+            index (NGramIndex): Index shared across requests.
+            threshold (float, optional): Minimum n-gram Jaccard similarity for a match. Defaults to 0.8.
+            max_chars (int, optional): Longer texts are neither looked up nor indexed. Defaults to 2000.
+        """
+        super().__init__(translator)
+        self.index = index
+        self.threshold = threshold
+        self.max_chars = max_chars
+        self.reused = 0
+        self.referenced = 0
+
+    def partition(self, from_lang: str, to_lang: str) -> str:
+        """
+        Get the index partition for a language pair on the wrapped translator.
+
+        Args:
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            str: Partition name.
+        """
+        return f"{self.provider}|{self.model}|{normalize_lang(from_lang)}|{normalize_lang(to_lang)}"
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text, reusing or adapting the translation of a near-duplicate if one exists.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If the wrapped translator fails.
+        """
+        if len(text) > self.max_chars or normalize_lang(from_lang) == normalize_lang(to_lang):
+            return await self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
+
+        partition = self.partition(from_lang, to_lang)
+        match = self.index.query(partition, text, self.threshold)
+        if match is not None:
+            reused = adapt_match(match, text)
+            if reused is not None:
+                self.reused += 1
+                self.logger.debug(f"Fuzzy match reused (similarity {match.similarity:.2f}): {from_lang} → {to_lang}")
+                return reused
+            self.referenced += 1
+            self.logger.debug(f"Fuzzy match used as reference (similarity {match.similarity:.2f}): {from_lang} → {to_lang}")
+            translated_text = await self.translator.translate_with_reference(
+                text, from_lang, to_lang, match.source, match.translation
+            )
+        else:
+            translated_text = await self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
+
+        self.index.add(partition, text, translated_text)
+        return translated_text
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Translate several texts, answering near-duplicates that can be reused locally and
+        sending the rest to the wrapped translator in one batch.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+
+        Raises:
+            TranslationError: If the wrapped translator fails.
+        """
+        if normalize_lang(from_lang) == normalize_lang(to_lang):
+            return await self.translator.translate_batch(texts, from_lang, to_lang)
+
+        partition = self.partition(from_lang, to_lang)
+        results: List[Optional[str]] = [None] * len(texts)
+        pending: List[int] = []
+        for index, text in enumerate(texts):
+            match = self.index.query(partition, text, self.threshold) if len(text) <= self.max_chars else None
+            reused = adapt_match(match, text) if match is not None else None
+            if reused is not None:
+                self.reused += 1
+                results[index] = reused
+            else:
+                pending.append(index)
+
+        if pending:
+            translations = await self.translator.translate_batch([texts[index] for index in pending], from_lang, to_lang)
+            for index, translated_text in zip(pending, translations):
+                results[index] = translated_text
+                if len(texts[index]) <= self.max_chars:
+                    self.index.add(partition, texts[index], translated_text)
+        return results
+
+
+_fuzzy_index: Optional[NGramIndex] = None
+_fuzzy_index_lock = threading.Lock()
+
+
+def get_fuzzy_index() -> NGramIndex:
+    """
+    Get the process-wide fuzzy match index, creating it from configuration on first use.
+
+    Returns:
+        NGramIndex: Shared index.
+    """
+    global _fuzzy_index
+    if _fuzzy_index is None:
+        with _fuzzy_index_lock:
+            if _fuzzy_index is None:
+                config = get_config()
+                _fuzzy_index = NGramIndex(max_entries=config.get("FUZZY_MATCH_MAX_ENTRIES", 100000))
+                logger.info(f"Fuzzy match index initialized (max_entries={_fuzzy_index.max_entries})")
+    return _fuzzy_index
+
+
+def reset_fuzzy_index() -> None:
+    """
+    Drop the process-wide fuzzy match index so the next call rebuilds it from configuration.
+    """
+    global _fuzzy_index
+    with _fuzzy_index_lock:
+        _fuzzy_index = None
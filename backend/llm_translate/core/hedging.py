@@ -0,0 +1,369 @@
+"""
+Request hedging module.
+Sends a slow request to a secondary provider as well, once the primary has taken longer than its
+usual latency, and keeps whichever answer arrives first.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from llm_translate.core.providers import provider_key
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.hedging")
+
+
+class LatencyWindow:
+    """Latencies of the most recent calls to one provider."""
+
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        """
+        Initialize the window.
+
+        Args:
+            size (int, optional): Number of recent latencies kept. Defaults to 200.
+            min_samples (int, optional): Samples needed before quantiles are reported. Defaults to 20.
+        """
+        self._samples: Deque[float] = deque(maxlen=size)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a call's latency.
+
+        Args:
+            seconds (float): Latency in seconds.
+        """
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Get a latency quantile.
+
+        Args:
+            q (float): Quantile between 0 and 1.
+
+        Returns:
+            Optional[float]: Latency in seconds, or None while there are too few samples.
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class HedgeController:
+    """
+    Decides when to hedge and limits how often.
+
+    The hedge delay for a provider is its observed latency quantile (p90 by default), never below
+    min_delay_ms, and initial_delay_ms until enough calls have been seen. Each request earns
+    budget_percent / 100 of a hedge, up to a burst of max_burst, so hedges add at most that share
+    of extra provider calls.
+    """
+
+    def __init__(self, quantile: float = 0.9, min_delay_ms: float = 50.0, initial_delay_ms: float = 1000.0,
+                 budget_percent: float = 10.0, max_burst: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the hedge controller.
+
+        Args:
+            quantile (float, optional): Primary latency quantile after which to hedge. Defaults to 0.9.
+            min_delay_ms (float, optional): Shortest hedge delay. Defaults to 50.
+            initial_delay_ms (float, optional): Hedge delay until enough latencies are known. Defaults to 1000.
+            budget_percent (float, optional): Hedges allowed per 100 requests. Defaults to 10.
+            max_burst (float, optional): Most hedges that can be saved up. Defaults to 10.
+            clock (Callable[[], float], optional): Monotonic clock, overridable for tests. Defaults to time.monotonic.
+        """
+        self.quantile = quantile
+        self.min_delay = min_delay_ms / 1000.0
+        self.initial_delay = initial_delay_ms / 1000.0
+        self.budget_ratio = budget_percent / 100.0
+        self.max_burst = max_burst
+        self.clock = clock
+        self._windows: Dict[str, LatencyWindow] = {}
+        self._tokens = max_burst
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+
+    def window(self, provider: str) -> LatencyWindow:
+        """
+        Get a provider's latency window.
+
+        Args:
+            provider (str): Provider key.
+
+        Returns:
+            LatencyWindow: The provider's recent latencies.
+        """
+        window = self._windows.get(provider)
+        if window is None:
+            window = self._windows[provider] = LatencyWindow()
+        return window
+
+    def delay(self, provider: str) -> float:
+        """
+        Time to wait for a provider before hedging.
+
+        Args:
+            provider (str): Provider key of the primary.
+
+        Returns:
+            float: Seconds.
+        """
+        observed = self.window(provider).quantile(self.quantile)
+        if observed is None:
+            return self.initial_delay
+        return max(self.min_delay, observed)
+
+    def admit(self) -> None:
+        """Count a request and earn its share of the hedge budget."""
+        self.requests += 1
+        self._tokens = min(self.max_burst, self._tokens + self.budget_ratio)
+
+    def try_hedge(self) -> bool:
+        """
+        Spend one hedge from the budget.
+
+        Returns:
+            bool: True if a hedge may be sent.
+        """
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self.hedges += 1
+            return True
+        self.budget_denied += 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging counters.
+
+        Returns:
+            Dict[str, Any]: Requests, hedges sent, hedges that won, hedges denied by the budget and
+            the current hedge delay per provider in milliseconds.
+        """
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_denied": self.budget_denied,
+            "budget_percent": self.budget_ratio * 100.0,
+            "delay_ms": {provider: self.delay(provider) * 1000.0 for provider in self._windows},
+        }
+
+
+class HedgedTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that hedges slow requests to a secondary provider.
+
+    The request goes to the primary first. If it has not answered within the controller's delay and
+    the hedge budget allows, the same request is also sent to the secondary; the first successful
+    answer wins and the other call is cancelled. Errors from the primary before the delay are raised
+    as they are. Streams are not hedged.
+    """
+
+    def __init__(self, primary: BaseTranslator, secondary: BaseTranslator, controller: HedgeController):
+        """
+        Initialize the hedged translator.
+
+        Args:
+            primary (BaseTranslator): Provider translator tried first.
+            secondary (BaseTranslator): Provider translator used for hedges.
+            controller (HedgeController): Hedge delay and budget shared across requests.
+        """
+        super().__init__(primary)
+        self.secondary = secondary
+        self.controller = controller
+
+    def _timed(self, translator: BaseTranslator, call: Callable[[BaseTranslator], Awaitable[Any]]) -> "asyncio.Task[Any]":
+        """
+        Start a call and record its latency if it succeeds.
+
+        Cancelled and failed calls are not recorded, since the time until a hedge cancels a call or an
+        error cuts it short would pull the percentile, and with it the hedge delay, down.
+
+        Args:
+            translator (BaseTranslator): Provider translator to call.
+            call (Callable[[BaseTranslator], Awaitable[Any]]): The request to make.
+
+        Returns:
+            asyncio.Task: Running call.
+        """
+        window = self.controller.window(provider_key(translator))
+        start = self.controller.clock()
+        task = asyncio.ensure_future(call(translator))
+
+        def record(task: "asyncio.Task[Any]") -> None:
+            if not task.cancelled() and task.exception() is None:
+                window.record(self.controller.clock() - start)
+
+        task.add_done_callback(record)
+        return task
+
+    async def _hedge(self, call: Callable[[BaseTranslator], Awaitable[Any]]) -> Any:
+        """
+        Make a request against the primary, hedging it to the secondary when it is slow.
+
+        Args:
+            call (Callable[[BaseTranslator], Awaitable[Any]]): The request to make against a translator.
+
+        Returns:
+            Any: The first successful result.
+
+        Raises:
+            TranslationError: If the primary fails before the hedge delay, or both calls fail.
+        """
+        self.controller.admit()
+        primary = self._timed(self.translator, call)
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.controller.delay(provider_key(self.translator)))
+            if done or not self.controller.try_hedge():
+                return await primary
+
+            self.logger.debug(f"Hedging slow request from {provider_key(self.translator)} to {provider_key(self.secondary)}")
+            secondary = self._timed(self.secondary, call)
+            tasks.append(secondary)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is secondary:
+                            self.controller.hedge_wins += 1
+                        return task.result()
+            # Both failed; report the primary's error
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text, hedging to the secondary provider when the primary is slow.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If translation fails.
+        """
+        return await self._hedge(lambda translator: translator.translate(text=text, from_lang=from_lang, to_lang=to_lang))
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Translate a batch, hedging to the secondary provider when the primary is slow.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+        """
+        return await self._hedge(lambda translator: translator.translate_batch(texts, from_lang, to_lang))
+
+    async def translate_with_context(self, text: str, from_lang: str, to_lang: str, context: str) -> str:
+        """
+        Translate a passage with preceding context, hedging to the secondary provider when the primary is slow.
+
+        Args:
+            text (str): Passage to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            context (str): Source text immediately before the passage.
+
+        Returns:
+            str: Translated passage.
+        """
+        return await self._hedge(lambda translator: translator.translate_with_context(text, from_lang, to_lang, context))
+
+    async def translate_with_reference(self, text: str, from_lang: str, to_lang: str,
+                                       reference_source: str, reference_translation: str) -> str:
+        """
+        Translate with a reference translation, hedging to the secondary provider when the primary is slow.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            reference_source (str): Previously translated similar text.
+            reference_translation (str): Its translation.
+
+        Returns:
+            str: Translated text.
+        """
+        return await self._hedge(lambda translator: translator.translate_with_reference(
+            text, from_lang, to_lang, reference_source, reference_translation
+        ))
+
+    async def detect_and_translate(self, text: str, to_lang: str) -> Optional[Tuple[str, str]]:
+        """
+        Detect and translate in one call, hedging to the secondary provider when the primary is slow.
+
+        Args:
+            text (str): Text to translate.
+            to_lang (str): Target language.
+
+        Returns:
+            Optional[Tuple[str, str]]: Detected language and translated text, or None if unavailable.
+        """
+        return await self._hedge(lambda translator: translator.detect_and_translate(text, to_lang))
+
+
+_hedge_controller: Optional[HedgeController] = None
+_hedge_controller_lock = threading.Lock()
+
+
+def get_hedge_controller() -> HedgeController:
+    """
+    Get the process-wide hedge controller, creating it from configuration on first use.
+
+    Returns:
+        HedgeController: Shared hedge controller.
+    """
+    global _hedge_controller
+    if _hedge_controller is None:
+        with _hedge_controller_lock:
+            if _hedge_controller is None:
+                config = get_config()
+                _hedge_controller = HedgeController(
+                    quantile=config.get("HEDGE_QUANTILE", 0.9),
+                    min_delay_ms=config.get("HEDGE_MIN_DELAY_MS", 50.0),
+                    initial_delay_ms=config.get("HEDGE_INITIAL_DELAY_MS", 1000.0),
+                    budget_percent=config.get("HEDGE_BUDGET_PERCENT", 10.0),
+                )
+                logger.info(
+                    f"Hedge controller initialized (quantile={_hedge_controller.quantile}, "
+                    f"budget_percent={config.get('HEDGE_BUDGET_PERCENT', 10.0)})"
+                )
+    return _hedge_controller
+
+
+def reset_hedge_controller() -> None:
+    """
+    Drop the process-wide hedge controller so the next call rebuilds it from configuration.
+    """
+    global _hedge_controller
+    with _hedge_controller_lock:
+        _hedge_controller = None
@@ -0,0 +1,508 @@
+"""
+Instrumentation module.
+Records request and provider metrics for the /metrics endpoint: latency histograms, in-flight
+gauges, error counts and the characters and tokens sent to and returned by providers. Also traces
+each request with spans for its handler, provider calls and response serialization, and reports
+where each request's time went in a Server-Timing header.
+"""
+import functools
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from llm_translate.core.admission import get_admission_controller
+from llm_translate.core.circuit_breaker import get_circuit_breakers
+from llm_translate.core.rate_limiter import get_rate_limiters
+from llm_translate.core.retry import get_retry_policy
+from llm_translate.core.translation_cache import normalize_lang
+from llm_translate.services.base_speaker import BaseSpeaker, SpeakerWrapper
+from llm_translate.services.base_translator import BaseTranslator, BatchPackingTranslator, call_texts
+from llm_translate.utils.config import get_config
+from llm_translate.utils.exceptions import ErrorType, TranslationError
+from llm_translate.utils.metrics import (
+    ENDPOINTS, INPUT_CHARACTERS, INPUT_TOKENS, OUTPUT_CHARACTERS, OUTPUT_TOKENS, PROVIDER_ERRORS, PROVIDER_IN_FLIGHT,
+    PROVIDER_SECONDS, REGISTRY, REQUEST_SECONDS, REQUESTS_IN_FLIGHT, record_timing, render_family, request_timings,
+    timed_request
+)
+from llm_translate.utils.tokens import estimate_tokens
+from llm_translate.utils.tracing import SPAN_KIND_CLIENT, Span, get_tracer, span, start_span, use_span
+
+
+# Label value for requests that never reached a provider, e.g. validation errors
+NONE_LABEL = "none"
+
+# Provider operations with a latency series each
+OPERATIONS = ("translate", "translate_batch", "translate_with_context", "translate_with_reference",
+              "detect_and_translate", "translate_stream", "detect_language", "speak")
+
+# Operation names of the translator calls whose method name differs; a packed request is part of a batch
+CALL_OPERATIONS = {"_complete": "translate_batch", "_detect_language": "detect_language"}
+
+# Circuit breaker states as gauge values
+BREAKER_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+class ProviderInstruments:
+    """Metric children of one provider and model, created once and shared by all its calls."""
+
+    __slots__ = ("provider", "model", "seconds", "in_flight", "input_characters", "output_characters",
+                 "input_tokens", "output_tokens")
+
+    def __init__(self, provider: str, model: str):
+        """
+        Create the children of a provider and model.
+
+        Args:
+            provider (str): Provider name.
+            model (str): Model name.
+        """
+        self.provider = provider
+        self.model = model
+        self.seconds = {operation: PROVIDER_SECONDS.labels(provider, model, operation) for operation in OPERATIONS}
+        self.in_flight = PROVIDER_IN_FLIGHT.labels(provider, model)
+        self.input_characters = INPUT_CHARACTERS.labels(provider, model)
+        self.output_characters = OUTPUT_CHARACTERS.labels(provider, model)
+        self.input_tokens = INPUT_TOKENS.labels(provider, model)
+        self.output_tokens = OUTPUT_TOKENS.labels(provider, model)
+
+    def record_input(self, text: str) -> None:
+        """
+        Count a text sent to the provider.
+
+        Args:
+            text (str): Text sent.
+        """
+        self.input_characters.inc(len(text))
+        self.input_tokens.inc(estimate_tokens(text))
+
+    def record_output(self, text: str) -> None:
+        """
+        Count a text returned by the provider.
+
+        Args:
+            text (str): Text returned.
+        """
+        self.output_characters.inc(len(text))
+        self.output_tokens.inc(estimate_tokens(text))
+
+    def record_error(self, e: BaseException) -> None:
+        """
+        Count a failed call by its error type.
+
+        Args:
+            e (BaseException): The call's exception.
+        """
+        error_type = e.error_type.value if isinstance(e, TranslationError) else ErrorType.UNKNOWN.value
+        PROVIDER_ERRORS.labels(self.provider, self.model, error_type).inc()
+
+
+_instruments: Dict[Tuple[str, str], ProviderInstruments] = {}
+
+
+def provider_instruments(provider: str, model: Optional[str]) -> ProviderInstruments:
+    """
+    Get the shared metric children of a provider and model.
+
+    Args:
+        provider (str): Provider name.
+        model (Optional[str]): Model name.
+
+    Returns:
+        ProviderInstruments: Children created on the first call for the provider and model.
+    """
+    key = (provider, str(model))
+    instruments = _instruments.get(key)
+    if instruments is None:
+        instruments = _instruments.setdefault(key, ProviderInstruments(*key))
+    return instruments
+
+
+class InstrumentedTranslator(BatchPackingTranslator):
+    """Translator wrapper that records the round-trip time, errors and volume of every provider call."""
+
+    def __init__(self, translator: BaseTranslator):
+        """
+        Initialize the instrumented translator.
+
+        Args:
+            translator (BaseTranslator): Provider translator.
+        """
+        super().__init__(translator)
+        self.instruments = provider_instruments(self.provider, translator.model)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a provider call and record its duration and volume, or its error.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+        """
+        operation = CALL_OPERATIONS.get(method, method)
+        instruments = self.instruments
+        instruments.record_input("".join(call_texts(method, args)))
+        instruments.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            with span(operation, SPAN_KIND_CLIENT, provider=self.provider, model=instruments.model):
+                result = await super()._call(method, *args)
+        except Exception as e:
+            instruments.record_error(e)
+            raise
+        finally:
+            instruments.in_flight.dec()
+            # Language detection is reported as its own phase by detect_language()
+            if operation != "detect_language":
+                record_timing("provider", time.perf_counter() - started)
+        instruments.seconds[operation].observe(time.perf_counter() - started)
+        if isinstance(result, tuple):
+            instruments.record_output(result[1])
+        elif operation != "detect_language" and result is not None:
+            instruments.record_output(result)
+        return result
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation, recording the time until the stream ends and the streamed volume.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        instruments = self.instruments
+        instruments.record_input(text)
+        instruments.in_flight.inc()
+        # Not made current: the context of a generator does not carry over between pieces
+        stream_span = start_span("translate_stream", SPAN_KIND_CLIENT, provider=self.provider, model=instruments.model)
+        started = time.perf_counter()
+        characters = 0
+        try:
+            async for piece in self.translator.translate_stream(text, from_lang, to_lang, usage):
+                characters += len(piece)
+                yield piece
+        except Exception as e:
+            instruments.record_error(e)
+            if stream_span is not None:
+                stream_span.record_error(e)
+            raise
+        finally:
+            instruments.in_flight.dec()
+            record_timing("provider", time.perf_counter() - started)
+            instruments.output_characters.inc(characters)
+            if stream_span is not None:
+                stream_span.set_attribute("output_characters", characters)
+                stream_span.end()
+        instruments.output_tokens.inc((usage or {}).get("completion_tokens") or -(-characters // 4))
+        instruments.seconds["translate_stream"].observe(time.perf_counter() - started)
+
+
+class InstrumentedSpeaker(SpeakerWrapper):
+    """Speaker wrapper that records the round-trip time, errors and input characters of every provider call."""
+
+    def __init__(self, speaker: BaseSpeaker):
+        """
+        Initialize the instrumented speaker.
+
+        Args:
+            speaker (BaseSpeaker): Provider speaker.
+        """
+        super().__init__(speaker)
+        self.instruments = provider_instruments(self.provider, speaker.model)
+
+    async def speak(self, text: str, lang: str, voice: Optional[str] = None,
+                    response_format: str = "mp3", instructions: Optional[str] = None) -> bytes:
+        """
+        Convert text to speech, recording the provider call including any audio conversion.
+
+        Args:
+            text (str): Text to convert to speech.
+            lang (str): Language of the text (e.g., "English", "Spanish").
+            voice (Optional[str], optional): Voice to use. Defaults to None.
+            response_format (str, optional): Format of the audio response. Defaults to "mp3".
+            instructions (Optional[str], optional): Additional instructions for the TTS service. Defaults to None.
+
+        Returns:
+            bytes: Audio content.
+        """
+        instruments = self.instruments
+        instruments.input_characters.inc(len(text))
+        instruments.in_flight.inc()
+        timings = request_timings()
+        transcoded = timings.transcode if timings is not None else 0.0
+        started = time.perf_counter()
+        try:
+            with span("speak", SPAN_KIND_CLIENT, provider=self.provider, model=instruments.model):
+                audio = await self.speaker.speak(
+                    text=text, lang=lang, voice=voice, response_format=response_format, instructions=instructions
+                )
+        except Exception as e:
+            instruments.record_error(e)
+            raise
+        finally:
+            instruments.in_flight.dec()
+            if timings is not None:
+                # Audio conversion within the call is reported as its own phase
+                timings.add("provider", time.perf_counter() - started - (timings.transcode - transcoded))
+        instruments.seconds["speak"].observe(time.perf_counter() - started)
+        return audio
+
+
+class RequestLabels:
+    """Provider, model and language pair of the request being served, filled in by its handler."""
+
+    __slots__ = ("provider", "model", "from_lang", "to_lang")
+
+    def __init__(self):
+        """Initialize labels for a request that has not reached a provider."""
+        self.provider = NONE_LABEL
+        self.model = NONE_LABEL
+        self.from_lang = NONE_LABEL
+        self.to_lang = NONE_LABEL
+
+
+_request_labels: ContextVar[Optional[RequestLabels]] = ContextVar("request_labels", default=None)
+
+
+def label_request(provider: Optional[str], model: Optional[str], from_lang: Optional[str] = None,
+                  to_lang: Optional[str] = None) -> None:
+    """
+    Set the labels the current request's latency is recorded under.
+
+    Args:
+        provider (Optional[str]): Provider serving the request.
+        model (Optional[str]): Model serving the request.
+        from_lang (Optional[str], optional): Source language. Defaults to None.
+        to_lang (Optional[str], optional): Target language(s). Defaults to None.
+    """
+    labels = _request_labels.get()
+    if labels is None:
+        return
+    labels.provider = provider or NONE_LABEL
+    labels.model = model or NONE_LABEL
+    labels.from_lang = normalize_lang(from_lang) or NONE_LABEL
+    labels.to_lang = normalize_lang(to_lang) or NONE_LABEL
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that records the latency and in-flight count of every request, including queue
+    wait and streaming the response body.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (Callable[..., Awaitable[None]]): Wrapped ASGI application.
+        """
+        self.app = app
+        self.in_flight = {endpoint: REQUESTS_IN_FLIGHT.labels(endpoint) for endpoint in ENDPOINTS + ("other",)}
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Awaitable[Any]],
+                       send: Callable[..., Awaitable[None]]) -> None:
+        """
+        Serve a request and record its metrics.
+
+        Args:
+            scope (Dict[str, Any]): ASGI connection scope.
+            receive (Callable[..., Awaitable[Any]]): ASGI receive channel.
+            send (Callable[..., Awaitable[None]]): ASGI send channel.
+        """
+        if scope["type"] != "http" or not get_config().get("METRICS_ENABLED", True):
+            await self.app(scope, receive, send)
+            return
+        endpoint = scope["path"] if scope["path"] in ENDPOINTS else "other"
+        labels = RequestLabels()
+        token = _request_labels.set(labels)
+        in_flight = self.in_flight[endpoint]
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            in_flight.dec()
+            _request_labels.reset(token)
+            REQUEST_SECONDS.labels(
+                endpoint, labels.provider, labels.model, labels.from_lang, labels.to_lang
+            ).observe(time.perf_counter() - started)
+
+
+def traced_handler(handler: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Record an endpoint function as a "handler" span, so the time FastAPI then spends serializing
+    its result shows up as the "serialize" span.
+
+    Args:
+        handler (Callable[..., Awaitable[Any]]): Async endpoint function.
+
+    Returns:
+        Callable[..., Awaitable[Any]]: Wrapped endpoint with the same signature.
+    """
+    @functools.wraps(handler)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with span("handler", handler=handler.__name__):
+            return await handler(*args, **kwargs)
+    return wrapper
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware that traces every request, continuing the caller's trace from its traceparent
+    header and returning the request's own traceparent so clients can correlate their spans.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (Callable[..., Awaitable[None]]): Wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Awaitable[Any]],
+                       send: Callable[..., Awaitable[None]]) -> None:
+        """
+        Serve a request within its root span.
+
+        Args:
+            scope (Dict[str, Any]): ASGI connection scope.
+            receive (Callable[..., Awaitable[Any]]): ASGI receive channel.
+            send (Callable[..., Awaitable[None]]): ASGI send channel.
+        """
+        root = None
+        if scope["type"] == "http" and get_config().get("TRACING_ENABLED", False):
+            traceparent = dict(scope["headers"]).get(b"traceparent", b"").decode("latin-1")
+            root = get_tracer().start_trace(
+                f"{scope['method']} {scope['path']}", traceparent, {"http.method": scope["method"], "http.target": scope["path"]}
+            )
+        if root is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_traced(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                root.set_attribute("http.status_code", message["status"])
+                _record_serialization(root)
+                message["headers"] = list(message.get("headers", [])) + [(b"traceparent", root.traceparent.encode())]
+            await send(message)
+
+        with use_span(root):
+            await self.app(scope, receive, send_traced)
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware that times the phases of every request and reports them in a Server-Timing header:
+    queue wait, cache lookup, language detection, provider call, post-processing and audio transcoding.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (Callable[..., Awaitable[None]]): Wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Awaitable[Any]],
+                       send: Callable[..., Awaitable[None]]) -> None:
+        """
+        Serve a request and add its timings to the response headers.
+
+        Args:
+            scope (Dict[str, Any]): ASGI connection scope.
+            receive (Callable[..., Awaitable[Any]]): ASGI receive channel.
+            send (Callable[..., Awaitable[None]]): ASGI send channel.
+        """
+        if scope["type"] != "http" or not get_config().get("SERVER_TIMING_ENABLED", True):
+            await self.app(scope, receive, send)
+            return
+
+        with timed_request() as timings:
+            async def send_timed(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", timings.header().encode())
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_timed)
+
+
+def _record_serialization(root: Span) -> None:
+    """
+    Record the time from the end of the request's handler span until its response starts as a "serialize" span.
+
+    Args:
+        root (Span): Root span of the request.
+    """
+    handler = next((s for s in reversed(root.trace.spans) if s.name == "handler" and s.parent_id == root.span_id), None)
+    if handler is None:
+        return
+    serialize = Span(root.trace, "serialize", root.span_id)
+    serialize.start_ns = handler.end_ns
+    serialize.end()
+
+
+def _component_metrics() -> str:
+    """
+    Render the admission, rate limiting, retry and circuit breaker counters at scrape time.
+
+    Returns:
+        str: Metric families in the text exposition format.
+    """
+    admission = get_admission_controller().stats()
+    bulkheads = [({"scope": scope, "name": name}, stats)
+                 for scope in ("endpoints", "providers") for name, stats in admission[scope].items()]
+    rate_limits = get_rate_limiters().stats()
+    retries = get_retry_policy().stats()
+    breakers = get_circuit_breakers().stats()
+    families = [
+        ("llm_translate_bulkhead_active", "Slots in use by endpoint or provider bulkhead.", "gauge",
+         [(labels, stats["active"]) for labels, stats in bulkheads]),
+        ("llm_translate_bulkhead_queue_depth", "Requests waiting for a bulkhead slot.", "gauge",
+         [(labels, stats["queue_depth"]) for labels, stats in bulkheads]),
+        ("llm_translate_bulkhead_shed_total", "Requests shed by a full bulkhead.", "counter",
+         [(labels, stats["shed"] + stats["timed_out"]) for labels, stats in bulkheads]),
+        ("llm_translate_rate_limit_waiting", "Requests waiting for provider quota.", "gauge",
+         [({"provider": provider}, stats["waiting"]) for provider, stats in rate_limits.items()]),
+        ("llm_translate_rate_limit_delayed_total", "Requests delayed for provider quota.", "counter",
+         [({"provider": provider}, stats["delayed"]) for provider, stats in rate_limits.items()]),
+        ("llm_translate_rate_limit_rejected_total", "Requests rejected for lack of provider quota.", "counter",
+         [({"provider": provider}, stats["rejected"]) for provider, stats in rate_limits.items()]),
+        ("llm_translate_rate_limit_throttled_total", "Rate limit responses received from the provider.", "counter",
+         [({"provider": provider}, stats["throttled"]) for provider, stats in rate_limits.items()]),
+        ("llm_translate_retries_total", "Provider calls retried by error type.", "counter",
+         [({"type": error_type}, count) for error_type, count in retries["retries_by_error"].items()]),
+        ("llm_translate_retries_exhausted_total", "Calls that failed after all attempts.", "counter",
+         [({}, retries["exhausted"])]),
+        ("llm_translate_retry_budget_denied_total", "Retries refused by the retry budget.", "counter",
+         [({}, retries["budget_denied"])]),
+        ("llm_translate_circuit_breaker_state", "Circuit state by provider and model (0 closed, 1 half open, 2 open).",
+         "gauge", [({"provider": key}, BREAKER_STATES.get(stats["state"], 0)) for key, stats in breakers.items()]),
+        ("llm_translate_circuit_breaker_rejected_total", "Calls rejected by an open circuit.", "counter",
+         [({"provider": key}, stats["rejected"]) for key, stats in breakers.items()]),
+    ]
+    return "".join(render_family(name, help_text, kind, samples) for name, help_text, kind, samples in families)
+
+
+def render_metrics() -> str:
+    """
+    Render all metrics for a scrape.
+
+    Returns:
+        str: Metrics in the Prometheus text exposition format.
+    """
+    return REGISTRY.render() + _component_metrics()
@@ -0,0 +1,500 @@
+"""
+Language detection module.
+Detects the source language of a text locally from its script, common words and character trigrams,
+falls back to the provider's LLM detection for short or ambiguous input, and caches results by text hash.
+"""
+import bisect
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from llm_translate.core.language_profiles import (
+    COMMON_WORDS,
+    DISTINCTIVE_CHARACTERS,
+    SAMPLE_TEXT,
+    SCRIPT_LANGUAGES,
+    SCRIPT_RANGES,
+)
+from llm_translate.core.translation_cache import CachedTranslator, TranslationCache, make_cache_key
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.metrics import DETECTION_SECONDS, record_timing
+from llm_translate.utils.tokens import estimate_tokens
+from llm_translate.utils.tracing import span
+
+
+# Set up logger
+logger = setup_logger("llm_translate.language_detection")
+
+# Detection time of texts answered without and with the provider
+_LOCAL_DETECTION_SECONDS = DETECTION_SECONDS.labels("local")
+_PROVIDER_DETECTION_SECONDS = DETECTION_SECONDS.labels("provider")
+
+# Words, allowing inner apostrophes (c'est, j'ai)
+_WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+
+
+def _trigrams(words: List[str]) -> Counter:
+    """
+    Count the character trigrams of words, padded with spaces to mark word boundaries.
+
+    Args:
+        words (List[str]): Lower-cased words.
+
+    Returns:
+        Counter: Trigram counts.
+    """
+    counts: Counter = Counter()
+    for word in words:
+        padded = f" {word} "
+        for index in range(len(padded) - 2):
+            counts[padded[index:index + 3]] += 1
+    return counts
+
+
+class LocalLanguageDetector:
+    """
+    Zero-network language detector for the supported languages.
+
+    Languages with their own script (Hebrew, Arabic, Hindi, Thai, Greek, Russian, Korean, Japanese,
+    Chinese) are identified by the dominant script. Latin-script languages are scored on the share of
+    common words, the cosine similarity of character trigrams with a reference profile, and distinctive
+    letters. Confidence is the best score's margin over the runner-up, reduced for very short input.
+    """
+
+    def __init__(self, max_chars: int = 1000):
+        """
+        Initialize the detector and build the trigram profiles.
+
+        Args:
+            max_chars (int, optional): Only this many leading characters are analysed. Defaults to 1000.
+        """
+        self.max_chars = max_chars
+        ranges = sorted((start, end, script) for script, spans in SCRIPT_RANGES.items() for start, end in spans)
+        self._range_starts = [start for start, _, _ in ranges]
+        self._ranges = ranges
+        self._languages = list(SAMPLE_TEXT)
+        self._word_index: Dict[str, List[str]] = {}
+        for language, words in COMMON_WORDS.items():
+            for word in words.split():
+                self._word_index.setdefault(word, []).append(language)
+        self._distinctive = {char: language for language, chars in DISTINCTIVE_CHARACTERS.items() for char in chars}
+
+        # Trigram -> [(language, weight)] over unit-length profiles, so scoring is one pass over the input
+        self._trigram_index: Dict[str, List[Tuple[str, float]]] = {}
+        for language in self._languages:
+            profile = _trigrams(_WORD.findall((SAMPLE_TEXT[language] + " " + COMMON_WORDS[language]).lower()))
+            norm = math.sqrt(sum(count * count for count in profile.values()))
+            for trigram, count in profile.items():
+                self._trigram_index.setdefault(trigram, []).append((language, count / norm))
+
+    def _script(self, char: str) -> Optional[str]:
+        """
+        Look up the script of a non-Latin letter.
+
+        Args:
+            char (str): Character.
+
+        Returns:
+            Optional[str]: Script name from SCRIPT_RANGES, or None.
+        """
+        code = ord(char)
+        position = bisect.bisect_right(self._range_starts, code) - 1
+        if position >= 0:
+            start, end, script = self._ranges[position]
+            if start <= code <= end:
+                return script
+        return None
+
+    def detect(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Detect the language of a text.
+
+        Args:
+            text (str): Text to analyse.
+
+        Returns:
+            Tuple[Optional[str], float]: Language name (None if there is nothing to go on) and confidence between 0 and 1.
+        """
+        text = text[:self.max_chars]
+        latin = 0
+        scripts: Counter = Counter()
+        for char in text:
+            if not char.isalpha():
+                continue
+            code = ord(char)
+            if code < 0x0250 or 0x1E00 <= code <= 0x1EFF:
+                latin += 1
+                continue
+            script = self._script(char)
+            if script is not None:
+                scripts[script] += 1
+        letters = latin + sum(scripts.values())
+        if not letters:
+            return None, 0.0
+
+        # Kana and Han are counted together; any Kana makes the text Japanese
+        kana = scripts.pop("Kana", 0)
+        han = scripts.pop("Han", 0)
+        candidates = dict(scripts)
+        if kana or han:
+            candidates["Kana" if kana else "Han"] = kana + han
+        script, count = max(candidates.items(), key=lambda item: item[1], default=(None, 0))
+        if script is not None and count >= latin:
+            confidence = count / letters
+            if script == "Han":
+                # A few Han characters alone may just as well be Japanese kanji
+                confidence *= min(1.0, han / 12)
+            return SCRIPT_LANGUAGES[script], confidence
+
+        language, confidence = self._detect_latin(text)
+        return language, confidence * latin / letters
+
+    def _detect_latin(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Score a Latin-script text against the Latin-script language profiles.
+
+        Args:
+            text (str): Text to analyse.
+
+        Returns:
+            Tuple[Optional[str], float]: Best language and its confidence.
+        """
+        lower = text.lower()
+        words = _WORD.findall(lower)
+        if not words:
+            return None, 0.0
+
+        scores = dict.fromkeys(self._languages, 0.0)
+        for word in words:
+            for language in self._word_index.get(word, ()):
+                scores[language] += 1.0 / len(words)
+
+        trigrams = _trigrams(words)
+        norm = math.sqrt(sum(count * count for count in trigrams.values()))
+        for trigram, count in trigrams.items():
+            for language, weight in self._trigram_index.get(trigram, ()):
+                scores[language] += count * weight / norm
+
+        distinctive: Counter = Counter(self._distinctive[char] for char in lower if char in self._distinctive)
+        for language, hits in distinctive.items():
+            scores[language] += 0.5 * min(1.0, hits / 2)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        (best, best_score), (_, second_score) = ranked[0], ranked[1]
+        if best_score <= 0:
+            return None, 0.0
+        margin = (best_score - second_score) / best_score
+        # A couple of words say little, however clear the margin
+        evidence = min(1.0, len(words) / 4)
+        return best, min(1.0, margin * 2) * evidence
+
+
+def detection_key(translator: BaseTranslator, text: str) -> str:
+    """
+    Build the detection cache key for a text.
+
+    Args:
+        translator (BaseTranslator): Provider translator that performs the detection.
+        text (str): Text to detect the language of.
+
+    Returns:
+        str: Detection cache key.
+    """
+    provider = getattr(translator, "provider", translator.__class__.__name__)
+    return "detect|" + make_cache_key(provider, str(translator.model), "", "", text)
+
+
+def known_language(translator: BaseTranslator, text: str, cache: TranslationCache,
+                   detector: Optional[LocalLanguageDetector] = None, min_confidence: float = 0.2) -> Optional[str]:
+    """
+    Detect the language of a text without calling the provider: from the cache, then the local detector.
+
+    Args:
+        translator (BaseTranslator): Provider translator the detection cache is keyed on.
+        text (str): Text to detect the language of.
+        cache (TranslationCache): Detection cache.
+        detector (Optional[LocalLanguageDetector], optional): Local detector. Defaults to None.
+        min_confidence (float, optional): Lowest local confidence accepted. Defaults to 0.2.
+
+    Returns:
+        Optional[str]: Detected language name, or None if the provider has to be asked.
+    """
+    key = detection_key(translator, text)
+    detected = cache.get(key)
+    if detected is not None:
+        logger.debug(f"Language detection cache hit: {detected}")
+        return detected
+
+    if detector is not None:
+        detected, confidence = detector.detect(text)
+        if detected is not None and confidence >= min_confidence:
+            logger.debug(f"Detected language locally: {detected} (confidence {confidence:.2f})")
+            cache.set(key, detected)
+            return detected
+        logger.debug(f"Local language detection inconclusive ({detected}, confidence {confidence:.2f})")
+    return None
+
+
+async def detect_language(translator: BaseTranslator, text: str, cache: Optional[TranslationCache] = None,
+                          detector: Optional[LocalLanguageDetector] = None, min_confidence: float = 0.2) -> str:
+    """
+    Detect the language of a text, reusing an earlier detection of the same text.
+
+    The local detector answers when it is confident enough; otherwise the provider's LLM detection is used.
+
+    Args:
+        translator (BaseTranslator): Provider translator used for LLM detection.
+        text (str): Text to detect the language of.
+        cache (Optional[TranslationCache], optional): Detection cache. Defaults to the process-wide cache.
+        detector (Optional[LocalLanguageDetector], optional): Local detector; None always uses the LLM. Defaults to None.
+        min_confidence (float, optional): Lowest local confidence accepted without the LLM. Defaults to 0.2.
+
+    Returns:
+        str: Detected language name.
+
+    Raises:
+        TranslationError: If LLM detection fails.
+    """
+    cache = cache if cache is not None else get_detection_cache()
+    with span("detect") as detect_span:
+        started = time.perf_counter()
+        detected = known_language(translator, text, cache, detector, min_confidence)
+        if detected is not None:
+            _LOCAL_DETECTION_SECONDS.observe(time.perf_counter() - started)
+            record_timing("detect", time.perf_counter() - started)
+            if detect_span is not None:
+                detect_span.set_attribute("method", "local")
+            return detected
+
+        try:
+            detected = await translator._detect_language(text)
+        except Exception as e:
+            raise translator._translation_error(e) from e
+        _PROVIDER_DETECTION_SECONDS.observe(time.perf_counter() - started)
+        record_timing("detect", time.perf_counter() - started)
+        if detect_span is not None:
+            detect_span.set_attribute("method", "provider")
+    cache.set(detection_key(translator, text), detected)
+    logger.info(f"Detected language: {detected}")
+    return detected
+
+
+class LanguageDetectingTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that resolves "Auto-detect" before the request reaches the other layers,
+    so caches, coalescing and micro-batching all see the actual source language.
+
+    When the language is neither cached nor confidently detected locally and fused detection is enabled,
+    a single translation is sent as one detect-and-translate completion instead of a detection call
+    followed by a translation call. The completion goes down the wrapped pipeline, so it is coalesced
+    and sent to the model tier of the text like a translation, and its result is stored in the
+    translation cache layer. Texts above the fused size limit take the two-call path, so long documents
+    still reach the chunking layer.
+    """
+
+    def __init__(self, translator: BaseTranslator, provider_translator: BaseTranslator,
+                 detector: Optional[LocalLanguageDetector] = None, min_confidence: float = 0.2,
+                 cache: Optional[TranslationCache] = None, fused: bool = False, fused_max_tokens: int = 1000,
+                 cached: Optional[CachedTranslator] = None):
+        """
+        Initialize the language detecting translator.
+
+        Args:
+            translator (BaseTranslator): Translator to delegate to.
+            provider_translator (BaseTranslator): Provider translator used for LLM detection.
+            detector (Optional[LocalLanguageDetector], optional): Local detector; None always uses the LLM. Defaults to None.
+            min_confidence (float, optional): Lowest local confidence accepted without the LLM. Defaults to 0.2.
+            cache (Optional[TranslationCache], optional): Detection cache. Defaults to the process-wide cache.
+            fused (bool, optional): Detect and translate single texts in one completion. Defaults to False.
+            fused_max_tokens (int, optional): Largest estimated token count translated in one fused completion.
+                Defaults to 1000.
+            cached (Optional[CachedTranslator], optional): Translation cache layer of the wrapped pipeline,
+                which stores fused results. Defaults to None.
+        """
+        super().__init__(translator)
+        self.provider_translator = provider_translator
+        self.detector = detector
+        self.min_confidence = min_confidence
+        self.cache = cache
+        self.fused = fused
+        self.fused_max_tokens = fused_max_tokens
+        self.cached = cached
+
+    def _cache(self) -> TranslationCache:
+        """
+        Get the detection cache.
+
+        Returns:
+            TranslationCache: Configured cache or the process-wide detection cache.
+        """
+        return self.cache if self.cache is not None else get_detection_cache()
+
+    async def detect_language(self, text: str) -> str:
+        """
+        Detect the language of a text.
+
+        Args:
+            text (str): Text to detect the language of.
+
+        Returns:
+            str: Detected language name.
+
+        Raises:
+            TranslationError: If detection fails.
+        """
+        return await detect_language(self.provider_translator, text, self._cache(), self.detector, self.min_confidence)
+
+    async def _resolve(self, text: str, from_lang: str) -> str:
+        """
+        Replace "Auto-detect" with the detected language.
+
+        Args:
+            text (str): Source text.
+            from_lang (str): Requested source language.
+
+        Returns:
+            str: Source language to translate from.
+        """
+        if from_lang.lower() == "auto-detect":
+            return await self.detect_language(text)
+        return from_lang
+
+    async def translate_and_detect(self, text: str, from_lang: str, to_lang: str) -> Tuple[str, Optional[str]]:
+        """
+        Translate text and report the source language detected for "Auto-detect" requests.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            Tuple[str, Optional[str]]: Translated text and the detected language, or None if from_lang was given.
+
+        Raises:
+            TranslationError: If detection or translation fails.
+        """
+        if from_lang.lower() != "auto-detect":
+            return await self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang), None
+
+        cache = self._cache()
+        detected = known_language(self.provider_translator, text, cache, self.detector, self.min_confidence)
+        if detected is None and self.fused and estimate_tokens(text) <= self.fused_max_tokens:
+            fused = await self.translator.detect_and_translate(text, to_lang)
+            if fused is not None:
+                detected, translated_text = fused
+                cache.set(detection_key(self.provider_translator, text), detected)
+                if self.cached is not None:
+                    self.cached.remember(text, detected, to_lang, translated_text)
+                return translated_text, detected
+        if detected is None:
+            detected = await self.detect_language(text)
+        return await self.translator.translate(text=text, from_lang=detected, to_lang=to_lang), detected
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text, detecting the source language first if needed.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If detection or translation fails.
+        """
+        translated_text, _ = await self.translate_and_detect(text, from_lang, to_lang)
+        return translated_text
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Translate a batch, detecting one source language for the whole batch first if needed.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+        """
+        if texts:
+            from_lang = await self._resolve("\n".join(texts), from_lang)
+        return await self.translator.translate_batch(texts, from_lang, to_lang)
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation, detecting the source language first if needed.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        from_lang = await self._resolve(text, from_lang)
+        async for piece in self.translator.translate_stream(text, from_lang, to_lang, usage):
+            yield piece
+
+
+_detection_cache: Optional[TranslationCache] = None
+_detection_cache_lock = threading.Lock()
+
+
+def get_detection_cache() -> TranslationCache:
+    """
+    Get the process-wide language detection cache, creating it from configuration on first use.
+
+    Returns:
+        TranslationCache: Shared detection cache.
+    """
+    global _detection_cache
+    if _detection_cache is None:
+        with _detection_cache_lock:
+            if _detection_cache is None:
+                config = get_config()
+                _detection_cache = TranslationCache(
+                    max_entries=config.get("TRANSLATION_CACHE_MAX_ENTRIES", 10000),
+                    ttl_seconds=config.get("TRANSLATION_CACHE_TTL_SECONDS", 3600.0),
+                )
+    return _detection_cache
+
+
+def reset_detection_cache() -> None:
+    """
+    Drop the process-wide detection cache so the next call rebuilds it from configuration.
+    """
+    global _detection_cache
+    with _detection_cache_lock:
+        _detection_cache = None
+
+
+_local_detector: Optional[LocalLanguageDetector] = None
+_local_detector_lock = threading.Lock()
+
+
+def get_local_language_detector() -> LocalLanguageDetector:
+    """
+    Get the process-wide local language detector, building its profiles on first use.
+
+    Returns:
+        LocalLanguageDetector: Shared local detector.
+    """
+    global _local_detector
+    if _local_detector is None:
+        with _local_detector_lock:
+            if _local_detector is None:
+                _local_detector = LocalLanguageDetector()
+    return _local_detector
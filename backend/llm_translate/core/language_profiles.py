@@ -0,0 +1,149 @@
+"""
+Language profiles for local language detection.
+Unicode script ranges for languages with their own script, and common words, distinctive letters
+and sample text (for character trigram profiles) for the supported Latin-script languages.
+"""
+from typing import Dict, List, Tuple
+
+
+# Unicode ranges of the scripts that identify a single supported language
+SCRIPT_RANGES: Dict[str, List[Tuple[int, int]]] = {
+    "Hebrew": [(0x0590, 0x05FF), (0xFB1D, 0xFB4F)],
+    "Arabic": [(0x0600, 0x06FF), (0x0750, 0x077F), (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)],
+    "Devanagari": [(0x0900, 0x097F)],
+    "Thai": [(0x0E00, 0x0E7F)],
+    "Greek": [(0x0370, 0x03FF), (0x1F00, 0x1FFF)],
+    "Cyrillic": [(0x0400, 0x04FF)],
+    "Hangul": [(0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7AF)],
+    "Kana": [(0x3040, 0x30FF), (0x31F0, 0x31FF), (0xFF66, 0xFF9F)],
+    "Han": [(0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF)],
+}
+
+# Supported language written in each script; Han is resolved to Chinese or Japanese by the presence of Kana
+SCRIPT_LANGUAGES: Dict[str, str] = {
+    "Hebrew": "Hebrew",
+    "Arabic": "Arabic",
+    "Devanagari": "Hindi",
+    "Thai": "Thai",
+    "Greek": "Greek",
+    "Cyrillic": "Russian",
+    "Hangul": "Korean",
+    "Kana": "Japanese",
+    "Han": "Chinese",
+}
+
+# Most frequent words of each Latin-script language
+COMMON_WORDS: Dict[str, str] = {
+    "English": "the be to of and a in that have it for not on with he as you do at this but his by from "
+               "they we is are was what there which will would can my your an i me",
+    "Spanish": "de la que el en y a los se del las un por con no una su para es al lo como más pero sus le ya "
+               "o este sí porque esta muy también cuando hay está yo tengo qué",
+    "French": "de la le et les des en un du une que est pour qui dans par pas au sur ne se plus avec ce il je "
+              "vous nous mais ou sont cette être très aussi c'est j'ai",
+    "German": "der die und in den von zu das mit sich des auf für ist im dem nicht ein eine als auch es an "
+              "werden aus er hat dass sie nach wird bei ich wir sind noch wie oder aber",
+    "Italian": "di e il la che è per un in non una sono mi si ho lo ma ti ha le con cosa del della questo anche "
+               "gli come io più al nel molto sei ci",
+    "Portuguese": "de a o que e do da em um para é com não uma os no se na por mais as dos como mas ao ele das à "
+                  "seu sua ou quando muito nos já eu também você está são",
+    "Dutch": "de van een het en in is dat op te zijn voor met die niet aan er om ook als bij of maar door over "
+             "naar wordt dan nog heb ik je wij zij hij was kan dit deze",
+    "Swedish": "och i att det som en på är av för med till den har de inte om ett han men var jag sig från vi så "
+               "kan man när år säger hon under också efter eller nu du mycket",
+    "Polish": "i w nie na się z do to że jest o jak a po co tak ale od za przez dla już czy jego jej być tylko "
+              "tym może bardzo są było mnie ja ty my też gdzie kiedy",
+    "Turkish": "bir ve bu da de için ile çok ne o ben sen daha gibi ama var yok mi değil olarak kadar sonra her "
+               "şey en ki diye olan bana nasıl neden evet hayır iyi ise",
+    "Vietnamese": "của và là các có được trong cho không một những với này người đã để khi từ đến cũng như tôi "
+                  "bạn chúng rất nhưng thì ra làm năm về sẽ đó",
+    "Indonesian": "yang dan di ini itu dengan untuk tidak dari dalam akan pada ada juga saya ke karena bisa kita "
+                  "kami mereka atau sudah lebih seperti apa anda oleh telah harus sangat hanya tetapi bagaimana",
+}
+
+# Characters that (among the supported Latin-script languages) point to one language
+DISTINCTIVE_CHARACTERS: Dict[str, str] = {
+    "Spanish": "ñ¿¡",
+    "French": "œûëïîÿ",
+    "German": "ß",
+    "Portuguese": "ãõ",
+    "Swedish": "å",
+    "Polish": "łąęśćńźż",
+    "Turkish": "ığş",
+    "Vietnamese": "ăđơưạảấầẩẫậắằẳẵặẹẻẽếềểễệỉịọỏốồổỗộớờởỡợụủứừửữựỳỵỷỹ",
+}
+
+# Representative text used to build each Latin-script language's character trigram profile
+SAMPLE_TEXT: Dict[str, str] = {
+    "English": (
+        "The weather was nice this morning, so we decided to walk to the office instead of taking the train. "
+        "Please let me know whether the meeting is still scheduled for Thursday afternoon. "
+        "Thank you for your help with the project; everything should be ready by the end of the week. "
+        "She thought that the new rules would make things easier for everyone who works here."
+    ),
+    "Spanish": (
+        "El tiempo estaba agradable esta mañana, así que decidimos caminar a la oficina en lugar de tomar el tren. "
+        "Por favor, avísame si la reunión sigue programada para el jueves por la tarde. "
+        "Gracias por tu ayuda con el proyecto; todo debería estar listo para el final de la semana. "
+        "Ella pensaba que las nuevas normas harían las cosas más fáciles para todos los que trabajan aquí."
+    ),
+    "French": (
+        "Il faisait beau ce matin, alors nous avons décidé d'aller au bureau à pied au lieu de prendre le train. "
+        "Merci de me dire si la réunion est toujours prévue pour jeudi après-midi. "
+        "Merci pour votre aide avec le projet ; tout devrait être prêt d'ici la fin de la semaine. "
+        "Elle pensait que les nouvelles règles rendraient les choses plus faciles pour tous ceux qui travaillent ici."
+    ),
+    "German": (
+        "Das Wetter war heute Morgen schön, deshalb haben wir beschlossen, zu Fuß ins Büro zu gehen, statt den Zug zu nehmen. "
+        "Bitte sag mir Bescheid, ob die Besprechung noch für Donnerstagnachmittag geplant ist. "
+        "Vielen Dank für deine Hilfe bei dem Projekt; bis zum Ende der Woche sollte alles fertig sein. "
+        "Sie dachte, dass die neuen Regeln die Dinge für alle, die hier arbeiten, einfacher machen würden."
+    ),
+    "Italian": (
+        "Stamattina il tempo era bello, così abbiamo deciso di andare in ufficio a piedi invece di prendere il treno. "
+        "Per favore fammi sapere se la riunione è ancora prevista per giovedì pomeriggio. "
+        "Grazie per il tuo aiuto con il progetto; tutto dovrebbe essere pronto entro la fine della settimana. "
+        "Lei pensava che le nuove regole avrebbero reso le cose più facili per tutti quelli che lavorano qui."
+    ),
+    "Portuguese": (
+        "O tempo estava agradável esta manhã, então decidimos ir a pé para o escritório em vez de pegar o trem. "
+        "Por favor, avise-me se a reunião ainda está marcada para quinta-feira à tarde. "
+        "Obrigado pela sua ajuda com o projeto; tudo deve estar pronto até o final da semana. "
+        "Ela achava que as novas regras tornariam as coisas mais fáceis para todos que trabalham aqui."
+    ),
+    "Dutch": (
+        "Het weer was vanochtend mooi, dus besloten we naar kantoor te lopen in plaats van de trein te nemen. "
+        "Laat me alsjeblieft weten of de vergadering nog steeds gepland staat voor donderdagmiddag. "
+        "Bedankt voor je hulp bij het project; alles zou aan het einde van de week klaar moeten zijn. "
+        "Ze dacht dat de nieuwe regels het voor iedereen die hier werkt gemakkelijker zouden maken."
+    ),
+    "Swedish": (
+        "Vädret var fint i morse, så vi bestämde oss för att gå till kontoret i stället för att ta tåget. "
+        "Säg gärna till om mötet fortfarande är planerat till torsdag eftermiddag. "
+        "Tack för din hjälp med projektet; allt borde vara klart i slutet av veckan. "
+        "Hon trodde att de nya reglerna skulle göra det enklare för alla som arbetar här."
+    ),
+    "Polish": (
+        "Dziś rano była ładna pogoda, więc postanowiliśmy pójść do biura pieszo zamiast jechać pociągiem. "
+        "Daj mi znać, czy spotkanie nadal jest zaplanowane na czwartek po południu. "
+        "Dziękuję za pomoc przy projekcie; wszystko powinno być gotowe do końca tygodnia. "
+        "Myślała, że nowe zasady ułatwią życie wszystkim, którzy tu pracują."
+    ),
+    "Turkish": (
+        "Bu sabah hava güzeldi, bu yüzden trene binmek yerine ofise yürümeye karar verdik. "
+        "Toplantının hâlâ perşembe öğleden sonraya planlanıp planlanmadığını lütfen bana bildir. "
+        "Projedeki yardımın için teşekkür ederim; her şey hafta sonuna kadar hazır olmalı. "
+        "Yeni kuralların burada çalışan herkes için işleri kolaylaştıracağını düşünüyordu."
+    ),
+    "Vietnamese": (
+        "Sáng nay thời tiết đẹp nên chúng tôi quyết định đi bộ đến văn phòng thay vì đi tàu. "
+        "Vui lòng cho tôi biết cuộc họp có còn được lên lịch vào chiều thứ năm không. "
+        "Cảm ơn bạn đã giúp đỡ dự án; mọi thứ sẽ sẵn sàng vào cuối tuần. "
+        "Cô ấy nghĩ rằng các quy định mới sẽ giúp mọi việc dễ dàng hơn cho tất cả những người làm việc ở đây."
+    ),
+    "Indonesian": (
+        "Cuaca pagi ini cerah, jadi kami memutuskan untuk berjalan kaki ke kantor daripada naik kereta. "
+        "Tolong beri tahu saya apakah rapatnya masih dijadwalkan pada hari Kamis sore. "
+        "Terima kasih atas bantuan Anda dengan proyek ini; semuanya seharusnya siap pada akhir minggu. "
+        "Dia berpikir bahwa peraturan baru akan membuat segalanya lebih mudah bagi semua orang yang bekerja di sini."
+    ),
+}
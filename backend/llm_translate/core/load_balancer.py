@@ -0,0 +1,295 @@
+"""
+Provider load balancing module.
+Spreads requests over several configured providers, preferring the ones that are currently fast,
+idle and healthy.
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from llm_translate.core.providers import provider_key
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.config import get_config
+from llm_translate.utils.exceptions import is_local_rejection, is_provider_error
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.load_balancer")
+
+STRATEGIES = ("p2c", "least_outstanding")
+
+
+class ProviderStats:
+    """Smoothed latency, error rate and outstanding requests of one provider."""
+
+    __slots__ = ("latency", "error_rate", "in_flight", "requests", "errors")
+
+    def __init__(self):
+        # Seconds; None until the first response
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+
+
+class LoadBalancer:
+    """
+    Chooses a provider for each request.
+
+    Each provider's cost is its EWMA latency times (outstanding requests + 1), divided by its EWMA
+    success rate, so slow, busy and failing providers all become less attractive. The "p2c" strategy
+    compares two randomly chosen providers and takes the cheaper one, which avoids herding onto a
+    single provider; "least_outstanding" takes the provider with the fewest requests in flight.
+    """
+
+    def __init__(self, strategy: str = "p2c", smoothing: float = 0.2, rng: Optional[random.Random] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the load balancer.
+
+        Args:
+            strategy (str, optional): "p2c" or "least_outstanding". Defaults to "p2c".
+            smoothing (float, optional): Weight of the newest sample in the moving averages. Defaults to 0.2.
+            rng (Optional[random.Random], optional): Random source, overridable for tests. Defaults to None.
+            clock (Callable[[], float], optional): Monotonic clock, overridable for tests. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown load balancing strategy: {strategy}")
+        self.strategy = strategy
+        self.smoothing = smoothing
+        self._rng = rng or random.Random()
+        self.clock = clock
+        self._stats: Dict[str, ProviderStats] = {}
+
+    def stats_for(self, key: str) -> ProviderStats:
+        """
+        Get a provider's statistics.
+
+        Args:
+            key (str): Provider key ("provider/model").
+
+        Returns:
+            ProviderStats: The provider's statistics.
+        """
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = ProviderStats()
+        return stats
+
+    def _typical_latency(self) -> float:
+        """
+        Latency assumed for providers without responses yet: the best known one, so new providers get tried.
+
+        Returns:
+            float: Seconds.
+        """
+        known = [stats.latency for stats in self._stats.values() if stats.latency is not None]
+        return min(known) if known else 1.0
+
+    def cost(self, key: str) -> float:
+        """
+        Expected cost of sending the next request to a provider.
+
+        Args:
+            key (str): Provider key.
+
+        Returns:
+            float: Lower is better.
+        """
+        stats = self.stats_for(key)
+        latency = stats.latency if stats.latency is not None else self._typical_latency()
+        # Floor at a millisecond so instant answers (e.g. cached upstream) still compare sensibly
+        return max(latency, 0.001) * (stats.in_flight + 1) / max(0.05, 1.0 - stats.error_rate)
+
+    def choose(self, translators: List[BaseTranslator]) -> BaseTranslator:
+        """
+        Choose the provider for a request.
+
+        Args:
+            translators (List[BaseTranslator]): Candidate provider translators.
+
+        Returns:
+            BaseTranslator: Chosen translator.
+        """
+        if len(translators) == 1:
+            return translators[0]
+        if self.strategy == "least_outstanding":
+            return min(translators, key=lambda t: (self.stats_for(provider_key(t)).in_flight, self.cost(provider_key(t))))
+        first, second = self._rng.sample(translators, 2)
+        return first if self.cost(provider_key(first)) <= self.cost(provider_key(second)) else second
+
+    def start(self, key: str) -> float:
+        """
+        Record that a request was sent to a provider.
+
+        Args:
+            key (str): Provider key.
+
+        Returns:
+            float: Start time to pass to finish().
+        """
+        stats = self.stats_for(key)
+        stats.in_flight += 1
+        stats.requests += 1
+        return self.clock()
+
+    def finish(self, key: str, started: float, error: Optional[BaseException] = None) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            key (str): Provider key.
+            started (float): Value returned by start().
+            error (Optional[BaseException], optional): Error the request failed with. Defaults to None.
+        """
+        stats = self.stats_for(key)
+        stats.in_flight -= 1
+        if isinstance(error, asyncio.CancelledError) or (error is not None and is_local_rejection(error)):
+            return
+        failed = error is not None and is_provider_error(error)
+        if failed:
+            stats.errors += 1
+        else:
+            elapsed = self.clock() - started
+            stats.latency = elapsed if stats.latency is None else stats.latency + self.smoothing * (elapsed - stats.latency)
+        stats.error_rate += self.smoothing * ((1.0 if failed else 0.0) - stats.error_rate)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get routing statistics.
+
+        Returns:
+            Dict[str, Any]: Strategy and, per provider, smoothed latency, error rate, outstanding and total
+            requests, errors and its routing weight (share of 1 / cost).
+        """
+        inverse = {key: 1.0 / self.cost(key) for key in self._stats}
+        total = sum(inverse.values()) or 1.0
+        return {
+            "strategy": self.strategy,
+            "providers": {
+                key: {
+                    "ewma_latency_ms": stats.latency * 1000.0 if stats.latency is not None else None,
+                    "error_rate": stats.error_rate,
+                    "in_flight": stats.in_flight,
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "weight": inverse[key] / total,
+                }
+                for key, stats in self._stats.items()
+            },
+        }
+
+
+class BalancedTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that sends each call to one of several provider translators chosen by a LoadBalancer.
+
+    The first translator is the primary: its provider and model identify the wrapper, e.g. in cache keys.
+    Failures are recorded and raised; moving to another provider is left to the fallback layer.
+    """
+
+    def __init__(self, translators: List[BaseTranslator], balancer: LoadBalancer):
+        """
+        Initialize the balanced translator.
+
+        Args:
+            translators (List[BaseTranslator]): Provider translators, primary first.
+            balancer (LoadBalancer): Load balancer shared across requests.
+
+        Raises:
+            ValueError: If no translators are given.
+        """
+        if not translators:
+            raise ValueError("At least one translator is required")
+        super().__init__(translators[0])
+        self.translators = translators
+        self.balancer = balancer
+        self.supports_batch = all(translator.supports_batch for translator in translators)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a call with the provider chosen by the load balancer and record the outcome.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            TranslationError: If the chosen provider fails.
+        """
+        translator = self.balancer.choose(self.translators)
+        key = provider_key(translator)
+        started = self.balancer.start(key)
+        try:
+            result = await getattr(translator, method)(*args)
+        except BaseException as e:
+            self.balancer.finish(key, started, e)
+            raise
+        self.balancer.finish(key, started)
+        return result
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation from the provider chosen by the load balancer; the request counts as
+        outstanding until the stream ends.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        translator = self.balancer.choose(self.translators)
+        key = provider_key(translator)
+        started = self.balancer.start(key)
+        try:
+            async for piece in translator.translate_stream(text, from_lang, to_lang, usage):
+                yield piece
+        except BaseException as e:
+            self.balancer.finish(key, started, e)
+            raise
+        self.balancer.finish(key, started)
+
+
+_load_balancer: Optional[LoadBalancer] = None
+_load_balancer_lock = threading.Lock()
+
+
+def get_load_balancer() -> LoadBalancer:
+    """
+    Get the process-wide load balancer, creating it from configuration on first use.
+
+    Returns:
+        LoadBalancer: Shared load balancer.
+    """
+    global _load_balancer
+    if _load_balancer is None:
+        with _load_balancer_lock:
+            if _load_balancer is None:
+                config = get_config()
+                _load_balancer = LoadBalancer(strategy=config.get("LOAD_BALANCER_STRATEGY", "p2c"))
+                logger.info(f"Load balancer initialized (strategy={_load_balancer.strategy})")
+    return _load_balancer
+
+
+def reset_load_balancer() -> None:
+    """
+    Drop the process-wide load balancer so the next call rebuilds it from configuration.
+    """
+    global _load_balancer
+    with _load_balancer_lock:
+        _load_balancer = None
@@ -0,0 +1,316 @@
+"""
+Micro-batching module.
+Merges concurrent single-text translations for the same provider, model and language pair into packed batch requests.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from llm_translate.core.model_tiering import TieringPolicy, request_tokens, tiering_scope
+from llm_translate.core.translation_cache import normalize_lang
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.tokens import estimate_tokens
+
+
+# Set up logger
+logger = setup_logger("llm_translate.micro_batching")
+
+
+class _Lane:
+    """Pending texts and arrival statistics for one provider, model, language pair and model tier."""
+
+    __slots__ = ("pending", "translator", "from_lang", "to_lang", "timer", "last_arrival", "interval")
+
+    def __init__(self):
+        # Text, the future its request awaits and the estimated tokens of the text the request started with
+        self.pending: List[Tuple[str, "asyncio.Future[str]", int]] = []
+        self.translator: Optional[BaseTranslator] = None
+        self.from_lang = ""
+        self.to_lang = ""
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.last_arrival: Optional[float] = None
+        # Smoothed seconds between arrivals
+        self.interval: Optional[float] = None
+
+
+class MicroBatcher:
+    """
+    Collects concurrent translations into short-lived batches.
+
+    Each lane (provider, model, language pair and model tier) tracks a smoothed inter-arrival time. When no other
+    request is expected within max_wait_ms, a request is sent on its own straight away, so a quiet server
+    adds no latency. Under load, requests wait up to the adaptive window and are flushed early once the
+    number of requests expected within max_wait_ms (capped at max_items) has arrived.
+    """
+
+    def __init__(self, max_wait_ms: float = 10.0, max_items: int = 16, smoothing: float = 0.2,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the micro-batcher.
+
+        Args:
+            max_wait_ms (float, optional): Longest time a request waits for others. Defaults to 10.
+            max_items (int, optional): Largest number of requests merged into one batch. Defaults to 16.
+            smoothing (float, optional): Weight of the newest inter-arrival time in the moving average. Defaults to 0.2.
+            clock (Callable[[], float], optional): Monotonic clock, overridable for tests. Defaults to time.monotonic.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_items = max_items
+        self.smoothing = smoothing
+        self._clock = clock
+        self._lanes: Dict[Tuple[str, str, str, str, Optional[str]], _Lane] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.direct = 0
+        self.batches = 0
+        self.batched_items = 0
+
+    def _observe(self, lane: _Lane, now: float) -> None:
+        """
+        Update a lane's smoothed inter-arrival time.
+
+        Args:
+            lane (_Lane): Lane the request arrived on.
+            now (float): Arrival time.
+        """
+        if lane.last_arrival is not None:
+            elapsed = now - lane.last_arrival
+            if lane.interval is None:
+                lane.interval = elapsed
+            else:
+                lane.interval += self.smoothing * (elapsed - lane.interval)
+        lane.last_arrival = now
+
+    def _target_size(self, lane: _Lane) -> int:
+        """
+        Number of requests a lane is expected to receive within max_wait_ms.
+
+        Args:
+            lane (_Lane): Lane to size.
+
+        Returns:
+            int: Batch size that triggers an immediate flush, between 2 and max_items.
+        """
+        if not lane.interval:
+            return self.max_items
+        return max(2, min(self.max_items, int(self.max_wait / lane.interval)))
+
+    def _window(self, lane: _Lane) -> float:
+        """
+        Time to wait for a lane's batch to fill.
+
+        Args:
+            lane (_Lane): Lane to size.
+
+        Returns:
+            float: Seconds, at most max_wait_ms.
+        """
+        if not lane.interval:
+            return self.max_wait
+        return min(self.max_wait, lane.interval * self._target_size(lane))
+
+    async def submit(self, translator: BaseTranslator, text: str, from_lang: str, to_lang: str,
+                     tier: Optional[str] = None) -> str:
+        """
+        Translate text, possibly together with other concurrent requests on the same lane.
+
+        A batch is sent within the tiering scope of its largest request, so requests of different model
+        tiers must be kept on separate lanes.
+
+        Args:
+            translator (BaseTranslator): Provider translator for this request.
+            text (str): Text to translate.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+            tier (Optional[str], optional): Model tier of the request, if the provider is tiered. Defaults to None.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If the translation fails.
+        """
+        key = (
+            getattr(translator, "provider", translator.__class__.__name__),
+            str(translator.model),
+            normalize_lang(from_lang),
+            normalize_lang(to_lang),
+            tier,
+        )
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane()
+        self._observe(lane, self._clock())
+
+        if not lane.pending and (lane.interval is None or lane.interval >= self.max_wait):
+            # Nothing to merge with and nothing expected soon
+            self.direct += 1
+            return await translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[str]" = loop.create_future()
+        if not lane.pending:
+            lane.translator, lane.from_lang, lane.to_lang = translator, from_lang, to_lang
+        lane.pending.append((text, future, request_tokens()))
+        if len(lane.pending) >= self._target_size(lane):
+            self._flush(lane)
+        elif lane.timer is None:
+            lane.timer = loop.call_later(self._window(lane), self._flush, lane)
+        return await future
+
+    def _flush(self, lane: _Lane) -> None:
+        """
+        Send a lane's pending requests as one batch.
+
+        Args:
+            lane (_Lane): Lane to flush.
+        """
+        if lane.timer is not None:
+            lane.timer.cancel()
+            lane.timer = None
+        items, lane.pending = lane.pending, []
+        if not items:
+            return
+        task = asyncio.ensure_future(self._run(lane.translator, items, lane.from_lang, lane.to_lang))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, translator: BaseTranslator, items: List[Tuple[str, "asyncio.Future[str]", int]],
+                   from_lang: str, to_lang: str) -> None:
+        """
+        Translate a batch and hand each result to its waiting request.
+
+        Args:
+            translator (BaseTranslator): Provider translator to use.
+            items (List[Tuple[str, asyncio.Future, int]]): Texts, the futures their requests await and the
+                estimated tokens of the texts the requests started with.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+        """
+        # Requests cancelled while waiting are left out
+        items = [item for item in items if not item[1].done()]
+        if not items:
+            return
+        texts = [text for text, _, _ in items]
+        self.batches += 1
+        self.batched_items += len(texts)
+        logger.debug(f"Micro-batch of {len(texts)} texts: {from_lang} → {to_lang}")
+        try:
+            # The batch runs in the context of whichever request filled the lane; tier it by the largest
+            # request instead, which keeps every item in the lane's tier
+            with tiering_scope(max(tokens for _, _, tokens in items)):
+                if len(texts) == 1:
+                    results = [await translator.translate(text=texts[0], from_lang=from_lang, to_lang=to_lang)]
+                else:
+                    results = await translator.translate_batch(texts, from_lang, to_lang)
+        except BaseException as e:
+            for _, future, _ in items:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for (_, future, _), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get micro-batching counters.
+
+        Returns:
+            Dict[str, Any]: Requests sent directly, batches sent, requests batched and average batch size.
+        """
+        return {
+            "direct": self.direct,
+            "batches": self.batches,
+            "batched_items": self.batched_items,
+            "average_batch_size": (self.batched_items / self.batches) if self.batches else 0.0,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "max_items": self.max_items,
+        }
+
+
+class MicroBatchingTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that routes single translations with a known source language through a MicroBatcher.
+    Auto-detect requests are sent on their own, since a batch shares one source language, and so are
+    texts too long to share a packed request. Behind a tiered provider, requests of different model
+    tiers are batched separately.
+    """
+
+    def __init__(self, translator: BaseTranslator, batcher: MicroBatcher, tiering: Optional[TieringPolicy] = None):
+        """
+        Initialize the micro-batching translator.
+
+        Args:
+            translator (BaseTranslator): Provider translator to delegate to.
+            batcher (MicroBatcher): Micro-batcher shared across requests.
+            tiering (Optional[TieringPolicy], optional): Policy of the TieredTranslator below, if any. Defaults to None.
+        """
+        super().__init__(translator)
+        self.batcher = batcher
+        self.tiering = tiering
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text, merging it with concurrent requests for the same language pair when under load.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If the wrapped translator fails.
+        """
+        if (from_lang.lower() == "auto-detect" or normalize_lang(from_lang) == normalize_lang(to_lang)
+                or estimate_tokens(text) > self.translator.batch_max_tokens):
+            return await self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
+        tier = None
+        if self.tiering is not None:
+            tier = self.tiering.tier_tokens(max(estimate_tokens(text), request_tokens()), from_lang, to_lang)
+        return await self.batcher.submit(self.translator, text, from_lang, to_lang, tier)
+
+
+_micro_batcher: Optional[MicroBatcher] = None
+_micro_batcher_lock = threading.Lock()
+
+
+def get_micro_batcher() -> MicroBatcher:
+    """
+    Get the process-wide micro-batcher, creating it from configuration on first use.
+
+    Returns:
+        MicroBatcher: Shared micro-batcher.
+    """
+    global _micro_batcher
+    if _micro_batcher is None:
+        with _micro_batcher_lock:
+            if _micro_batcher is None:
+                config = get_config()
+                _micro_batcher = MicroBatcher(
+                    max_wait_ms=config.get("MICRO_BATCH_MAX_WAIT_MS", 10.0),
+                    max_items=config.get("MICRO_BATCH_MAX_ITEMS", 16),
+                )
+                logger.info(
+                    f"Micro-batcher initialized (max_wait_ms={config.get('MICRO_BATCH_MAX_WAIT_MS', 10.0)}, "
+                    f"max_items={_micro_batcher.max_items})"
+                )
+    return _micro_batcher
+
+
+def reset_micro_batcher() -> None:
+    """
+    Drop the process-wide micro-batcher so the next call rebuilds it from configuration.
+    """
+    global _micro_batcher
+    with _micro_batcher_lock:
+        _micro_batcher = None
@@ -0,0 +1,286 @@
+"""
+Model tiering module.
+Routes short texts to a provider's fast, cheap model and longer texts to its stronger model, with
+token thresholds configurable per language pair.
+"""
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from llm_translate.core.translation_cache import normalize_lang
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.tokens import estimate_tokens
+
+
+# Set up logger
+logger = setup_logger("llm_translate.model_tiering")
+
+FAST = "fast"
+STRONG = "strong"
+
+# Estimated tokens of the text the current request started with, set by TieringScopeTranslator
+_request_tokens: ContextVar[int] = ContextVar("tiering_request_tokens", default=0)
+
+
+def request_tokens() -> int:
+    """
+    Get the estimated tokens of the text the current request started with.
+
+    Returns:
+        int: Tokens recorded by the innermost tiering scope, or 0 outside one.
+    """
+    return _request_tokens.get()
+
+
+@contextmanager
+def tiering_scope(tokens: int) -> Iterator[None]:
+    """
+    Tier the provider calls made within the block as pieces of a text of the given size.
+
+    Args:
+        tokens (int): Estimated tokens of the whole text.
+    """
+    token = _request_tokens.set(tokens)
+    try:
+        yield
+    finally:
+        _request_tokens.reset(token)
+
+
+def parse_pair_limits(value: Optional[str]) -> Dict[Tuple[str, str], int]:
+    """
+    Parse per-language-pair fast tier limits.
+
+    Args:
+        value (Optional[str]): Comma-separated "from>to=max_tokens" entries, e.g.
+            "English>Spanish=400,*>Japanese=0". "*" matches any language; 0 sends every text to the strong model.
+
+    Returns:
+        Dict[Tuple[str, str], int]: Fast tier token limit by normalized (from, to) pair.
+
+    Raises:
+        ValueError: If an entry is malformed.
+    """
+    limits = {}
+    for entry in (value or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        pair, _, max_tokens = entry.partition("=")
+        from_lang, _, to_lang = pair.partition(">")
+        if not from_lang.strip() or not to_lang.strip() or not max_tokens.strip().isdigit():
+            raise ValueError(f"Invalid model tier entry: {entry!r}, expected from>to=max_tokens")
+        limits[(normalize_lang(from_lang.strip()), normalize_lang(to_lang.strip()))] = int(max_tokens)
+    return limits
+
+
+class TieringPolicy:
+    """Chooses the model tier for a text by its estimated token count and language pair."""
+
+    def __init__(self, fast_max_tokens: int = 200, pair_limits: Optional[Mapping[Tuple[str, str], int]] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            fast_max_tokens (int, optional): Texts of at most this many estimated tokens go to the fast model. Defaults to 200.
+            pair_limits (Optional[Mapping[Tuple[str, str], int]], optional): Limits overriding fast_max_tokens for
+                language pairs, as returned by parse_pair_limits(). Defaults to None.
+        """
+        self.fast_max_tokens = fast_max_tokens
+        self.pair_limits = dict(pair_limits or {})
+
+    def limit(self, from_lang: str, to_lang: str) -> int:
+        """
+        Get the fast tier token limit for a language pair.
+
+        The most specific entry wins: the exact pair, then any target from the source, then any
+        source to the target, then the default limit.
+
+        Args:
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            int: Largest estimated token count the fast model handles for the pair.
+        """
+        from_lang, to_lang = normalize_lang(from_lang), normalize_lang(to_lang)
+        for pair in ((from_lang, to_lang), (from_lang, "*"), ("*", to_lang)):
+            if pair in self.pair_limits:
+                return self.pair_limits[pair]
+        return self.fast_max_tokens
+
+    def tier(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Choose the model tier for a text.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            str: FAST or STRONG.
+        """
+        return self.tier_tokens(estimate_tokens(text), from_lang, to_lang)
+
+    def tier_tokens(self, tokens: int, from_lang: str, to_lang: str) -> str:
+        """
+        Choose the model tier for a text of an estimated size.
+
+        Args:
+            tokens (int): Estimated tokens of the text.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            str: FAST or STRONG.
+        """
+        return FAST if tokens <= self.limit(from_lang, to_lang) else STRONG
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "TieringPolicy":
+        """
+        Build the policy from a configuration snapshot.
+
+        Args:
+            config (Mapping[str, Any]): Application configuration.
+
+        Returns:
+            TieringPolicy: Policy with the configured limits.
+
+        Raises:
+            ValueError: If MODEL_TIERING_PAIR_LIMITS is malformed.
+        """
+        return cls(
+            fast_max_tokens=config.get("MODEL_TIERING_FAST_MAX_TOKENS", 200),
+            pair_limits=parse_pair_limits(config.get("MODEL_TIERING_PAIR_LIMITS"))
+        )
+
+
+class TieredTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that sends each text to the fast or the strong model of one provider.
+
+    Passages of a chunked document always go to the strong model, since they are parts of a long
+    text however short each one is. Likewise, sentences of a segmented text are tiered by the text
+    the request started with, as recorded by TieringScopeTranslator, rather than by their own size. The wrapper reports the strong model as its own, so cached
+    translations are keyed on it whichever tier produced them.
+    """
+
+    def __init__(self, strong: BaseTranslator, fast: BaseTranslator, policy: TieringPolicy):
+        """
+        Initialize the tiered translator.
+
+        Args:
+            strong (BaseTranslator): Translator of the provider's strong model.
+            fast (BaseTranslator): Translator of the provider's fast model.
+            policy (TieringPolicy): Chooses the tier for each text.
+        """
+        super().__init__(strong)
+        self.fast = fast
+        self.policy = policy
+        self.supports_batch = strong.supports_batch and fast.supports_batch
+
+    def _select(self, text: str, from_lang: str, to_lang: str) -> BaseTranslator:
+        """
+        Get the translator for a text's tier.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            BaseTranslator: The fast or the strong translator.
+        """
+        tokens = max(estimate_tokens(text), request_tokens())
+        return self.fast if self.policy.tier_tokens(tokens, from_lang, to_lang) == FAST else self.translator
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a call with the model of its text's tier. Detect-and-translate calls are tiered for any
+        source language, passages with context and packed requests go to the strong model, and
+        language detection goes to the fast one.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+        """
+        if method in ("translate", "translate_with_reference"):
+            translator = self._select(*args[:3])
+        elif method == "detect_and_translate":
+            translator = self._select(args[0], "*", args[1])
+        elif method == "_detect_language":
+            translator = self.fast
+        else:
+            translator = self.translator
+        return await getattr(translator, method)(*args)
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Translate a batch, sending the texts of each tier to its model in one batch.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+        """
+        groups: Dict[BaseTranslator, List[int]] = {}
+        for index, text in enumerate(texts):
+            groups.setdefault(self._select(text, from_lang, to_lang), []).append(index)
+        results = await asyncio.gather(*(
+            translator.translate_batch([texts[i] for i in indices], from_lang, to_lang)
+            for translator, indices in groups.items()
+        ))
+        translations = [""] * len(texts)
+        for indices, translated in zip(groups.values(), results):
+            for index, translation in zip(indices, translated):
+                translations[index] = translation
+        return translations
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation from the model of the text's tier.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        async for piece in self._select(text, from_lang, to_lang).translate_stream(text, from_lang, to_lang, usage):
+            yield piece
+
+
+class TieringScopeTranslator(TranslatorWrapper):
+    """
+    Translator wrapper, just below source language detection, that records the size of the text a request started with, so that
+    TieredTranslator routes the pieces of a text split further down the pipeline by the whole text.
+    """
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text, tiering every provider call it leads to by the text's size.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+        """
+        with tiering_scope(estimate_tokens(text)):
+            return await self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
@@ -0,0 +1,22 @@
+"""
+Provider identity module.
+Names the provider and model behind a translator or speaker, for the components that keep state per
+provider: circuit breakers, load balancing and hedging.
+"""
+from typing import Union
+
+from llm_translate.services.base_speaker import BaseSpeaker
+from llm_translate.services.base_translator import BaseTranslator
+
+
+def provider_key(service: Union[BaseTranslator, BaseSpeaker]) -> str:
+    """
+    Identify the provider and model of a translator or speaker.
+
+    Args:
+        service (Union[BaseTranslator, BaseSpeaker]): Provider translator or speaker.
+
+    Returns:
+        str: "provider/model".
+    """
+    return f"{getattr(service, 'provider', service.__class__.__name__)}/{service.model}"
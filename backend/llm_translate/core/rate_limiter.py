@@ -0,0 +1,572 @@
+"""
+Client-side rate limiting module.
+Makes requests wait for per-provider request and token budgets before they are sent, and follows the
+rate limit and Retry-After headers of provider responses, so traffic stays within the provider quota
+instead of bursting into 429 errors.
+"""
+import asyncio
+import math
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+import httpx
+
+from llm_translate.services.base_speaker import BaseSpeaker, SpeakerWrapper
+from llm_translate.services.base_translator import BaseTranslator, BatchPackingTranslator, call_texts
+from llm_translate.utils.config import get_config
+from llm_translate.utils.exceptions import ErrorType, TranslationError
+from llm_translate.utils.http_client import add_response_hook
+from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.metrics import record_timing
+from llm_translate.utils.tokens import estimate_tokens
+
+
+# Set up logger
+logger = setup_logger("llm_translate.rate_limiter")
+
+# API hosts of the providers, for attributing response headers
+PROVIDER_HOSTS = {
+    "api.openai.com": "openai",
+    "api.groq.com": "groq",
+    "openrouter.ai": "openrouter",
+}
+
+# Tokens assumed for the system prompt and instructions around each text
+PROMPT_OVERHEAD_TOKENS = 50
+
+# Pause after a 429 response that carries no Retry-After header
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate limit reset duration such as "20ms", "7.66s" or "6m0s".
+
+    Args:
+        value (Optional[str]): Header value; a bare number is read as seconds.
+
+    Returns:
+        Optional[float]: Seconds, or None if the value cannot be parsed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Read the wait a response asks for from its retry-after-ms or Retry-After header.
+
+    Args:
+        headers (Mapping[str, str]): Response headers (case-insensitive).
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the response does not say.
+    """
+    milliseconds = headers.get("retry-after-ms")
+    if milliseconds:
+        try:
+            return max(0.0, float(milliseconds) / 1000.0)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    seconds = parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Continuously refilling budget of a per-minute quota.
+
+    take() may drive the level below zero; callers then wait until it has refilled, which keeps
+    reservations in arrival order.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute (float): Quota per minute; also the burst capacity.
+            clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+        """
+        self.clock = clock
+        self.per_minute = per_minute
+        self.level = per_minute
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        """Add the budget accrued since the last update."""
+        now = self.clock()
+        self.level = min(self.per_minute, self.level + (now - self._updated) * self.per_minute / 60.0)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """
+        Time until the bucket holds an amount.
+
+        Args:
+            amount (float): Budget needed.
+
+        Returns:
+            float: Seconds to wait; 0 if available now.
+        """
+        self._refill()
+        return max(0.0, (min(amount, self.per_minute) - self.level) * 60.0 / self.per_minute)
+
+    def take(self, amount: float) -> None:
+        """
+        Reserve an amount of budget.
+
+        Args:
+            amount (float): Budget to reserve.
+        """
+        self._refill()
+        self.level -= min(amount, self.per_minute)
+
+    def set_limit(self, per_minute: float) -> None:
+        """
+        Change the quota, keeping the current level within it.
+
+        Args:
+            per_minute (float): New quota per minute.
+        """
+        self._refill()
+        self.per_minute = per_minute
+        self.level = min(self.level, per_minute)
+
+    def sync(self, remaining: float) -> None:
+        """
+        Lower the level to what the provider reports as remaining.
+
+        Args:
+            remaining (float): Remaining budget reported by the provider.
+        """
+        self._refill()
+        self.level = min(self.level, remaining)
+
+
+class ProviderRateLimiter:
+    """
+    Request and token budgets of one provider, with a bounded queue of waiting requests.
+
+    A quota of 0 means unknown: it is learned from the provider's x-ratelimit-limit-* headers. A
+    configured quota is only ever lowered by those headers. Retry-After and exhausted x-ratelimit-remaining-*
+    headers pause the provider until the indicated time.
+    """
+
+    def __init__(self, provider: str, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 max_queue: int = 100, max_wait_seconds: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            provider (str): Provider name, for errors and stats.
+            requests_per_minute (float, optional): Request quota; 0 learns it from headers. Defaults to 0.
+            tokens_per_minute (float, optional): Token quota; 0 learns it from headers. Defaults to 0.
+            max_queue (int, optional): Requests allowed to wait at once. Defaults to 100.
+            max_wait_seconds (float, optional): Longest a request may wait. Defaults to 10.0.
+            clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+            sleep (Callable[[float], Awaitable[Any]], optional): Async sleep. Defaults to asyncio.sleep.
+        """
+        self.provider = provider
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.requests = TokenBucket(requests_per_minute, clock) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute, clock) if tokens_per_minute > 0 else None
+        self.paused_until = 0.0
+        self.waiting = 0
+        self.admitted = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.throttled = 0
+
+    def _wait_time(self, tokens: int) -> float:
+        """
+        Time until a request of a number of tokens fits all budgets.
+
+        Args:
+            tokens (int): Estimated tokens of the request.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        wait = max(0.0, self.paused_until - self.clock())
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_time(1))
+        if self.tokens is not None and tokens:
+            wait = max(wait, self.tokens.wait_time(tokens))
+        return wait
+
+    def _reject(self, reason: str, wait: float) -> TranslationError:
+        """
+        Count a rejected request and build its error.
+
+        Args:
+            reason (str): Why the request is rejected.
+            wait (float): Seconds until the provider's budgets allow a request again.
+
+        Returns:
+            TranslationError: Overloaded error; the request never reached the provider, so it is
+            neither retried nor counted against the provider's health.
+        """
+        self.rejected += 1
+        return TranslationError(
+            f"Rate limit for {self.provider} exceeded: {reason}. Please retry later.",
+            error_type=ErrorType.OVERLOADED,
+            status_code=503,
+            retry_after=math.ceil(wait)
+        )
+
+    async def acquire(self, tokens: int = 0, deadline: Optional[float] = None) -> None:
+        """
+        Wait until a request fits the provider's budgets, then reserve them.
+
+        Args:
+            tokens (int, optional): Estimated tokens of the request. Defaults to 0.
+            deadline (Optional[float], optional): Monotonic time by which the request must be sent;
+                the configured maximum wait also applies. Defaults to None.
+
+        Raises:
+            TranslationError: With OVERLOADED if the queue is full or the wait would exceed the deadline.
+        """
+        limit = self.clock() + self.max_wait_seconds
+        if deadline is not None:
+            limit = min(limit, deadline)
+        while True:
+            wait = self._wait_time(tokens)
+            if wait <= 0:
+                break
+            if self.clock() + wait > limit:
+                raise self._reject(f"request would wait {wait:.1f}s", wait)
+            if self.waiting >= self.max_queue:
+                raise self._reject("too many requests waiting", wait)
+            self.delayed += 1
+            self.waiting += 1
+            try:
+                await self.sleep(wait)
+            finally:
+                self.waiting -= 1
+            record_timing("queue", wait)
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None and tokens:
+            self.tokens.take(tokens)
+        self.admitted += 1
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapt to the rate limit information of a provider response.
+
+        Args:
+            status_code (int): Response status code.
+            headers (Mapping[str, str]): Response headers (case-insensitive).
+        """
+        now = self.clock()
+        retry_after = parse_retry_after(headers)
+        if status_code == 429:
+            self.throttled += 1
+            retry_after = DEFAULT_RETRY_AFTER_SECONDS if retry_after is None else retry_after
+        if retry_after is not None and (status_code == 429 or status_code >= 500):
+            self.paused_until = max(self.paused_until, now + retry_after)
+
+        for kind in ("requests", "tokens"):
+            bucket = getattr(self, kind)
+            limit = _number(headers.get(f"x-ratelimit-limit-{kind}"))
+            if limit:
+                if bucket is None:
+                    bucket = TokenBucket(limit, self.clock)
+                    setattr(self, kind, bucket)
+                    logger.info(f"Learned {self.provider} quota: {limit:.0f} {kind}/min")
+                elif limit < bucket.per_minute:
+                    bucket.set_limit(limit)
+            remaining = _number(headers.get(f"x-ratelimit-remaining-{kind}"))
+            if remaining is None:
+                continue
+            if bucket is not None:
+                bucket.sync(remaining)
+            if remaining <= 0:
+                reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                if reset is not None:
+                    self.paused_until = max(self.paused_until, now + reset)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter state and counters.
+
+        Returns:
+            Dict[str, Any]: Quotas, remaining budgets, pause, queue length and request counters.
+        """
+        return {
+            "requests_per_minute": self.requests.per_minute if self.requests else None,
+            "tokens_per_minute": self.tokens.per_minute if self.tokens else None,
+            "requests_available": self.requests.level if self.requests else None,
+            "tokens_available": self.tokens.level if self.tokens else None,
+            "paused_seconds": max(0.0, self.paused_until - self.clock()),
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+        }
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a numeric header value.
+
+    Args:
+        value (Optional[str]): Header value.
+
+    Returns:
+        Optional[float]: The number, or None if missing or malformed.
+    """
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class RateLimiterRegistry:
+    """One rate limiter per provider, created with the configured quotas on first use."""
+
+    def __init__(self, quotas: Optional[Dict[str, Tuple[float, float]]] = None, max_queue: int = 100,
+                 max_wait_seconds: float = 10.0):
+        """
+        Initialize the registry.
+
+        Args:
+            quotas (Optional[Dict[str, Tuple[float, float]]], optional): Requests and tokens per minute by
+                provider; missing providers learn their quotas from headers. Defaults to None.
+            max_queue (int, optional): Requests allowed to wait per provider. Defaults to 100.
+            max_wait_seconds (float, optional): Longest a request may wait. Defaults to 10.0.
+        """
+        self.quotas = quotas or {}
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self._limiters: Dict[str, ProviderRateLimiter] = {}
+
+    def limiter(self, provider: str) -> ProviderRateLimiter:
+        """
+        Get the rate limiter of a provider.
+
+        Args:
+            provider (str): Provider name.
+
+        Returns:
+            ProviderRateLimiter: The provider's limiter.
+        """
+        limiter = self._limiters.get(provider)
+        if limiter is None:
+            requests_per_minute, tokens_per_minute = self.quotas.get(provider, (0, 0))
+            limiter = self._limiters[provider] = ProviderRateLimiter(
+                provider, requests_per_minute, tokens_per_minute, self.max_queue, self.max_wait_seconds
+            )
+        return limiter
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every limiter.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Limiter stats by provider.
+        """
+        return {provider: limiter.stats() for provider, limiter in self._limiters.items()}
+
+
+async def observe_rate_limit_headers(response: httpx.Response) -> None:
+    """
+    HTTP client response hook that passes provider responses to the provider's rate limiter.
+
+    Args:
+        response (httpx.Response): Response received by the shared HTTP client.
+    """
+    provider = PROVIDER_HOSTS.get(response.request.url.host)
+    if provider is not None:
+        get_rate_limiters().limiter(provider).observe(response.status_code, response.headers)
+
+
+def translation_tokens(texts: List[str]) -> int:
+    """
+    Estimate the tokens a translation request uses: prompt, texts and a translation of similar length.
+
+    Args:
+        texts (List[str]): Texts sent in the request.
+
+    Returns:
+        int: Estimated tokens.
+    """
+    return PROMPT_OVERHEAD_TOKENS + 2 * sum(estimate_tokens(text) for text in texts)
+
+
+def call_tokens(method: str, args: Tuple[Any, ...]) -> int:
+    """
+    Estimate the tokens a translator call uses.
+
+    Args:
+        method (str): Name of the translator method, e.g. "translate" or "_complete".
+        args (Tuple[Any, ...]): Its positional arguments.
+
+    Returns:
+        int: Estimated tokens.
+    """
+    text, *others = call_texts(method, args)
+    if method == "_detect_language":
+        return PROMPT_OVERHEAD_TOKENS + estimate_tokens(text)
+    return translation_tokens([text]) + sum(estimate_tokens(other) for other in others)
+
+
+class RateLimitedTranslator(BatchPackingTranslator):
+    """Translator wrapper that waits for the provider's rate limiter before every call."""
+
+    def __init__(self, translator: BaseTranslator, limiter: ProviderRateLimiter):
+        """
+        Initialize the rate limited translator.
+
+        Args:
+            translator (BaseTranslator): Provider translator.
+            limiter (ProviderRateLimiter): The provider's rate limiter.
+        """
+        super().__init__(translator)
+        self.limiter = limiter
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a call once the provider's budgets allow it.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            TranslationError: With OVERLOADED if the request cannot be sent in time, or the provider's error.
+        """
+        await self.limiter.acquire(call_tokens(method, args))
+        return await super()._call(method, *args)
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation once the provider's budgets allow it.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        await self.limiter.acquire(translation_tokens([text]))
+        async for piece in self.translator.translate_stream(text, from_lang, to_lang, usage):
+            yield piece
+
+
+class RateLimitedSpeaker(SpeakerWrapper):
+    """Speaker wrapper that waits for the provider's request budget before every call."""
+
+    def __init__(self, speaker: BaseSpeaker, limiter: ProviderRateLimiter):
+        """
+        Initialize the rate limited speaker.
+
+        Args:
+            speaker (BaseSpeaker): Provider speaker.
+            limiter (ProviderRateLimiter): The provider's rate limiter.
+        """
+        super().__init__(speaker)
+        self.limiter = limiter
+
+    async def speak(self, text: str, lang: str, voice: Optional[str] = None,
+                    response_format: str = "mp3", instructions: Optional[str] = None) -> bytes:
+        """
+        Convert text to speech once the provider's request budget allows it.
+
+        Args:
+            text (str): Text to convert to speech.
+            lang (str): Language of the text (e.g., "English", "Spanish").
+            voice (Optional[str], optional): Voice to use. Defaults to None.
+            response_format (str, optional): Format of the audio response. Defaults to "mp3".
+            instructions (Optional[str], optional): Additional instructions for the TTS service. Defaults to None.
+
+        Returns:
+            bytes: Audio content.
+
+        Raises:
+            TranslationError: With OVERLOADED if the request cannot be sent in time, or the provider's error.
+        """
+        await self.limiter.acquire()
+        return await self.speaker.speak(
+            text=text, lang=lang, voice=voice, response_format=response_format, instructions=instructions
+        )
+
+
+_rate_limiters: Optional[RateLimiterRegistry] = None
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiters() -> RateLimiterRegistry:
+    """
+    Get the process-wide rate limiter registry, creating it from configuration on first use.
+
+    Returns:
+        RateLimiterRegistry: Shared registry.
+    """
+    global _rate_limiters
+    if _rate_limiters is None:
+        with _rate_limiters_lock:
+            if _rate_limiters is None:
+                config = get_config()
+                quotas = {
+                    provider: (
+                        config.get(f"{provider.upper()}_RATE_LIMIT_RPM", 0),
+                        config.get(f"{provider.upper()}_RATE_LIMIT_TPM", 0)
+                    )
+                    for provider in PROVIDER_HOSTS.values()
+                }
+                _rate_limiters = RateLimiterRegistry(
+                    quotas,
+                    max_queue=config.get("RATE_LIMIT_MAX_QUEUE", 100),
+                    max_wait_seconds=config.get("RATE_LIMIT_MAX_WAIT_SECONDS", 10.0)
+                )
+                # Follow the rate limit headers of every provider response from now on
+                add_response_hook(observe_rate_limit_headers)
+                logger.info(f"Rate limiters initialized (quotas={quotas})")
+    return _rate_limiters
+
+
+def reset_rate_limiters() -> None:
+    """
+    Drop the process-wide rate limiter registry so the next call rebuilds it from configuration.
+    """
+    global _rate_limiters
+    with _rate_limiters_lock:
+        _rate_limiters = None
@@ -0,0 +1,385 @@
+"""
+Retry module.
+Retries transient provider failures with decorrelated-jitter backoff within a per-request deadline,
+and caps retries across all requests with a budget so retries cannot amplify an outage.
+"""
+import asyncio
+import random
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+from llm_translate.services.base_speaker import BaseSpeaker, SpeakerWrapper
+from llm_translate.services.base_translator import BaseTranslator, BatchPackingTranslator
+from llm_translate.utils.config import get_config
+from llm_translate.utils.exceptions import ErrorType, TranslationError
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.retry")
+
+# Error types of transient failures worth another attempt
+RETRYABLE_ERROR_TYPES = frozenset({
+    ErrorType.CONNECTION,
+    ErrorType.NETWORK_ERROR,
+    ErrorType.TIMEOUT,
+    ErrorType.RATE_LIMIT,
+    ErrorType.SERVICE_UNAVAILABLE,
+    ErrorType.API_ERROR,
+})
+
+# Client errors that are nonetheless transient
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Check whether a failed call may succeed when repeated.
+
+    Args:
+        error (BaseException): Error the call failed with.
+
+    Returns:
+        bool: True for transient provider errors; API errors only for server-side (5xx) failures.
+    """
+    if not isinstance(error, TranslationError) or error.error_type not in RETRYABLE_ERROR_TYPES:
+        return False
+    if error.error_type == ErrorType.API_ERROR:
+        return error.status_code >= 500 or error.status_code in RETRYABLE_STATUS_CODES
+    return True
+
+
+class RetryBudget:
+    """
+    Limits retries to a share of the requests seen in a sliding window, with a small floor so
+    occasional failures on a quiet server are still retried.
+    """
+
+    def __init__(self, percent: float = 20.0, min_retries: int = 10, window_seconds: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the retry budget.
+
+        Args:
+            percent (float, optional): Retries allowed, in percent of requests in the window. Defaults to 20.0.
+            min_retries (int, optional): Retries always allowed per window. Defaults to 10.
+            window_seconds (float, optional): Length of the sliding window. Defaults to 60.0.
+            clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+        """
+        self.percent = percent
+        self.min_retries = min_retries
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _expire(self, now: float) -> None:
+        """
+        Drop events that left the window.
+
+        Args:
+            now (float): Current time.
+        """
+        horizon = now - self.window_seconds
+        for events in (self._requests, self._retries):
+            while events and events[0] <= horizon:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Count a request (first attempt)."""
+        self._requests.append(self.clock())
+
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            bool: True if the retry may be made.
+        """
+        now = self.clock()
+        self._expire(now)
+        if len(self._retries) >= max(self.min_retries, len(self._requests) * self.percent / 100.0):
+            return False
+        self._retries.append(now)
+        return True
+
+
+class RetryPolicy:
+    """
+    Runs calls with retries of transient failures and keeps retry metrics.
+
+    Backoff uses decorrelated jitter: each delay is drawn between the base delay and three times the
+    previous delay, capped at the maximum delay. No retry starts if its delay would pass the call's deadline.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 5.0,
+                 deadline_seconds: float = 30.0, budget: Optional[RetryBudget] = None,
+                 rng: Optional[random.Random] = None, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts (int, optional): Attempts per call, including the first. Defaults to 3.
+            base_delay (float, optional): Shortest backoff in seconds. Defaults to 0.2.
+            max_delay (float, optional): Longest backoff in seconds. Defaults to 5.0.
+            deadline_seconds (float, optional): Time from the first attempt after which no retry starts. Defaults to 30.0.
+            budget (Optional[RetryBudget], optional): Retry budget shared by all calls. Defaults to a new RetryBudget.
+            rng (Optional[random.Random], optional): Random source, overridable for tests. Defaults to None.
+            clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+            sleep (Callable[[float], Awaitable[Any]], optional): Async sleep. Defaults to asyncio.sleep.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max(base_delay, max_delay)
+        self.deadline_seconds = deadline_seconds
+        self.clock = clock
+        self.budget = budget or RetryBudget(clock=clock)
+        self.sleep = sleep
+        self._rng = rng or random.Random()
+        self.calls = 0
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self.budget_denied = 0
+        self.deadline_exceeded = 0
+        self.retries_by_error: Counter = Counter()
+
+    def backoff(self, previous: float) -> float:
+        """
+        Draw the next backoff delay.
+
+        Args:
+            previous (float): Previous delay, or 0 before the first retry.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        return min(self.max_delay, self._rng.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    async def run(self, call: Callable[[], Awaitable[Any]], key: str = "") -> Any:
+        """
+        Make a call, retrying transient failures.
+
+        Args:
+            call (Callable[[], Awaitable[Any]]): Makes one attempt.
+            key (str, optional): Provider key for log messages. Defaults to "".
+
+        Returns:
+            Any: The result of the first successful attempt.
+
+        Raises:
+            Exception: The last attempt's error once retries are exhausted, not allowed or not worthwhile.
+        """
+        self.calls += 1
+        self.budget.record_request()
+        deadline = self.clock() + self.deadline_seconds
+        delay = 0.0
+        attempt = 1
+        while True:
+            try:
+                result = await call()
+            except Exception as e:
+                delay = await self._before_retry(e, attempt, delay, deadline, key)
+                attempt += 1
+                continue
+            if attempt > 1:
+                self.recovered += 1
+            return result
+
+    async def _before_retry(self, error: Exception, attempt: int, delay: float, deadline: float, key: str) -> float:
+        """
+        Decide whether a failed attempt is retried and wait for the backoff.
+
+        Args:
+            error (Exception): Error of the failed attempt.
+            attempt (int): Number of the failed attempt.
+            delay (float): Previous backoff delay.
+            deadline (float): Time after which no retry starts.
+            key (str): Provider key for log messages.
+
+        Returns:
+            float: The backoff delay waited.
+
+        Raises:
+            Exception: The error, if it is not retried.
+        """
+        if not is_retryable(error):
+            raise error
+        if attempt >= self.max_attempts:
+            self.exhausted += 1
+            raise error
+        delay = self.backoff(delay)
+        if self.clock() + delay > deadline:
+            self.deadline_exceeded += 1
+            raise error
+        if not self.budget.try_spend():
+            self.budget_denied += 1
+            raise error
+        self.retries += 1
+        self.retries_by_error[error.error_type.value] += 1
+        logger.warning(f"Retrying {key or 'provider call'} in {delay:.2f}s after attempt {attempt} failed: {error}")
+        await self.sleep(delay)
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get retry metrics.
+
+        Returns:
+            Dict[str, Any]: Calls, retries made, calls that succeeded after retrying, calls that ran out of
+            attempts, retries denied by the budget or the deadline, and retries per error type.
+        """
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "recovered": self.recovered,
+            "exhausted": self.exhausted,
+            "budget_denied": self.budget_denied,
+            "deadline_exceeded": self.deadline_exceeded,
+            "retries_by_error": dict(self.retries_by_error),
+        }
+
+
+class RetryingTranslator(BatchPackingTranslator):
+    """Translator wrapper that retries transient provider failures."""
+
+    def __init__(self, translator: BaseTranslator, policy: RetryPolicy):
+        """
+        Initialize the retrying translator.
+
+        Args:
+            translator (BaseTranslator): Provider translator.
+            policy (RetryPolicy): Retry policy shared across requests.
+        """
+        super().__init__(translator)
+        self.policy = policy
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a call, retrying transient failures; a packed batch request is retried alone.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            TranslationError: If the provider keeps failing or fails permanently.
+        """
+        call = super()._call
+        return await self.policy.run(lambda: call(method, *args), f"{self.provider}/{self.model}")
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation, retrying transient failures that happen before the first piece.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        stream = None
+
+        async def first_piece() -> Optional[str]:
+            nonlocal stream
+            stream = self.translator.translate_stream(text, from_lang, to_lang, usage).__aiter__()
+            try:
+                return await stream.__anext__()
+            except StopAsyncIteration:
+                return None
+
+        piece = await self.policy.run(first_piece, f"{self.provider}/{self.model}")
+        if piece is None:
+            return
+        yield piece
+        async for piece in stream:
+            yield piece
+
+
+class RetryingSpeaker(SpeakerWrapper):
+    """Speaker wrapper that retries transient provider failures."""
+
+    def __init__(self, speaker: BaseSpeaker, policy: RetryPolicy):
+        """
+        Initialize the retrying speaker.
+
+        Args:
+            speaker (BaseSpeaker): Provider speaker.
+            policy (RetryPolicy): Retry policy shared across requests.
+        """
+        super().__init__(speaker)
+        self.policy = policy
+
+    async def speak(self, text: str, lang: str, voice: Optional[str] = None,
+                    response_format: str = "mp3", instructions: Optional[str] = None) -> bytes:
+        """
+        Convert text to speech, retrying transient failures.
+
+        Args:
+            text (str): Text to convert to speech.
+            lang (str): Language of the text (e.g., "English", "Spanish").
+            voice (Optional[str], optional): Voice to use. Defaults to None.
+            response_format (str, optional): Format of the audio response. Defaults to "mp3".
+            instructions (Optional[str], optional): Additional instructions for the TTS service. Defaults to None.
+
+        Returns:
+            bytes: Audio content.
+
+        Raises:
+            TranslationError: If the provider keeps failing or fails permanently.
+        """
+        return await self.policy.run(lambda: self.speaker.speak(
+            text=text, lang=lang, voice=voice, response_format=response_format, instructions=instructions
+        ), f"{self.provider}/{self.model}")
+
+
+_retry_policy: Optional[RetryPolicy] = None
+_retry_policy_lock = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Get the process-wide retry policy, creating it from configuration on first use.
+
+    Returns:
+        RetryPolicy: Shared policy; its budget covers all providers.
+    """
+    global _retry_policy
+    if _retry_policy is None:
+        with _retry_policy_lock:
+            if _retry_policy is None:
+                config = get_config()
+                _retry_policy = RetryPolicy(
+                    max_attempts=config.get("RETRY_MAX_ATTEMPTS", 3),
+                    base_delay=config.get("RETRY_BASE_DELAY_MS", 200) / 1000.0,
+                    max_delay=config.get("RETRY_MAX_DELAY_MS", 5000) / 1000.0,
+                    deadline_seconds=config.get("RETRY_DEADLINE_SECONDS", 30.0),
+                    budget=RetryBudget(
+                        percent=config.get("RETRY_BUDGET_PERCENT", 20.0),
+                        min_retries=config.get("RETRY_BUDGET_MIN_PER_MINUTE", 10)
+                    )
+                )
+                logger.info(
+                    f"Retry policy initialized (max_attempts={_retry_policy.max_attempts}, "
+                    f"budget_percent={_retry_policy.budget.percent})"
+                )
+    return _retry_policy
+
+
+def reset_retry_policy() -> None:
+    """
+    Drop the process-wide retry policy so the next call rebuilds it from configuration.
+    """
+    global _retry_policy
+    with _retry_policy_lock:
+        _retry_policy = None
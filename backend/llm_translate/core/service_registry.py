@@ -0,0 +1,123 @@
+"""
+Service registry module.
+Keeps one translator or speaker instance per provider, model and API key, so requests reuse
+services (and their SDK clients) instead of constructing new ones.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from llm_translate.utils.http_client import add_close_hook
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.service_registry")
+
+
+class ServiceRegistry:
+    """
+    Thread-safe store of service instances keyed by (kind, provider, model, API key, configuration version).
+
+    A lookup for a key that is already present is a single dictionary read. Building a service for a
+    new model or key of the same kind and provider replaces the old instance, so configuration changes
+    do not accumulate stale services; invalidate() drops everything.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._services: Dict[Tuple[Hashable, ...], Any] = {}
+        # Reentrant, since building a pipeline looks up the provider services it wraps
+        self._lock = threading.RLock()
+        self.builds = 0
+        self.hits = 0
+
+    def get(self, kind: str, provider: str, model: Optional[str], api_key: Optional[str],
+            factory: Callable[[], Any], version: Optional[int] = None) -> Any:
+        """
+        Get the service for a provider, model and key, building it on first use.
+
+        Args:
+            kind (str): Service kind, e.g. "translator" or "speaker".
+            provider (str): Provider name.
+            model (Optional[str]): Model name.
+            api_key (Optional[str]): API key the service authenticates with.
+            factory (Callable[[], Any]): Builds the service; exceptions propagate and nothing is stored.
+            version (Optional[int], optional): Configuration version, for services built from more settings
+                than the provider's own, e.g. request pipelines. Defaults to None.
+
+        Returns:
+            Any: Shared service instance.
+        """
+        key = (kind, provider, model, api_key, version)
+        service = self._services.get(key)
+        if service is not None:
+            self.hits += 1
+            return service
+        with self._lock:
+            service = self._services.get(key)
+            if service is None:
+                service = factory()
+                stale = [other for other in self._services if other[:2] == (kind, provider)]
+                for other in stale:
+                    del self._services[other]
+                self._services[key] = service
+                self.builds += 1
+                logger.info(f"Built {kind} service for provider {provider} with model {model}")
+            else:
+                self.hits += 1
+        return service
+
+    def invalidate(self) -> None:
+        """
+        Drop all services so the next lookups rebuild them, e.g. after a configuration change.
+        """
+        with self._lock:
+            self._services.clear()
+        logger.info("Service registry invalidated")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get registry counters.
+
+        Returns:
+            Dict[str, int]: Services held, services built and lookups served from the registry.
+        """
+        return {"size": len(self._services), "builds": self.builds, "hits": self.hits}
+
+
+_service_registry: Optional[ServiceRegistry] = None
+_service_registry_lock = threading.Lock()
+
+
+def get_service_registry() -> ServiceRegistry:
+    """
+    Get the process-wide service registry.
+
+    Returns:
+        ServiceRegistry: Shared registry.
+    """
+    global _service_registry
+    if _service_registry is None:
+        with _service_registry_lock:
+            if _service_registry is None:
+                _service_registry = ServiceRegistry()
+                # Services hold SDK clients bound to the shared HTTP client, so they cannot outlive it
+                add_close_hook(_invalidate_service_registry)
+    return _service_registry
+
+
+def _invalidate_service_registry() -> None:
+    """
+    Drop every service of the process-wide registry, if it exists.
+    """
+    if _service_registry is not None:
+        _service_registry.invalidate()
+
+
+def reset_service_registry() -> None:
+    """
+    Drop the process-wide service registry and every service it holds.
+    """
+    global _service_registry
+    with _service_registry_lock:
+        _service_registry = None
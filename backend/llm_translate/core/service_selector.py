@@ -1,11 +1,28 @@
 """
 Service selector module for selecting the appropriate translator service based on configuration.
 """
-from typing import Dict, Any
+from typing import Any, List, Mapping, Optional
 
-from llm_translate.utils.config import load_config
+from llm_translate.core.admission import BulkheadSpeaker, BulkheadTranslator, get_admission_controller
+from llm_translate.core.chunking import ChunkedTranslator
+from llm_translate.core.circuit_breaker import FallbackSpeaker, FallbackTranslator, get_circuit_breakers
+from llm_translate.core.disk_cache import get_disk_translation_cache
+from llm_translate.core.fuzzy_memory import FuzzyMatchTranslator, get_fuzzy_index
+from llm_translate.core.hedging import HedgedTranslator, get_hedge_controller
+from llm_translate.core.instrumentation import InstrumentedSpeaker, InstrumentedTranslator
+from llm_translate.core.language_detection import LanguageDetectingTranslator, get_local_language_detector
+from llm_translate.core.load_balancer import BalancedTranslator, get_load_balancer
+from llm_translate.core.micro_batching import MicroBatchingTranslator, get_micro_batcher
+from llm_translate.core.model_tiering import FAST, TieredTranslator, TieringPolicy, TieringScopeTranslator
+from llm_translate.core.rate_limiter import RateLimitedSpeaker, RateLimitedTranslator, get_rate_limiters
+from llm_translate.core.retry import RetryingSpeaker, RetryingTranslator, get_retry_policy
+from llm_translate.core.service_registry import get_service_registry
+from llm_translate.core.single_flight import CoalescingTranslator, get_single_flight
+from llm_translate.core.translation_cache import CachedTranslator, get_translation_cache
+from llm_translate.core.translation_memory import SegmentedTranslator, get_translation_memory
+from llm_translate.utils.config import get_config
 from llm_translate.utils.logging import setup_logger
-from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.services.base_translator import BaseTranslator, BatchPackingTranslator
 from llm_translate.services.base_speaker import BaseSpeaker
 from llm_translate.services.openai_speaker import OpenAISpeaker
 from llm_translate.services.groq_speaker import GroqSpeaker
@@ -15,28 +32,136 @@ from llm_translate.services.groq_speaker import GroqSpeaker
 logger = setup_logger("llm_translate.service_selector")
 
 
-def get_translation_service() -> BaseTranslator:
+# API key and model settings for each provider
+_PROVIDER_SETTINGS = {
+    "openai": ("OPENAI_API_KEY", "OPENAI_MODEL"),
+    "groq": ("GROQ_API_KEY", "GROQ_MODEL"),
+    "openrouter": ("OPENROUTER_API_KEY", "OPENROUTER_MODEL"),
+}
+
+# Fast, cheap model setting of each provider for short texts
+_FAST_MODEL_SETTINGS = {
+    "openai": "OPENAI_FAST_MODEL",
+    "groq": "GROQ_FAST_MODEL",
+    "openrouter": "OPENROUTER_FAST_MODEL",
+}
+
+
+def get_translation_service(config: Optional[Mapping[str, Any]] = None) -> BaseTranslator:
     """
-    Get the appropriate translation service based on the configuration.
+    Get the translation service for the configured provider, reusing the instance built for the same
+    provider, model and API key by earlier requests.
+    
+    Args:
+        config (Optional[Mapping[str, Any]], optional): Configuration snapshot of the current request.
+            Defaults to the current snapshot.
     
     Returns:
-        BaseTranslator: An instance of a translator service.
+        BaseTranslator: A shared instance of a translator service.
         
     Raises:
         ValueError: If the configured AI service provider is not supported.
         ImportError: If the required translator module is not available.
     """
-    config: Dict[str, Any] = load_config()
-    provider = config.get("AI_SOURCE", "openai").lower()
+    config = config if config is not None else get_config()
+    return get_provider_translator(config.get("AI_SOURCE", "openai"), config)
+
+
+def get_provider_translator(provider: str, config: Optional[Mapping[str, Any]] = None,
+                            fast: bool = False) -> BaseTranslator:
+    """
+    Get the shared translator for a specific provider, e.g. a hedging, load balancing or fallback target.
+    
+    Args:
+        provider (str): Provider name ("openai", "groq" or "openrouter").
+        config (Optional[Mapping[str, Any]], optional): Configuration snapshot of the current request.
+            Defaults to the current snapshot.
+        fast (bool, optional): Use the provider's fast model instead of its main model. Defaults to False.
+    
+    Returns:
+        BaseTranslator: A shared instance of the provider's translator.
+        
+    Raises:
+        ValueError: If the provider is not supported.
+        ImportError: If the required translator module is not available.
+    """
+    config = config if config is not None else get_config()
+    provider = provider.lower()
+    key_setting, model_setting = _PROVIDER_SETTINGS.get(provider, ("", ""))
+    # Fast models are registered separately so they do not replace the provider's main model
+    kind, model = "translator", config.get(model_setting)
+    if fast:
+        kind, model = "fast_translator", config.get(_FAST_MODEL_SETTINGS.get(provider, ""))
+    return get_service_registry().get(
+        kind, provider, model, config.get(key_setting),
+        lambda: _create_translation_service(provider, config, model)
+    )
+
+
+def get_fast_model(provider: str, config: Mapping[str, Any]) -> Optional[str]:
+    """
+    Get the fast model short texts are routed to, if model tiering is enabled for a provider.
+
+    Args:
+        provider (str): Provider name ("openai", "groq" or "openrouter").
+        config (Mapping[str, Any]): Application configuration.
+
+    Returns:
+        Optional[str]: The provider's fast model, or None if tiering is disabled, no fast model is
+            configured or it is the provider's main model.
+    """
+    provider = provider.lower()
+    fast_model = config.get(_FAST_MODEL_SETTINGS.get(provider, ""))
+    if not config.get("MODEL_TIERING_ENABLED", False) or not fast_model:
+        return None
+    _, model_setting = _PROVIDER_SETTINGS[provider]
+    return fast_model if fast_model != config.get(model_setting) else None
+
+
+def get_tiered_model(config: Mapping[str, Any], text: str, from_lang: str, to_lang: str) -> Optional[str]:
+    """
+    Get the fast model of the configured provider if model tiering routes a text to it.
+
+    Args:
+        config (Mapping[str, Any]): Configuration snapshot of the request.
+        text (str): Text to translate.
+        from_lang (str): Source language, detected if the request asked for "Auto-detect".
+        to_lang (str): Target language.
+
+    Returns:
+        Optional[str]: The provider's fast model, or None if the text goes to its main model.
+    """
+    fast_model = get_fast_model(config.get("AI_SOURCE", "openai"), config)
+    if fast_model and TieringPolicy.from_config(config).tier(text, from_lang, to_lang) == FAST:
+        return fast_model
+    return None
+
+
+def _create_translation_service(provider: str, config: Mapping[str, Any], model: Optional[str] = None) -> BaseTranslator:
+    """
+    Create a translation service for a provider.
+    
+    Args:
+        provider (str): Lower-cased AI_SOURCE.
+        config (Mapping[str, Any]): Application configuration.
+        model (Optional[str], optional): Model to use; None selects the provider's configured model. Defaults to None.
+    
+    Returns:
+        BaseTranslator: A new instance of a translator service.
+        
+    Raises:
+        ValueError: If the AI service provider is not supported.
+        ImportError: If the required translator module is not available.
+    """
     logger.info(f"Selecting translation service for provider: {provider}")
     
     if provider == "openai":
         try:
             from llm_translate.services.openai_translator import OpenAITranslator
-            logger.debug(f"Initializing OpenAI translator with model: {config.get('OPENAI_MODEL', 'gpt-4.1-mini-2025-04-14')}")
+            logger.debug(f"Initializing OpenAI translator with model: {model or config.get('OPENAI_MODEL', 'gpt-4.1-mini-2025-04-14')}")
             return OpenAITranslator(
                 api_key=config.get("OPENAI_API_KEY"),
-                model=config.get("OPENAI_MODEL", "gpt-4.1-mini-2025-04-14")
+                model=model or config.get("OPENAI_MODEL", "gpt-4.1-mini-2025-04-14")
             )
         except ImportError:
             logger.error("OpenAI translator module not found")
@@ -45,10 +170,10 @@ def get_translation_service() -> BaseTranslator:
     elif provider == "groq":
         try:
             from llm_translate.services.groq_translator import GroqTranslator
-            logger.debug(f"Initializing Groq translator with model: {config.get('GROQ_MODEL', 'meta-llama/llama-4-maverick-17b-128e-instruct')}")
+            logger.debug(f"Initializing Groq translator with model: {model or config.get('GROQ_MODEL', 'meta-llama/llama-4-maverick-17b-128e-instruct')}")
             return GroqTranslator(
                 api_key=config.get("GROQ_API_KEY"),
-                model=config.get("GROQ_MODEL", "meta-llama/llama-4-maverick-17b-128e-instruct")
+                model=model or config.get("GROQ_MODEL", "meta-llama/llama-4-maverick-17b-128e-instruct")
             )
         except ImportError:
             logger.error("Groq translator module not found")
@@ -57,10 +182,10 @@ def get_translation_service() -> BaseTranslator:
     elif provider == "openrouter":
         try:
             from llm_translate.services.openrouter_translator import OpenRouterTranslator
-            logger.debug(f"Initializing OpenRouter translator with model: {config.get('OPENROUTER_MODEL', 'qwen/qwen3-4b:free')}")
+            logger.debug(f"Initializing OpenRouter translator with model: {model or config.get('OPENROUTER_MODEL', 'qwen/qwen3-4b:free')}")
             return OpenRouterTranslator(
                 api_key=config.get("OPENROUTER_API_KEY"),
-                model=config.get("OPENROUTER_MODEL", "qwen/qwen3-4b:free")
+                model=model or config.get("OPENROUTER_MODEL", "qwen/qwen3-4b:free")
             )
         except ImportError:
             logger.error("OpenRouter translator module not found")
@@ -71,22 +196,312 @@ def get_translation_service() -> BaseTranslator:
         raise ValueError(f"Unsupported AI service provider: {provider}")
 
 
-def get_speaker_service() -> BaseSpeaker:
+def _provider_list(value: Optional[str], exclude: str) -> List[str]:
+    """
+    Parse a comma-separated provider list setting.
+
+    Args:
+        value (Optional[str]): Setting value, e.g. "openai, openrouter".
+        exclude (str): Provider to leave out, usually the primary one.
+
+    Returns:
+        List[str]: Lower-cased provider names in order, without duplicates.
+    """
+    names = dict.fromkeys(name.strip().lower() for name in (value or "").split(","))
+    return [name for name in names if name and name != exclude]
+
+
+def _wrap_provider(translator: BaseTranslator, config: Mapping[str, Any]) -> BaseTranslator:
+    """
+    Put a provider translator behind its metrics and tracing, its provider's bulkhead, rate limiter and the retry policy, as configured.
+
+    Args:
+        translator (BaseTranslator): Provider translator.
+        config (Mapping[str, Any]): Application configuration.
+
+    Returns:
+        BaseTranslator: The translator, instrumented, concurrency limited, rate limited and retrying as configured;
+        each retry waits for the rate limiter and the bulkhead again and is recorded as its own provider call.
+        Batches are packed with the configured limits, leaving the shared provider instance unchanged.
+    """
+    translator = BatchPackingTranslator(
+        translator,
+        batch_max_tokens=config.get("BATCH_MAX_TOKENS", 2000),
+        batch_max_items=config.get("BATCH_MAX_ITEMS", 50),
+        batch_concurrency=config.get("BATCH_CONCURRENCY", 8)
+    )
+    if config.get("METRICS_ENABLED", True) or config.get("TRACING_ENABLED", False):
+        translator = InstrumentedTranslator(translator)
+    bulkhead = get_admission_controller().provider(translator.provider) if config.get("ADMISSION_ENABLED", True) else None
+    if bulkhead is not None:
+        translator = BulkheadTranslator(translator, bulkhead)
+    if config.get("RATE_LIMIT_ENABLED", True):
+        translator = RateLimitedTranslator(translator, get_rate_limiters().limiter(translator.provider))
+    if config.get("RETRY_ENABLED", True):
+        translator = RetryingTranslator(translator, get_retry_policy())
+    return translator
+
+
+def _wrap_speaker(speaker: BaseSpeaker, config: Mapping[str, Any]) -> BaseSpeaker:
+    """
+    Put a speaker behind its metrics and tracing, its provider's bulkhead, rate limiter and the retry policy, as configured.
+
+    Args:
+        speaker (BaseSpeaker): Provider speaker.
+        config (Mapping[str, Any]): Application configuration.
+
+    Returns:
+        BaseSpeaker: The speaker, instrumented, concurrency limited, rate limited and retrying as configured.
+    """
+    if config.get("METRICS_ENABLED", True) or config.get("TRACING_ENABLED", False):
+        speaker = InstrumentedSpeaker(speaker)
+    bulkhead = get_admission_controller().provider(speaker.provider) if config.get("ADMISSION_ENABLED", True) else None
+    if bulkhead is not None:
+        speaker = BulkheadSpeaker(speaker, bulkhead)
+    if config.get("RATE_LIMIT_ENABLED", True):
+        speaker = RateLimitedSpeaker(speaker, get_rate_limiters().limiter(speaker.provider))
+    if config.get("RETRY_ENABLED", True):
+        speaker = RetryingSpeaker(speaker, get_retry_policy())
+    return speaker
+
+
+def _member_translator(provider: str, config: Mapping[str, Any], guarded: bool = True) -> BaseTranslator:
+    """
+    Get another provider's translator for use next to the primary one.
+
+    Args:
+        provider (str): Provider name.
+        config (Mapping[str, Any]): Application configuration.
+        guarded (bool, optional): Put the translator behind its circuit breaker, if circuit breaking is enabled.
+            Defaults to True.
+
+    Returns:
+        BaseTranslator: The provider's shared translator.
+    """
+    member = _wrap_provider(get_provider_translator(provider, config), config)
+    if guarded and config.get("CIRCUIT_BREAKER_ENABLED", True):
+        member = FallbackTranslator([member], get_circuit_breakers())
+    return member
+
+
+def build_translation_pipeline(translator: BaseTranslator, config: Mapping[str, Any]) -> BaseTranslator:
+    """
+    Get the translation pipeline of a provider translator, built once per configuration version and
+    shared by the requests that use that version; plain mappings without a version get a new pipeline.
+
+    Args:
+        translator (BaseTranslator): Provider translator returned by get_translation_service().
+        config (Mapping[str, Any]): Application configuration.
+
+    Returns:
+        BaseTranslator: The translator wrapped with the layers enabled in the configuration.
+    """
+    version = getattr(config, "version", None)
+    if version is None:
+        return _build_translation_pipeline(translator, config)
+    return get_service_registry().get(
+        "translation_pipeline", translator.provider, translator.model, translator.api_key,
+        lambda: _build_translation_pipeline(translator, config), version=version
+    )
+
+
+def _build_translation_pipeline(translator: BaseTranslator, config: Mapping[str, Any]) -> BaseTranslator:
+    """
+    Wrap a translator with the caching, batching and chunking layers enabled in the configuration.
+
+    Args:
+        translator (BaseTranslator): Provider translator returned by get_translation_service().
+        config (Mapping[str, Any]): Application configuration.
+
+    Returns:
+        BaseTranslator: The translator wrapped with rate limiting, retries, model tiering, circuit breaking and fallback, load balancing, hedging, chunking, micro-batching, the translation memory,
+        fuzzy matching, request coalescing and translation cache, as configured, behind source language detection.
+    """
+    translator = _wrap_provider(translator, config)
+
+    tiering = None
+    if get_fast_model(translator.provider, config):
+        tiering = TieringPolicy.from_config(config)
+        fast = _wrap_provider(get_provider_translator(translator.provider, config, fast=True), config)
+        translator = TieredTranslator(translator, fast, tiering)
+
+    if config.get("CIRCUIT_BREAKER_ENABLED", True):
+        fallbacks = _provider_list(config.get("FALLBACK_PROVIDERS"), exclude=translator.provider)
+        translator = FallbackTranslator(
+            [translator] + [_member_translator(provider, config, guarded=False) for provider in fallbacks],
+            get_circuit_breakers()
+        )
+
+    balanced_providers = _provider_list(config.get("LOAD_BALANCER_PROVIDERS"), exclude=translator.provider)
+    if config.get("LOAD_BALANCER_ENABLED", False) and balanced_providers:
+        translator = BalancedTranslator(
+            [translator] + [_member_translator(provider, config) for provider in balanced_providers],
+            get_load_balancer()
+        )
+
+    supports_batch = translator.supports_batch
+    provider_translator = translator
+
+    hedge_provider = (config.get("HEDGE_PROVIDER") or "").lower()
+    if config.get("HEDGING_ENABLED", False) and hedge_provider and hedge_provider != translator.provider:
+        translator = HedgedTranslator(
+            translator, _member_translator(hedge_provider, config), get_hedge_controller()
+        )
+
+    disk_cache = get_disk_translation_cache()
+    if config.get("CHUNKING_ENABLED", True):
+        translator = ChunkedTranslator(
+            translator,
+            chunk_max_tokens=config.get("CHUNK_MAX_TOKENS", 1000),
+            overlap_tokens=config.get("CHUNK_OVERLAP_TOKENS", 64),
+            concurrency=config.get("CHUNK_CONCURRENCY", 4)
+        )
+    if config.get("MICRO_BATCH_ENABLED", True) and supports_batch:
+        translator = MicroBatchingTranslator(translator, get_micro_batcher(), tiering)
+    if config.get("TRANSLATION_MEMORY_ENABLED", False):
+        translator = SegmentedTranslator(
+            translator,
+            get_translation_memory(),
+            disk_cache,
+            min_segments=config.get("TRANSLATION_MEMORY_MIN_SEGMENTS", 2)
+        )
+    if config.get("FUZZY_MATCH_ENABLED", False):
+        translator = FuzzyMatchTranslator(
+            translator,
+            get_fuzzy_index(),
+            threshold=config.get("FUZZY_MATCH_THRESHOLD", 0.8),
+            max_chars=config.get("FUZZY_MATCH_MAX_CHARS", 2000)
+        )
+    if config.get("SINGLE_FLIGHT_ENABLED", True):
+        translator = CoalescingTranslator(translator, get_single_flight())
+    cached = None
+    if config.get("TRANSLATION_CACHE_ENABLED", True):
+        translator = cached = CachedTranslator(translator, get_translation_cache(), disk_cache)
+    if config.get("MODEL_TIERING_ENABLED", False):
+        translator = TieringScopeTranslator(translator)
+    # Resolve "Auto-detect" first so every layer below keys on the actual source language
+    translator = LanguageDetectingTranslator(
+        translator,
+        provider_translator,
+        detector=get_local_language_detector() if config.get("LOCAL_LANGUAGE_DETECTION_ENABLED", True) else None,
+        min_confidence=config.get("LANGUAGE_DETECTION_MIN_CONFIDENCE", 0.2),
+        fused=config.get("FUSED_DETECTION_ENABLED", True),
+        # Longer texts are chunked below, which the fused completion would bypass
+        fused_max_tokens=config.get("CHUNK_MAX_TOKENS", 1000),
+        cached=cached
+    )
+    return translator
+
+
+def get_speaker_service(config: Optional[Mapping[str, Any]] = None) -> BaseSpeaker:
     """
-    Get the appropriate TTS speaker service based on the configuration.
+    Get the TTS speaker service for the configured provider, reusing the instance built for the same
+    provider, model and API key by earlier requests.
+
+    Args:
+        config (Optional[Mapping[str, Any]], optional): Configuration snapshot of the current request.
+            Defaults to the current snapshot.
 
     Returns:
-        BaseSpeaker: An instance of a speaker service.
+        BaseSpeaker: A shared instance of a speaker service.
 
     Raises:
         ValueError: If the configured TTS service provider is not supported.
         ImportError: If the required speaker module is not available.
     """
-    config: Dict[str, Any] = load_config()
+    config = config if config is not None else get_config()
     tts_provider = config.get("TTS_SOURCE", "openai").lower()
-    logger.info(f"Selecting TTS speaker service for provider: {tts_provider}")
+    key_setting, _ = _PROVIDER_SETTINGS.get(tts_provider, ("", ""))
+    return get_service_registry().get(
+        "speaker", tts_provider, config.get("TTS_MODEL"), config.get(key_setting),
+        lambda: _create_speaker_service(tts_provider, config, config.get("TTS_MODEL"))
+    )
+
+
+def get_provider_speaker(provider: str, config: Optional[Mapping[str, Any]] = None) -> BaseSpeaker:
+    """
+    Get the shared speaker for a specific TTS provider with that provider's default model, e.g. a fallback target.
+
+    Args:
+        provider (str): TTS provider name ("openai" or "groq").
+        config (Optional[Mapping[str, Any]], optional): Configuration snapshot of the current request.
+            Defaults to the current snapshot.
+
+    Returns:
+        BaseSpeaker: A shared instance of the provider's speaker.
+
+    Raises:
+        ValueError: If the TTS service provider is not supported.
+        ImportError: If the required speaker module is not available.
+    """
+    config = config if config is not None else get_config()
+    provider = provider.lower()
+    key_setting, _ = _PROVIDER_SETTINGS.get(provider, ("", ""))
+    return get_service_registry().get(
+        "speaker", provider, None, config.get(key_setting),
+        lambda: _create_speaker_service(provider, config, None)
+    )
+
+
+def build_speaker_pipeline(speaker: BaseSpeaker, config: Mapping[str, Any]) -> BaseSpeaker:
+    """
+    Get the speaker pipeline of a provider speaker, built once per configuration version and shared by
+    the requests that use that version; plain mappings without a version get a new pipeline.
+
+    Args:
+        speaker (BaseSpeaker): Speaker returned by get_speaker_service().
+        config (Mapping[str, Any]): Application configuration.
+
+    Returns:
+        BaseSpeaker: The speaker wrapped with the layers enabled in the configuration.
+    """
+    version = getattr(config, "version", None)
+    if version is None:
+        return _build_speaker_pipeline(speaker, config)
+    return get_service_registry().get(
+        "speaker_pipeline", speaker.provider, speaker.model, speaker.api_key,
+        lambda: _build_speaker_pipeline(speaker, config), version=version
+    )
+
 
-    tts_model = config.get("TTS_MODEL") # Get the generic TTS_MODEL
+def _build_speaker_pipeline(speaker: BaseSpeaker, config: Mapping[str, Any]) -> BaseSpeaker:
+    """
+    Put a speaker behind its rate limiter, retries, circuit breaker and the TTS fallback chain, if enabled in the configuration.
+
+    Args:
+        speaker (BaseSpeaker): Speaker returned by get_speaker_service().
+        config (Mapping[str, Any]): Application configuration.
+
+    Returns:
+        BaseSpeaker: The speaker, wrapped with rate limiting, retries, circuit breaking and fallback as configured.
+    """
+    speakers = [speaker]
+    if config.get("CIRCUIT_BREAKER_ENABLED", True):
+        fallbacks = _provider_list(config.get("TTS_FALLBACK_PROVIDERS"), exclude=speaker.provider)
+        speakers += [get_provider_speaker(provider, config) for provider in fallbacks]
+    speakers = [_wrap_speaker(member, config) for member in speakers]
+    if not config.get("CIRCUIT_BREAKER_ENABLED", True):
+        return speakers[0]
+    return FallbackSpeaker(speakers, get_circuit_breakers())
+
+
+def _create_speaker_service(tts_provider: str, config: Mapping[str, Any], tts_model: Optional[str]) -> BaseSpeaker:
+    """
+    Create a TTS speaker service for a provider.
+
+    Args:
+        tts_provider (str): Lower-cased TTS provider name.
+        config (Mapping[str, Any]): Application configuration.
+        tts_model (Optional[str]): TTS model; None selects the provider's default model.
+
+    Returns:
+        BaseSpeaker: A new instance of a speaker service.
+
+    Raises:
+        ValueError: If the TTS service provider is not supported.
+        ImportError: If the required speaker module is not available.
+    """
+    logger.info(f"Selecting TTS speaker service for provider: {tts_provider}")
 
     if tts_provider == "openai":
         openai_api_key = config.get("OPENAI_API_KEY")
@@ -0,0 +1,182 @@
+"""
+Request coalescing module.
+Concurrent identical translation requests share a single provider call.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from llm_translate.core.translation_cache import make_cache_key
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+
+
+class _Call:
+    """An in-flight call and the number of callers waiting on it."""
+
+    __slots__ = ("task", "waiters", "abandoned")
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+        self.abandoned = False
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key.
+
+    The first caller for a key starts the work in its own task; callers that arrive while it is
+    running await the same task. A cancelled caller only stops waiting: the work keeps running for
+    the others and is cancelled only once every caller has gone. Errors reach every caller.
+    """
+
+    def __init__(self):
+        """
+        Initialize the single-flight group.
+        """
+        self._calls: Dict[str, _Call] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn once for all concurrent callers using the same key.
+
+        Args:
+            key (str): Deduplication key.
+            fn (Callable[[], Awaitable[Any]]): Coroutine function doing the work.
+
+        Returns:
+            Any: Result of fn.
+
+        Raises:
+            Exception: Whatever fn raised.
+        """
+        call = self._calls.get(key)
+        if call is None or call.abandoned:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda task: self._finish(key, call))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Nobody is waiting any more; stop the work and let new callers start afresh
+                call.abandoned = True
+                call.task.cancel()
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            raise
+
+    def _finish(self, key: str, call: _Call) -> None:
+        """
+        Forget a finished call.
+
+        Args:
+            key (str): Deduplication key.
+            call (_Call): Finished call.
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.task.cancelled():
+            # Mark the exception as retrieved even if every caller was cancelled
+            call.task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dict[str, int]: Number of calls started, callers that joined an in-flight call, and calls in flight.
+        """
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
+
+
+class CoalescingTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that lets concurrent identical requests share one translation.
+    Requests are identical when provider, model, normalized language pair and normalized text match.
+    """
+
+    def __init__(self, translator: BaseTranslator, group: SingleFlight):
+        """
+        Initialize the coalescing translator.
+
+        Args:
+            translator (BaseTranslator): Translator to delegate to.
+            group (SingleFlight): Single-flight group shared across requests.
+        """
+        super().__init__(translator)
+        self.group = group
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text, joining an identical in-flight translation if there is one.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If the wrapped translator fails.
+        """
+        key = make_cache_key(self.provider, str(self.model), from_lang, to_lang, text)
+        return await self.group.do(
+            key, lambda: self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
+        )
+
+    async def detect_and_translate(self, text: str, to_lang: str) -> Optional[Tuple[str, str]]:
+        """
+        Detect and translate in one call, joining an identical in-flight call if there is one.
+
+        Args:
+            text (str): Text to translate.
+            to_lang (str): Target language.
+
+        Returns:
+            Optional[Tuple[str, str]]: Detected language and translated text, or None if unavailable.
+        """
+        key = "detect:" + make_cache_key(self.provider, str(self.model), "*", to_lang, text)
+        return await self.group.do(key, lambda: self.translator.detect_and_translate(text, to_lang))
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Get the process-wide single-flight group for translations.
+
+    Returns:
+        SingleFlight: Shared single-flight group.
+    """
+    global _single_flight
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight()
+    return _single_flight
+
+
+def reset_single_flight() -> None:
+    """
+    Drop the process-wide single-flight group.
+    """
+    global _single_flight
+    with _single_flight_lock:
+        _single_flight = None
@@ -0,0 +1,405 @@
+"""
+In-process translation cache module.
+Provides a bounded LRU cache with TTL expiry and a translator wrapper that serves repeat requests from it.
+"""
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from llm_translate.core.disk_cache import DiskTranslationCache
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.metrics import record_timing
+
+
+# Set up logger
+logger = setup_logger("llm_translate.translation_cache")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text before hashing so trivially different inputs share a cache entry.
+
+    Args:
+        text (str): Text to normalize.
+
+    Returns:
+        str: NFC-normalized text with surrounding whitespace removed.
+    """
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def normalize_lang(lang: str) -> str:
+    """
+    Normalize a language name for use in cache keys.
+
+    Args:
+        lang (str): Language name, e.g. "English" or " spanish ".
+
+    Returns:
+        str: Lower-cased language name with surrounding whitespace removed.
+    """
+    return (lang or "").strip().lower()
+
+
+def make_cache_key(provider: str, model: str, from_lang: str, to_lang: str, text: str) -> str:
+    """
+    Build a cache key for a translation.
+
+    Args:
+        provider (str): Provider name, e.g. "openai".
+        model (str): Model used for the translation.
+        from_lang (str): Source language.
+        to_lang (str): Target language.
+        text (str): Source text.
+
+    Returns:
+        str: Cache key of the form "provider|model|from|to|sha256".
+    """
+    text_hash = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{provider}|{model}|{normalize_lang(from_lang)}|{normalize_lang(to_lang)}|{text_hash}"
+
+
+class TranslationCache:
+    """
+    Thread-safe, bounded in-memory cache with LRU eviction and a per-entry TTL.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the translation cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of entries kept. Defaults to 10000.
+            ttl_seconds (float, optional): Seconds an entry stays valid. Zero or less disables expiry. Defaults to 3600.
+            clock (Callable[[], float], optional): Monotonic clock, overridable for tests. Defaults to time.monotonic.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than zero")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached translation and mark it as most recently used.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[str]: Cached translation, or None on a miss or an expired entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at and expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a translation, evicting the least recently used entries when full.
+
+        Args:
+            key (str): Cache key.
+            value (str): Translated text.
+        """
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict[str, Any]: Hit, miss, eviction and expiration counts plus size and limits.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+class CachedTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that answers repeat requests from a TranslationCache.
+    Works with any BaseTranslator subclass; only successful translations are cached.
+    An optional DiskTranslationCache acts as a second tier behind the in-memory cache.
+    """
+
+    def __init__(self, translator: BaseTranslator, cache: TranslationCache,
+                 disk_cache: Optional[DiskTranslationCache] = None):
+        """
+        Initialize the cached translator.
+
+        Args:
+            translator (BaseTranslator): Translator to delegate cache misses to.
+            cache (TranslationCache): In-memory cache shared across requests.
+            disk_cache (Optional[DiskTranslationCache], optional): Persistent second tier. Defaults to None.
+        """
+        super().__init__(translator)
+        self.cache = cache
+        self.disk_cache = disk_cache
+
+    def cache_key(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Build the cache key for a request against the wrapped translator.
+
+        Args:
+            text (str): Source text.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            str: Cache key.
+        """
+        return make_cache_key(self.provider, str(self.model), from_lang, to_lang, text)
+
+    async def _lookup(self, key: str) -> Optional[str]:
+        """
+        Look up a translation in the memory cache and then the disk cache, recording the time spent.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[str]: Cached translation, or None on a miss.
+        """
+        started = time.perf_counter()
+        try:
+            cached = self.cache.get(key)
+            if cached is None and self.disk_cache is not None:
+                cached = await self.disk_cache.aget(key)
+                if cached is not None:
+                    self.logger.debug("Translation disk cache hit")
+                    self.cache.set(key, cached)
+            return cached
+        finally:
+            record_timing("cache", time.perf_counter() - started)
+
+    async def _lookup_many(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Look up several translations in the memory cache and then, in one call, the disk cache.
+
+        Args:
+            keys (List[str]): Cache keys.
+
+        Returns:
+            Dict[str, str]: Cached translations by key; misses are left out.
+        """
+        started = time.perf_counter()
+        try:
+            found: Dict[str, str] = {}
+            for key in keys:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    found[key] = cached
+            missing = [key for key in keys if key not in found]
+            if missing and self.disk_cache is not None:
+                from_disk = await self.disk_cache.aget_many(missing)
+                if from_disk:
+                    self.logger.debug(f"Translation disk cache hits: {len(from_disk)}")
+                for key, cached in from_disk.items():
+                    self.cache.set(key, cached)
+                found.update(from_disk)
+            return found
+        finally:
+            record_timing("cache", time.perf_counter() - started)
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text, serving repeats from the memory cache and then the disk cache.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If the wrapped translator fails.
+        """
+        key = self.cache_key(text, from_lang, to_lang)
+        cached = await self._lookup(key)
+        if cached is not None:
+            self.logger.debug(f"Translation cache hit: {from_lang} → {to_lang}")
+            return cached
+
+        translated_text = await self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
+        self._store(key, translated_text)
+        return translated_text
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Translate several texts, sending only the ones missing from the caches to the wrapped translator.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+
+        Raises:
+            TranslationError: If the wrapped translator fails.
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        keys = {text: self.cache_key(text, from_lang, to_lang) for text in texts}
+        cached = await self._lookup_many(list(keys.values()))
+        # Unique missing texts mapped to every position they appear at
+        missing: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if keys[text] in cached:
+                results[index] = cached[keys[text]]
+            else:
+                missing.setdefault(text, []).append(index)
+
+        if missing:
+            sources = list(missing)
+            translations = await self.translator.translate_batch(sources, from_lang, to_lang)
+            for source, translated_text in zip(sources, translations):
+                self._store(keys[source], translated_text)
+                for index in missing[source]:
+                    results[index] = translated_text
+        return results
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Stream a translation, serving repeats from the caches in one piece.
+        A streamed translation is cached once it has completed.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+
+        Raises:
+            TranslationError: If the wrapped translator fails.
+        """
+        key = self.cache_key(text, from_lang, to_lang)
+        cached = await self._lookup(key)
+        if cached is not None:
+            self.logger.debug(f"Translation cache hit: {from_lang} → {to_lang}")
+            yield cached
+            return
+
+        pieces: List[str] = []
+        async for piece in self.translator.translate_stream(text, from_lang, to_lang, usage):
+            pieces.append(piece)
+            yield piece
+        self._store(key, "".join(pieces))
+
+    def remember(self, text: str, from_lang: str, to_lang: str, translated_text: str) -> None:
+        """
+        Store a translation obtained outside this wrapper, so repeats are served from the caches.
+
+        Args:
+            text (str): Source text.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+            translated_text (str): Translated text.
+        """
+        self._store(self.cache_key(text, from_lang, to_lang), translated_text)
+
+    def _store(self, key: str, translated_text: str) -> None:
+        """
+        Store a translation in the memory cache and, if configured, the disk cache.
+
+        Args:
+            key (str): Cache key.
+            translated_text (str): Translated text.
+        """
+        self.cache.set(key, translated_text)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, translated_text)
+
+
+_translation_cache: Optional[TranslationCache] = None
+_translation_cache_lock = threading.Lock()
+
+
+def get_translation_cache() -> TranslationCache:
+    """
+    Get the process-wide translation cache, creating it from configuration on first use.
+
+    Returns:
+        TranslationCache: Shared translation cache.
+    """
+    global _translation_cache
+    if _translation_cache is None:
+        with _translation_cache_lock:
+            if _translation_cache is None:
+                config = get_config()
+                _translation_cache = TranslationCache(
+                    max_entries=config.get("TRANSLATION_CACHE_MAX_ENTRIES", 10000),
+                    ttl_seconds=config.get("TRANSLATION_CACHE_TTL_SECONDS", 3600.0),
+                )
+                logger.info(
+                    f"Translation cache initialized (max_entries={_translation_cache.max_entries}, "
+                    f"ttl_seconds={_translation_cache.ttl_seconds})"
+                )
+    return _translation_cache
+
+
+def reset_translation_cache() -> None:
+    """
+    Drop the process-wide translation cache so the next call rebuilds it from configuration.
+    """
+    global _translation_cache
+    with _translation_cache_lock:
+        _translation_cache = None
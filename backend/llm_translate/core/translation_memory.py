@@ -0,0 +1,231 @@
+"""
+Sentence-level translation memory module.
+Splits texts into segments, reuses stored segment translations and sends only the misses to the provider.
+"""
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from llm_translate.core.disk_cache import DiskTranslationCache
+from llm_translate.core.translation_cache import TranslationCache, make_cache_key
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.translation_memory")
+
+# Line breaks, or whitespace following sentence-ending punctuation
+_SEGMENT_BOUNDARY = re.compile(r"(\s*\n\s*|(?<=[.!?;。！？])\s+)")
+
+
+def split_segments(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Split text into sentence segments and the separators between them.
+
+    The text is reassembled exactly by interleaving the two lists:
+    separators[0] + segments[0] + separators[1] + segments[1] + ... + separators[-1].
+
+    Args:
+        text (str): Text to split.
+
+    Returns:
+        Tuple[List[str], List[str]]: Segments, and separators (one more than segments).
+    """
+    parts = _SEGMENT_BOUNDARY.split(text)
+    segments: List[str] = []
+    separators: List[str] = [""]
+    for index, part in enumerate(parts):
+        if index % 2:
+            separators[-1] += part
+        elif part:
+            segments.append(part)
+            separators.append("")
+    return segments, separators
+
+
+def join_segments(segments: List[str], separators: List[str]) -> str:
+    """
+    Reassemble text split by split_segments.
+
+    Args:
+        segments (List[str]): Segments, possibly translated.
+        separators (List[str]): Separators returned by split_segments.
+
+    Returns:
+        str: Reassembled text.
+    """
+    parts = [separators[0]]
+    for segment, separator in zip(segments, separators[1:]):
+        parts.append(segment)
+        parts.append(separator)
+    return "".join(parts)
+
+
+def needs_translation(segment: str) -> bool:
+    """
+    Check whether a segment contains anything to translate.
+
+    Args:
+        segment (str): Segment text.
+
+    Returns:
+        bool: False for segments made only of digits, punctuation or symbols.
+    """
+    return any(char.isalpha() for char in segment)
+
+
+class SegmentedTranslator(TranslatorWrapper):
+    """
+    Translator wrapper backed by a sentence-level translation memory.
+    Each segment is looked up per provider, model and language pair; only the missing
+    segments are sent to the wrapped translator, together in one batch request.
+    """
+
+    def __init__(self, translator: BaseTranslator, memory: TranslationCache,
+                 disk_cache: Optional[DiskTranslationCache] = None, min_segments: int = 2):
+        """
+        Initialize the segmented translator.
+
+        Args:
+            translator (BaseTranslator): Translator to delegate missing segments to.
+            memory (TranslationCache): Segment store shared across requests.
+            disk_cache (Optional[DiskTranslationCache], optional): Persistent segment store. Defaults to None.
+            min_segments (int, optional): Texts with fewer segments bypass the memory. Defaults to 2.
+        """
+        super().__init__(translator)
+        self.memory = memory
+        self.disk_cache = disk_cache
+        self.min_segments = min_segments
+
+    def segment_key(self, segment: str, from_lang: str, to_lang: str) -> str:
+        """
+        Build the translation memory key for a segment.
+
+        Args:
+            segment (str): Segment text.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            str: Segment key.
+        """
+        return "tm|" + make_cache_key(self.provider, str(self.model), from_lang, to_lang, segment)
+
+    async def _lookup_many(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Look up segments in memory and then, in one call, on disk.
+
+        Args:
+            keys (List[str]): Segment keys.
+
+        Returns:
+            Dict[str, str]: Stored translations by key; misses are left out.
+        """
+        found: Dict[str, str] = {}
+        for key in keys:
+            translated = self.memory.get(key)
+            if translated is not None:
+                found[key] = translated
+        missing = [key for key in keys if key not in found]
+        if missing and self.disk_cache is not None:
+            from_disk = await self.disk_cache.aget_many(missing)
+            for key, translated in from_disk.items():
+                self.memory.set(key, translated)
+            found.update(from_disk)
+        return found
+
+    def _store(self, key: str, translated: str) -> None:
+        """
+        Store a segment translation in memory and on disk.
+
+        Args:
+            key (str): Segment key.
+            translated (str): Translated segment.
+        """
+        self.memory.set(key, translated)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, translated)
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Translate text segment by segment, reusing stored segment translations.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text with the original segment order and separators.
+
+        Raises:
+            TranslationError: If the wrapped translator fails.
+        """
+        segments, separators = split_segments(text)
+        if len(segments) < self.min_segments or from_lang.strip().lower() == to_lang.strip().lower():
+            return await self.translator.translate(text=text, from_lang=from_lang, to_lang=to_lang)
+
+        translated: List[Optional[str]] = [None] * len(segments)
+        keys: Dict[int, str] = {}
+        for index, segment in enumerate(segments):
+            if needs_translation(segment):
+                keys[index] = self.segment_key(segment, from_lang, to_lang)
+            else:
+                translated[index] = segment
+        stored = await self._lookup_many(list(dict.fromkeys(keys.values())))
+
+        # Unique missing segments mapped to every position they appear at
+        missing: Dict[str, List[int]] = {}
+        for index, key in keys.items():
+            translated[index] = stored.get(key)
+            if translated[index] is None:
+                missing.setdefault(segments[index], []).append(index)
+
+        self.logger.debug(
+            f"Translation memory: {len(segments)} segments, {len(missing)} to translate: {from_lang} → {to_lang}"
+        )
+        if missing:
+            sources = list(missing)
+            results = await self.translator.translate_batch(sources, from_lang, to_lang)
+            for source, result in zip(sources, results):
+                positions = missing[source]
+                self._store(keys[positions[0]], result)
+                for index in positions:
+                    translated[index] = result
+
+        return join_segments(translated, separators)
+
+
+_translation_memory: Optional[TranslationCache] = None
+_translation_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> TranslationCache:
+    """
+    Get the process-wide segment store, creating it from configuration on first use.
+
+    Returns:
+        TranslationCache: Shared translation memory.
+    """
+    global _translation_memory
+    if _translation_memory is None:
+        with _translation_memory_lock:
+            if _translation_memory is None:
+                config = get_config()
+                _translation_memory = TranslationCache(
+                    max_entries=config.get("TRANSLATION_MEMORY_MAX_SEGMENTS", 100000),
+                    ttl_seconds=config.get("TRANSLATION_CACHE_TTL_SECONDS", 3600.0),
+                )
+                logger.info(f"Translation memory initialized (max_segments={_translation_memory.max_entries})")
+    return _translation_memory
+
+
+def reset_translation_memory() -> None:
+    """
+    Drop the process-wide translation memory so the next call rebuilds it from configuration.
+    """
+    global _translation_memory
+    with _translation_memory_lock:
+        _translation_memory = None
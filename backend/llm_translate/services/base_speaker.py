@@ -5,15 +5,19 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
 import io
 import logging
+import time
 from pydub import AudioSegment
 
 from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.metrics import AUDIO_CONVERSION_SECONDS, record_timing
+from llm_translate.utils.tracing import span
 
 
 class BaseSpeaker(ABC):
     """
     Abstract base class for text-to-speech services.
     """
+    provider = "unknown"
     
     def __init__(self, api_key: str, model: str):
         """
@@ -63,14 +67,56 @@ class BaseSpeaker(ABC):
         if from_format == to_format:
             return audio_bytes
             
+        started = time.perf_counter()
         try:
-            # Load the audio using pydub
-            audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format=from_format)
-            
-            # Export to the target format
-            output = io.BytesIO()
-            audio.export(output, format=to_format)
+            with span("convert", from_format=from_format, to_format=to_format):
+                # Load the audio using pydub
+                audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format=from_format)
+                
+                # Export to the target format
+                output = io.BytesIO()
+                audio.export(output, format=to_format)
+            AUDIO_CONVERSION_SECONDS.labels(from_format, to_format).observe(time.perf_counter() - started)
+            record_timing("transcode", time.perf_counter() - started)
             return output.getvalue()
         except Exception as e:
             self.logger.error(f"Error converting audio from {from_format} to {to_format}: {str(e)}")
-            raise ValueError(f"Failed to convert audio from {from_format} to {to_format}: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Failed to convert audio from {from_format} to {to_format}: {str(e)}")
+
+class SpeakerWrapper(BaseSpeaker):
+    """
+    Base class of speaker layers that wrap another speaker, e.g. rate limiting or retries.
+
+    The wrapper takes on the wrapped speaker's provider and model, and passes speech requests through
+    to it; layers override speak() to add their behavior.
+    """
+
+    def __init__(self, speaker: BaseSpeaker):
+        """
+        Initialize the wrapper.
+
+        Args:
+            speaker (BaseSpeaker): Speaker to delegate to.
+        """
+        super().__init__(api_key=speaker.api_key, model=speaker.model)
+        self.speaker = speaker
+        self.provider = speaker.provider
+
+    async def speak(self, text: str, lang: str, voice: Optional[str] = None,
+                    response_format: str = "mp3", instructions: Optional[str] = None) -> bytes:
+        """
+        Pass a speech request through to the wrapped speaker.
+
+        Args:
+            text (str): Text to convert to speech.
+            lang (str): Language of the text (e.g., "English", "Spanish").
+            voice (Optional[str], optional): Voice to use. Defaults to None.
+            response_format (str, optional): Format of the audio response. Defaults to "mp3".
+            instructions (Optional[str], optional): Additional instructions for the TTS service. Defaults to None.
+
+        Returns:
+            bytes: Audio content.
+        """
+        return await self.speaker.speak(
+            text=text, lang=lang, voice=voice, response_format=response_format, instructions=instructions
+        )
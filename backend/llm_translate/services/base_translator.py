@@ -1,9 +1,60 @@
 """
 Base translator abstract class that defines the interface for all translator implementations.
 """
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from llm_translate.utils.exceptions import TranslationError
+import re
+from typing import Any, Awaitable, AsyncIterator, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from llm_translate.utils.exceptions import TranslationError, ErrorType
 from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.tokens import estimate_tokens
+
+T = TypeVar("T")
+
+
+# System prompt used for single-text translations
+TRANSLATION_SYSTEM_PROMPT = (
+    "You are an expert translator. Translate the given text accurately and naturally. "
+    "Preserve the meaning, tone, and style of the original text. "
+    "Only return the translated text without any additional explanations or notes."
+)
+
+# System prompt used when several texts are packed into a single request
+BATCH_SYSTEM_PROMPT = (
+    "You are an expert translator. You will receive a JSON object that maps ids to strings. "
+    "Translate every string accurately and naturally, preserving meaning, tone and style. "
+    "Return only a JSON object that maps the same ids to the translated strings, "
+    "without any additional explanations or notes."
+)
+
+# System prompt used when a similar earlier translation is supplied as a reference
+REFERENCE_SYSTEM_PROMPT = (
+    "You are an expert translator. You will be given a text to translate together with a similar text "
+    "that was translated before and its translation. Reuse the wording of the reference translation wherever "
+    "it still applies and change only what the differences require. "
+    "Only return the translated text without any additional explanations or notes."
+)
+
+# System prompt used when a long text is translated in chunks with the preceding text as context
+CONTEXT_SYSTEM_PROMPT = (
+    "You are an expert translator. You will be given a passage from a longer document together with the "
+    "text that immediately precedes it. Use the preceding text only as context for terminology, tone and "
+    "references, and do not translate it. Only return the translated passage without any additional "
+    "explanations or notes."
+)
+
+# System prompt used to detect the source language and translate in a single request
+DETECT_TRANSLATE_SYSTEM_PROMPT = (
+    "You are an expert translator. Identify the language of the given text and translate it accurately and "
+    "naturally, preserving meaning, tone and style. Respond with only a JSON object of the form "
+    "{\"language\": \"<source language name in English>\", \"translation\": \"<translated text>\"}, "
+    "without any additional explanations or notes."
+)
+
+# Outermost JSON object in a model response, possibly wrapped in a code fence or prose
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
 
 
 class BaseTranslator(ABC):
@@ -11,10 +62,22 @@ class BaseTranslator(ABC):
     Abstract base class for translator services.
     All translator implementations must inherit from this class and implement the translate method.
     """
+    provider = "unknown"
+
+    # Set by implementations whose _complete method can send a packed multi-text prompt
+    supports_batch = False
+
+    # Limits for a single packed batch request
+    batch_max_tokens = 2000
+    batch_max_items = 50
+
+    # Most provider calls a single batch has in flight at once
+    batch_concurrency = 8
+
     def __init__(self, api_key: str = None, model: str = None):
         """
         Initialize the translator with API key and model name.
-        
+
         Args:
             api_key (str, optional): API key for the service. Defaults to None.
             model (str, optional): Model name to use for translation. Defaults to None.
@@ -28,16 +91,778 @@ class BaseTranslator(ABC):
     async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
         """
         Translate text from source language to target language.
-        
+
         Args:
             text (str): Text to translate.
             from_lang (str): Source language.
             to_lang (str): Target language.
-            
+
         Returns:
             str: Translated text.
-            
+
+        Raises:
+            TranslationError: If translation fails, with appropriate error type and status code.
+        """
+        pass
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Translate several texts that share a language pair, in order.
+
+        Implementations that support batching pack the texts into as few requests as the
+        batch_max_tokens and batch_max_items limits allow and send those requests concurrently.
+        Items whose output comes back missing or malformed are re-split and retried on their own;
+        implementations without batching translate each text concurrently with translate(). Either
+        way, at most batch_concurrency requests are in flight at once.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+
+        Raises:
+            TranslationError: If translation fails, with appropriate error type and status code.
+        """
+        if not texts:
+            return []
+        if not self.supports_batch or len(texts) == 1:
+            return await self._gather_limited([
+                lambda text=text: self.translate(text, from_lang, to_lang) for text in texts
+            ])
+
+        try:
+            # Detect the source language once for the whole batch
+            if from_lang.lower() == "auto-detect":
+                from_lang = await self._detect_language("\n".join(texts))
+                self.logger.info(f"Detected language: {from_lang}")
+        except Exception as e:
+            raise self._translation_error(e) from e
+
+        # Short-circuit if languages are the same (case-insensitive)
+        if from_lang.strip().lower() == to_lang.strip().lower():
+            return list(texts)
+
+        results: List[Optional[str]] = [None] * len(texts)
+        packs = self._pack_batch(texts)
+        self.logger.debug(f"Translating {len(texts)} texts in {len(packs)} packed requests: {from_lang} → {to_lang}")
+        await self._gather_limited([
+            lambda pack=pack: self._translate_pack(texts, pack, from_lang, to_lang, results) for pack in packs
+        ])
+        return results
+
+    async def _gather_limited(self, calls: List[Callable[[], Awaitable[T]]]) -> List[T]:
+        """
+        Run calls concurrently, at most batch_concurrency at a time.
+
+        Args:
+            calls (List[Callable[[], Awaitable[T]]]): Calls to run.
+
+        Returns:
+            List[T]: Their results, in the same order as the calls.
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def run(call: Callable[[], Awaitable[T]]) -> T:
+            async with semaphore:
+                return await call()
+
+        return list(await asyncio.gather(*(run(call) for call in calls)))
+
+    def _pack_batch(self, texts: List[str]) -> List[List[int]]:
+        """
+        Group text indices into packs that fit the per-request token and item limits.
+
+        Args:
+            texts (List[str]): Texts to pack.
+
+        Returns:
+            List[List[int]]: Packs of indices into texts, in order.
+        """
+        packs: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, text in enumerate(texts):
+            tokens = estimate_tokens(text)
+            if current and (current_tokens + tokens > self.batch_max_tokens or len(current) >= self.batch_max_items):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            packs.append(current)
+        return packs
+
+    async def _translate_pack(self, texts: List[str], indices: List[int], from_lang: str, to_lang: str,
+                              results: List[Optional[str]]) -> None:
+        """
+        Translate one pack of texts in a single request, storing the translations in results.
+        Items missing from the response are split in two and retried.
+
+        Args:
+            texts (List[str]): All texts of the batch.
+            indices (List[int]): Indices of the texts in this pack.
+            from_lang (str): Source language (already detected).
+            to_lang (str): Target language.
+            results (List[Optional[str]]): Output list, filled in place.
+
+        Raises:
+            TranslationError: If a request fails.
+        """
+        if len(indices) == 1:
+            results[indices[0]] = await self.translate(texts[indices[0]], from_lang, to_lang)
+            return
+
+        try:
+            prompt = self._build_batch_prompt([texts[index] for index in indices], from_lang, to_lang)
+            content = await self._complete(BATCH_SYSTEM_PROMPT, prompt, temperature=0.3)
+        except Exception as e:
+            raise self._translation_error(e) from e
+
+        parsed = self._parse_batch_response(content, len(indices))
+        failed = []
+        for position, index in enumerate(indices):
+            if position in parsed:
+                results[index] = parsed[position]
+            else:
+                failed.append(index)
+        if failed:
+            # Retry only the malformed items, in smaller packs
+            self.logger.warning(f"Malformed batch translation output for {len(failed)} of {len(indices)} items; retrying")
+            middle = (len(failed) + 1) // 2
+            halves = [half for half in (failed[:middle], failed[middle:]) if half]
+            await asyncio.gather(*(self._translate_pack(texts, half, from_lang, to_lang, results) for half in halves))
+
+    async def translate_with_reference(self, text: str, from_lang: str, to_lang: str,
+                                       reference_source: str, reference_translation: str) -> str:
+        """
+        Translate text using the translation of a similar text as a reference, so the model
+        only has to edit the parts that differ.
+
+        Implementations without a _complete method translate the text normally.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            reference_source (str): Previously translated similar text.
+            reference_translation (str): Its translation.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            TranslationError: If translation fails, with appropriate error type and status code.
+        """
+        try:
+            if from_lang.lower() == "auto-detect":
+                from_lang = await self._detect_language(text)
+                self.logger.info(f"Detected language: {from_lang}")
+
+            # Short-circuit if languages are the same (case-insensitive)
+            if from_lang.strip().lower() == to_lang.strip().lower():
+                return text
+
+            prompt = (
+                f"Reference {from_lang} text: \"{reference_source}\"\n"
+                f"Reference {to_lang} translation: \"{reference_translation}\"\n\n"
+                f"Translate the following text from {from_lang} to {to_lang}: \"{text}\""
+            )
+            self.logger.debug(f"Sending reference-assisted translation request: {from_lang} → {to_lang}")
+            content = await self._complete(REFERENCE_SYSTEM_PROMPT, prompt, temperature=0.3)
+        except NotImplementedError:
+            return await self.translate(text, from_lang, to_lang)
+        except Exception as e:
+            raise self._translation_error(e) from e
+        return self._strip_quotes(content)
+
+    async def translate_with_context(self, text: str, from_lang: str, to_lang: str, context: str) -> str:
+        """
+        Translate a passage of a longer document, using the text that precedes it as context.
+
+        Implementations without a _complete method translate the passage on its own.
+
+        Args:
+            text (str): Passage to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            context (str): Source text immediately before the passage; not translated.
+
+        Returns:
+            str: Translated passage.
+
         Raises:
             TranslationError: If translation fails, with appropriate error type and status code.
         """
-        pass
\ No newline at end of file
+        try:
+            if from_lang.lower() == "auto-detect":
+                from_lang = await self._detect_language(text)
+                self.logger.info(f"Detected language: {from_lang}")
+
+            # Short-circuit if languages are the same (case-insensitive)
+            if from_lang.strip().lower() == to_lang.strip().lower():
+                return text
+
+            prompt = (
+                f"Preceding {from_lang} text (context only): \"{context}\"\n\n"
+                f"Translate the following passage from {from_lang} to {to_lang}: \"{text}\""
+            )
+            self.logger.debug(f"Sending context-assisted translation request: {from_lang} → {to_lang}")
+            content = await self._complete(CONTEXT_SYSTEM_PROMPT, prompt, temperature=0.3)
+        except NotImplementedError:
+            return await self.translate(text, from_lang, to_lang)
+        except Exception as e:
+            raise self._translation_error(e) from e
+        return self._strip_quotes(content)
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Translate text, yielding the translation in pieces as the model generates it.
+
+        Implementations without a _complete_stream method yield the whole translation at once.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage when it
+                reports one. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+
+        Raises:
+            TranslationError: If translation fails, with appropriate error type and status code.
+        """
+        try:
+            if from_lang.lower() == "auto-detect":
+                from_lang = await self._detect_language(text)
+                self.logger.info(f"Detected language: {from_lang}")
+
+            # Short-circuit if languages are the same (case-insensitive)
+            if from_lang.strip().lower() == to_lang.strip().lower():
+                yield text
+                return
+
+            prompt = f"Translate the following text from {from_lang} to {to_lang}: \"{text}\""
+            self.logger.debug(f"Sending streaming translation request: {from_lang} → {to_lang}")
+            chunks = self._complete_stream(TRANSLATION_SYSTEM_PROMPT, prompt, temperature=0.3, usage=usage)
+            async for piece in self._strip_stream_quotes(chunks):
+                yield piece
+        except NotImplementedError:
+            yield await self.translate(text, from_lang, to_lang)
+        except Exception as e:
+            raise self._translation_error(e) from e
+
+    async def detect_and_translate(self, text: str, to_lang: str) -> Optional[Tuple[str, str]]:
+        """
+        Detect the source language and translate text with a single JSON completion.
+
+        If the detected language is the target language the original text is returned unchanged.
+
+        Args:
+            text (str): Text to translate.
+            to_lang (str): Target language.
+
+        Returns:
+            Optional[Tuple[str, str]]: Detected language and translated text, or None if the implementation
+            has no _complete method or the response could not be parsed; callers then fall back to
+            _detect_language followed by translate().
+
+        Raises:
+            TranslationError: If the request fails, with appropriate error type and status code.
+        """
+        prompt = f"Translate the following text to {to_lang}: \"{text}\""
+        try:
+            self.logger.debug(f"Sending detect-and-translate request: Auto-detect → {to_lang}")
+            content = await self._complete(DETECT_TRANSLATE_SYSTEM_PROMPT, prompt, temperature=0.3, json_mode=True)
+        except NotImplementedError:
+            return None
+        except Exception as e:
+            raise self._translation_error(e) from e
+
+        parsed = self._parse_detect_translate(content)
+        if parsed is None:
+            self.logger.warning("Could not parse detect-and-translate response; falling back to separate calls")
+            return None
+        from_lang, translated_text = parsed
+        self.logger.info(f"Detected language: {from_lang}")
+        # Short-circuit if languages are the same (case-insensitive)
+        if from_lang.strip().lower() == to_lang.strip().lower():
+            return from_lang, text
+        return from_lang, translated_text
+
+    @classmethod
+    def _parse_detect_translate(cls, content: str) -> Optional[Tuple[str, str]]:
+        """
+        Parse a detect-and-translate response.
+
+        Args:
+            content (str): Model output, ideally a JSON object with "language" and "translation" strings.
+
+        Returns:
+            Optional[Tuple[str, str]]: Detected language and translation, or None if either is missing or empty.
+        """
+        match = _JSON_OBJECT.search(content)
+        if match is None:
+            return None
+        try:
+            data = json.loads(match.group(0))
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        language, translation = data.get("language"), data.get("translation")
+        if not isinstance(language, str) or not isinstance(translation, str):
+            return None
+        language = cls._strip_quotes(language.strip()).strip()
+        if not language or not translation.strip():
+            return None
+        return language, cls._strip_quotes(translation.strip())
+
+    async def _detect_language(self, text: str) -> str:
+        """
+        Detect the language of the given text.
+
+        Args:
+            text (str): Text to detect language for.
+
+        Returns:
+            str: Detected language name.
+
+        Raises:
+            TranslationError: If the implementation does not support language detection.
+        """
+        raise TranslationError(
+            message=f"{self.__class__.__name__} does not support language detection",
+            error_type=ErrorType.INVALID_REQUEST,
+            status_code=400
+        )
+
+    async def _complete(self, system_prompt: str, user_prompt: str, temperature: float = 0.3,
+                        json_mode: bool = False) -> str:
+        """
+        Send a single chat completion request and return the response text.
+        Implementations raise their provider's native exceptions; callers map them with _translation_error.
+
+        Args:
+            system_prompt (str): System prompt.
+            user_prompt (str): User prompt.
+            temperature (float, optional): Sampling temperature. Defaults to 0.3.
+            json_mode (bool, optional): Ask for a JSON object response where the provider supports it. Defaults to False.
+
+        Returns:
+            str: Response content with surrounding whitespace removed.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement _complete")
+
+    async def _complete_stream(self, system_prompt: str, user_prompt: str, temperature: float = 0.3,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Send a streaming chat completion request and yield the response text as it arrives.
+        Implementations raise their provider's native exceptions; callers map them with _translation_error.
+
+        Args:
+            system_prompt (str): System prompt.
+            user_prompt (str): User prompt.
+            temperature (float, optional): Sampling temperature. Defaults to 0.3.
+            usage (Optional[Dict[str, int]], optional): Filled with prompt, completion and total token
+                counts if the provider reports them. Defaults to None.
+
+        Yields:
+            str: Content deltas.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement _complete_stream")
+        yield  # pragma: no cover - makes this an async generator
+
+    def _translation_error(self, e: Exception) -> TranslationError:
+        """
+        Map an exception raised while talking to the provider to a TranslationError.
+
+        Args:
+            e (Exception): Exception to map.
+
+        Returns:
+            TranslationError: Mapped error; TranslationError instances are returned unchanged.
+        """
+        if isinstance(e, TranslationError):
+            return e
+        self.logger.error(f"Unexpected error during translation: {str(e)}", exc_info=True)
+        return TranslationError(
+            message=f"An unexpected error occurred during translation: {str(e)}",
+            error_type=ErrorType.UNKNOWN,
+            status_code=500,
+            original_exception=e
+        )
+
+    @staticmethod
+    def _strip_quotes(text: str) -> str:
+        """
+        Remove one pair of outermost quotes that models sometimes wrap translations in.
+
+        Args:
+            text (str): Model output.
+
+        Returns:
+            str: Text without the surrounding quotes.
+        """
+        if len(text) >= 2 and ((text.startswith("'") and text.endswith("'")) or
+                               (text.startswith('"') and text.endswith('"'))):
+            return text[1:-1]
+        return text
+
+    @staticmethod
+    async def _strip_stream_quotes(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        Streaming counterpart of _strip_quotes and str.strip.
+
+        Drops leading whitespace and an opening quote, and holds back trailing whitespace and a
+        possible closing quote until more text shows they are not the end of the output.
+
+        Args:
+            chunks (AsyncIterator[str]): Content deltas from the model.
+
+        Yields:
+            str: Content deltas without the surrounding quotes and whitespace.
+        """
+        quote = None
+        started = False
+        held = ""
+        async for chunk in chunks:
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+                if chunk[0] in "'\"":
+                    quote, chunk = chunk[0], chunk[1:]
+            text = held + chunk
+            body = text.rstrip()
+            if quote and body.endswith(quote):
+                body = body[:-1]
+            held = text[len(body):]
+            if body:
+                yield body
+        if held.strip() and held.strip() != quote:
+            yield held.rstrip()
+
+    @staticmethod
+    def _build_batch_prompt(texts: List[str], from_lang: str, to_lang: str) -> str:
+        """
+        Build the user prompt for a packed batch translation.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language.
+            to_lang (str): Target language.
+
+        Returns:
+            str: Prompt containing the texts as a JSON object keyed by position.
+        """
+        items = {str(position): text for position, text in enumerate(texts)}
+        return (
+            f"Translate each value in the following JSON object from {from_lang} to {to_lang}. "
+            f"Respond with a JSON object with the same {len(texts)} keys.\n\n"
+            f"{json.dumps(items, ensure_ascii=False)}"
+        )
+
+    @staticmethod
+    def _parse_batch_response(content: str, expected: int) -> Dict[int, str]:
+        """
+        Parse the model output of a packed batch translation, keeping every well-formed item.
+
+        Args:
+            content (str): Model output, a JSON object (or array) optionally wrapped in a Markdown code fence.
+            expected (int): Number of items sent.
+
+        Returns:
+            Dict[int, str]: Translations by position; missing or malformed items are left out.
+        """
+        content = content.strip()
+        if content.startswith("```"):
+            content = content.split("\n", 1)[1] if "\n" in content else ""
+            content = content.rsplit("```", 1)[0]
+        brackets = [(content.find(opening), content.rfind(closing)) for opening, closing in (("{", "}"), ("[", "]"))]
+        candidates = [(start, end) for start, end in brackets if start != -1 and end > start]
+        if not candidates:
+            return {}
+        start, end = min(candidates)
+        try:
+            items = json.loads(content[start:end + 1])
+        except ValueError:
+            return {}
+
+        if isinstance(items, list):
+            # Accept a plain array only if every item is accounted for
+            if len(items) != expected:
+                return {}
+            items = {str(position): item for position, item in enumerate(items)}
+        if not isinstance(items, dict):
+            return {}
+        parsed = {}
+        for position in range(expected):
+            item = items.get(str(position))
+            if isinstance(item, str):
+                parsed[position] = item
+        return parsed
+
+
+def call_texts(method: str, args: Tuple[Any, ...]) -> List[str]:
+    """
+    Get the texts a non-streaming translator call sends to the provider, as passed to TranslatorWrapper._call.
+
+    Args:
+        method (str): Name of the translator method, e.g. "translate" or "_complete".
+        args (Tuple[Any, ...]): Its positional arguments.
+
+    Returns:
+        List[str]: The text to translate or detect first, then any context or reference texts; for a
+            packed request, its user prompt.
+    """
+    if method == "_complete":
+        return [args[1]]
+    # Context and reference texts follow the two languages
+    return [args[0], *args[3:]]
+
+
+class TranslatorWrapper(BaseTranslator):
+    """
+    Base class of translator layers that wrap another translator, e.g. caching, rate limiting or fallback.
+
+    The wrapper takes on the wrapped translator's provider, model and batch settings, and passes every
+    operation through to it. Non-streaming operations all go through _call, so a layer that acts on
+    every call overrides _call and, if it needs to, translate_stream.
+    """
+
+    def __init__(self, translator: BaseTranslator):
+        """
+        Initialize the wrapper.
+
+        Args:
+            translator (BaseTranslator): Translator to delegate to.
+        """
+        super().__init__(api_key=translator.api_key, model=translator.model)
+        self.translator = translator
+        self.provider = getattr(translator, "provider", translator.__class__.__name__)
+        self.supports_batch = translator.supports_batch
+        self.batch_max_tokens = translator.batch_max_tokens
+        self.batch_max_items = translator.batch_max_items
+        self.batch_concurrency = translator.batch_concurrency
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a non-streaming call on the wrapped translator.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+        """
+        return await getattr(self.translator, method)(*args)
+
+    async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
+        """
+        Pass a translation through to the wrapped translator.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            str: Translated text.
+        """
+        return await self._call("translate", text, from_lang, to_lang)
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Pass a batch through to the wrapped translator.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+        """
+        return await self._call("translate_batch", texts, from_lang, to_lang)
+
+    async def translate_with_context(self, text: str, from_lang: str, to_lang: str, context: str) -> str:
+        """
+        Pass a passage with preceding context through to the wrapped translator.
+
+        Args:
+            text (str): Passage to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            context (str): Source text immediately before the passage.
+
+        Returns:
+            str: Translated passage.
+        """
+        return await self._call("translate_with_context", text, from_lang, to_lang, context)
+
+    async def translate_with_reference(self, text: str, from_lang: str, to_lang: str,
+                                       reference_source: str, reference_translation: str) -> str:
+        """
+        Pass a reference-assisted translation through to the wrapped translator.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            reference_source (str): Previously translated similar text.
+            reference_translation (str): Its translation.
+
+        Returns:
+            str: Translated text.
+        """
+        return await self._call(
+            "translate_with_reference", text, from_lang, to_lang, reference_source, reference_translation
+        )
+
+    async def detect_and_translate(self, text: str, to_lang: str) -> Optional[Tuple[str, str]]:
+        """
+        Pass a detect-and-translate call through to the wrapped translator.
+
+        Args:
+            text (str): Text to translate.
+            to_lang (str): Target language.
+
+        Returns:
+            Optional[Tuple[str, str]]: Detected language and translated text, or None if unavailable.
+        """
+        return await self._call("detect_and_translate", text, to_lang)
+
+    async def translate_stream(self, text: str, from_lang: str, to_lang: str,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Pass a streaming translation through to the wrapped translator.
+
+        Args:
+            text (str): Text to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+            usage (Optional[Dict[str, int]], optional): Filled with the provider's token usage. Defaults to None.
+
+        Yields:
+            str: Consecutive pieces of the translated text.
+        """
+        async for piece in self.translator.translate_stream(text, from_lang, to_lang, usage):
+            yield piece
+
+    async def _detect_language(self, text: str) -> str:
+        """
+        Pass language detection through to the wrapped translator.
+
+        Args:
+            text (str): Text to detect the language of.
+
+        Returns:
+            str: Detected language name.
+        """
+        return await self._call("_detect_language", text)
+
+    async def _complete(self, system_prompt: str, user_prompt: str, temperature: float = 0.3,
+                        json_mode: bool = False) -> str:
+        """
+        Pass a chat completion request through to the wrapped translator.
+
+        Args:
+            system_prompt (str): System prompt.
+            user_prompt (str): User prompt.
+            temperature (float, optional): Sampling temperature. Defaults to 0.3.
+            json_mode (bool, optional): Ask for a JSON object response. Defaults to False.
+
+        Returns:
+            str: Response content.
+        """
+        return await self._call("_complete", system_prompt, user_prompt, temperature, json_mode)
+
+    def _translation_error(self, e: Exception) -> TranslationError:
+        """
+        Map an exception with the wrapped translator's mapping.
+
+        Args:
+            e (Exception): Exception to map.
+
+        Returns:
+            TranslationError: Mapped error.
+        """
+        return self.translator._translation_error(e)
+
+
+class BatchPackingTranslator(TranslatorWrapper):
+    """
+    Translator wrapper that packs batches itself and sends each packed request through the wrapped
+    translator's _complete.
+
+    Layers that act on every provider call (metrics, bulkheads, rate limits, retries) extend it and
+    override _call, so each packed request of a batch passes through them on its own. Its own batch
+    limits let a pipeline apply the configured limits without changing the shared provider instance.
+    """
+
+    def __init__(self, translator: BaseTranslator, batch_max_tokens: Optional[int] = None,
+                 batch_max_items: Optional[int] = None, batch_concurrency: Optional[int] = None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            translator (BaseTranslator): Translator to delegate to.
+            batch_max_tokens (Optional[int], optional): Estimated token limit per packed request.
+                Defaults to the wrapped translator's limit.
+            batch_max_items (Optional[int], optional): Item limit per packed request.
+                Defaults to the wrapped translator's limit.
+            batch_concurrency (Optional[int], optional): Most requests of one batch in flight at once.
+                Defaults to the wrapped translator's limit.
+        """
+        super().__init__(translator)
+        if batch_max_tokens is not None:
+            self.batch_max_tokens = batch_max_tokens
+        if batch_max_items is not None:
+            self.batch_max_items = batch_max_items
+        if batch_concurrency is not None:
+            self.batch_concurrency = batch_concurrency
+
+    async def translate_batch(self, texts: List[str], from_lang: str, to_lang: str) -> List[str]:
+        """
+        Translate a batch in packed requests, each sent through this layer's _complete.
+
+        Args:
+            texts (List[str]): Texts to translate.
+            from_lang (str): Source language or "Auto-detect".
+            to_lang (str): Target language.
+
+        Returns:
+            List[str]: Translated texts, in the same order as the input.
+        """
+        return await BaseTranslator.translate_batch(self, texts, from_lang, to_lang)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """
+        Make a call on the wrapped translator. A packed request's provider exceptions are mapped to
+        TranslationError, as the other operations map their own, so the layers that inspect errors see
+        classified ones.
+
+        Args:
+            method (str): Name of the translator method to call, e.g. "translate" or "_complete".
+            *args (Any): Its positional arguments.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            TranslationError: If the call fails.
+        """
+        try:
+            return await super()._call(method, *args)
+        except Exception as e:
+            if method != "_complete":
+                raise
+            raise self._translation_error(e) from e
@@ -6,6 +6,7 @@ import httpx
 import json
 
 from llm_translate.services.base_speaker import BaseSpeaker
+from llm_translate.utils.http_client import get_http_client
 from llm_translate.utils.exceptions import ErrorType, TranslationError
 
 
@@ -14,6 +15,8 @@ class GroqSpeaker(BaseSpeaker):
     Speaker implementation using Groq's API.
     """
     
+    provider = "groq"
+
     def __init__(self, api_key: str, model: str = "playai-tts"):
         """
         Initialize the Groq speaker.
@@ -74,34 +77,34 @@ class GroqSpeaker(BaseSpeaker):
             }
             
             # Make API call
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=60.0  # Longer timeout for TTS
-                )
+            client = get_http_client()
+            response = await client.post(
+                self.api_url,
+                headers=headers,
+                json=payload,
+                timeout=60.0  # Longer timeout for TTS
+            )
                 
-                # Check for errors
-                if response.status_code != 200:
-                    error_message = f"Groq API error: {response.status_code}"
-                    try:
-                        error_data = response.json()
-                        if "error" in error_data and "message" in error_data["error"]:
-                            error_message = f"Groq API error: {error_data['error']['message']}"
-                    except Exception:
-                        pass
+            # Check for errors
+            if response.status_code != 200:
+                error_message = f"Groq API error: {response.status_code}"
+                try:
+                    error_data = response.json()
+                    if "error" in error_data and "message" in error_data["error"]:
+                        error_message = f"Groq API error: {error_data['error']['message']}"
+                except Exception:
+                    pass
                     
-                    self.logger.error(error_message)
-                    raise TranslationError(
-                        message=error_message,
-                        error_type=ErrorType.API_ERROR,
-                        status_code=response.status_code,
-                        original_exception=None
-                    )
+                self.logger.error(error_message)
+                raise TranslationError(
+                    message=error_message,
+                    error_type=ErrorType.API_ERROR,
+                    status_code=response.status_code,
+                    original_exception=None
+                )
                 
-                # Get the audio content
-                audio_content = response.content
+            # Get the audio content
+            audio_content = response.content
             
             # If the requested format is different from what Groq provided, convert it
             if response_format.lower() != groq_format:
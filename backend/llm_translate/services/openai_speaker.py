@@ -6,6 +6,7 @@ import io
 import httpx
 
 from llm_translate.services.base_speaker import BaseSpeaker
+from llm_translate.utils.http_client import get_http_client
 from llm_translate.utils.exceptions import ErrorType, TranslationError
 
 
@@ -14,6 +15,8 @@ class OpenAISpeaker(BaseSpeaker):
     Speaker implementation using OpenAI's API via direct HTTP requests.
     """
     
+    provider = "openai"
+
     def __init__(self, api_key: str, model: str = "gpt-4o-mini-tts"):
         """
         Initialize the OpenAI speaker.
@@ -76,47 +79,47 @@ class OpenAISpeaker(BaseSpeaker):
             }
             
             # Make HTTP request
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30.0  # 30 second timeout
-                )
+            client = get_http_client()
+            response = await client.post(
+                self.api_url,
+                json=payload,
+                headers=headers,
+                timeout=30.0  # 30 second timeout
+            )
                 
-                # Check for errors
-                if response.status_code != 200:
-                    error_info = response.json() if response.headers.get("content-type") == "application/json" else {"error": response.text}
-                    error_message = error_info.get("error", {}).get("message", str(error_info)) if isinstance(error_info, dict) else str(error_info)
-                    self.logger.error(f"OpenAI API error: {response.status_code} - {error_message}")
+            # Check for errors
+            if response.status_code != 200:
+                error_info = response.json() if response.headers.get("content-type") == "application/json" else {"error": response.text}
+                error_message = error_info.get("error", {}).get("message", str(error_info)) if isinstance(error_info, dict) else str(error_info)
+                self.logger.error(f"OpenAI API error: {response.status_code} - {error_message}")
                     
-                    if response.status_code == 401:
-                        raise TranslationError(
-                            message="Authentication failed with OpenAI API. Please check your API key.",
-                            error_type=ErrorType.AUTHENTICATION,
-                            status_code=401
-                        )
-                    elif response.status_code == 429:
-                        raise TranslationError(
-                            message="OpenAI API rate limit exceeded. Please try again later.",
-                            error_type=ErrorType.RATE_LIMIT,
-                            status_code=429
-                        )
-                    elif response.status_code == 400:
-                        raise TranslationError(
-                            message=f"Invalid request to OpenAI API: {error_message}",
-                            error_type=ErrorType.BAD_REQUEST,
-                            status_code=400
-                        )
-                    else:
-                        raise TranslationError(
-                            message=f"OpenAI API error: {response.status_code} - {error_message}",
-                            error_type=ErrorType.API_ERROR,
-                            status_code=response.status_code
-                        )
+                if response.status_code == 401:
+                    raise TranslationError(
+                        message="Authentication failed with OpenAI API. Please check your API key.",
+                        error_type=ErrorType.AUTHENTICATION,
+                        status_code=401
+                    )
+                elif response.status_code == 429:
+                    raise TranslationError(
+                        message="OpenAI API rate limit exceeded. Please try again later.",
+                        error_type=ErrorType.RATE_LIMIT,
+                        status_code=429
+                    )
+                elif response.status_code == 400:
+                    raise TranslationError(
+                        message=f"Invalid request to OpenAI API: {error_message}",
+                        error_type=ErrorType.BAD_REQUEST,
+                        status_code=400
+                    )
+                else:
+                    raise TranslationError(
+                        message=f"OpenAI API error: {response.status_code} - {error_message}",
+                        error_type=ErrorType.API_ERROR,
+                        status_code=response.status_code
+                    )
                 
-                # Get the audio content
-                audio_content = response.content
+            # Get the audio content
+            audio_content = response.content
             
             # If the requested format is different from what OpenAI provided, convert it
             if response_format.lower() != format_to_use:
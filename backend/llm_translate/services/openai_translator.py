@@ -1,10 +1,13 @@
 """
 OpenAI translator implementation.
 """
+from typing import AsyncIterator, Dict, Optional
+
 from openai import AsyncOpenAI
-from openai import APIError, APIConnectionError, RateLimitError, AuthenticationError, BadRequestError
-from .base_translator import BaseTranslator
+from openai import APIError, APIStatusError, APIConnectionError, RateLimitError, AuthenticationError, BadRequestError
+from .base_translator import BaseTranslator, TRANSLATION_SYSTEM_PROMPT
 from llm_translate.utils.exceptions import TranslationError, ErrorType
+from llm_translate.utils.http_client import get_http_client
 
 
 class OpenAITranslator(BaseTranslator):
@@ -12,6 +15,9 @@ class OpenAITranslator(BaseTranslator):
     Translator implementation using OpenAI's API.
     """
     
+    provider = "openai"
+    supports_batch = True
+    
     def __init__(self, api_key: str, model: str = "gpt-4.1-mini-2025-04-14"):
         """
         Initialize the OpenAI translator.
@@ -21,7 +27,9 @@ class OpenAITranslator(BaseTranslator):
             model (str, optional): OpenAI model to use. Defaults to "gpt-4.1-mini-2025-04-14".
         """
         super().__init__(api_key=api_key, model=model)
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # Requests go through the shared connection pool
+        # Retries are made by the shared retry policy (core.retry), not by the SDK
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=get_http_client(), max_retries=0)
         
     async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
         """
@@ -56,83 +64,146 @@ class OpenAITranslator(BaseTranslator):
             self.logger.debug(f"Sending translation request to OpenAI: {from_lang} → {to_lang}")
             
             # System prompt to guide the model
-            system_prompt = "You are an expert translator. Translate the given text accurately and naturally. Preserve the meaning, tone, and style of the original text. Only return the translated text without any additional explanations or notes."
+            system_prompt = TRANSLATION_SYSTEM_PROMPT
             
-            # Make API call
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3  # Lower temperature for more deterministic translation
-            )
-            
-            # Extract and return the translated text
-            translated_text = response.choices[0].message.content.strip()
+            # Make API call (lower temperature for more deterministic translation)
+            translated_text = await self._complete(system_prompt, prompt, temperature=0.3)
             
             # Remove outermost quotes if present
-            if (translated_text.startswith("'") and translated_text.endswith("'")) or \
-               (translated_text.startswith('"') and translated_text.endswith('"')):
-                translated_text = translated_text[1:-1]
+            translated_text = self._strip_quotes(translated_text)
 
             self.logger.debug(f"Received translation response from OpenAI (length: {len(translated_text)})")
             return translated_text
             
-        except AuthenticationError as e:
+        except Exception as e:
+            raise self._translation_error(e) from e
+    
+    async def _complete(self, system_prompt: str, user_prompt: str, temperature: float = 0.3,
+                        json_mode: bool = False) -> str:
+        """
+        Send a chat completion request to OpenAI and return the response text.
+        
+        Args:
+            system_prompt (str): System prompt.
+            user_prompt (str): User prompt.
+            temperature (float, optional): Sampling temperature. Defaults to 0.3.
+            json_mode (bool, optional): Ask for a JSON object response. Defaults to False.
+            
+        Returns:
+            str: Response content with surrounding whitespace removed.
+        """
+        options = {"response_format": {"type": "json_object"}} if json_mode else {}
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=temperature,
+            **options
+        )
+        return response.choices[0].message.content.strip()
+    
+    async def _complete_stream(self, system_prompt: str, user_prompt: str, temperature: float = 0.3,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Send a streaming chat completion request to OpenAI and yield the content deltas.
+        
+        Args:
+            system_prompt (str): System prompt.
+            user_prompt (str): User prompt.
+            temperature (float, optional): Sampling temperature. Defaults to 0.3.
+            usage (Optional[Dict[str, int]], optional): Filled with token counts if OpenAI reports them. Defaults to None.
+            
+        Yields:
+            str: Content deltas.
+        """
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=temperature,
+            stream=True
+        )
+        async for chunk in stream:
+            chunk_usage = getattr(chunk, "usage", None)
+            if usage is not None and chunk_usage is not None:
+                usage.update(
+                    prompt_tokens=chunk_usage.prompt_tokens,
+                    completion_tokens=chunk_usage.completion_tokens,
+                    total_tokens=chunk_usage.total_tokens
+                )
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    def _translation_error(self, e: Exception) -> TranslationError:
+        """
+        Map an exception raised by the OpenAI client to a TranslationError.
+        
+        Args:
+            e (Exception): Exception to map.
+            
+        Returns:
+            TranslationError: Mapped error with appropriate error type and status code.
+        """
+        if isinstance(e, TranslationError):
+            return e
+        if isinstance(e, AuthenticationError):
             # Handle authentication errors (invalid API key)
             self.logger.error(f"OpenAI authentication error: {str(e)}")
-            raise TranslationError(
+            return TranslationError(
                 message="Authentication failed with OpenAI API. Please check your API key.",
                 error_type=ErrorType.AUTHENTICATION,
                 status_code=401,
                 original_exception=e
-            ) from e
-        except RateLimitError as e:
+            )
+        if isinstance(e, RateLimitError):
             # Handle rate limit errors
             self.logger.error(f"OpenAI rate limit error: {str(e)}")
-            raise TranslationError(
+            return TranslationError(
                 message="OpenAI API rate limit exceeded. Please try again later.",
                 error_type=ErrorType.RATE_LIMIT,
                 status_code=429,
                 original_exception=e
-            ) from e
-        except BadRequestError as e:
+            )
+        if isinstance(e, BadRequestError):
             # Handle bad request errors (invalid parameters)
             self.logger.error(f"OpenAI bad request error: {str(e)}")
-            raise TranslationError(
+            return TranslationError(
                 message="Invalid request to OpenAI API. Please check your parameters.",
                 error_type=ErrorType.BAD_REQUEST,
                 status_code=400,
                 original_exception=e
-            ) from e
-        except APIConnectionError as e:
+            )
+        if isinstance(e, APIConnectionError):
             # Handle connection errors
             self.logger.error(f"OpenAI connection error: {str(e)}")
-            raise TranslationError(
+            return TranslationError(
                 message="Failed to connect to OpenAI API. Please check your internet connection.",
                 error_type=ErrorType.CONNECTION,
                 status_code=503,
                 original_exception=e
-            ) from e
-        except APIError as e:
+            )
+        if isinstance(e, APIError):
             # Handle API errors
             self.logger.error(f"OpenAI API error: {str(e)}")
-            raise TranslationError(
+            return TranslationError(
                 message="OpenAI API error occurred. Please try again later.",
                 error_type=ErrorType.API_ERROR,
-                status_code=500,
-                original_exception=e
-            ) from e
-        except Exception as e:
-            # Handle unexpected errors
-            self.logger.error(f"Unexpected error during OpenAI translation: {str(e)}", exc_info=True)
-            raise TranslationError(
-                message=f"An unexpected error occurred during translation: {str(e)}",
-                error_type=ErrorType.UNKNOWN,
-                status_code=500,
+                # Keep the provider's status, which decides whether the error is retried or trips the breaker
+                status_code=e.status_code if isinstance(e, APIStatusError) else 500,
                 original_exception=e
-            ) from e
+            )
+        # Handle unexpected errors
+        self.logger.error(f"Unexpected error during OpenAI translation: {str(e)}", exc_info=True)
+        return TranslationError(
+            message=f"An unexpected error occurred during translation: {str(e)}",
+            error_type=ErrorType.UNKNOWN,
+            status_code=500,
+            original_exception=e
+        )
     
     async def _detect_language(self, text: str) -> str:
         """
@@ -154,25 +225,10 @@ class OpenAITranslator(BaseTranslator):
             # System prompt to guide the model
             system_prompt = "You are a language identification expert. Your task is to identify the language of the given text. Respond with only the language name in English."
             
-            # Make API call
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1  # Very low temperature for deterministic response
-            )
-            
-            # Extract and return the detected language
-            detected_lang = response.choices[0].message.content.strip()
+            # Make API call (very low temperature for deterministic response)
+            detected_lang = await self._complete(system_prompt, prompt, temperature=0.1)
             return detected_lang
             
         except Exception as e:
             self.logger.error(f"Error during language detection: {str(e)}", exc_info=True)
-            raise TranslationError(
-                message=f"Failed to detect language: {str(e)}",
-                error_type=ErrorType.UNKNOWN,
-                status_code=500,
-                original_exception=e
-            ) from e
\ No newline at end of file
+            raise self._translation_error(e) from e
\ No newline at end of file
@@ -1,11 +1,14 @@
 """
 OpenRouter translator implementation.
 """
+import json
+from typing import AsyncIterator, Dict, Optional
+
 import httpx
-import os
-from .base_translator import BaseTranslator
-from llm_translate.utils.config import load_config
+from .base_translator import BaseTranslator, TRANSLATION_SYSTEM_PROMPT
+from llm_translate.utils.config import get_config
 from llm_translate.utils.exceptions import TranslationError, ErrorType
+from llm_translate.utils.http_client import get_http_client
 
 
 class OpenRouterTranslator(BaseTranslator):
@@ -14,6 +17,8 @@ class OpenRouterTranslator(BaseTranslator):
     """
     
     API_URL = "https://openrouter.ai/api/v1/chat/completions"
+    provider = "openrouter"
+    supports_batch = True
     
     def __init__(self, api_key: str, model: str = "qwen/qwen3-4b:free"):
         """
@@ -24,7 +29,7 @@ class OpenRouterTranslator(BaseTranslator):
             model (str, optional): OpenRouter model to use. Defaults to "qwen/qwen3-4b:free".
         """
         super().__init__(api_key=api_key, model=model)
-        self.config = load_config()
+        self.config = get_config()
         
     async def translate(self, text: str, from_lang: str, to_lang: str) -> str:
         """
@@ -59,127 +64,232 @@ class OpenRouterTranslator(BaseTranslator):
             self.logger.debug(f"Sending translation request to OpenRouter: {from_lang} → {to_lang}")
             
             # System prompt to guide the model
-            system_prompt = "You are an expert translator. Translate the given text accurately and naturally. Preserve the meaning, tone, and style of the original text. Only return the translated text without any additional explanations or notes."
+            system_prompt = TRANSLATION_SYSTEM_PROMPT
             
-            # Prepare headers
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+            # Make API call (lower temperature for more deterministic translation)
+            translated_text = await self._complete(system_prompt, prompt, temperature=0.3)
             
-            # Add optional headers if available
-            site_url = self.config.get("SITE_URL")
-            site_name = self.config.get("SITE_NAME")
+            # Remove outermost quotes if present
+            translated_text = self._strip_quotes(translated_text)
+
+            self.logger.debug(f"Received translation response from OpenRouter (length: {len(translated_text)})")
+            return translated_text
+                
+        except Exception as e:
+            raise self._translation_error(e) from e
+    
+    def _headers(self) -> dict:
+        """
+        Build the request headers for OpenRouter.
+        
+        Returns:
+            dict: Authorization and content headers plus the optional attribution headers.
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Add optional headers if available
+        site_url = self.config.get("SITE_URL")
+        site_name = self.config.get("SITE_NAME")
+        
+        if site_url:
+            headers["HTTP-Referer"] = site_url
+        if site_name:
+            headers["X-Title"] = site_name
+        return headers
+    
+    def _payload(self, system_prompt: str, user_prompt: str, temperature: float) -> dict:
+        """
+        Build the chat completion request body.
+        
+        Args:
+            system_prompt (str): System prompt.
+            user_prompt (str): User prompt.
+            temperature (float): Sampling temperature.
             
-            if site_url:
-                headers["HTTP-Referer"] = site_url
-                self.logger.debug(f"Added HTTP-Referer header: {site_url}")
-            if site_name:
-                headers["X-Title"] = site_name
-                self.logger.debug(f"Added X-Title header: {site_name}")
+        Returns:
+            dict: Request payload.
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": temperature
+        }
+    
+    async def _complete(self, system_prompt: str, user_prompt: str, temperature: float = 0.3,
+                        json_mode: bool = False) -> str:
+        """
+        Send a chat completion request to OpenRouter and return the response text.
+        
+        Args:
+            system_prompt (str): System prompt.
+            user_prompt (str): User prompt.
+            temperature (float, optional): Sampling temperature. Defaults to 0.3.
+            json_mode (bool, optional): Ask for a JSON object response. Defaults to False.
             
-            # Prepare request payload
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.3  # Lower temperature for more deterministic translation
-            }
+        Returns:
+            str: Response content with surrounding whitespace removed.
             
-            # Make API call
-            self.logger.debug(f"Making API call to OpenRouter with model: {self.model}")
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.API_URL,
-                    headers=headers,
-                    json=payload,
-                    timeout=30.0  # 30 second timeout
-                )
-                
-                # Check for HTTP errors
-                response.raise_for_status()
-                
-                # Parse response - json() is synchronous, do not use await
-                response_data = response.json()
-                
-                # Extract and return the translated text
-                if "choices" in response_data and len(response_data["choices"]) > 0:
-                    translated_text = response_data["choices"][0]["message"]["content"].strip()
-
-                    # Remove outermost quotes if present
-                    if (translated_text.startswith("'") and translated_text.endswith("'")) or \
-                    (translated_text.startswith('"') and translated_text.endswith('"')):
-                        translated_text = translated_text[1:-1]
-
-                    self.logger.debug(f"Received translation response from OpenRouter (length: {len(translated_text)})")
-                    return translated_text
-                else:
-                    self.logger.error(f"Unexpected response format from OpenRouter: {response_data}")
+        Raises:
+            TranslationError: If the response does not contain any choices.
+        """
+        payload = self._payload(system_prompt, user_prompt, temperature)
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        
+        # Make API call
+        self.logger.debug(f"Making API call to OpenRouter with model: {self.model}")
+        client = get_http_client()
+        response = await client.post(
+            self.API_URL,
+            headers=self._headers(),
+            json=payload,
+            timeout=30.0  # 30 second timeout
+        )
+            
+        # Check for HTTP errors
+        response.raise_for_status()
+            
+        # Parse response - json() is synchronous, do not use await
+        response_data = response.json()
+        
+        if "choices" in response_data and len(response_data["choices"]) > 0:
+            return response_data["choices"][0]["message"]["content"].strip()
+        
+        self.logger.error(f"Unexpected response format from OpenRouter: {response_data}")
+        raise TranslationError(
+            message="Unexpected response format from OpenRouter API.",
+            error_type=ErrorType.API_ERROR,
+            status_code=500
+        )
+    
+    async def _complete_stream(self, system_prompt: str, user_prompt: str, temperature: float = 0.3,
+                               usage: Optional[Dict[str, int]] = None) -> AsyncIterator[str]:
+        """
+        Send a streaming chat completion request to OpenRouter and yield the content deltas
+        from its server-sent events.
+        
+        Args:
+            system_prompt (str): System prompt.
+            user_prompt (str): User prompt.
+            temperature (float, optional): Sampling temperature. Defaults to 0.3.
+            usage (Optional[Dict[str, int]], optional): Filled with token counts from the final event. Defaults to None.
+            
+        Yields:
+            str: Content deltas.
+            
+        Raises:
+            TranslationError: If OpenRouter reports an error in the stream.
+        """
+        payload = self._payload(system_prompt, user_prompt, temperature)
+        payload["stream"] = True
+        
+        self.logger.debug(f"Making streaming API call to OpenRouter with model: {self.model}")
+        client = get_http_client()
+        async with client.stream(
+            "POST",
+            self.API_URL,
+            headers=self._headers(),
+            json=payload,
+            timeout=30.0  # 30 second timeout between bytes
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                # Skip keep-alive comments and blank separator lines
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                if "error" in event:
                     raise TranslationError(
-                        message="Unexpected response format from OpenRouter API.",
+                        message=f"OpenRouter stream error: {event['error'].get('message', 'unknown error')}",
                         error_type=ErrorType.API_ERROR,
                         status_code=500
                     )
-                
-        except httpx.HTTPStatusError as e:
+                if usage is not None and event.get("usage"):
+                    usage.update(
+                        prompt_tokens=event["usage"].get("prompt_tokens", 0),
+                        completion_tokens=event["usage"].get("completion_tokens", 0),
+                        total_tokens=event["usage"].get("total_tokens", 0)
+                    )
+                choices = event.get("choices") or []
+                content = choices[0].get("delta", {}).get("content") if choices else None
+                if content:
+                    yield content
+    
+    def _translation_error(self, e: Exception) -> TranslationError:
+        """
+        Map an exception raised while calling OpenRouter to a TranslationError.
+        
+        Args:
+            e (Exception): Exception to map.
+            
+        Returns:
+            TranslationError: Mapped error with appropriate error type and status code.
+        """
+        if isinstance(e, TranslationError):
+            return e
+        if isinstance(e, httpx.HTTPStatusError):
             # Handle HTTP errors
             status_code = e.response.status_code
             self.logger.error(f"OpenRouter HTTP error: {status_code} - {str(e)}")
             
             if status_code == 401:
                 # Authentication error
-                raise TranslationError(
+                return TranslationError(
                     message="Authentication failed with OpenRouter API. Please check your API key.",
                     error_type=ErrorType.AUTHENTICATION,
                     status_code=401,
                     original_exception=e
-                ) from e
+                )
             elif status_code == 429:
                 # Rate limit error
-                raise TranslationError(
+                return TranslationError(
                     message="OpenRouter API rate limit exceeded. Please try again later.",
                     error_type=ErrorType.RATE_LIMIT,
                     status_code=429,
                     original_exception=e
-                ) from e
+                )
             elif status_code == 400:
                 # Bad request error
-                raise TranslationError(
+                return TranslationError(
                     message="Invalid request to OpenRouter API. Please check your parameters.",
                     error_type=ErrorType.BAD_REQUEST,
                     status_code=400,
                     original_exception=e
-                ) from e
+                )
             else:
                 # Other HTTP errors
-                raise TranslationError(
+                return TranslationError(
                     message=f"OpenRouter API error: {e.response.text}",
                     error_type=ErrorType.API_ERROR,
                     status_code=status_code,
                     original_exception=e
-                ) from e
-                
-        except httpx.RequestError as e:
+                )
+        if isinstance(e, httpx.RequestError):
             # Handle connection errors
             self.logger.error(f"OpenRouter connection error: {str(e)}")
-            raise TranslationError(
+            return TranslationError(
                 message="Failed to connect to OpenRouter API. Please check your internet connection.",
                 error_type=ErrorType.CONNECTION,
                 status_code=503,
                 original_exception=e
-            ) from e
-            
-        except Exception as e:
-            # Handle unexpected errors
-            self.logger.error(f"Unexpected error during OpenRouter translation: {str(e)}", exc_info=True)
-            raise TranslationError(
-                message=f"An unexpected error occurred during translation: {str(e)}",
-                error_type=ErrorType.UNKNOWN,
-                status_code=500,
-                original_exception=e
-            ) from e
+            )
+        # Handle unexpected errors
+        self.logger.error(f"Unexpected error during OpenRouter translation: {str(e)}", exc_info=True)
+        return TranslationError(
+            message=f"An unexpected error occurred during translation: {str(e)}",
+            error_type=ErrorType.UNKNOWN,
+            status_code=500,
+            original_exception=e
+        )
                 
     async def _detect_language(self, text: str) -> str:
         """
@@ -201,63 +311,10 @@ class OpenRouterTranslator(BaseTranslator):
             # System prompt to guide the model
             system_prompt = "You are a language identification expert. Your task is to identify the language of the given text. Respond with only the language name in English."
             
-            # Prepare headers
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Add optional headers if available
-            site_url = self.config.get("SITE_URL")
-            site_name = self.config.get("SITE_NAME")
-            
-            if site_url:
-                headers["HTTP-Referer"] = site_url
-            if site_name:
-                headers["X-Title"] = site_name
-            
-            # Prepare request payload
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.1  # Very low temperature for deterministic response
-            }
-            
-            # Make API call
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.API_URL,
-                    headers=headers,
-                    json=payload,
-                    timeout=30.0  # 30 second timeout
-                )
-                
-                # Check for HTTP errors
-                response.raise_for_status()
-                
-                # Parse response - json() is synchronous, do not use await
-                response_data = response.json()
-                
-                # Extract and return the detected language
-                if "choices" in response_data and len(response_data["choices"]) > 0:
-                    detected_lang = response_data["choices"][0]["message"]["content"].strip()
-                    return detected_lang
-                else:
-                    self.logger.error(f"Unexpected response format from OpenRouter: {response_data}")
-                    raise TranslationError(
-                        message="Unexpected response format from OpenRouter API during language detection.",
-                        error_type=ErrorType.API_ERROR,
-                        status_code=500
-                    )
+            # Make API call (very low temperature for deterministic response)
+            detected_lang = await self._complete(system_prompt, prompt, temperature=0.1)
+            return detected_lang
                     
         except Exception as e:
             self.logger.error(f"Error during language detection: {str(e)}", exc_info=True)
-            raise TranslationError(
-                message=f"Failed to detect language: {str(e)}",
-                error_type=ErrorType.UNKNOWN,
-                status_code=500,
-                original_exception=e
-            ) from e
\ No newline at end of file
+            raise self._translation_error(e) from e
@@ -1,21 +1,29 @@
 """
 Configuration loading module for llm-translate.
-Loads environment variables from .env file.
+Loads environment variables from .env file into an immutable snapshot that is read once and
+swapped atomically on reload.
 """
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Mapping, Optional
 from dotenv import load_dotenv
 
 
-def load_config() -> Dict[str, Any]:
+def load_config(override: bool = False) -> Dict[str, Any]:
     """
     Load configuration from .env file.
     
+    Args:
+        override (bool, optional): Let values in .env replace variables already set in the environment,
+            so edits to .env take effect on reload. Defaults to False.
+    
     Returns:
         Dict[str, Any]: Dictionary containing configuration values.
     """
     # Load environment variables from .env file
-    load_dotenv()
+    load_dotenv(override=override)
     
     # Create configuration dictionary
     config = {
@@ -29,11 +37,173 @@ def load_config() -> Dict[str, Any]:
         "TTS_SOURCE": os.getenv("TTS_SOURCE", "openai"),
         "TTS_MODEL": os.getenv("TTS_MODEL", "gpt-4o-mini-tts"),
         "LOG_LEVEL": os.getenv("LOG_LEVEL", "INFO"),
+        "ADMIN_TOKEN": os.getenv("ADMIN_TOKEN", ""),
+        "METRICS_ENABLED": os.getenv("METRICS_ENABLED", "true").lower() == "true",
+        "SERVER_TIMING_ENABLED": os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true",
+        "TRACING_ENABLED": os.getenv("TRACING_ENABLED", "false").lower() == "true",
+        "TRACING_EXPORTER": os.getenv("TRACING_EXPORTER", "file"),
+        "TRACING_FILE_PATH": os.getenv("TRACING_FILE_PATH", "traces.jsonl"),
+        "TRACING_OTLP_ENDPOINT": os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"),
+        "TRACING_SAMPLE_RATIO": float(os.getenv("TRACING_SAMPLE_RATIO", "1.0")),
+        "TRACING_SERVICE_NAME": os.getenv("TRACING_SERVICE_NAME", "llm-translate"),
+        "TRANSLATION_CACHE_ENABLED": os.getenv("TRANSLATION_CACHE_ENABLED", "true").lower() == "true",
+        "TRANSLATION_CACHE_MAX_ENTRIES": int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "10000")),
+        "TRANSLATION_CACHE_TTL_SECONDS": float(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", "3600")),
+        "TRANSLATION_MEMORY_ENABLED": os.getenv("TRANSLATION_MEMORY_ENABLED", "false").lower() == "true",
+        "TRANSLATION_MEMORY_MIN_SEGMENTS": int(os.getenv("TRANSLATION_MEMORY_MIN_SEGMENTS", "2")),
+        "TRANSLATION_MEMORY_MAX_SEGMENTS": int(os.getenv("TRANSLATION_MEMORY_MAX_SEGMENTS", "100000")),
+        "FUZZY_MATCH_ENABLED": os.getenv("FUZZY_MATCH_ENABLED", "false").lower() == "true",
+        "FUZZY_MATCH_THRESHOLD": float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.8")),
+        "FUZZY_MATCH_MAX_ENTRIES": int(os.getenv("FUZZY_MATCH_MAX_ENTRIES", "100000")),
+        "FUZZY_MATCH_MAX_CHARS": int(os.getenv("FUZZY_MATCH_MAX_CHARS", "2000")),
+        "SINGLE_FLIGHT_ENABLED": os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true",
+        "CHUNKING_ENABLED": os.getenv("CHUNKING_ENABLED", "true").lower() == "true",
+        "CHUNK_MAX_TOKENS": int(os.getenv("CHUNK_MAX_TOKENS", "1000")),
+        "CHUNK_OVERLAP_TOKENS": int(os.getenv("CHUNK_OVERLAP_TOKENS", "64")),
+        "CHUNK_CONCURRENCY": int(os.getenv("CHUNK_CONCURRENCY", "4")),
+        "MICRO_BATCH_ENABLED": os.getenv("MICRO_BATCH_ENABLED", "true").lower() == "true",
+        "MICRO_BATCH_MAX_WAIT_MS": float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", "10")),
+        "MICRO_BATCH_MAX_ITEMS": int(os.getenv("MICRO_BATCH_MAX_ITEMS", "16")),
+        "BATCH_MAX_TOKENS": int(os.getenv("BATCH_MAX_TOKENS", "2000")),
+        "BATCH_MAX_ITEMS": int(os.getenv("BATCH_MAX_ITEMS", "50")),
+        "BATCH_CONCURRENCY": int(os.getenv("BATCH_CONCURRENCY", "8")),
+        "BATCH_MAX_TEXTS": int(os.getenv("BATCH_MAX_TEXTS", "1000")),
+        "MULTI_MAX_TARGETS": int(os.getenv("MULTI_MAX_TARGETS", "25")),
+        "LOCAL_LANGUAGE_DETECTION_ENABLED": os.getenv("LOCAL_LANGUAGE_DETECTION_ENABLED", "true").lower() == "true",
+        "LANGUAGE_DETECTION_MIN_CONFIDENCE": float(os.getenv("LANGUAGE_DETECTION_MIN_CONFIDENCE", "0.2")),
+        "FUSED_DETECTION_ENABLED": os.getenv("FUSED_DETECTION_ENABLED", "true").lower() == "true",
+        "HTTP_MAX_CONNECTIONS": int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+        "HTTP_MAX_KEEPALIVE_CONNECTIONS": int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+        "HTTP_KEEPALIVE_EXPIRY": float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+        "HTTP2_ENABLED": os.getenv("HTTP2_ENABLED", "false").lower() == "true",
+        "ADMISSION_ENABLED": os.getenv("ADMISSION_ENABLED", "true").lower() == "true",
+        "ADMISSION_ENDPOINT_LIMITS": os.getenv(
+            "ADMISSION_ENDPOINT_LIMITS",
+            "/translate=64:128,/translate/batch=16:32,/translate/multi=16:32,/translate/stream=32:64,/speak=8:16"
+        ),
+        "ADMISSION_PROVIDER_LIMITS": os.getenv("ADMISSION_PROVIDER_LIMITS", "openai=32:64,groq=32:64,openrouter=32:64"),
+        "ADMISSION_MAX_WAIT_SECONDS": float(os.getenv("ADMISSION_MAX_WAIT_SECONDS", "5")),
+        "RATE_LIMIT_ENABLED": os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true",
+        "OPENAI_RATE_LIMIT_RPM": float(os.getenv("OPENAI_RATE_LIMIT_RPM", "0")),
+        "OPENAI_RATE_LIMIT_TPM": float(os.getenv("OPENAI_RATE_LIMIT_TPM", "0")),
+        "GROQ_RATE_LIMIT_RPM": float(os.getenv("GROQ_RATE_LIMIT_RPM", "0")),
+        "GROQ_RATE_LIMIT_TPM": float(os.getenv("GROQ_RATE_LIMIT_TPM", "0")),
+        "OPENROUTER_RATE_LIMIT_RPM": float(os.getenv("OPENROUTER_RATE_LIMIT_RPM", "0")),
+        "OPENROUTER_RATE_LIMIT_TPM": float(os.getenv("OPENROUTER_RATE_LIMIT_TPM", "0")),
+        "RATE_LIMIT_MAX_QUEUE": int(os.getenv("RATE_LIMIT_MAX_QUEUE", "100")),
+        "RATE_LIMIT_MAX_WAIT_SECONDS": float(os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "10")),
+        "RETRY_ENABLED": os.getenv("RETRY_ENABLED", "true").lower() == "true",
+        "RETRY_MAX_ATTEMPTS": int(os.getenv("RETRY_MAX_ATTEMPTS", "3")),
+        "RETRY_BASE_DELAY_MS": float(os.getenv("RETRY_BASE_DELAY_MS", "200")),
+        "RETRY_MAX_DELAY_MS": float(os.getenv("RETRY_MAX_DELAY_MS", "5000")),
+        "RETRY_DEADLINE_SECONDS": float(os.getenv("RETRY_DEADLINE_SECONDS", "30")),
+        "RETRY_BUDGET_PERCENT": float(os.getenv("RETRY_BUDGET_PERCENT", "20")),
+        "RETRY_BUDGET_MIN_PER_MINUTE": int(os.getenv("RETRY_BUDGET_MIN_PER_MINUTE", "10")),
+        "CIRCUIT_BREAKER_ENABLED": os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true",
+        "CIRCUIT_BREAKER_FAILURE_THRESHOLD": int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")),
+        "CIRCUIT_BREAKER_RECOVERY_SECONDS": float(os.getenv("CIRCUIT_BREAKER_RECOVERY_SECONDS", "30")),
+        "CIRCUIT_BREAKER_HALF_OPEN_PROBES": int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_PROBES", "1")),
+        "FALLBACK_PROVIDERS": os.getenv("FALLBACK_PROVIDERS", ""),
+        "TTS_FALLBACK_PROVIDERS": os.getenv("TTS_FALLBACK_PROVIDERS", ""),
+        "LOAD_BALANCER_ENABLED": os.getenv("LOAD_BALANCER_ENABLED", "false").lower() == "true",
+        "LOAD_BALANCER_PROVIDERS": os.getenv("LOAD_BALANCER_PROVIDERS", ""),
+        "LOAD_BALANCER_STRATEGY": os.getenv("LOAD_BALANCER_STRATEGY", "p2c"),
+        "HEDGING_ENABLED": os.getenv("HEDGING_ENABLED", "false").lower() == "true",
+        "HEDGE_PROVIDER": os.getenv("HEDGE_PROVIDER", "openai"),
+        "HEDGE_QUANTILE": float(os.getenv("HEDGE_QUANTILE", "0.9")),
+        "HEDGE_MIN_DELAY_MS": float(os.getenv("HEDGE_MIN_DELAY_MS", "50")),
+        "HEDGE_INITIAL_DELAY_MS": float(os.getenv("HEDGE_INITIAL_DELAY_MS", "1000")),
+        "HEDGE_BUDGET_PERCENT": float(os.getenv("HEDGE_BUDGET_PERCENT", "10")),
+        "MODEL_TIERING_ENABLED": os.getenv("MODEL_TIERING_ENABLED", "false").lower() == "true",
+        "OPENAI_FAST_MODEL": os.getenv("OPENAI_FAST_MODEL", "gpt-4.1-nano-2025-04-14"),
+        "GROQ_FAST_MODEL": os.getenv("GROQ_FAST_MODEL", "llama-3.1-8b-instant"),
+        "OPENROUTER_FAST_MODEL": os.getenv("OPENROUTER_FAST_MODEL", ""),
+        "MODEL_TIERING_FAST_MAX_TOKENS": int(os.getenv("MODEL_TIERING_FAST_MAX_TOKENS", "200")),
+        "MODEL_TIERING_PAIR_LIMITS": os.getenv("MODEL_TIERING_PAIR_LIMITS", ""),
+        "TRANSLATION_DISK_CACHE_ENABLED": os.getenv("TRANSLATION_DISK_CACHE_ENABLED", "false").lower() == "true",
+        "TRANSLATION_DISK_CACHE_PATH": os.getenv("TRANSLATION_DISK_CACHE_PATH", ".cache/translations.sqlite3"),
+        "TRANSLATION_DISK_CACHE_MAX_MB": int(os.getenv("TRANSLATION_DISK_CACHE_MAX_MB", "256")),
+        "TRANSLATION_DISK_CACHE_TTL_SECONDS": float(os.getenv("TRANSLATION_DISK_CACHE_TTL_SECONDS", "604800")),
     }
     
     return config
 
 
+class ConfigSnapshot(Mapping):
+    """
+    Read-only view of the configuration at one point in time.
+
+    Values are already parsed to their types by load_config(). A request that holds a snapshot keeps
+    a consistent view even if the configuration is reloaded while it runs.
+    """
+
+    def __init__(self, values: Mapping[str, Any], version: int = 1):
+        """
+        Initialize the snapshot.
+
+        Args:
+            values (Mapping[str, Any]): Configuration values; copied.
+            version (int, optional): Reload counter, starting at 1. Defaults to 1.
+        """
+        self._values = MappingProxyType(dict(values))
+        self.version = version
+        self.loaded_at = time.time()
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(version={self.version}, keys={len(self._values)})"
+
+
+_config: Optional[ConfigSnapshot] = None
+_config_lock = threading.Lock()
+
+
+def get_config() -> ConfigSnapshot:
+    """
+    Get the current configuration snapshot, loading it on first use.
+
+    Returns:
+        ConfigSnapshot: Current configuration; a dictionary-like, read-only mapping.
+    """
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = ConfigSnapshot(load_config())
+    return _config
+
+
+def reload_config() -> ConfigSnapshot:
+    """
+    Re-read .env and the environment and atomically replace the current snapshot.
+
+    Returns:
+        ConfigSnapshot: The new configuration.
+    """
+    global _config
+    with _config_lock:
+        version = _config.version + 1 if _config is not None else 1
+        _config = ConfigSnapshot(load_config(override=True), version)
+    return _config
+
+
+def reset_config() -> None:
+    """
+    Drop the current snapshot so the next get_config() loads it again.
+    """
+    global _config
+    with _config_lock:
+        _config = None
+
+
 def get_config_value(key: str, default: Optional[Any] = None) -> Any:
     """
     Get a specific configuration value.
@@ -45,5 +215,4 @@ def get_config_value(key: str, default: Optional[Any] = None) -> Any:
     Returns:
         Any: Configuration value.
     """
-    config = load_config()
-    return config.get(key, default)
\ No newline at end of file
+    return get_config().get(key, default)
\ No newline at end of file
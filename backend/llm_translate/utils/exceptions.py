@@ -1,8 +1,9 @@
 """
 Custom exceptions for the llm-translate application.
 """
+import math
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 
 
 class ErrorType(Enum):
@@ -21,6 +22,8 @@ class ErrorType(Enum):
     TIMEOUT = "timeout_error"
     BAD_REQUEST = "bad_request_error"
     UNKNOWN = "unknown_error"
+    # Shed by the server's own admission control or rate limiter, before reaching a provider
+    OVERLOADED = "overloaded_error"
 
 
 class TranslationError(Exception):
@@ -32,6 +35,7 @@ class TranslationError(Exception):
         error_type (ErrorType): Type of error.
         status_code (int): HTTP status code to return.
         original_exception (Exception, optional): Original exception that was caught.
+        retry_after (float, optional): Seconds after which the client may retry, sent as Retry-After.
     """
     
     def __init__(
@@ -39,7 +43,8 @@ class TranslationError(Exception):
         message: str, 
         error_type: ErrorType = ErrorType.UNKNOWN, 
         status_code: int = 500,
-        original_exception: Optional[Exception] = None
+        original_exception: Optional[Exception] = None,
+        retry_after: Optional[float] = None
     ):
         """
         Initialize the TranslationError.
@@ -49,11 +54,13 @@ class TranslationError(Exception):
             error_type (ErrorType, optional): Type of error. Defaults to ErrorType.UNKNOWN.
             status_code (int, optional): HTTP status code. Defaults to 500.
             original_exception (Exception, optional): Original exception. Defaults to None.
+            retry_after (float, optional): Seconds after which the client may retry. Defaults to None.
         """
         self.message = message
         self.error_type = error_type
         self.status_code = status_code
         self.original_exception = original_exception
+        self.retry_after = retry_after
         super().__init__(self.message)
     
     def to_dict(self):
@@ -69,4 +76,59 @@ class TranslationError(Exception):
                 "message": self.message,
                 "details": str(self.original_exception) if self.original_exception else None
             }
-        }
\ No newline at end of file
+        }
+
+    def headers(self) -> Dict[str, str]:
+        """
+        Get the HTTP headers to send with the error response.
+
+        Returns:
+            Dict[str, str]: Retry-After in whole seconds if the error carries one, otherwise no headers.
+        """
+        if self.retry_after is None:
+            return {}
+        return {"Retry-After": str(max(1, math.ceil(self.retry_after)))}
+
+
+# Error types that say something about the provider's health rather than about the request
+PROVIDER_ERROR_TYPES = frozenset({
+    ErrorType.CONNECTION,
+    ErrorType.NETWORK_ERROR,
+    ErrorType.TIMEOUT,
+    ErrorType.RATE_LIMIT,
+    ErrorType.API_ERROR,
+    ErrorType.SERVICE_UNAVAILABLE,
+})
+
+# Error types of calls the server rejected itself before they reached the provider
+LOCAL_ERROR_TYPES = frozenset({ErrorType.OVERLOADED})
+
+
+def is_provider_error(error: BaseException) -> bool:
+    """
+    Check whether an error indicates an unhealthy provider rather than a bad request or a bug.
+
+    Args:
+        error (BaseException): Error a provider call failed with.
+
+    Returns:
+        bool: True for classified transport errors, provider rate limiting and server-side (5xx) API errors.
+    """
+    if not isinstance(error, TranslationError) or error.error_type not in PROVIDER_ERROR_TYPES:
+        return False
+    if error.error_type == ErrorType.API_ERROR:
+        return error.status_code >= 500
+    return True
+
+
+def is_local_rejection(error: BaseException) -> bool:
+    """
+    Check whether a call was rejected by the server's own load shedding without reaching the provider.
+
+    Args:
+        error (BaseException): Error a provider call failed with.
+
+    Returns:
+        bool: True if the call says nothing about the provider's health.
+    """
+    return isinstance(error, TranslationError) and error.error_type in LOCAL_ERROR_TYPES
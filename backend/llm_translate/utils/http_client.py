@@ -0,0 +1,126 @@
+"""
+Shared HTTP client module.
+Provides one pooled, keep-alive httpx.AsyncClient for all provider traffic, so requests reuse open
+connections instead of paying DNS, TCP and TLS setup on every call.
+"""
+import importlib.util
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.http_client")
+
+# Async callbacks run on every response of the shared client
+_response_hooks: List[Callable[[httpx.Response], Awaitable[None]]] = []
+# Callbacks run after the shared client is closed
+_close_hooks: List[Callable[[], None]] = []
+
+
+def build_http_client(config: Dict[str, Any]) -> httpx.AsyncClient:
+    """
+    Build a pooled HTTP client from configuration.
+
+    Args:
+        config (Dict[str, Any]): Application configuration.
+
+    Returns:
+        httpx.AsyncClient: Client with the configured pool limits and HTTP version.
+    """
+    http2 = config.get("HTTP2_ENABLED", False)
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP2_ENABLED is set but the h2 package is not installed; using HTTP/1.1")
+        http2 = False
+    limits = httpx.Limits(
+        max_connections=config.get("HTTP_MAX_CONNECTIONS", 100),
+        max_keepalive_connections=config.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20),
+        keepalive_expiry=config.get("HTTP_KEEPALIVE_EXPIRY", 30.0),
+    )
+    # Per-request timeouts are set by the callers; this default only covers requests that omit one
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=http2,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        event_hooks={"response": list(_response_hooks)}
+    )
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it from configuration on first use.
+
+    Returns:
+        httpx.AsyncClient: Shared pooled client; callers must not close it.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        with _http_client_lock:
+            if _http_client is None or _http_client.is_closed:
+                config = get_config()
+                _http_client = build_http_client(config)
+                logger.info(
+                    f"HTTP client initialized (max_connections={config.get('HTTP_MAX_CONNECTIONS', 100)}, "
+                    f"max_keepalive_connections={config.get('HTTP_MAX_KEEPALIVE_CONNECTIONS', 20)}, "
+                    f"http2={config.get('HTTP2_ENABLED', False)})"
+                )
+    return _http_client
+
+
+def add_response_hook(hook: Callable[[httpx.Response], Awaitable[None]]) -> None:
+    """
+    Run an async callback on every response of the shared client, e.g. to follow rate limit headers.
+
+    Args:
+        hook (Callable[[httpx.Response], Awaitable[None]]): Callback; adding it again has no effect.
+    """
+    with _http_client_lock:
+        if hook in _response_hooks:
+            return
+        _response_hooks.append(hook)
+        if _http_client is not None:
+            _http_client.event_hooks = {**_http_client.event_hooks, "response": list(_response_hooks)}
+
+
+def add_close_hook(hook: Callable[[], None]) -> None:
+    """
+    Run a callback whenever the shared client is closed, e.g. to drop services whose SDK clients use it.
+
+    Args:
+        hook (Callable[[], None]): Callback; adding it again has no effect.
+    """
+    with _http_client_lock:
+        if hook not in _close_hooks:
+            _close_hooks.append(hook)
+
+
+async def close_http_client() -> None:
+    """
+    Close the process-wide HTTP client and its pooled connections; called on application shutdown.
+    """
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+        hooks = list(_close_hooks)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.info("HTTP client closed")
+    for hook in hooks:
+        hook()
+
+
+def reset_http_client() -> None:
+    """
+    Drop the process-wide HTTP client without closing it, so the next call rebuilds it from configuration.
+    """
+    global _http_client
+    with _http_client_lock:
+        _http_client = None
@@ -0,0 +1,559 @@
+"""
+Metrics utility module for llm-translate.
+Provides counters, gauges and histograms rendered in the Prometheus text exposition format, without
+depending on a client library.
+
+Label children are created once per label combination and kept, so the hot path only increments
+numbers on an existing child. Updates are made from the event loop thread and are not locked.
+"""
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# Content type of the text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request and provider latency buckets in seconds, from cache hits to long documents
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Label value used for every label once a metric has reached its series limit
+OVERFLOW_LABEL = "other"
+
+# Endpoints with their own label; other paths are reported as "other"
+ENDPOINTS = ("/translate", "/translate/batch", "/translate/multi", "/translate/stream", "/speak")
+
+# Request phases reported in the Server-Timing header, with their descriptions
+TIMING_PHASES = (
+    ("queue", "Queue wait"),
+    ("cache", "Cache lookup"),
+    ("detect", "Language detection"),
+    ("provider", "Provider call"),
+    ("post", "Post-processing"),
+    ("transcode", "Audio transcoding"),
+)
+
+
+def _escape(value: str) -> str:
+    """
+    Escape a label value for the text exposition format.
+
+    Args:
+        value (str): Label value.
+
+    Returns:
+        str: Escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """
+    Format a sample value.
+
+    Args:
+        value (float): Sample value.
+
+    Returns:
+        str: Value in the text exposition format.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """
+    Format a label set.
+
+    Args:
+        names (Sequence[str]): Label names.
+        values (Sequence[str]): Label values in the same order.
+
+    Returns:
+        str: Label set such as '{provider="groq"}', or an empty string without labels.
+    """
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def render_family(name: str, help_text: str, kind: str, samples: Iterable[Tuple[Dict[str, str], float]]) -> str:
+    """
+    Render a metric family from samples computed at scrape time, e.g. from a component's stats().
+
+    Args:
+        name (str): Metric name.
+        help_text (str): Description of the metric.
+        kind (str): "counter" or "gauge".
+        samples (Iterable[Tuple[Dict[str, str], float]]): Label sets and their values.
+
+    Returns:
+        str: The family in the text exposition format.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        lines.append(f"{name}{format_labels(list(labels), list(labels.values()))} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class CounterChild:
+    """Monotonic counter of one label combination."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        """Initialize the counter at zero."""
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount (float, optional): Non-negative increment. Defaults to 1.
+        """
+        self.value += amount
+
+
+class GaugeChild:
+    """Gauge of one label combination."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        """Initialize the gauge at zero."""
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the gauge.
+
+        Args:
+            amount (float, optional): Increment. Defaults to 1.
+        """
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """
+        Decrease the gauge.
+
+        Args:
+            amount (float, optional): Decrement. Defaults to 1.
+        """
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge.
+
+        Args:
+            value (float): New value.
+        """
+        self.value = value
+
+
+class HistogramChild:
+    """Histogram of one label combination, counting observations per bucket."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            bounds (Tuple[float, ...]): Sorted upper bucket bounds, without +Inf.
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value (float): Observed value, e.g. a duration in seconds.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric:
+    """Metric family with label children of one type."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), max_series: int = 1000):
+        """
+        Initialize the metric.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): Description of the metric.
+            labelnames (Sequence[str], optional): Label names. Defaults to no labels.
+            max_series (int, optional): Most label combinations kept; further combinations are counted
+                under OVERFLOW_LABEL so user-supplied values like language names cannot grow memory
+                without bound. Defaults to 1000.
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.max_series = max_series
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def _new_child(self) -> object:
+        """
+        Create a child for a new label combination.
+
+        Returns:
+            object: New child.
+        """
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """
+        Get the child of a label combination, creating it on first use.
+
+        Callers on the hot path should keep the returned child instead of looking it up per request.
+
+        Args:
+            *values (str): Label values in the order of the label names.
+
+        Returns:
+            The child for the label values.
+        """
+        child = self._children.get(values)
+        if child is not None:
+            return child
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                if len(self._children) >= self.max_series:
+                    values = (OVERFLOW_LABEL,) * len(self.labelnames)
+                    child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def _samples(self, values: Tuple[str, ...], child: object) -> List[str]:
+        """
+        Render the samples of a child.
+
+        Args:
+            values (Tuple[str, ...]): Label values of the child.
+            child (object): The child.
+
+        Returns:
+            List[str]: Sample lines.
+        """
+        return [f"{self.name}{format_labels(self.labelnames, values)} {_format_value(child.value)}"]
+
+    def render(self) -> str:
+        """
+        Render the metric family.
+
+        Returns:
+            str: The family in the text exposition format.
+        """
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in list(self._children.items()):
+            lines.extend(self._samples(values, child))
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """Counter metric family."""
+
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        """
+        Create a child for a new label combination.
+
+        Returns:
+            CounterChild: New child at zero.
+        """
+        return CounterChild()
+
+
+class Gauge(Metric):
+    """Gauge metric family."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        """
+        Create a child for a new label combination.
+
+        Returns:
+            GaugeChild: New child at zero.
+        """
+        return GaugeChild()
+
+
+class Histogram(Metric):
+    """Histogram metric family with fixed bucket bounds."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS, max_series: int = 1000):
+        """
+        Initialize the histogram.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): Description of the metric.
+            labelnames (Sequence[str], optional): Label names. Defaults to no labels.
+            buckets (Sequence[float], optional): Upper bucket bounds. Defaults to LATENCY_BUCKETS.
+            max_series (int, optional): Most label combinations kept. Defaults to 1000.
+        """
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help_text, labelnames, max_series)
+
+    def _new_child(self) -> HistogramChild:
+        """
+        Create a child for a new label combination.
+
+        Returns:
+            HistogramChild: New empty histogram.
+        """
+        return HistogramChild(self.buckets)
+
+    def _samples(self, values: Tuple[str, ...], child: HistogramChild) -> List[str]:
+        """
+        Render the cumulative buckets, sum and count of a child.
+
+        Args:
+            values (Tuple[str, ...]): Label values of the child.
+            child (HistogramChild): The child.
+
+        Returns:
+            List[str]: Sample lines.
+        """
+        names = self.labelnames + ("le",)
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), child.counts):
+            cumulative += count
+            lines.append(f"{self.name}_bucket{format_labels(names, values + (_format_value(bound),))} {cumulative}")
+        labels = format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Add a metric family, or return the one already registered under its name.
+
+        Args:
+            metric (Metric): Metric family.
+
+        Returns:
+            Metric: The registered family.
+        """
+        return self._metrics.setdefault(metric.name, metric)
+
+    def get(self, name: str) -> Optional[Metric]:
+        """
+        Get a registered metric family.
+
+        Args:
+            name (str): Metric name.
+
+        Returns:
+            Optional[Metric]: The family, or None if it is not registered.
+        """
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render all metric families.
+
+        Returns:
+            str: The registry in the text exposition format.
+        """
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+# Process-wide registry of the application's metrics
+REGISTRY = MetricsRegistry()
+
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "llm_translate_request_duration_seconds", "Request latency by endpoint, provider, model and language pair.",
+    ("endpoint", "provider", "model", "from_lang", "to_lang")
+))
+REQUESTS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "llm_translate_requests_in_flight", "Requests being served by endpoint.", ("endpoint",)
+))
+ERRORS = REGISTRY.register(Counter(
+    "llm_translate_errors_total", "Failed requests by endpoint and error type.", ("endpoint", "type")
+))
+PROVIDER_SECONDS = REGISTRY.register(Histogram(
+    "llm_translate_provider_duration_seconds", "Provider round-trip time by provider, model and operation.",
+    ("provider", "model", "operation")
+))
+PROVIDER_IN_FLIGHT = REGISTRY.register(Gauge(
+    "llm_translate_provider_requests_in_flight", "Calls in progress by provider and model.", ("provider", "model")
+))
+PROVIDER_ERRORS = REGISTRY.register(Counter(
+    "llm_translate_provider_errors_total", "Failed provider calls by provider, model and error type.",
+    ("provider", "model", "type")
+))
+INPUT_CHARACTERS = REGISTRY.register(Counter(
+    "llm_translate_input_characters_total", "Characters sent to providers.", ("provider", "model")
+))
+OUTPUT_CHARACTERS = REGISTRY.register(Counter(
+    "llm_translate_output_characters_total", "Characters of translations returned by providers.", ("provider", "model")
+))
+INPUT_TOKENS = REGISTRY.register(Counter(
+    "llm_translate_input_tokens_total", "Estimated tokens of texts sent to providers.", ("provider", "model")
+))
+OUTPUT_TOKENS = REGISTRY.register(Counter(
+    "llm_translate_output_tokens_total", "Estimated tokens of translations returned by providers.", ("provider", "model")
+))
+DETECTION_SECONDS = REGISTRY.register(Histogram(
+    "llm_translate_detection_duration_seconds", "Source language detection time by method (local or provider).",
+    ("method",)
+))
+AUDIO_CONVERSION_SECONDS = REGISTRY.register(Histogram(
+    "llm_translate_audio_conversion_duration_seconds", "Audio format conversion time by source and target format.",
+    ("from_format", "to_format")
+))
+
+
+def record_error(path: str, error_type: str) -> None:
+    """
+    Count a failed request.
+
+    Args:
+        path (str): Request path.
+        error_type (str): ErrorType value of the failure.
+    """
+    ERRORS.labels(path if path in ENDPOINTS else "other", error_type).inc()
+
+
+class RequestTimings:
+    """
+    Time a request has spent in each phase so far.
+
+    Phases of concurrent work, e.g. the chunks of a long document, are summed. Post-processing is
+    the remainder of the elapsed time: preparing prompts, merging results and building the response.
+    """
+
+    __slots__ = ("started", "queue", "cache", "detect", "provider", "transcode")
+
+    def __init__(self):
+        """Start timing a request."""
+        self.started = time.perf_counter()
+        self.queue = 0.0
+        self.cache = 0.0
+        self.detect = 0.0
+        self.provider = 0.0
+        self.transcode = 0.0
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Add time spent in a phase.
+
+        Args:
+            phase (str): Phase name from TIMING_PHASES, except "post".
+            seconds (float): Time spent.
+        """
+        setattr(self, phase, getattr(self, phase) + seconds)
+
+    def breakdown(self) -> Dict[str, float]:
+        """
+        Get the time spent in each phase and in total so far.
+
+        Returns:
+            Dict[str, float]: Milliseconds by phase name, plus "total".
+        """
+        total = time.perf_counter() - self.started
+        measured = self.queue + self.cache + self.detect + self.provider + self.transcode
+        seconds = {
+            "queue": self.queue,
+            "cache": self.cache,
+            "detect": self.detect,
+            "provider": self.provider,
+            "post": max(0.0, total - measured),
+            "transcode": self.transcode,
+            "total": total,
+        }
+        return {phase: round(value * 1000, 1) for phase, value in seconds.items()}
+
+    def header(self) -> str:
+        """
+        Format the breakdown as a Server-Timing header.
+
+        Returns:
+            str: Header value, e.g. 'queue;dur=0.0;desc="Queue wait", ..., total;dur=412.5'.
+        """
+        breakdown = self.breakdown()
+        entries = [f'{phase};dur={breakdown[phase]};desc="{description}"' for phase, description in TIMING_PHASES]
+        entries.append(f"total;dur={breakdown['total']}")
+        return ", ".join(entries)
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def request_timings() -> Optional[RequestTimings]:
+    """
+    Get the phase timings of the request being served.
+
+    Returns:
+        Optional[RequestTimings]: Timings, or None outside a timed request.
+    """
+    return _request_timings.get()
+
+
+@contextmanager
+def timed_request() -> Iterator[RequestTimings]:
+    """
+    Time the phases of the request served within the block.
+
+    Yields:
+        RequestTimings: The request's timings.
+    """
+    timings = RequestTimings()
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def record_timing(phase: str, seconds: float) -> None:
+    """
+    Add time spent in a phase to the request being served, if it is timed.
+
+    Args:
+        phase (str): Phase name from TIMING_PHASES, except "post".
+        seconds (float): Time spent.
+    """
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(phase, seconds)
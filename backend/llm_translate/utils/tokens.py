@@ -0,0 +1,25 @@
+"""
+Token estimation utility module for llm-translate.
+Provides a fast local approximation of LLM token counts without loading a tokenizer.
+"""
+import math
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens a text will use.
+
+    ASCII text averages roughly four characters per token with BPE tokenizers, while
+    non-ASCII characters (accented letters, CJK, emoji) are closer to one token each.
+
+    Args:
+        text (str): Text to estimate.
+
+    Returns:
+        int: Estimated token count, at least 1 for non-empty text.
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    non_ascii_chars = len(text) - ascii_chars
+    return max(1, math.ceil(ascii_chars / 4 + non_ascii_chars * 0.9))
@@ -0,0 +1,568 @@
+"""
+Tracing utility module for llm-translate.
+Provides lightweight spans with W3C traceparent propagation, exported in the OTLP/JSON format to a
+local file or an OTLP/HTTP collector from a background thread, without depending on an SDK.
+"""
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import httpx
+
+from llm_translate.utils.config import get_config
+from llm_translate.utils.logging import setup_logger
+
+
+# Set up logger
+logger = setup_logger("llm_translate.tracing")
+
+# version-trace_id-parent_id-flags, e.g. 00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse a W3C traceparent header.
+
+    Args:
+        value (Optional[str]): Header value.
+
+    Returns:
+        Optional[Tuple[str, str, bool]]: Trace ID, parent span ID and sampled flag, or None if the
+            header is missing or invalid.
+    """
+    match = _TRACEPARENT.match((value or "").strip().lower())
+    if match is None:
+        return None
+    version, trace_id, parent_id, flags = match.groups()
+    if version == "ff" or trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+def format_traceparent(trace_id: str, span_id: str, sampled: bool = True) -> str:
+    """
+    Format a W3C traceparent header.
+
+    Args:
+        trace_id (str): 32 hex digit trace ID.
+        span_id (str): 16 hex digit span ID.
+        sampled (bool, optional): Whether the trace is recorded. Defaults to True.
+
+    Returns:
+        str: Header value.
+    """
+    return f"00-{trace_id}-{span_id}-{'01' if sampled else '00'}"
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """
+    Convert an attribute value to an OTLP/JSON AnyValue.
+
+    Args:
+        value (Any): Attribute value.
+
+    Returns:
+        Dict[str, Any]: OTLP/JSON value.
+    """
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Convert attributes to OTLP/JSON key-values.
+
+    Args:
+        attributes (Mapping[str, Any]): Attributes.
+
+    Returns:
+        List[Dict[str, Any]]: OTLP/JSON attributes.
+    """
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class Trace:
+    """Spans of one trace recorded in this process."""
+
+    __slots__ = ("tracer", "trace_id", "spans", "exported")
+
+    def __init__(self, tracer: "Tracer", trace_id: str):
+        """
+        Initialize the trace.
+
+        Args:
+            tracer (Tracer): Tracer that exports the trace.
+            trace_id (str): 32 hex digit trace ID.
+        """
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.spans: List["Span"] = []
+        self.exported = False
+
+
+class Span:
+    """Timed operation within a trace."""
+
+    __slots__ = ("trace", "name", "span_id", "parent_id", "kind", "start_ns", "end_ns", "attributes", "error", "root")
+
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str], kind: int = SPAN_KIND_INTERNAL,
+                 attributes: Optional[Dict[str, Any]] = None, root: bool = False):
+        """
+        Start a span.
+
+        Args:
+            trace (Trace): Trace the span belongs to.
+            name (str): Span name, e.g. "detect".
+            parent_id (Optional[str]): Parent span ID, or None for a trace started here.
+            kind (int, optional): OTLP span kind. Defaults to SPAN_KIND_INTERNAL.
+            attributes (Optional[Dict[str, Any]], optional): Initial attributes. Defaults to None.
+            root (bool, optional): Whether the span is the local root; the trace is exported when it ends.
+                Defaults to False.
+        """
+        self.trace = trace
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes or {}
+        self.error: Optional[str] = None
+        self.root = root
+
+    @property
+    def traceparent(self) -> str:
+        """
+        Get the traceparent header that makes this span the parent of a remote span.
+
+        Returns:
+            str: Header value.
+        """
+        return format_traceparent(self.trace.trace_id, self.span_id)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set an attribute.
+
+        Args:
+            key (str): Attribute name, e.g. "llm.provider".
+            value (Any): String, number or boolean value.
+        """
+        self.attributes[key] = value
+
+    def record_error(self, e: BaseException) -> None:
+        """
+        Mark the span as failed.
+
+        Args:
+            e (BaseException): The failure.
+        """
+        self.error = f"{e.__class__.__name__}: {e}"
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """
+        End the span and hand it to the tracer for export; ending it again has no effect.
+
+        Args:
+            end_ns (Optional[int], optional): End time in Unix nanoseconds. Defaults to now.
+        """
+        if self.end_ns is not None:
+            return
+        self.end_ns = end_ns or time.time_ns()
+        self.trace.tracer.finish(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Convert the span to OTLP/JSON.
+
+        Returns:
+            Dict[str, Any]: OTLP/JSON span.
+        """
+        span = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {"code": STATUS_UNSET},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def otlp_payload(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """
+    Build an OTLP/JSON ExportTraceServiceRequest.
+
+    Args:
+        spans (List[Span]): Ended spans.
+        service_name (str): service.name resource attribute.
+
+    Returns:
+        Dict[str, Any]: Request body.
+    """
+    return {"resourceSpans": [{
+        "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+        "scopeSpans": [{"scope": {"name": "llm_translate"}, "spans": [span.to_otlp() for span in spans]}],
+    }]}
+
+
+class SpanExporter:
+    """Sends ended spans to a backend."""
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        """
+        Export a batch of spans.
+
+        Args:
+            payload (Dict[str, Any]): OTLP/JSON ExportTraceServiceRequest.
+        """
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Release the exporter's resources."""
+
+
+class JsonFileExporter(SpanExporter):
+    """Appends each batch as one line of OTLP/JSON, the format read by the OpenTelemetry Collector's otlpjsonfile receiver."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the exporter.
+
+        Args:
+            path (str): File to append to.
+        """
+        self.path = path
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        """
+        Append a batch to the file.
+
+        Args:
+            payload (Dict[str, Any]): OTLP/JSON ExportTraceServiceRequest.
+        """
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+
+
+class OtlpHttpExporter(SpanExporter):
+    """Posts each batch to an OTLP/HTTP endpoint with JSON encoding."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        """
+        Initialize the exporter.
+
+        Args:
+            endpoint (str): Traces URL, e.g. "http://localhost:4318/v1/traces".
+            timeout (float, optional): Request timeout in seconds. Defaults to 5.
+        """
+        self.endpoint = endpoint
+        self.client = httpx.Client(timeout=timeout)
+
+    def export(self, payload: Dict[str, Any]) -> None:
+        """
+        Post a batch to the collector.
+
+        Args:
+            payload (Dict[str, Any]): OTLP/JSON ExportTraceServiceRequest.
+
+        Raises:
+            httpx.HTTPError: If the collector cannot be reached or rejects the batch.
+        """
+        self.client.post(self.endpoint, json=payload).raise_for_status()
+
+    def shutdown(self) -> None:
+        """Close the HTTP client."""
+        self.client.close()
+
+
+class BatchSpanProcessor:
+    """Queues ended spans and exports them in batches from a background thread, off the event loop."""
+
+    def __init__(self, exporter: SpanExporter, service_name: str = "llm-translate", max_queue: int = 2048,
+                 batch_size: int = 256, interval_seconds: float = 1.0):
+        """
+        Initialize the processor and start its export thread.
+
+        Args:
+            exporter (SpanExporter): Exporter the batches are sent to.
+            service_name (str, optional): service.name resource attribute. Defaults to "llm-translate".
+            max_queue (int, optional): Spans queued before new spans are dropped. Defaults to 2048.
+            batch_size (int, optional): Most spans per export. Defaults to 256.
+            interval_seconds (float, optional): Longest wait before a partial batch is exported. Defaults to 1.
+        """
+        self.exporter = exporter
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue)
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, spans: List[Span]) -> None:
+        """
+        Queue ended spans for export, dropping them if the queue is full.
+
+        Args:
+            spans (List[Span]): Ended spans.
+        """
+        for span in spans:
+            try:
+                self.queue.put_nowait(span)
+            except queue.Full:
+                self.dropped += 1
+
+    def _export(self, batch: List[Span]) -> None:
+        """
+        Export a batch, logging instead of raising on failure.
+
+        Args:
+            batch (List[Span]): Spans to export.
+        """
+        if not batch:
+            return
+        try:
+            self.exporter.export(otlp_payload(batch, self.service_name))
+            self.exported += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.warning(f"Failed to export {len(batch)} spans: {str(e)}")
+
+    def _run(self) -> None:
+        """Export queued spans until shutdown() is called."""
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.interval_seconds
+        while True:
+            try:
+                span = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                span = False
+            if span is None:
+                self._export(batch)
+                return
+            if span:
+                batch.append(span)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._export(batch)
+                batch = []
+                deadline = time.monotonic() + self.interval_seconds
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Export the queued spans and stop the export thread.
+
+        Args:
+            timeout (float, optional): Longest wait for the thread in seconds. Defaults to 5.
+        """
+        self.queue.put(None)
+        self._thread.join(timeout)
+        self.exporter.shutdown()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Starts traces for incoming requests and hands ended spans to the batch processor."""
+
+    def __init__(self, processor: Optional[BatchSpanProcessor], sample_ratio: float = 1.0,
+                 rng: Callable[[], float] = random.random):
+        """
+        Initialize the tracer.
+
+        Args:
+            processor (Optional[BatchSpanProcessor]): Processor ended spans are submitted to; None keeps
+                them only in their Trace, e.g. in tests.
+            sample_ratio (float, optional): Fraction of traces started here that are recorded; an incoming
+                traceparent's sampled flag is followed instead. Defaults to 1.0.
+            rng (Callable[[], float], optional): Random source for sampling. Defaults to random.random.
+        """
+        self.processor = processor
+        self.sample_ratio = sample_ratio
+        self.rng = rng
+
+    def start_trace(self, name: str, traceparent: Optional[str] = None,
+                    attributes: Optional[Dict[str, Any]] = None) -> Optional[Span]:
+        """
+        Start the local root span of a request, continuing the caller's trace if it sent a traceparent.
+
+        Args:
+            name (str): Span name, e.g. "POST /translate".
+            traceparent (Optional[str], optional): Incoming traceparent header. Defaults to None.
+            attributes (Optional[Dict[str, Any]], optional): Initial attributes. Defaults to None.
+
+        Returns:
+            Optional[Span]: The root span, or None if the trace is not sampled.
+        """
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id, sampled = os.urandom(16).hex(), None, self.rng() < self.sample_ratio
+        if not sampled:
+            return None
+        return Span(Trace(self, trace_id), name, parent_id, SPAN_KIND_SERVER, attributes, root=True)
+
+    def finish(self, span: Span) -> None:
+        """
+        Collect an ended span, exporting its trace once the local root has ended.
+
+        Args:
+            span (Span): Ended span.
+        """
+        trace = span.trace
+        trace.spans.append(span)
+        if self.processor is None:
+            return
+        if span.root:
+            trace.exported = True
+            self.processor.submit(trace.spans)
+        elif trace.exported:
+            # Ended after the request, e.g. a background call; export it on its own
+            self.processor.submit([span])
+
+    def shutdown(self) -> None:
+        """Export queued spans and stop the processor."""
+        if self.processor is not None:
+            self.processor.shutdown()
+
+
+def current_span() -> Optional[Span]:
+    """
+    Get the span of the running operation.
+
+    Returns:
+        Optional[Span]: Current span, or None outside a sampled trace.
+    """
+    return _current_span.get()
+
+
+@contextmanager
+def use_span(span: Optional[Span]) -> Iterator[Optional[Span]]:
+    """
+    Make a span current, recording an exception that escapes it and ending it on exit.
+
+    Args:
+        span (Optional[Span]): Span to use; None does nothing.
+
+    Yields:
+        Optional[Span]: The span.
+    """
+    if span is None:
+        yield None
+        return
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Optional[Span]:
+    """
+    Start a child of the current span without making it current, e.g. for an async generator.
+
+    Args:
+        name (str): Span name.
+        kind (int, optional): OTLP span kind. Defaults to SPAN_KIND_INTERNAL.
+        **attributes (Any): Initial attributes.
+
+    Returns:
+        Optional[Span]: The span, or None outside a sampled trace.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return None
+    return Span(parent.trace, name, parent.span_id, kind, attributes)
+
+
+@contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Record a phase of the current request as a child span; does nothing outside a sampled trace.
+
+    Args:
+        name (str): Span name, e.g. "detect".
+        kind (int, optional): OTLP span kind. Defaults to SPAN_KIND_INTERNAL.
+        **attributes (Any): Initial attributes.
+
+    Yields:
+        Optional[Span]: The span, or None outside a sampled trace.
+    """
+    with use_span(start_span(name, kind, **attributes)) as child:
+        yield child
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the process-wide tracer, creating it and its exporter from configuration on first use.
+
+    Returns:
+        Tracer: Shared tracer.
+    """
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                config = get_config()
+                exporter_name = config.get("TRACING_EXPORTER", "file").lower()
+                if exporter_name == "otlp":
+                    exporter = OtlpHttpExporter(config.get("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"))
+                else:
+                    exporter = JsonFileExporter(config.get("TRACING_FILE_PATH", "traces.jsonl"))
+                _tracer = Tracer(
+                    BatchSpanProcessor(exporter, service_name=config.get("TRACING_SERVICE_NAME", "llm-translate")),
+                    sample_ratio=config.get("TRACING_SAMPLE_RATIO", 1.0)
+                )
+                logger.info(
+                    f"Tracer initialized (exporter={exporter_name}, sample_ratio={_tracer.sample_ratio})"
+                )
+    return _tracer
+
+
+def reset_tracer() -> None:
+    """
+    Export queued spans and drop the process-wide tracer so the next call rebuilds it from configuration.
+    """
+    global _tracer
+    with _tracer_lock:
+        if _tracer is not None:
+            _tracer.shutdown()
+        _tracer = None
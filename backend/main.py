@@ -1,39 +1,156 @@
 """
 Main application entry point for llm-translate.
 """
-from fastapi import FastAPI, HTTPException, Request
+import asyncio
+import hmac
+import json
+import signal
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
-from llm_translate.api.models import TranslationRequest, TranslationResponse, SpeakRequest
-from llm_translate.core.service_selector import get_translation_service, get_speaker_service
-from llm_translate.utils.config import load_config
+from llm_translate.api.models import (
+    BatchTranslationRequest,
+    BatchTranslationResponse,
+    MultiTranslationRequest,
+    MultiTranslationResponse,
+    SpeakRequest,
+    TranslationRequest,
+    TranslationResponse,
+)
+from llm_translate.core.admission import AdmissionMiddleware, get_admission_controller
+from llm_translate.core.service_selector import (
+    build_speaker_pipeline, build_translation_pipeline, get_speaker_service, get_tiered_model, get_translation_service
+)
+from llm_translate.core.disk_cache import get_disk_translation_cache, reset_disk_translation_cache
+from llm_translate.core.circuit_breaker import get_circuit_breakers
+from llm_translate.core.hedging import get_hedge_controller
+from llm_translate.core.instrumentation import (
+    MetricsMiddleware, ServerTimingMiddleware, TracingMiddleware, label_request, render_metrics, traced_handler
+)
+from llm_translate.core.load_balancer import get_load_balancer
+from llm_translate.core.rate_limiter import get_rate_limiters
+from llm_translate.core.retry import get_retry_policy
+from llm_translate.core.language_detection import get_detection_cache
+from llm_translate.core.micro_batching import get_micro_batcher
+from llm_translate.core.service_registry import get_service_registry
+from llm_translate.core.single_flight import get_single_flight
+from llm_translate.core.translation_cache import get_translation_cache
+from llm_translate.core.translation_memory import get_translation_memory
+from llm_translate.utils.config import get_config, reload_config
 from llm_translate.utils.exceptions import ErrorType, TranslationError
+from llm_translate.utils.metrics import CONTENT_TYPE, record_error, request_timings
+from llm_translate.utils.tracing import reset_tracer
+from llm_translate.utils.http_client import close_http_client, get_http_client
 from llm_translate.utils.logging import setup_logger
+from llm_translate.utils.tokens import estimate_tokens
 
 
 # Set up logger
 logger = setup_logger("llm_translate.main")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the shared HTTP connection pool and install the SIGHUP configuration reload handler on
+    startup; close the pool, export the remaining trace spans and flush the disk cache on shutdown.
+    
+    Args:
+        app (FastAPI): Application instance.
+    """
+    get_http_client()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGHUP, reload_app_config)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        # No SIGHUP on this platform, or not running in the main thread
+        logger.debug("SIGHUP configuration reload is not available")
+    yield
+    await close_http_client()
+    reset_tracer()
+    reset_disk_translation_cache()
+
+
+def reload_app_config() -> dict:
+    """
+    Re-read the configuration, swap it in atomically and rebuild provider services on next use.
+    Requests already running keep the snapshot they started with.
+    
+    Returns:
+        dict: Version and load time of the new configuration.
+    """
+    global app_config
+    app_config = reload_config()
+    get_service_registry().invalidate()
+    logger.info(
+        f"Configuration reloaded (version {app_config.version}): "
+        f"AI_SOURCE={app_config.get('AI_SOURCE', 'unknown')}, TTS_SOURCE={app_config.get('TTS_SOURCE', 'unknown')}"
+    )
+    return {"version": app_config.version, "loaded_at": app_config.loaded_at}
+
+
+def require_admin_token(request: Request) -> None:
+    """
+    Allow a request to an admin endpoint only if it carries the configured admin token.
+    
+    The token is read from an `Authorization: Bearer <token>` or an `X-Admin-Token` header.
+    
+    Args:
+        request (Request): The incoming request.
+        
+    Raises:
+        HTTPException: 404 if ADMIN_TOKEN is not set, 401 if the token is missing or wrong.
+    """
+    expected = app_config.get("ADMIN_TOKEN") or ""
+    if not expected:
+        raise HTTPException(status_code=404, detail="Admin endpoints are disabled")
+    
+    token = request.headers.get("X-Admin-Token", "")
+    scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer":
+        token = credentials.strip()
+    if not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token", headers={"WWW-Authenticate": "Bearer"})
+
+
 # Create FastAPI application
 app = FastAPI(
     title="LLM Translate API",
     description="A simple REST-based language translation application using LLMs",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
-# Load configuration once at startup
-app_config = load_config()
+# Load configuration once at startup; replaced as a whole by reload_app_config()
+app_config = get_config()
 logger.info(f"Application started with AI_SOURCE: {app_config.get('AI_SOURCE', 'unknown')}")
 logger.info(f"Application started with TTS_SOURCE: {app_config.get('TTS_SOURCE', 'unknown')}")
 
-# Add CORS middleware
+# Middlewares added later wrap those added earlier, so the order below runs from innermost to outermost.
+# Bound concurrent requests per endpoint; excess requests queue briefly or get 503 with Retry-After
+app.add_middleware(AdmissionMiddleware)
+
+# Outside admission control, so request latency includes the admission queue and shed requests
+app.add_middleware(MetricsMiddleware)
+
+# Trace requests, continuing the caller's trace from its traceparent header
+app.add_middleware(TracingMiddleware)
+
+# Outside admission control, so the Server-Timing header accounts for the admission queue as well
+app.add_middleware(ServerTimingMiddleware)
+
+# Add CORS middleware last, so it is outermost and 503s shed by admission control carry CORS headers too
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # For development; restrict in production
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
 
@@ -41,12 +158,15 @@ app.add_middleware(
 @app.exception_handler(TranslationError)
 async def translation_error_handler(request: Request, exc: TranslationError):
     logger.error(f"Translation error: {exc.message} (Type: {exc.error_type}, Status: {exc.status_code})")
+    record_error(request.url.path, exc.error_type.value)
     return JSONResponse(
         status_code=exc.status_code,
-        content=exc.to_dict()
+        content=exc.to_dict(),
+        headers=exc.headers()
     )
 
 @app.post("/translate", response_model=TranslationResponse)
+@traced_handler
 async def translate_text(request: TranslationRequest):
     """
     Translate text from source language to target language.
@@ -60,14 +180,24 @@ async def translate_text(request: TranslationRequest):
     Raises:
         HTTPException: If translation fails.
     """
+    # Use one configuration snapshot for the whole request, even if it is reloaded meanwhile
+    config = app_config
     logger.info(f"Translation request received: {request.from_lang} → {request.to_lang}")
     try:
         # Get translator service based on configuration
-        translator = get_translation_service()
+        translator = get_translation_service(config)
         logger.debug(f"Using translator service: {translator.__class__.__name__}")
+        label_request(
+            config.get("AI_SOURCE"),
+            get_tiered_model(config, request.text, request.from_lang, request.to_lang) or translator.model,
+            request.from_lang, request.to_lang
+        )
+        
+        # Serve repeat texts and unchanged segments from the caches instead of the provider
+        translator = build_translation_pipeline(translator, config)
         
         # Translate text
-        translated_text = await translator.translate(
+        translated_text, detected_lang = await translator.translate_and_detect(
             text=request.text,
             from_lang=request.from_lang,
             to_lang=request.to_lang
@@ -75,12 +205,16 @@ async def translate_text(request: TranslationRequest):
         
         # Return response
         logger.info(f"Translation completed successfully: {request.from_lang} → {request.to_lang}")
+        timings = request_timings() if request.debug else None
         return TranslationResponse(
             translated_text=translated_text,
             from_lang=request.from_lang,
+            detected_lang=detected_lang,
             to_lang=request.to_lang,
-            service_used=app_config.get("AI_SOURCE", "unknown"),
-            model_used=translator.model or "unknown"  
+            service_used=config.get("AI_SOURCE", "unknown"),
+            model_used=get_tiered_model(config, request.text, detected_lang or request.from_lang, request.to_lang)
+            or translator.model or "unknown",
+            timings=timings.breakdown() if timings is not None else None
         )
     except ValueError as e:
         # For unsupported provider
@@ -115,7 +249,305 @@ async def translate_text(request: TranslationRequest):
                 original_exception=e
             )
 
+@app.post("/translate/batch", response_model=BatchTranslationResponse)
+@traced_handler
+async def translate_batch(request: BatchTranslationRequest):
+    """
+    Translate many texts that share a language pair, packing them into as few provider calls as possible.
+    
+    Args:
+        request (BatchTranslationRequest): Batch request containing the texts, source language, and target language.
+        
+    Returns:
+        BatchTranslationResponse: Translated texts in request order and metadata.
+        
+    Raises:
+        TranslationError: If the batch is too large or translation fails.
+    """
+    # Use one configuration snapshot for the whole request, even if it is reloaded meanwhile
+    config = app_config
+    logger.info(f"Batch translation request received: {len(request.texts)} texts, {request.from_lang} → {request.to_lang}")
+    max_texts = config.get("BATCH_MAX_TEXTS", 1000)
+    if len(request.texts) > max_texts:
+        raise TranslationError(
+            message=f"A batch may contain at most {max_texts} texts",
+            error_type=ErrorType.INVALID_REQUEST,
+            status_code=400
+        )
+    try:
+        # Get translator service based on configuration
+        translator = get_translation_service(config)
+        logger.debug(f"Using translator service: {translator.__class__.__name__}")
+        label_request(config.get("AI_SOURCE"), translator.model, request.from_lang, request.to_lang)
+        translator = build_translation_pipeline(translator, config)
+        
+        # Translate all texts
+        translations = await translator.translate_batch(
+            texts=request.texts,
+            from_lang=request.from_lang,
+            to_lang=request.to_lang
+        )
+        
+        logger.info(f"Batch translation completed successfully: {len(translations)} texts")
+        return BatchTranslationResponse(
+            translations=translations,
+            from_lang=request.from_lang,
+            to_lang=request.to_lang,
+            service_used=config.get("AI_SOURCE", "unknown"),
+            # Texts of different tiers go to different models; report each model used, in order of first use
+            model_used=", ".join(dict.fromkeys(
+                get_tiered_model(config, text, request.from_lang, request.to_lang) or translator.model or "unknown"
+                for text in request.texts
+            )) or translator.model or "unknown"
+        )
+    except TranslationError:
+        raise
+    except ValueError as e:
+        # For unsupported provider
+        logger.error(f"Unsupported provider error: {str(e)}")
+        raise TranslationError(
+            message=str(e),
+            error_type=ErrorType.INVALID_REQUEST,
+            status_code=400,
+            original_exception=e
+        )
+    except ImportError as e:
+        # For missing dependencies
+        logger.error(f"Missing dependency error: {str(e)}")
+        raise TranslationError(
+            message=f"Missing dependency: {str(e)}",
+            error_type=ErrorType.SERVICE_UNAVAILABLE,
+            status_code=500,
+            original_exception=e
+        )
+    except Exception as e:
+        # For unexpected errors
+        logger.error(f"Unexpected error during batch translation: {str(e)}", exc_info=True)
+        raise TranslationError(
+            message="An unexpected error occurred during translation",
+            error_type=ErrorType.UNKNOWN,
+            status_code=500,
+            original_exception=e
+        )
+
+@app.post("/translate/multi", response_model=MultiTranslationResponse)
+@traced_handler
+async def translate_multi(request: MultiTranslationRequest):
+    """
+    Translate one text into several target languages.
+    
+    The source language is detected at most once and the targets are translated concurrently.
+    
+    Args:
+        request (MultiTranslationRequest): Request containing the text, source language, and target languages.
+        
+    Returns:
+        MultiTranslationResponse: Translations keyed by target language and metadata.
+        
+    Raises:
+        TranslationError: If there are too many targets or translation fails.
+    """
+    # Use one configuration snapshot for the whole request, even if it is reloaded meanwhile
+    config = app_config
+    logger.info(f"Multi-target translation request received: {request.from_lang} → {', '.join(request.to_langs)}")
+    max_targets = config.get("MULTI_MAX_TARGETS", 25)
+    targets = list(dict.fromkeys(request.to_langs))
+    if len(targets) > max_targets:
+        raise TranslationError(
+            message=f"A request may contain at most {max_targets} target languages",
+            error_type=ErrorType.INVALID_REQUEST,
+            status_code=400
+        )
+    try:
+        # Get translator service based on configuration
+        translator = get_translation_service(config)
+        logger.debug(f"Using translator service: {translator.__class__.__name__}")
+        label_request(config.get("AI_SOURCE"), translator.model, request.from_lang, "multi")
+        
+        translator = build_translation_pipeline(translator, config)
+        
+        # Detect the source language once for all targets
+        from_lang = request.from_lang
+        detected_lang = None
+        if from_lang.lower() == "auto-detect":
+            detected_lang = await translator.detect_language(request.text)
+            from_lang = detected_lang
+        translations = await asyncio.gather(*(
+            translator.translate(text=request.text, from_lang=from_lang, to_lang=to_lang)
+            for to_lang in targets
+        ))
+        
+        logger.info(f"Multi-target translation completed successfully: {len(targets)} targets")
+        return MultiTranslationResponse(
+            translations=dict(zip(targets, translations)),
+            from_lang=request.from_lang,
+            detected_lang=detected_lang,
+            service_used=config.get("AI_SOURCE", "unknown"),
+            # Language pairs may tier the text differently; report each model used, in order of first use
+            model_used=", ".join(dict.fromkeys(
+                get_tiered_model(config, request.text, from_lang, to_lang) or translator.model or "unknown"
+                for to_lang in targets
+            )) or translator.model or "unknown"
+        )
+    except TranslationError:
+        raise
+    except ValueError as e:
+        # For unsupported provider
+        logger.error(f"Unsupported provider error: {str(e)}")
+        raise TranslationError(
+            message=str(e),
+            error_type=ErrorType.INVALID_REQUEST,
+            status_code=400,
+            original_exception=e
+        )
+    except ImportError as e:
+        # For missing dependencies
+        logger.error(f"Missing dependency error: {str(e)}")
+        raise TranslationError(
+            message=f"Missing dependency: {str(e)}",
+            error_type=ErrorType.SERVICE_UNAVAILABLE,
+            status_code=500,
+            original_exception=e
+        )
+    except Exception as e:
+        # For unexpected errors
+        logger.error(f"Unexpected error during multi-target translation: {str(e)}", exc_info=True)
+        raise TranslationError(
+            message="An unexpected error occurred during translation",
+            error_type=ErrorType.UNKNOWN,
+            status_code=500,
+            original_exception=e
+        )
+
+def _sse_event(event: str, data: dict) -> str:
+    """
+    Format a server-sent event.
+    
+    Args:
+        event (str): Event name.
+        data (dict): JSON payload.
+        
+    Returns:
+        str: Event in text/event-stream format.
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.post("/translate/stream")
+@traced_handler
+async def translate_text_stream(request: TranslationRequest):
+    """
+    Translate text and stream the translation as server-sent events while the model generates it.
+    
+    The stream consists of "token" events carrying {"text": ...} pieces, followed by a single "done"
+    event with the model used, timing and token usage, or an "error" event if the provider fails
+    after streaming has started. Failures before the first piece are returned as regular error responses.
+    
+    Args:
+        request (TranslationRequest): Translation request containing text, source language, and target language.
+        
+    Returns:
+        StreamingResponse: text/event-stream response.
+        
+    Raises:
+        TranslationError: If translation fails before the first piece arrives.
+    """
+    # Use one configuration snapshot for the whole request, even if it is reloaded meanwhile
+    config = app_config
+    logger.info(f"Streaming translation request received: {request.from_lang} → {request.to_lang}")
+    started_at = time.perf_counter()
+    usage = {}
+    try:
+        # Get translator service based on configuration
+        translator = get_translation_service(config)
+        logger.debug(f"Using translator service: {translator.__class__.__name__}")
+        label_request(
+            config.get("AI_SOURCE"),
+            get_tiered_model(config, request.text, request.from_lang, request.to_lang) or translator.model,
+            request.from_lang, request.to_lang
+        )
+        translator = build_translation_pipeline(translator, config)
+        
+        # Detect the source language up front, so the done event can report it and the model it was routed to
+        from_lang = request.from_lang
+        detected_lang = None
+        if from_lang.lower() == "auto-detect":
+            detected_lang = await translator.detect_language(request.text)
+            from_lang = detected_lang
+        
+        # Wait for the first piece so early failures still get a proper status code
+        pieces = translator.translate_stream(request.text, from_lang, request.to_lang, usage)
+        try:
+            first_piece = await pieces.__anext__()
+        except StopAsyncIteration:
+            first_piece = ""
+        first_piece_at = time.perf_counter()
+    except TranslationError:
+        raise
+    except ValueError as e:
+        # For unsupported provider
+        logger.error(f"Unsupported provider error: {str(e)}")
+        raise TranslationError(
+            message=str(e),
+            error_type=ErrorType.INVALID_REQUEST,
+            status_code=400,
+            original_exception=e
+        )
+    except Exception as e:
+        # For unexpected errors
+        logger.error(f"Unexpected error during streaming translation: {str(e)}", exc_info=True)
+        raise TranslationError(
+            message="An unexpected error occurred during translation",
+            error_type=ErrorType.UNKNOWN,
+            status_code=500,
+            original_exception=e
+        )
+    
+    async def events():
+        translated = [first_piece]
+        if first_piece:
+            yield _sse_event("token", {"text": first_piece})
+        try:
+            async for piece in pieces:
+                translated.append(piece)
+                yield _sse_event("token", {"text": piece})
+        except Exception as e:
+            error = e if isinstance(e, TranslationError) else TranslationError(
+                message="An unexpected error occurred during translation",
+                error_type=ErrorType.UNKNOWN,
+                status_code=500,
+                original_exception=e
+            )
+            logger.error(f"Streaming translation failed after the first piece: {error.message}")
+            record_error("/translate/stream", error.error_type.value)
+            yield _sse_event("error", error.to_dict()["error"])
+            return
+        
+        finished_at = time.perf_counter()
+        translated_text = "".join(translated)
+        logger.info(f"Streaming translation completed successfully: {request.from_lang} → {request.to_lang}")
+        yield _sse_event("done", {
+            "from_lang": request.from_lang,
+            "detected_lang": detected_lang,
+            "to_lang": request.to_lang,
+            "service_used": config.get("AI_SOURCE", "unknown"),
+            "model_used": get_tiered_model(config, request.text, from_lang, request.to_lang)
+            or translator.model or "unknown",
+            "timing": {
+                "time_to_first_token_ms": round((first_piece_at - started_at) * 1000, 1),
+                "total_ms": round((finished_at - started_at) * 1000, 1)
+            },
+            # Not every provider reports usage on streams; fall back to an estimate of the output
+            "usage": usage or {"completion_tokens": estimate_tokens(translated_text), "estimated": True}
+        })
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/speak")
+@traced_handler
 async def speak_text(request: SpeakRequest):
     """
     Convert text to speech using the configured TTS provider.
@@ -129,10 +561,14 @@ async def speak_text(request: SpeakRequest):
     Raises:
         HTTPException: If text-to-speech conversion fails.
     """
+    # Use one configuration snapshot for the whole request, even if it is reloaded meanwhile
+    config = app_config
     logger.info(f"TTS request received: lang={request.lang}, voice={request.voice}, format={request.response_format}")
     try:
-        # Get speaker service based on configuration
-        speaker = get_speaker_service()
+        # Get speaker service based on configuration, behind its circuit breaker and fallbacks
+        speaker = get_speaker_service(config)
+        label_request(config.get("TTS_SOURCE"), speaker.model, request.lang)
+        speaker = build_speaker_pipeline(speaker, config)
         logger.debug(f"Using speaker service: {speaker.__class__.__name__}")
         
         # Convert text to speech
@@ -163,17 +599,100 @@ async def speak_text(request: SpeakRequest):
     except ValueError as e:
         # For unsupported provider or format
         logger.error(f"Configuration error for /speak: {str(e)}")
+        record_error("/speak", ErrorType.INVALID_REQUEST.value)
         raise HTTPException(status_code=500, detail=str(e))
     except TranslationError as e:
         # Re-use TranslationError for TTS errors
         logger.error(f"TTS service error for /speak: {e.message}")
-        raise HTTPException(status_code=e.status_code, detail=e.message)
+        record_error("/speak", e.error_type.value)
+        raise HTTPException(status_code=e.status_code, detail=e.message, headers=e.headers() or None)
     except Exception as e:
         # For unexpected errors
         logger.error(f"Unexpected error in /speak: {str(e)}", exc_info=True)
+        record_error("/speak", ErrorType.UNKNOWN.value)
         raise HTTPException(status_code=500, detail="An unexpected error occurred during speech generation.")
 
 
+@app.get("/admin/cache", dependencies=[Depends(require_admin_token)])
+async def cache_stats():
+    """
+    Report translation cache counters.
+    
+    Returns:
+        dict: Hit, miss, eviction and size counters for the translation and language detection caches,
+        plus request coalescing and micro-batching counters.
+    """
+    disk_cache = get_disk_translation_cache()
+    return {
+        "memory": get_translation_cache().stats(),
+        "translation_memory": get_translation_memory().stats(),
+        "disk": disk_cache.stats() if disk_cache is not None else None,
+        "single_flight": get_single_flight().stats(),
+        "micro_batching": get_micro_batcher().stats(),
+        "language_detection": get_detection_cache().stats()
+    }
+
+
+@app.get("/admin/providers", dependencies=[Depends(require_admin_token)])
+async def provider_stats():
+    """
+    Report how requests are spread across providers.
+    
+    Returns:
+        dict: Rate limiter budgets and queues, retry counters, circuit breaker state, load balancer
+        routing weights and health per provider, hedging counters and the current hedge delay per provider.
+    """
+    return {
+        "rate_limits": get_rate_limiters().stats(),
+        "retries": get_retry_policy().stats(),
+        "circuit_breakers": get_circuit_breakers().stats(),
+        "load_balancer": get_load_balancer().stats(),
+        "hedging": get_hedge_controller().stats()
+    }
+
+
+@app.get("/admin/admission", dependencies=[Depends(require_admin_token)])
+async def admission_stats():
+    """
+    Report concurrency, queue depth, queue wait and shed requests of the endpoint and provider bulkheads.
+    
+    Returns:
+        dict: Bulkhead stats by endpoint path and by provider.
+    """
+    return get_admission_controller().stats()
+
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Expose request and provider metrics in the Prometheus text format.
+    
+    Returns:
+        PlainTextResponse: Latency histograms, in-flight gauges, error counts, provider volume and the
+        admission, rate limiting, retry and circuit breaker counters.
+        
+    Raises:
+        HTTPException: If metrics are disabled.
+    """
+    if not app_config.get("METRICS_ENABLED", True):
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
+
+
+@app.post("/admin/config/reload", dependencies=[Depends(require_admin_token)])
+async def config_reload():
+    """
+    Reload the configuration from .env and the environment without restarting.
+    
+    Providers, models and keys take effect for the next request. Cache, pool and batching sizes
+    keep their startup values until restart.
+    
+    Returns:
+        dict: Version and load time of the new configuration.
+    """
+    return reload_app_config()
+
+
 @app.get("/")
 async def root():
     """
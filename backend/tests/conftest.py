@@ -0,0 +1,62 @@
+"""
+Shared pytest fixtures for the llm-translate test suite.
+"""
+import pytest
+
+from llm_translate.core.admission import reset_admission_controller
+from llm_translate.core.circuit_breaker import reset_circuit_breakers
+from llm_translate.core.disk_cache import reset_disk_translation_cache
+from llm_translate.core.fuzzy_memory import reset_fuzzy_index
+from llm_translate.core.hedging import reset_hedge_controller
+from llm_translate.core.language_detection import reset_detection_cache
+from llm_translate.core.load_balancer import reset_load_balancer
+from llm_translate.core.micro_batching import reset_micro_batcher
+from llm_translate.core.rate_limiter import reset_rate_limiters
+from llm_translate.core.retry import reset_retry_policy
+from llm_translate.core.service_registry import reset_service_registry
+from llm_translate.core.single_flight import reset_single_flight
+from llm_translate.core.translation_cache import reset_translation_cache
+from llm_translate.core.translation_memory import reset_translation_memory
+from llm_translate.utils.config import reset_config
+from llm_translate.utils.http_client import reset_http_client
+from llm_translate.utils.tracing import reset_tracer
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """Reset process-wide caches so state does not leak between tests."""
+    reset_translation_cache()
+    reset_translation_memory()
+    reset_fuzzy_index()
+    reset_disk_translation_cache()
+    reset_single_flight()
+    reset_micro_batcher()
+    reset_detection_cache()
+    reset_http_client()
+    reset_service_registry()
+    reset_config()
+    reset_hedge_controller()
+    reset_load_balancer()
+    reset_circuit_breakers()
+    reset_rate_limiters()
+    reset_retry_policy()
+    reset_admission_controller()
+    reset_tracer()
+    yield
+    reset_translation_cache()
+    reset_translation_memory()
+    reset_fuzzy_index()
+    reset_disk_translation_cache()
+    reset_single_flight()
+    reset_micro_batcher()
+    reset_detection_cache()
+    reset_http_client()
+    reset_service_registry()
+    reset_config()
+    reset_hedge_controller()
+    reset_load_balancer()
+    reset_circuit_breakers()
+    reset_rate_limiters()
+    reset_retry_policy()
+    reset_admission_controller()
+    reset_tracer()
@@ -1,10 +1,14 @@
 """
 Integration tests for the API endpoints.
 """
+import json
+
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
+from llm_translate.core.admission import AdmissionController
 from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.tracing import Tracer
 from main import app
 
 
@@ -22,6 +26,16 @@ class MockTranslator(BaseTranslator):
         return f"[{to_lang}] {text} [{from_lang}]"
 
 
+class CollectingProcessor:
+    """Span processor that keeps submitted spans."""
+    
+    def __init__(self):
+        self.spans = []
+    
+    def submit(self, spans):
+        self.spans.extend(spans)
+
+
 @pytest.fixture
 def test_client():
     """Create a test client for the FastAPI app."""
@@ -150,4 +164,309 @@ def test_translate_endpoint_value_error(mock_get_service, test_client, mock_load
     assert "error" in response_data
     assert "message" in response_data["error"]
     assert "Unsupported AI service provider: invalid" in response_data["error"]["message"]
-    assert response_data["error"]["type"] == "invalid_request_error"
\ No newline at end of file
+    assert response_data["error"]["type"] == "invalid_request_error"
+
+def test_translate_endpoint_uses_cache(test_client, mock_get_translation_service, mock_load_config):
+    """Test that a repeated /translate request is served from the translation cache."""
+    test_data = {
+        "text": "Good morning",
+        "from_lang": "English",
+        "to_lang": "German",
+    }
+    translator = mock_get_translation_service.return_value
+    translator.translate = AsyncMock(wraps=translator.translate)
+
+    with patch("main.app_config", {"AI_SOURCE": "test-service", "ADMIN_TOKEN": "secret"}):
+        first = test_client.post("/translate", json=test_data)
+        second = test_client.post("/translate", json=test_data)
+        stats = test_client.get("/admin/cache", headers={"Authorization": "Bearer secret"}).json()["memory"]
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert translator.translate.await_count == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_translate_batch_endpoint(test_client, mock_get_translation_service, mock_load_config):
+    """Test the /translate/batch endpoint returns translations in request order."""
+    test_data = {
+        "texts": ["Hello", "Goodbye", "Hello"],
+        "from_lang": "English",
+        "to_lang": "Spanish",
+    }
+
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}):
+        response = test_client.post("/translate/batch", json=test_data)
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["translations"] == [
+        "[Spanish] Hello [English]",
+        "[Spanish] Goodbye [English]",
+        "[Spanish] Hello [English]",
+    ]
+    assert response_data["service_used"] == "test-service"
+    assert response_data["model_used"] == "test-model"
+
+
+def test_translate_batch_endpoint_too_many_texts(test_client, mock_get_translation_service):
+    """Test the /translate/batch endpoint rejects batches above BATCH_MAX_TEXTS."""
+    test_data = {"texts": ["a", "b", "c"], "from_lang": "English", "to_lang": "Spanish"}
+
+    with patch("main.app_config", {"AI_SOURCE": "test-service", "BATCH_MAX_TEXTS": 2}):
+        response = test_client.post("/translate/batch", json=test_data)
+
+    assert response.status_code == 400
+    assert response.json()["error"]["type"] == "invalid_request_error"
+
+
+def test_translate_stream_endpoint(test_client, mock_get_translation_service, mock_load_config):
+    """Test the /translate/stream endpoint sends token events followed by a done event."""
+    test_data = {"text": "Hello", "from_lang": "English", "to_lang": "Spanish"}
+
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}):
+        response = test_client.post("/translate/stream", json=test_data)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n", 1) for block in response.text.strip().split("\n\n")]
+    names = [name for name, _ in events]
+    payloads = [json.loads(data[len("data: "):]) for _, data in events]
+
+    assert names == ["event: token", "event: done"]
+    assert payloads[0]["text"] == "[Spanish] Hello [English]"
+    assert payloads[1]["model_used"] == "test-model"
+    assert "time_to_first_token_ms" in payloads[1]["timing"]
+    assert payloads[1]["usage"]["estimated"] is True
+
+
+def test_translate_stream_reports_model_for_detected_language(test_client, mock_get_translation_service):
+    """Test that the done event reports the detected language and the model tiering routed it to."""
+    translator = mock_get_translation_service.return_value
+    translator._detect_language = AsyncMock(return_value="Japanese")
+    config = {"AI_SOURCE": "groq", "MODEL_TIERING_ENABLED": True, "GROQ_MODEL": "big-model",
+              "GROQ_FAST_MODEL": "small-model", "MODEL_TIERING_PAIR_LIMITS": "Japanese>*=0"}
+    test_data = {"text": "こんにちは", "from_lang": "Auto-detect", "to_lang": "Spanish"}
+
+    with patch("main.app_config", config):
+        response = test_client.post("/translate/stream", json=test_data)
+
+    done = json.loads(response.text.strip().split("\n\n")[-1].split("\n", 1)[1][len("data: "):])
+    assert done["detected_lang"] == "Japanese"
+    assert done["model_used"] == "test-model"
+
+
+def test_translate_multi_endpoint(test_client, mock_get_translation_service, mock_load_config):
+    """Test the /translate/multi endpoint returns one translation per unique target language."""
+    test_data = {"text": "Hello", "from_lang": "English", "to_langs": ["Spanish", "French", "Spanish"]}
+
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}):
+        response = test_client.post("/translate/multi", json=test_data)
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["translations"] == {
+        "Spanish": "[Spanish] Hello [English]",
+        "French": "[French] Hello [English]",
+    }
+    assert response_data["detected_lang"] is None
+    assert response_data["model_used"] == "test-model"
+
+
+def test_translate_multi_endpoint_detects_once(test_client, mock_get_translation_service, mock_load_config):
+    """Test that auto-detection runs once for all targets."""
+    translator = mock_get_translation_service.return_value
+    translator._detect_language = AsyncMock(return_value="English")
+    test_data = {"text": "Hello", "from_lang": "Auto-detect", "to_langs": ["Spanish", "French", "German"]}
+
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}):
+        response = test_client.post("/translate/multi", json=test_data)
+
+    assert response.status_code == 200
+    assert response.json()["detected_lang"] == "English"
+    assert response.json()["translations"]["German"] == "[German] Hello [English]"
+    assert translator._detect_language.await_count == 1
+
+
+def test_translate_endpoint_reports_detected_language(test_client, mock_get_translation_service):
+    """Test that /translate reports the source language detected for Auto-detect requests."""
+    test_data = {"text": "Wir haben gestern den ganzen Tag im Garten gearbeitet.", "from_lang": "Auto-detect", "to_lang": "English"}
+
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}):
+        response = test_client.post("/translate", json=test_data)
+
+    assert response.status_code == 200
+    assert response.json()["detected_lang"] == "German"
+    assert response.json()["translated_text"] == f"[English] {test_data['text']} [German]"
+
+
+def test_translate_multi_endpoint_too_many_targets(test_client, mock_get_translation_service):
+    """Test the /translate/multi endpoint rejects requests above MULTI_MAX_TARGETS."""
+    test_data = {"text": "Hello", "from_lang": "English", "to_langs": ["Spanish", "French", "German"]}
+
+    with patch("main.app_config", {"AI_SOURCE": "test-service", "MULTI_MAX_TARGETS": 2}):
+        response = test_client.post("/translate/multi", json=test_data)
+
+    assert response.status_code == 400
+    assert response.json()["error"]["type"] == "invalid_request_error"
+
+
+def test_config_reload_endpoint(test_client):
+    """Test that /admin/config/reload swaps the configuration and invalidates cached services."""
+    with patch("main.app_config", {"AI_SOURCE": "test-service", "ADMIN_TOKEN": "secret"}), \
+            patch("llm_translate.utils.config.load_dotenv"), \
+            patch("main.get_service_registry") as mock_registry:
+        response = test_client.post("/admin/config/reload", headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 200
+    assert response.json()["version"] >= 1
+    mock_registry.return_value.invalidate.assert_called_once()
+
+
+def test_admin_endpoints_disabled_without_admin_token(test_client):
+    """Test that the admin endpoints are off while ADMIN_TOKEN is not set."""
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}), \
+            patch("main.reload_app_config") as mock_reload:
+        responses = [
+            test_client.get("/admin/cache"),
+            test_client.get("/admin/providers"),
+            test_client.get("/admin/admission"),
+            test_client.post("/admin/config/reload", headers={"Authorization": "Bearer "}),
+        ]
+
+    assert [response.status_code for response in responses] == [404, 404, 404, 404]
+    mock_reload.assert_not_called()
+
+
+def test_admin_endpoints_require_admin_token(test_client):
+    """Test that the admin endpoints reject requests without the configured token."""
+    with patch("main.app_config", {"AI_SOURCE": "test-service", "ADMIN_TOKEN": "secret"}), \
+            patch("main.reload_app_config") as mock_reload:
+        missing = test_client.get("/admin/providers")
+        wrong = test_client.post("/admin/config/reload", headers={"Authorization": "Bearer guess"})
+        allowed = test_client.get("/admin/admission", headers={"Authorization": "Bearer secret"})
+
+    assert missing.status_code == wrong.status_code == 401
+    assert missing.headers["www-authenticate"] == "Bearer"
+    assert allowed.status_code == 200
+    mock_reload.assert_not_called()
+
+
+def test_overloaded_endpoint_sheds_with_retry_after(test_client, mock_get_translation_service):
+    """Test that a request beyond an endpoint's concurrency and queue is shed with 503 and Retry-After."""
+    controller = AdmissionController({"/translate": (1, 0)}, {})
+    controller.endpoint("/translate").active = 1
+    with patch("llm_translate.core.admission.get_admission_controller", return_value=controller):
+        response = test_client.post("/translate", json={"text": "Hello", "from_lang": "English", "to_lang": "Spanish"})
+        other = test_client.post("/translate/batch", json={"texts": ["Hello"], "from_lang": "English", "to_lang": "Spanish"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["error"]["type"] == "overloaded_error"
+    assert other.status_code == 200
+    mock_get_translation_service.assert_called_once()
+
+
+def test_overloaded_endpoint_still_serves_cors(test_client, mock_get_translation_service):
+    """Test that preflights bypass admission control and shed responses carry CORS headers."""
+    controller = AdmissionController({"/translate": (1, 0)}, {})
+    controller.endpoint("/translate").active = 1
+    origin = {"Origin": "http://localhost:3000"}
+    with patch("llm_translate.core.admission.get_admission_controller", return_value=controller):
+        preflight = test_client.options("/translate", headers={**origin, "Access-Control-Request-Method": "POST"})
+        shed = test_client.post("/translate", headers=origin,
+                                json={"text": "Hello", "from_lang": "English", "to_lang": "Spanish"})
+
+    assert preflight.status_code == 200
+    assert shed.status_code == 503
+    assert "access-control-allow-origin" in shed.headers
+
+
+def test_translate_endpoint_reports_tiered_model(test_client, mock_get_translation_service):
+    """Test that model_used names the fast model for short texts when model tiering is enabled."""
+    config = {"AI_SOURCE": "groq", "MODEL_TIERING_ENABLED": True, "GROQ_MODEL": "big-model",
+              "GROQ_FAST_MODEL": "small-model", "MODEL_TIERING_FAST_MAX_TOKENS": 5}
+    with patch("main.app_config", config):
+        short = test_client.post("/translate", json={"text": "Save", "from_lang": "English", "to_lang": "Spanish"})
+        long = test_client.post("/translate", json={"text": "word " * 50, "from_lang": "English", "to_lang": "Spanish"})
+
+    assert short.json()["model_used"] == "small-model"
+    assert long.json()["model_used"] == "test-model"
+
+
+def test_translate_multi_endpoint_reports_tiered_models(test_client, mock_get_translation_service):
+    """Test that model_used names the model tiering routed each target to."""
+    config = {"AI_SOURCE": "groq", "MODEL_TIERING_ENABLED": True, "GROQ_MODEL": "big-model",
+              "GROQ_FAST_MODEL": "small-model", "MODEL_TIERING_PAIR_LIMITS": "*>Japanese=0"}
+    with patch("main.app_config", config):
+        fast = test_client.post("/translate/multi", json={"text": "Save", "from_lang": "English",
+                                                          "to_langs": ["Spanish", "French"]})
+        mixed = test_client.post("/translate/multi", json={"text": "Save", "from_lang": "English",
+                                                           "to_langs": ["Spanish", "Japanese"]})
+
+    assert fast.json()["model_used"] == "small-model"
+    assert mixed.json()["model_used"] == "small-model, test-model"
+
+
+def test_translate_batch_endpoint_reports_tiered_models(test_client, mock_get_translation_service):
+    """Test that model_used names the models tiering routed the texts of a batch to, in order of first use."""
+    config = {"AI_SOURCE": "groq", "MODEL_TIERING_ENABLED": True, "GROQ_MODEL": "big-model",
+              "GROQ_FAST_MODEL": "small-model", "MODEL_TIERING_FAST_MAX_TOKENS": 5}
+    with patch("main.app_config", config):
+        short = test_client.post("/translate/batch", json={"texts": ["Save", "Cancel"], "from_lang": "English",
+                                                           "to_lang": "Spanish"})
+        mixed = test_client.post("/translate/batch", json={"texts": ["word " * 50, "Save"], "from_lang": "English",
+                                                           "to_lang": "Spanish"})
+
+    assert short.json()["model_used"] == "small-model"
+    assert mixed.json()["model_used"] == "test-model, small-model"
+
+
+def test_metrics_endpoint_records_requests(test_client, mock_get_translation_service):
+    """Test that /metrics exposes the latency of served requests by provider, model and language pair."""
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}):
+        test_client.post("/translate", json={"text": "Hello", "from_lang": "English", "to_lang": "Spanish"})
+        response = test_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert ('llm_translate_request_duration_seconds_count{endpoint="/translate",provider="test-service",'
+            'model="test-model",from_lang="english",to_lang="spanish"}') in response.text
+
+
+def test_translate_reports_server_timing(test_client, mock_get_translation_service):
+    """Test that responses break their latency down in a Server-Timing header, and in the body with debug set."""
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}):
+        response = test_client.post(
+            "/translate", json={"text": "Hello", "from_lang": "English", "to_lang": "Spanish", "debug": True}
+        )
+        plain = test_client.post("/translate", json={"text": "Hello", "from_lang": "English", "to_lang": "Spanish"})
+
+    assert response.status_code == 200
+    phases = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+    assert phases == ["queue", "cache", "detect", "provider", "post", "transcode", "total"]
+    timings = response.json()["timings"]
+    assert set(timings) == set(phases)
+    assert timings["provider"] <= timings["total"]
+    assert "server-timing" in plain.headers
+    assert plain.json()["timings"] is None
+
+
+def test_traced_request_continues_caller_trace(test_client, mock_get_translation_service):
+    """Test that a traced request joins the caller's trace, records its phases and returns its traceparent."""
+    processor = CollectingProcessor()
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    with patch("main.app_config", {"AI_SOURCE": "test-service"}), \
+            patch("llm_translate.core.instrumentation.get_config", return_value={"TRACING_ENABLED": True}), \
+            patch("llm_translate.core.instrumentation.get_tracer", return_value=Tracer(processor)):
+        response = test_client.post(
+            "/translate",
+            json={"text": "Hello", "from_lang": "English", "to_lang": "Spanish"},
+            headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["traceparent"].startswith(f"00-{trace_id}-")
+    names = {span.name for span in processor.spans}
+    assert {"POST /translate", "handler", "serialize"} <= names
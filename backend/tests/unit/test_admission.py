@@ -0,0 +1,112 @@
+"""
+Unit tests for the admission control module.
+"""
+import asyncio
+
+import pytest
+from llm_translate.core.admission import AdmissionController, Bulkhead, BulkheadTranslator, parse_limits
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class GatedTranslator(BaseTranslator):
+    """Translator that answers once its gate is opened."""
+
+    provider = "groq"
+
+    def __init__(self):
+        super().__init__(api_key="test-key", model="test-model")
+        self.gate = asyncio.Event()
+
+    async def translate(self, text, from_lang, to_lang):
+        await self.gate.wait()
+        return text
+
+
+class GatedBatchTranslator(GatedTranslator):
+    """Translator that answers packed batch prompts once its gate is opened."""
+
+    supports_batch = True
+
+    async def _complete(self, system_prompt, user_prompt, temperature=0.3, json_mode=False):
+        await self.gate.wait()
+        return user_prompt[user_prompt.index("{"):]
+
+
+def test_parse_limits():
+    """Test the name=concurrency:queue format, with the queue defaulting to twice the concurrency."""
+    assert parse_limits("/translate=64:128, /speak=8,") == {"/translate": (64, 128), "/speak": (8, 16)}
+    assert parse_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_limits("/speak")
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_shed():
+    """Test that requests beyond the concurrency and queue limits are shed immediately."""
+    bulkhead = Bulkhead("/speak", max_concurrent=1, max_queue=1)
+    first = await bulkhead.acquire()
+    waiting = asyncio.create_task(bulkhead.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(TranslationError) as error:
+        await bulkhead.acquire()
+    assert error.value.error_type == ErrorType.OVERLOADED
+    assert error.value.status_code == 503
+    assert error.value.headers()["Retry-After"] == "2"
+
+    bulkhead.release(first)
+    bulkhead.release(await waiting)
+    stats = bulkhead.stats()
+    assert stats["active"] == 0
+    assert stats["admitted"] == 2
+    assert stats["queued"] == 1
+    assert stats["shed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_times_out():
+    """Test that a request waiting longer than allowed is shed and leaves the queue."""
+    bulkhead = Bulkhead("groq", max_concurrent=1, max_queue=5, max_wait_seconds=0.01)
+    await bulkhead.acquire()
+
+    with pytest.raises(TranslationError):
+        await bulkhead.acquire()
+    assert bulkhead.stats()["queue_depth"] == 0
+    assert bulkhead.stats()["timed_out"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_translator_limits_provider_concurrency():
+    """Test that provider calls beyond the limit wait for a slot in arrival order."""
+    provider = GatedTranslator()
+    controller = AdmissionController({}, {"groq": (1, 4)})
+    translator = BulkheadTranslator(provider, controller.provider("groq"))
+
+    calls = [asyncio.create_task(translator.translate(text, "English", "Spanish")) for text in ("a", "b")]
+    await asyncio.sleep(0)
+    assert controller.stats()["providers"]["groq"]["active"] == 1
+    assert controller.stats()["providers"]["groq"]["queue_depth"] == 1
+
+    provider.gate.set()
+    assert await asyncio.gather(*calls) == ["a", "b"]
+    assert controller.stats()["providers"]["groq"]["active"] == 0
+    assert controller.endpoint("/translate") is None
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_translator_holds_a_slot_per_packed_request():
+    """Test that each packed request of a batch takes its own slot."""
+    provider = GatedBatchTranslator()
+    provider.batch_max_items = 2
+    controller = AdmissionController({}, {"groq": (1, 4)})
+    translator = BulkheadTranslator(provider, controller.provider("groq"))
+
+    batch = asyncio.create_task(translator.translate_batch(["a", "b", "c", "d"], "English", "Spanish"))
+    await asyncio.sleep(0.01)
+    assert controller.stats()["providers"]["groq"]["active"] == 1
+    assert controller.stats()["providers"]["groq"]["queue_depth"] == 1
+
+    provider.gate.set()
+    assert await batch == ["a", "b", "c", "d"]
+    assert controller.stats()["providers"]["groq"]["admitted"] == 2
@@ -0,0 +1,238 @@
+"""
+Unit tests for the shared batching, streaming and detect-and-translate logic in BaseTranslator.
+"""
+import asyncio
+import json
+import pytest
+from llm_translate.services.base_translator import BaseTranslator, TranslatorWrapper
+
+
+class PackingTranslator(BaseTranslator):
+    """Translator whose _complete answers packed prompts, optionally dropping some items."""
+
+    provider = "fake"
+    supports_batch = True
+
+    def __init__(self, drop=()):
+        super().__init__(api_key="test-key", model="test-model")
+        self.drop = set(drop)
+        self.prompts = []
+        self.single_calls = []
+
+    async def translate(self, text, from_lang, to_lang):
+        self.single_calls.append(text)
+        return text.upper()
+
+    async def _complete(self, system_prompt, user_prompt, temperature=0.3):
+        items = json.loads(user_prompt[user_prompt.index("{"):])
+        self.prompts.append(list(items.values()))
+        return json.dumps({key: value.upper() for key, value in items.items() if value not in self.drop})
+
+
+@pytest.mark.asyncio
+async def test_batch_packs_by_item_limit():
+    """Test that texts are split into packs of at most batch_max_items."""
+    translator = PackingTranslator()
+    translator.batch_max_items = 2
+
+    result = await translator.translate_batch(["a", "b", "c", "d", "e"], "English", "Spanish")
+
+    assert result == ["A", "B", "C", "D", "E"]
+    assert translator.prompts == [["a", "b"], ["c", "d"]]
+    assert translator.single_calls == ["e"]
+
+
+@pytest.mark.asyncio
+async def test_batch_packs_by_token_limit():
+    """Test that a pack is closed before it exceeds batch_max_tokens."""
+    translator = PackingTranslator()
+    translator.batch_max_tokens = 5
+
+    texts = ["x" * 12, "y" * 8, "z" * 8]  # 3, 2 and 2 estimated tokens
+    await translator.translate_batch(texts, "English", "Spanish")
+
+    assert translator.prompts == [["x" * 12, "y" * 8]]
+    assert translator.single_calls == ["z" * 8]
+
+
+@pytest.mark.asyncio
+async def test_batch_retries_only_malformed_items():
+    """Test that only items missing from the output are re-split and retried."""
+    translator = PackingTranslator(drop={"b", "c"})
+
+    result = await translator.translate_batch(["a", "b", "c", "d"], "English", "Spanish")
+
+    assert result == ["A", "B", "C", "D"]
+    assert translator.prompts[0] == ["a", "b", "c", "d"]
+    assert translator.single_calls == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_batch_same_language_short_circuit():
+    """Test that a same-language batch returns the input without any request."""
+    translator = PackingTranslator()
+    assert await translator.translate_batch(["a", "b"], "English", "english") == ["a", "b"]
+    assert translator.prompts == []
+
+
+class SlowTranslator(BaseTranslator):
+    """Translator without batching that records how many translations run at once."""
+
+    provider = "fake"
+
+    def __init__(self):
+        super().__init__(api_key="test-key", model="test-model")
+        self.running = 0
+        self.peak = 0
+
+    async def translate(self, text, from_lang, to_lang):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        return text.upper()
+
+
+@pytest.mark.asyncio
+async def test_batch_without_packing_is_bounded_by_batch_concurrency():
+    """Test that a batch for a provider without batching runs at most batch_concurrency translations at once."""
+    translator = SlowTranslator()
+    translator.batch_concurrency = 3
+
+    texts = [f"text {index}" for index in range(20)]
+    assert await translator.translate_batch(texts, "English", "Spanish") == [text.upper() for text in texts]
+    assert translator.peak == 3
+
+
+def test_parse_batch_response_variants():
+    """Test parsing of fenced objects, plain arrays and garbage."""
+    parse = BaseTranslator._parse_batch_response
+    assert parse('```json\n{"0": "A", "1": "B"}\n```', 2) == {0: "A", 1: "B"}
+    assert parse('Here you go: ["A", "B"]', 2) == {0: "A", 1: "B"}
+    assert parse('["A"]', 2) == {}
+    assert parse('{"0": "A", "1": 5}', 2) == {0: "A"}
+    assert parse("not json", 2) == {}
+
+
+class StreamingTranslator(BaseTranslator):
+    """Translator whose _complete_stream yields preset pieces."""
+
+    provider = "fake"
+
+    def __init__(self, pieces):
+        super().__init__(api_key="test-key", model="test-model")
+        self.pieces = pieces
+
+    async def translate(self, text, from_lang, to_lang):
+        return "full translation"
+
+    async def _complete_stream(self, system_prompt, user_prompt, temperature=0.3, usage=None):
+        if usage is not None:
+            usage.update(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+        for piece in self.pieces:
+            yield piece
+
+
+async def collect(translator, usage=None):
+    return [piece async for piece in translator.translate_stream("Hello", "English", "Spanish", usage)]
+
+
+@pytest.mark.asyncio
+async def test_stream_strips_surrounding_quotes_and_whitespace():
+    """Test that streamed output loses the outer quotes and whitespace, but keeps inner quotes."""
+    usage = {}
+    pieces = await collect(StreamingTranslator([" \"Hola", ", \"amigo\"", " mío", "\"\n"]), usage)
+
+    assert "".join(pieces) == "Hola, \"amigo\" mío"
+    assert pieces[0] == "Hola"
+    assert usage["total_tokens"] == 15
+
+
+@pytest.mark.asyncio
+async def test_stream_without_quotes_is_passed_through():
+    """Test that unquoted output streams unchanged apart from trailing whitespace."""
+    pieces = await collect(StreamingTranslator(["Hola", " mundo", " \n"]))
+    assert "".join(pieces) == "Hola mundo"
+
+
+@pytest.mark.asyncio
+async def test_stream_falls_back_to_translate():
+    """Test that translators without _complete_stream yield the whole translation once."""
+    pieces = await collect(PackingTranslator())
+    assert pieces == ["HELLO"]
+
+
+class FusedTranslator(BaseTranslator):
+    """Translator whose _complete returns a canned detect-and-translate response."""
+
+    def __init__(self, response):
+        super().__init__(api_key="test-key", model="test-model")
+        self.response = response
+        self.json_modes = []
+
+    async def translate(self, text, from_lang, to_lang):
+        return text
+
+    async def _complete(self, system_prompt, user_prompt, temperature=0.3, json_mode=False):
+        self.json_modes.append(json_mode)
+        return self.response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response", [
+    '{"language": "Spanish", "translation": "Hello"}',
+    '```json\n{"language": "Spanish", "translation": "\\"Hello\\""}\n```',
+    'Sure! {"translation": "Hello", "language": " Spanish "}',
+])
+async def test_detect_and_translate_parses_json(response):
+    """Test that detected language and translation are read from plain, fenced or wrapped JSON."""
+    translator = FusedTranslator(response)
+
+    assert await translator.detect_and_translate("Hola", "English") == ("Spanish", "Hello")
+    assert translator.json_modes == [True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response", ["Hello", '{"language": "Spanish"}', '{"language": "", "translation": "x"}', "{oops}"])
+async def test_detect_and_translate_returns_none_on_bad_output(response):
+    """Test that unparseable responses signal the caller to fall back to separate calls."""
+    assert await FusedTranslator(response).detect_and_translate("Hola", "English") is None
+
+
+@pytest.mark.asyncio
+async def test_detect_and_translate_short_circuits_same_language():
+    """Test that text already in the target language is returned unchanged."""
+    translator = FusedTranslator('{"language": "english", "translation": "Hi there"}')
+
+    assert await translator.detect_and_translate("Hello there", "English") == ("english", "Hello there")
+
+
+class CallRecordingWrapper(TranslatorWrapper):
+    """Wrapper that overrides only _call and records the calls it makes."""
+
+    def __init__(self, translator):
+        super().__init__(translator)
+        self.calls = []
+
+    async def _call(self, method, *args):
+        self.calls.append(method)
+        return await super()._call(method, *args)
+
+
+@pytest.mark.asyncio
+async def test_wrapper_sends_every_non_streaming_call_through_call():
+    """Test that a layer overriding _call sees each non-streaming operation, but not streams."""
+    wrapper = CallRecordingWrapper(FusedTranslator('{"language": "Spanish", "translation": "Hello"}'))
+
+    assert await wrapper.translate("Hola", "Spanish", "English") == "Hola"
+    await wrapper.translate_batch(["Hola"], "Spanish", "English")
+    await wrapper.translate_with_context("Hola", "Spanish", "English", "Buenos")
+    await wrapper.translate_with_reference("Hola", "Spanish", "English", "Adios", "Bye")
+    assert await wrapper.detect_and_translate("Hola", "English") == ("Spanish", "Hello")
+    await wrapper._complete("system", "user", 0.3, True)
+    assert [piece async for piece in wrapper.translate_stream("Hola", "Spanish", "English")] == ["Hola"]
+
+    assert wrapper.calls == [
+        "translate", "translate_batch", "translate_with_context", "translate_with_reference",
+        "detect_and_translate", "_complete"
+    ]
@@ -0,0 +1,113 @@
+"""
+Unit tests for the long document chunking module.
+"""
+import asyncio
+
+import pytest
+from llm_translate.core.chunking import ChunkedTranslator, context_tail, split_chunks
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.tokens import estimate_tokens
+
+
+class TrackingTranslator(BaseTranslator):
+    """Translator that upper-cases text and tracks concurrency and context."""
+
+    provider = "fake"
+
+    def __init__(self):
+        super().__init__(api_key="test-key", model="test-model")
+        self.active = 0
+        self.peak = 0
+        self.contexts = []
+        self.detected = []
+
+    async def translate(self, text, from_lang, to_lang):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return text.upper()
+
+    async def translate_with_context(self, text, from_lang, to_lang, context):
+        self.contexts.append(context)
+        return await self.translate(text, from_lang, to_lang)
+
+    async def _detect_language(self, text):
+        self.detected.append(text)
+        return "English"
+
+
+def make_document(paragraphs=12):
+    return "\n\n".join(
+        f"Paragraph {index} starts here. It has a second sentence. And a third one to pad it out."
+        for index in range(paragraphs)
+    )
+
+
+def test_split_chunks_respects_budget_and_reassembles():
+    """Test that chunks stay within budget, break at paragraphs and join back to the original text."""
+    text = make_document()
+    chunks = split_chunks(text, 60)
+
+    assert "".join(chunks) == text
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 60 for chunk in chunks)
+    assert all(chunk.endswith("\n\n") for chunk in chunks[:-1])
+
+
+def test_split_chunks_falls_back_to_sentences_and_characters():
+    """Test splitting of text without paragraph breaks, and of a single unbroken word."""
+    text = "One sentence here. " * 40
+    chunks = split_chunks(text, 20)
+    assert "".join(chunks) == text
+    assert all(estimate_tokens(chunk) <= 20 for chunk in chunks)
+
+    word = "x" * 500
+    chunks = split_chunks(word, 30)
+    assert "".join(chunks) == word
+    assert all(estimate_tokens(chunk) <= 30 for chunk in chunks)
+
+
+def test_context_tail():
+    """Test that the context is the end of the preceding text within the budget."""
+    tail = context_tail("First sentence. Second sentence. Third sentence.", 5)
+    assert tail == "Third sentence."
+    assert context_tail("Anything.", 0) == ""
+
+
+@pytest.mark.asyncio
+async def test_long_text_is_translated_in_parallel_chunks_in_order():
+    """Test that a long text is chunked, translated under the concurrency limit and reassembled in order."""
+    inner = TrackingTranslator()
+    translator = ChunkedTranslator(inner, chunk_max_tokens=60, overlap_tokens=10, concurrency=3)
+    text = make_document()
+
+    result = await translator.translate(text, "Auto-detect", "Spanish")
+
+    assert result == text.upper()
+    assert 1 < inner.peak <= 3
+    assert len(inner.detected) == 1 and len(inner.detected[0]) < len(text)
+    assert inner.contexts and all(context for context in inner.contexts)
+
+
+@pytest.mark.asyncio
+async def test_short_text_is_passed_through():
+    """Test that texts within the budget go to the wrapped translator unchanged."""
+    inner = TrackingTranslator()
+    translator = ChunkedTranslator(inner, chunk_max_tokens=60)
+
+    assert await translator.translate("Hello there.", "English", "Spanish") == "HELLO THERE."
+    assert inner.contexts == []
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_chunks_in_order():
+    """Test that streaming a long text yields each chunk translation in document order."""
+    inner = TrackingTranslator()
+    translator = ChunkedTranslator(inner, chunk_max_tokens=60, concurrency=4)
+    text = make_document()
+
+    pieces = [piece async for piece in translator.translate_stream(text, "English", "Spanish")]
+
+    assert len(pieces) == len(split_chunks(text, 60))
+    assert "".join(pieces) == text.upper()
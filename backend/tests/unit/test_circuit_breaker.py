@@ -0,0 +1,186 @@
+"""
+Unit tests for the circuit breaker module.
+"""
+import pytest
+from llm_translate.core.circuit_breaker import (
+    CircuitBreaker, CircuitBreakerRegistry, FallbackSpeaker, FallbackTranslator
+)
+from llm_translate.services.base_speaker import BaseSpeaker
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProviderTranslator(BaseTranslator):
+    """Translator that answers with its provider name, or fails."""
+
+    def __init__(self, provider, error=None):
+        super().__init__(api_key="test-key", model="test-model")
+        self.provider = provider
+        self.error = error
+        self.calls = 0
+
+    async def translate(self, text, from_lang, to_lang):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return f"{self.provider}: {text}"
+
+
+class ProviderSpeaker(BaseSpeaker):
+    """Speaker that returns the voice it was asked for, or fails."""
+
+    def __init__(self, provider, error=None):
+        super().__init__(api_key="test-key", model="test-tts")
+        self.provider = provider
+        self.error = error
+
+    async def speak(self, text, lang, voice=None, response_format="mp3", instructions=None):
+        if self.error is not None:
+            raise self.error
+        return f"{self.provider}:{voice}".encode()
+
+
+def timeout():
+    """Provider timeout error."""
+    return TranslationError("timed out", ErrorType.TIMEOUT)
+
+
+def test_breaker_opens_after_threshold_and_recovers():
+    """Test the closed, open, half-open and closed transitions."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=10, clock=clock)
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record(timeout())
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record()
+    assert breaker.state == "closed"
+    assert breaker.stats() == {"state": "closed", "failures": 0, "opened": 1, "rejected": 2}
+
+
+def test_failed_probe_reopens_breaker():
+    """Test that a provider error while half-open opens the breaker again."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=10, clock=clock)
+    breaker.allow()
+    breaker.record(timeout())
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record(timeout())
+    assert breaker.state == "open"
+    clock.now = 15
+    assert not breaker.allow()
+
+
+def test_request_errors_do_not_open_breaker():
+    """Test that errors caused by the request itself leave the breaker closed."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.allow()
+    breaker.record(TranslationError("bad input", ErrorType.BAD_REQUEST))
+
+    assert breaker.state == "closed"
+
+
+def test_unclassified_errors_do_not_open_breaker():
+    """Test that internal bugs and unknown errors are not taken for provider outages."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    for error in (KeyError("bug"), TranslationError("detection failed", ErrorType.UNKNOWN),
+                  TranslationError("no such model", ErrorType.API_ERROR, 404)):
+        breaker.allow()
+        breaker.record(error)
+
+    assert breaker.state == "closed"
+
+
+def test_local_rejections_are_no_outcome():
+    """Test that calls shed locally neither close a half-open breaker nor reset the failure count."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=10, clock=clock)
+    shed = TranslationError("overloaded", ErrorType.OVERLOADED, 503)
+
+    breaker.allow()
+    breaker.record(timeout())
+    breaker.allow()
+    breaker.record(shed)
+    assert breaker.stats()["failures"] == 1
+    breaker.allow()
+    breaker.record(timeout())
+    assert breaker.state == "open"
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record(shed)
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_fallback_translator_moves_along_chain():
+    """Test that a failing primary falls back and is skipped once its breaker is open."""
+    breakers = CircuitBreakerRegistry(failure_threshold=1, clock=FakeClock())
+    primary = ProviderTranslator("groq", timeout())
+    fallback = ProviderTranslator("openai")
+    translator = FallbackTranslator([primary, fallback], breakers)
+
+    assert await translator.translate("Hi", "English", "Spanish") == "openai: Hi"
+    assert await translator.translate("Hi", "English", "Spanish") == "openai: Hi"
+    assert primary.calls == 1
+    assert breakers.stats()["groq/test-model"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast():
+    """Test that an open breaker without fallbacks raises a service-unavailable error without calling the provider."""
+    breakers = CircuitBreakerRegistry(failure_threshold=1, clock=FakeClock())
+    primary = ProviderTranslator("groq", timeout())
+    translator = FallbackTranslator([primary], breakers)
+
+    with pytest.raises(TranslationError) as first:
+        await translator.translate("Hi", "English", "Spanish")
+    assert first.value.error_type == ErrorType.TIMEOUT
+
+    with pytest.raises(TranslationError) as second:
+        await translator.translate("Hi", "English", "Spanish")
+    assert second.value.error_type == ErrorType.SERVICE_UNAVAILABLE
+    assert second.value.status_code == 503
+    assert primary.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_request_error_is_not_retried_on_fallback():
+    """Test that a bad request is raised instead of being sent to the fallback provider."""
+    breakers = CircuitBreakerRegistry(clock=FakeClock())
+    primary = ProviderTranslator("groq", TranslationError("bad input", ErrorType.BAD_REQUEST, 400))
+    fallback = ProviderTranslator("openai")
+    translator = FallbackTranslator([primary, fallback], breakers)
+
+    with pytest.raises(TranslationError):
+        await translator.translate("Hi", "English", "Spanish")
+    assert fallback.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_fallback_speaker_uses_default_voice():
+    """Test that a fallback speaker is used with its default voice."""
+    breakers = CircuitBreakerRegistry(clock=FakeClock())
+    speaker = FallbackSpeaker([ProviderSpeaker("openai", timeout()), ProviderSpeaker("groq")], breakers)
+
+    assert await speaker.speak("Hi", "English", voice="alloy") == b"groq:None"
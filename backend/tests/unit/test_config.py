@@ -4,7 +4,7 @@ Unit tests for the configuration loading module.
 import os
 import pytest
 from unittest.mock import patch
-from llm_translate.utils.config import load_config
+from llm_translate.utils.config import get_config, load_config, reload_config
 
 
 @pytest.fixture
@@ -60,4 +60,33 @@ def test_load_config_defaults(monkeypatch):
     assert config.get("OPENAI_MODEL", "gpt-4.1-mini-2025-04-14") == "gpt-4.1-mini-2025-04-14"
     assert config.get("GROQ_MODEL", "meta-llama/llama-4-maverick-17b-128e-instruct") == "meta-llama/llama-4-maverick-17b-128e-instruct"
     assert config.get("OPENROUTER_MODEL", "qwen/qwen3-4b:free") == "qwen/qwen3-4b:free"
-    assert config.get("LOG_LEVEL", "INFO") == "INFO"
\ No newline at end of file
+    assert config.get("LOG_LEVEL", "INFO") == "INFO"
+
+
+def test_get_config_loads_once(monkeypatch):
+    """Test that the snapshot is read once and later environment changes need a reload."""
+    monkeypatch.setenv("AI_SOURCE", "groq")
+    with patch("llm_translate.utils.config.load_dotenv"):
+        config = get_config()
+        monkeypatch.setenv("AI_SOURCE", "openrouter")
+
+        assert get_config() is config
+        assert config["AI_SOURCE"] == "groq"
+
+        reloaded = reload_config()
+
+    assert reloaded["AI_SOURCE"] == "openrouter"
+    assert reloaded.version == config.version + 1
+    assert get_config() is reloaded
+    # The old snapshot is unchanged for requests still holding it
+    assert config["AI_SOURCE"] == "groq"
+
+
+def test_config_snapshot_is_read_only():
+    """Test that a snapshot cannot be modified."""
+    with patch("llm_translate.utils.config.load_dotenv"):
+        config = get_config()
+
+    with pytest.raises(TypeError):
+        config["AI_SOURCE"] = "groq"
+    assert config.get("NOT_A_SETTING", "default") == "default"
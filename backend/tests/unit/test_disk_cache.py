@@ -0,0 +1,146 @@
+"""
+Unit tests for the persistent on-disk translation cache.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+from llm_translate.core.disk_cache import DiskTranslationCache
+from llm_translate.core.translation_cache import CachedTranslator, TranslationCache
+from llm_translate.services.base_translator import BaseTranslator
+
+
+class CountingTranslator(BaseTranslator):
+    """Translator that counts provider calls."""
+
+    provider = "fake"
+
+    def __init__(self):
+        super().__init__(api_key="test-key", model="test-model")
+        self.calls = 0
+
+    async def translate(self, text, from_lang, to_lang):
+        self.calls += 1
+        return f"[{to_lang}] {text}"
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Create a disk cache in a temporary directory."""
+    cache = DiskTranslationCache(path=str(tmp_path / "cache" / "translations.sqlite3"))
+    yield cache
+    cache.close()
+
+
+def test_disk_cache_round_trip(disk_cache):
+    """Test that a written entry can be read back once flushed."""
+    disk_cache.set("key", "Hola")
+    disk_cache.flush()
+
+    assert disk_cache.get("key") == "Hola"
+    assert disk_cache.get("missing") is None
+    stats = disk_cache.stats()
+    assert stats["entries"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_disk_cache_survives_reopen(tmp_path):
+    """Test that entries persist across cache instances (process restarts)."""
+    path = str(tmp_path / "translations.sqlite3")
+    first = DiskTranslationCache(path=path)
+    first.set("key", "Bonjour")
+    first.close()
+
+    second = DiskTranslationCache(path=path)
+    try:
+        assert second.get("key") == "Bonjour"
+        assert second.stats()["size_bytes"] > 0
+    finally:
+        second.close()
+
+
+def test_disk_cache_size_eviction(tmp_path):
+    """Test that the least recently accessed entries are evicted when over the size limit."""
+    clock_values = iter(range(1, 1000))
+    cache = DiskTranslationCache(path=str(tmp_path / "t.sqlite3"), max_bytes=25,
+                                 clock=lambda: float(next(clock_values)))
+    try:
+        cache.set("k1", "a" * 8)
+        cache.set("k2", "b" * 8)
+        cache.flush()
+        assert cache.get("k1") is not None  # k2 is now least recently accessed
+        cache.flush()
+        cache.set("k3", "c" * 8)
+        cache.flush()
+
+        assert cache.get("k2") is None
+        assert cache.get("k1") is not None
+        assert cache.get("k3") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["size_bytes"] <= 25
+    finally:
+        cache.close()
+
+
+def test_disk_cache_ttl_expiry(tmp_path):
+    """Test that expired entries are treated as misses."""
+    now = [100.0]
+    cache = DiskTranslationCache(path=str(tmp_path / "t.sqlite3"), ttl_seconds=10, clock=lambda: now[0])
+    try:
+        cache.set("key", "Hallo")
+        cache.flush()
+        assert cache.get("key") == "Hallo"
+        now[0] = 110.0
+        assert cache.get("key") is None
+    finally:
+        cache.close()
+
+
+def test_disk_cache_get_many(tmp_path):
+    """Test that a bulk lookup returns only live entries and counts each key once."""
+    now = [100.0]
+    cache = DiskTranslationCache(path=str(tmp_path / "t.sqlite3"), ttl_seconds=10, clock=lambda: now[0])
+    try:
+        cache.set("old", "Alt")
+        cache.flush()
+        now[0] = 105.0
+        cache.set("new", "Neu")
+        cache.flush()
+        now[0] = 111.0
+        assert cache.get_many(["old", "new", "absent", "new"]) == {"new": "Neu"}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+    finally:
+        cache.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_translator_falls_back_to_disk(disk_cache):
+    """Test that a cold memory cache is warmed from the disk tier without a provider call."""
+    inner = CountingTranslator()
+    warm = CachedTranslator(inner, TranslationCache(), disk_cache)
+    assert await warm.translate("Hello", "English", "Spanish") == "[Spanish] Hello"
+    disk_cache.flush()
+
+    # Simulate a restart: a fresh memory cache in front of the same disk cache
+    cold = CachedTranslator(inner, TranslationCache(), disk_cache)
+    assert await cold.translate("Hello", "English", "Spanish") == "[Spanish] Hello"
+    assert inner.calls == 1
+    assert cold.cache.get(cold.cache_key("Hello", "English", "Spanish")) == "[Spanish] Hello"
+
+
+@pytest.mark.asyncio
+async def test_cached_translator_batch_reads_disk_once(disk_cache):
+    """Test that a batch looks up every key missing from memory in a single disk cache call."""
+    inner = CountingTranslator()
+    warm = CachedTranslator(inner, TranslationCache(), disk_cache)
+    await warm.translate_batch(["Hello", "Goodbye"], "English", "Spanish")
+    disk_cache.flush()
+
+    cold = CachedTranslator(inner, TranslationCache(), disk_cache)
+    disk_cache.aget_many = AsyncMock(wraps=disk_cache.aget_many)
+    translations = await cold.translate_batch(["Hello", "Thanks", "Goodbye", "Hello"], "English", "Spanish")
+
+    assert translations == ["[Spanish] Hello", "[Spanish] Thanks", "[Spanish] Goodbye", "[Spanish] Hello"]
+    disk_cache.aget_many.assert_awaited_once()
+    assert inner.calls == 3
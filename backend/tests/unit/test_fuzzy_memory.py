@@ -0,0 +1,116 @@
+"""
+Unit tests for the fuzzy translation memory.
+"""
+import pytest
+from llm_translate.core.fuzzy_memory import (
+    FuzzyMatch,
+    FuzzyMatchTranslator,
+    NGramIndex,
+    adapt_match,
+    normalize_for_matching,
+)
+from llm_translate.services.base_translator import BaseTranslator
+
+
+class RecordingTranslator(BaseTranslator):
+    """Translator that records plain and reference-assisted calls."""
+
+    provider = "fake"
+
+    def __init__(self):
+        super().__init__(api_key="test-key", model="test-model")
+        self.calls = []
+
+    async def translate(self, text, from_lang, to_lang):
+        self.calls.append(("translate", text))
+        return f"<{text}>"
+
+    async def translate_with_reference(self, text, from_lang, to_lang, reference_source, reference_translation):
+        self.calls.append(("reference", text, reference_source, reference_translation))
+        return f"<{text}>"
+
+
+def test_normalize_for_matching():
+    """Test that case, punctuation and whitespace are normalized away."""
+    assert normalize_for_matching("  Hello,   World! ") == "hello world"
+
+
+def test_index_finds_near_duplicate():
+    """Test that a near-duplicate is found and an unrelated text is not."""
+    index = NGramIndex()
+    index.add("p", "The quick brown fox jumps over the lazy dog", "Le renard")
+    index.add("p", "Completely unrelated sentence about weather", "Météo")
+
+    match = index.query("p", "The quick brown fox jumped over the lazy dog", 0.7)
+    assert match is not None
+    assert match.translation == "Le renard"
+    assert match.similarity >= 0.7
+    assert index.query("p", "Something else entirely here", 0.7) is None
+
+
+def test_index_partitions_are_isolated():
+    """Test that entries are only found within their own partition."""
+    index = NGramIndex()
+    index.add("english|spanish", "Good morning everyone", "Buenos días a todos")
+    assert index.query("english|french", "Good morning everyone", 0.5) is None
+
+
+def test_index_evicts_oldest_entries():
+    """Test that the oldest entry is evicted when the index is full."""
+    index = NGramIndex(max_entries=2)
+    index.add("p", "first text here", "1")
+    index.add("p", "second text here", "2")
+    index.add("p", "third text here", "3")
+
+    assert len(index) == 2
+    assert index.query("p", "first text here", 1.0) is None
+    assert index.query("p", "third text here", 1.0).translation == "3"
+
+
+def test_adapt_match_reuses_and_substitutes_numbers():
+    """Test that surrounding whitespace and number-only differences are answered locally."""
+    match = FuzzyMatch(source="You have 3 new messages.", translation="Tienes 3 mensajes nuevos.", similarity=0.9)
+
+    assert adapt_match(match, "  You have 3 new messages.\n") == "Tienes 3 mensajes nuevos."
+    assert adapt_match(match, "You have 12 new messages.") == "Tienes 12 mensajes nuevos."
+    assert adapt_match(match, "You have 3 old messages.") is None
+
+
+def test_adapt_match_leaves_case_and_punctuation_to_the_model():
+    """Test that case, punctuation or inner whitespace changes are not reused verbatim."""
+    match = FuzzyMatch(source="You have 3 new messages.", translation="Tienes 3 mensajes nuevos.", similarity=0.9)
+
+    assert adapt_match(match, "You have 3 new messages?") is None
+    assert adapt_match(match, "you have 3 new messages.") is None
+    assert adapt_match(match, "You have 3\nnew messages.") is None
+    assert adapt_match(match, "You have 3  new messages.") is None
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_translator_reuses_and_references():
+    """Test that near-duplicates are reused locally or sent with a reference translation."""
+    inner = RecordingTranslator()
+    translator = FuzzyMatchTranslator(inner, NGramIndex(), threshold=0.6)
+
+    await translator.translate("Please confirm your email address", "English", "Spanish")
+    reused = await translator.translate(" Please confirm your email address\n", "English", "Spanish")
+    await translator.translate("Please confirm your new email address", "English", "Spanish")
+
+    assert reused == "<Please confirm your email address>"
+    assert inner.calls[0] == ("translate", "Please confirm your email address")
+    assert inner.calls[1][0] == "reference"
+    assert inner.calls[1][2] == "Please confirm your email address"
+    assert len(inner.calls) == 2
+    assert translator.reused == 1
+    assert translator.referenced == 1
+
+
+def test_index_replaces_entries_in_place():
+    """Test that re-adding a source replaces its entry and leaves no stale bucket ids."""
+    index = NGramIndex()
+    index.add("p", "Good morning everyone", "Buenos días")
+    index.add("p", "Good morning everyone", "Buenos días a todos")
+
+    assert len(index) == 1
+    assert index.query("p", "Good morning everyone", 1.0).translation == "Buenos días a todos"
+    assert all(len(bucket) == 1 for bucket in index._buckets.values())
@@ -3,7 +3,7 @@ Unit tests for the Groq translator.
 """
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from groq import AuthenticationError, RateLimitError, BadRequestError, APIError, APIConnectionError
+from groq import AuthenticationError, RateLimitError, BadRequestError, APIError, APIConnectionError, APIStatusError
 from llm_translate.services.groq_translator import GroqTranslator
 from llm_translate.utils.exceptions import TranslationError, ErrorType
 
@@ -107,6 +107,24 @@ async def test_translate_rate_limit_error(translator, mock_groq_client):
     assert "rate limit exceeded" in error.message.lower()
 
 
+@pytest.mark.asyncio
+async def test_detect_language_keeps_error_type(translator, mock_groq_client):
+    """Test that provider errors during language detection are mapped like translation errors."""
+    mock_response = MagicMock()
+    mock_response.status_code = 429
+    mock_groq_client.chat.completions.create.side_effect = RateLimitError(
+        message="Rate limit exceeded",
+        response=mock_response,
+        body={"error": {"message": "Rate limit exceeded"}}
+    )
+
+    with pytest.raises(TranslationError) as excinfo:
+        await translator.translate("Hello", "Auto-detect", "French")
+
+    assert excinfo.value.error_type == ErrorType.RATE_LIMIT
+    assert excinfo.value.status_code == 429
+
+
 @pytest.mark.asyncio
 async def test_translate_bad_request_error(translator, mock_groq_client):
     """Test handling of bad request errors."""
@@ -154,4 +172,24 @@ async def test_translate_connection_error(translator, mock_groq_client):
     error = excinfo.value
     assert error.error_type == ErrorType.CONNECTION
     assert error.status_code == 503
-    assert "Failed to connect" in error.message
\ No newline at end of file
+    assert "Failed to connect" in error.message
+
+
+@pytest.mark.asyncio
+async def test_translate_api_status_error_keeps_status(translator, mock_groq_client):
+    """Test that API errors keep the provider's HTTP status."""
+    mock_response = MagicMock()
+    mock_response.status_code = 502
+
+    mock_groq_client.chat.completions.create.side_effect = APIStatusError(
+        message="Bad gateway",
+        response=mock_response,
+        body=None
+    )
+
+    with pytest.raises(TranslationError) as excinfo:
+        await translator.translate("Hello", "English", "Spanish")
+
+    error = excinfo.value
+    assert error.error_type == ErrorType.API_ERROR
+    assert error.status_code == 502
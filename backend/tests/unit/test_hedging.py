@@ -0,0 +1,155 @@
+"""
+Unit tests for the request hedging module.
+"""
+import asyncio
+
+import pytest
+from llm_translate.core.hedging import HedgeController, HedgedTranslator, LatencyWindow
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class DelayedTranslator(BaseTranslator):
+    """Translator that answers after a fixed delay, or fails."""
+
+    def __init__(self, provider, delay, error=None):
+        super().__init__(api_key="test-key", model="test-model")
+        self.provider = provider
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def translate(self, text, from_lang, to_lang):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return f"{self.provider}: {text}"
+
+    async def detect_and_translate(self, text, to_lang):
+        return "English", await self.translate(text, "English", to_lang)
+
+
+def controller(**kwargs):
+    """Hedge controller with short delays for tests."""
+    options = dict(min_delay_ms=10, initial_delay_ms=20, budget_percent=100, max_burst=10)
+    options.update(kwargs)
+    return HedgeController(**options)
+
+
+def test_latency_window_quantile():
+    """Test that quantiles are reported once enough samples have been seen."""
+    window = LatencyWindow(size=100, min_samples=10)
+    for value in range(1, 10):
+        window.record(value / 100)
+    assert window.quantile(0.9) is None
+
+    window.record(0.10)
+    assert window.quantile(0.9) == pytest.approx(0.10)
+    assert window.quantile(0.5) == pytest.approx(0.06)
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    """Test that a primary answering within the delay is used alone."""
+    primary, secondary = DelayedTranslator("groq", 0), DelayedTranslator("openai", 0)
+    translator = HedgedTranslator(primary, secondary, controller())
+
+    assert await translator.translate("Hi", "English", "Spanish") == "groq: Hi"
+    assert secondary.calls == 0
+    assert translator.controller.stats()["hedges"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    """Test that the secondary answers a slow request and the primary call is cancelled."""
+    primary, secondary = DelayedTranslator("groq", 1.0), DelayedTranslator("openai", 0)
+    translator = HedgedTranslator(primary, secondary, controller())
+
+    assert await asyncio.wait_for(translator.translate("Hi", "English", "Spanish"), timeout=0.5) == "openai: Hi"
+    await asyncio.sleep(0)
+    assert primary.cancelled == 1
+    assert translator.controller.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_detect_and_translate_is_hedged():
+    """Test that fused detect-and-translate calls are hedged like plain translations."""
+    primary, secondary = DelayedTranslator("groq", 1.0), DelayedTranslator("openai", 0)
+    translator = HedgedTranslator(primary, secondary, controller())
+
+    result = await asyncio.wait_for(translator.detect_and_translate("Hi", "Spanish"), timeout=0.5)
+    assert result == ("English", "openai: Hi")
+    assert translator.controller.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_limits_extra_calls():
+    """Test that hedges stop once the budget is spent."""
+    primary, secondary = DelayedTranslator("groq", 0.05), DelayedTranslator("openai", 0)
+    translator = HedgedTranslator(primary, secondary, controller(budget_percent=0, max_burst=1))
+
+    assert await translator.translate("a", "English", "Spanish") == "openai: a"
+    assert await translator.translate("b", "English", "Spanish") == "groq: b"
+    assert secondary.calls == 1
+    assert translator.controller.stats()["budget_denied"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_hedge_falls_back_to_primary():
+    """Test that a failing secondary does not hide a primary that answers later."""
+    error = TranslationError(message="Rate limited", error_type=ErrorType.RATE_LIMIT, status_code=429)
+    primary, secondary = DelayedTranslator("groq", 0.05), DelayedTranslator("openai", 0, error=error)
+    translator = HedgedTranslator(primary, secondary, controller())
+
+    assert await translator.translate("Hi", "English", "Spanish") == "groq: Hi"
+
+
+@pytest.mark.asyncio
+async def test_both_failing_raises_primary_error():
+    """Test that the primary's error is raised when both calls fail."""
+    primary_error = TranslationError(message="Down", error_type=ErrorType.CONNECTION, status_code=503)
+    secondary_error = TranslationError(message="Rate limited", error_type=ErrorType.RATE_LIMIT, status_code=429)
+    primary = DelayedTranslator("groq", 0.05, error=primary_error)
+    secondary = DelayedTranslator("openai", 0, error=secondary_error)
+    translator = HedgedTranslator(primary, secondary, controller())
+
+    with pytest.raises(TranslationError) as excinfo:
+        await translator.translate("Hi", "English", "Spanish")
+    assert excinfo.value is primary_error
+
+
+@pytest.mark.asyncio
+async def test_delay_follows_observed_latency():
+    """Test that the hedge delay tracks the primary's latency quantile."""
+    hedges = controller(min_delay_ms=1)
+    primary, secondary = DelayedTranslator("groq", 0), DelayedTranslator("openai", 0)
+    translator = HedgedTranslator(primary, secondary, hedges)
+    for _ in range(20):
+        await translator.translate("Hi", "English", "Spanish")
+
+    assert hedges.delay("groq/test-model") < 0.02
+
+
+@pytest.mark.asyncio
+async def test_only_successful_calls_are_timed():
+    """Test that cancelled and failed calls do not count towards the latency window."""
+    error = TranslationError(message="Rate limited", error_type=ErrorType.RATE_LIMIT, status_code=429)
+    hedges = controller()
+    primary, secondary = DelayedTranslator("groq", 1.0), DelayedTranslator("openai", 0.05)
+    translator = HedgedTranslator(primary, secondary, hedges)
+    assert await asyncio.wait_for(translator.translate("Hi", "English", "Spanish"), timeout=0.5) == "openai: Hi"
+    await asyncio.sleep(0)
+
+    failing = HedgedTranslator(DelayedTranslator("groq", 0, error=error), secondary, hedges)
+    with pytest.raises(TranslationError):
+        await failing.translate("Hi", "English", "Spanish")
+
+    assert primary.cancelled == 1
+    assert len(hedges.window("groq/test-model")) == 0
+    assert len(hedges.window("openai/test-model")) == 1
@@ -0,0 +1,44 @@
+"""
+Unit tests for the shared HTTP client module.
+"""
+from unittest.mock import patch
+
+import pytest
+from llm_translate.services.openai_translator import OpenAITranslator
+from llm_translate.utils.http_client import build_http_client, close_http_client, get_http_client
+
+
+def test_client_is_shared():
+    """Test that every caller gets the same pooled client."""
+    with patch("llm_translate.utils.http_client.get_config", return_value={}):
+        assert get_http_client() is get_http_client()
+
+
+def test_provider_sdk_clients_use_the_shared_pool():
+    """Test that SDK clients send their requests through the shared client."""
+    with patch("llm_translate.utils.http_client.get_config", return_value={}):
+        translator = OpenAITranslator(api_key="test-key", model="test-model")
+        assert translator.client._client is get_http_client()
+
+
+def test_http2_falls_back_without_h2():
+    """Test that HTTP/2 is only requested when the h2 package is available."""
+    with patch("llm_translate.utils.http_client.importlib.util.find_spec", return_value=None), \
+            patch("llm_translate.utils.http_client.httpx.AsyncClient") as client_class:
+        build_http_client({"HTTP2_ENABLED": True, "HTTP_MAX_CONNECTIONS": 7})
+
+    kwargs = client_class.call_args.kwargs
+    assert kwargs["http2"] is False
+    assert kwargs["limits"].max_connections == 7
+
+
+@pytest.mark.asyncio
+async def test_close_releases_the_client():
+    """Test that shutdown closes the client and the next call builds a new one."""
+    with patch("llm_translate.utils.http_client.get_config", return_value={}):
+        client = get_http_client()
+        await close_http_client()
+
+        assert client.is_closed
+        assert get_http_client() is not client
+        await close_http_client()
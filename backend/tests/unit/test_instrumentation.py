@@ -0,0 +1,77 @@
+"""
+Unit tests for the instrumentation module.
+"""
+import pytest
+from llm_translate.core.instrumentation import InstrumentedTranslator, provider_instruments, render_metrics
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+from llm_translate.utils.metrics import PROVIDER_ERRORS
+
+
+class EchoTranslator(BaseTranslator):
+    """Translator that echoes its input, or fails with a given error."""
+
+    provider = "groq"
+
+    def __init__(self, model, error=None):
+        super().__init__(api_key="test-key", model=model)
+        self.error = error
+
+    async def translate(self, text, from_lang, to_lang):
+        if self.error:
+            raise self.error
+        return text.upper()
+
+
+class PackingEchoTranslator(EchoTranslator):
+    """Echo translator that answers packed batch prompts."""
+
+    supports_batch = True
+
+    async def _complete(self, system_prompt, user_prompt, temperature=0.3, json_mode=False):
+        return user_prompt[user_prompt.index("{"):].upper()
+
+
+@pytest.mark.asyncio
+async def test_provider_calls_are_recorded():
+    """Test that a provider call records its latency, volume and in-flight count."""
+    translator = InstrumentedTranslator(EchoTranslator("instrumented-model"))
+    instruments = provider_instruments("groq", "instrumented-model")
+
+    assert await translator.translate("Hello world", "English", "Spanish") == "HELLO WORLD"
+    assert instruments.seconds["translate"].count == 1
+    assert instruments.input_characters.value == 11
+    assert instruments.output_characters.value == 11
+    assert instruments.input_tokens.value > 0
+    assert instruments.in_flight.value == 0
+
+
+@pytest.mark.asyncio
+async def test_provider_errors_are_counted_by_type():
+    """Test that failed calls are counted by error type and not observed as latency."""
+    error = TranslationError("slow down", ErrorType.RATE_LIMIT, 429)
+    translator = InstrumentedTranslator(EchoTranslator("failing-model", error))
+
+    with pytest.raises(TranslationError):
+        await translator.translate("Hello", "English", "Spanish")
+    assert PROVIDER_ERRORS.labels("groq", "failing-model", "rate_limit_error").value == 1
+    assert provider_instruments("groq", "failing-model").seconds["translate"].count == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_records_each_packed_request():
+    """Test that a batch is recorded as one provider call per packed request."""
+    provider = PackingEchoTranslator("batch-model")
+    provider.batch_max_items = 2
+    translator = InstrumentedTranslator(provider)
+
+    assert await translator.translate_batch(["a", "b", "c", "d"], "English", "Spanish") == ["A", "B", "C", "D"]
+    assert provider_instruments("groq", "batch-model").seconds["translate_batch"].count == 2
+
+
+def test_render_includes_component_counters():
+    """Test that a scrape includes the admission, retry and circuit breaker counters."""
+    text = render_metrics()
+    assert "# TYPE llm_translate_request_duration_seconds histogram" in text
+    assert 'llm_translate_bulkhead_active{scope="endpoints",name="/translate"}' in text
+    assert "llm_translate_retries_exhausted_total" in text
@@ -0,0 +1,193 @@
+"""
+Unit tests for the language detection module.
+"""
+import pytest
+from llm_translate.core.language_detection import LanguageDetectingTranslator, LocalLanguageDetector, detect_language
+from llm_translate.core.model_tiering import TieredTranslator, TieringPolicy, TieringScopeTranslator
+from llm_translate.core.translation_cache import CachedTranslator, TranslationCache
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class DetectingTranslator(BaseTranslator):
+    """Translator that counts detection calls."""
+
+    provider = "fake"
+
+    def __init__(self, error=None):
+        super().__init__(api_key="test-key", model="test-model")
+        self.detections = 0
+        self.error = error
+
+    async def translate(self, text, from_lang, to_lang):
+        return text
+
+    async def _detect_language(self, text):
+        self.detections += 1
+        if self.error is not None:
+            raise self.error
+        return "Spanish"
+
+
+@pytest.mark.asyncio
+async def test_detection_is_cached_by_text():
+    """Test that the same text is only sent for detection once."""
+    translator = DetectingTranslator()
+    cache = TranslationCache()
+
+    assert await detect_language(translator, "Hola mundo", cache) == "Spanish"
+    assert await detect_language(translator, " Hola mundo\n", cache) == "Spanish"
+    assert translator.detections == 1
+
+    await detect_language(translator, "Buenos días", cache)
+    assert translator.detections == 2
+
+
+@pytest.mark.asyncio
+async def test_detection_errors_are_not_cached():
+    """Test that failed detections raise TranslationError and are retried next time."""
+    error = TranslationError(message="Rate limited", error_type=ErrorType.RATE_LIMIT, status_code=429)
+    translator = DetectingTranslator(error=error)
+    cache = TranslationCache()
+
+    with pytest.raises(TranslationError):
+        await detect_language(translator, "Hola", cache)
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Я не знаю, смогу ли я прийти сегодня.", "Russian"),
+    ("오늘 밤 파티에 갈 수 있을지 모르겠어요.", "Korean"),
+    ("今夜のパーティーに行けるかどうか分かりません。", "Japanese"),
+    ("我不知道今晚能不能去参加聚会。", "Chinese"),
+    ("Could you send me the report before the meeting tomorrow?", "English"),
+    ("Me gustaría reservar una mesa para dos personas esta noche.", "Spanish"),
+    ("Wir haben gestern den ganzen Tag im Garten gearbeitet.", "German"),
+    ("Nie wiem, czy zdążę przyjść na przyjęcie dziś wieczorem.", "Polish"),
+])
+def test_local_detector_identifies_languages(text, expected):
+    """Test that the local detector identifies script and Latin-script languages confidently."""
+    detected, confidence = LocalLanguageDetector().detect(text)
+
+    assert detected == expected
+    assert confidence >= 0.2
+
+
+@pytest.mark.parametrize("text", ["Hello", "東京", "12345 !!"])
+def test_local_detector_is_unsure_of_short_input(text):
+    """Test that very short or letterless input gets a low confidence."""
+    _, confidence = LocalLanguageDetector().detect(text)
+
+    assert confidence < 0.2
+
+
+@pytest.mark.asyncio
+async def test_confident_local_detection_skips_the_llm():
+    """Test that a confident local detection is used and cached without calling the provider."""
+    translator = DetectingTranslator()
+    cache = TranslationCache()
+    text = "Je voudrais réserver une chambre pour deux nuits, s'il vous plaît."
+
+    assert await detect_language(translator, text, cache, LocalLanguageDetector()) == "French"
+    assert translator.detections == 0
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_uncertain_local_detection_falls_back_to_the_llm():
+    """Test that short input is sent to the provider's LLM detection."""
+    translator = DetectingTranslator()
+
+    assert await detect_language(translator, "Hola", TranslationCache(), LocalLanguageDetector()) == "Spanish"
+    assert translator.detections == 1
+
+
+@pytest.mark.asyncio
+async def test_language_detecting_translator_resolves_auto_detect():
+    """Test that the wrapper passes the detected language to the wrapped translator."""
+    calls = []
+
+    class Inner(BaseTranslator):
+        async def translate(self, text, from_lang, to_lang):
+            calls.append(from_lang)
+            return text
+
+    provider = DetectingTranslator()
+    translator = LanguageDetectingTranslator(Inner(api_key="k", model="m"), provider,
+                                             LocalLanguageDetector(), cache=TranslationCache())
+
+    await translator.translate("Wir haben gestern den ganzen Tag im Garten gearbeitet.", "Auto-detect", "English")
+    await translator.translate("Hola", "Auto-detect", "English")
+    await translator.translate("Hola", "Spanish", "English")
+
+    assert calls == ["German", "Spanish", "Spanish"]
+    assert provider.detections == 1
+
+
+class FusingTranslator(DetectingTranslator):
+    """Translator that answers detect-and-translate calls, or fails to parse them."""
+
+    def __init__(self, parsed=True):
+        super().__init__()
+        self.parsed = parsed
+        self.fused_calls = 0
+        self.translations = []
+
+    async def translate(self, text, from_lang, to_lang):
+        self.translations.append(from_lang)
+        return f"[{to_lang}] {text}"
+
+    async def detect_and_translate(self, text, to_lang):
+        self.fused_calls += 1
+        return ("Spanish", f"[{to_lang}] {text}") if self.parsed else None
+
+
+@pytest.mark.asyncio
+async def test_fused_detection_uses_one_call_and_fills_the_caches():
+    """Test that uncertain input is detected and translated in one call whose result is cached."""
+    provider = FusingTranslator()
+    cached = CachedTranslator(provider, TranslationCache())
+    translator = LanguageDetectingTranslator(cached, provider, LocalLanguageDetector(),
+                                             cache=TranslationCache(), fused=True, cached=cached)
+
+    assert await translator.translate_and_detect("Hola", "Auto-detect", "English") == ("[English] Hola", "Spanish")
+    assert await translator.translate_and_detect("Hola", "Auto-detect", "English") == ("[English] Hola", "Spanish")
+    assert (provider.fused_calls, provider.detections, provider.translations) == (1, 0, [])
+
+
+@pytest.mark.asyncio
+async def test_fused_detection_goes_through_tiering_and_the_cache_layer():
+    """Test that with tiering on, the fused call goes to the text's model tier and its result is cached."""
+    strong, fast = FusingTranslator(), FusingTranslator()
+    tiered = TieredTranslator(strong, fast, TieringPolicy(fast_max_tokens=20))
+    cached = CachedTranslator(tiered, TranslationCache())
+    translator = LanguageDetectingTranslator(TieringScopeTranslator(cached), tiered, LocalLanguageDetector(),
+                                             cache=TranslationCache(), fused=True, cached=cached)
+
+    assert await translator.translate_and_detect("Hola", "Auto-detect", "English") == ("[English] Hola", "Spanish")
+    assert await translator.translate_and_detect("Hola", "Auto-detect", "English") == ("[English] Hola", "Spanish")
+    assert (fast.fused_calls, strong.fused_calls) == (1, 0)
+    assert fast.translations == strong.translations == []
+
+
+@pytest.mark.asyncio
+async def test_fused_detection_falls_back_to_two_calls():
+    """Test that an unparseable fused response falls back to detection followed by translation."""
+    provider = FusingTranslator(parsed=False)
+    translator = LanguageDetectingTranslator(provider, provider, LocalLanguageDetector(),
+                                             cache=TranslationCache(), fused=True)
+
+    assert await translator.translate_and_detect("Hola", "Auto-detect", "English") == ("[English] Hola", "Spanish")
+    assert (provider.fused_calls, provider.detections, provider.translations) == (1, 1, ["Spanish"])
+
+
+@pytest.mark.asyncio
+async def test_long_texts_skip_fused_detection():
+    """Test that texts above the fused size limit are detected and translated separately."""
+    provider = FusingTranslator()
+    translator = LanguageDetectingTranslator(provider, provider, cache=TranslationCache(),
+                                             fused=True, fused_max_tokens=10)
+
+    text = "Hola, buenos días. " * 20
+    assert await translator.translate_and_detect(text, "Auto-detect", "English") == (f"[English] {text}", "Spanish")
+    assert (provider.fused_calls, provider.detections, provider.translations) == (0, 1, ["Spanish"])
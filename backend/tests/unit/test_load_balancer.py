@@ -0,0 +1,123 @@
+"""
+Unit tests for the provider load balancing module.
+"""
+import random
+
+import pytest
+from llm_translate.core.load_balancer import BalancedTranslator, LoadBalancer
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProviderTranslator(BaseTranslator):
+    """Translator that answers with its provider name, or fails."""
+
+    def __init__(self, provider, error=None):
+        super().__init__(api_key="test-key", model="test-model")
+        self.provider = provider
+        self.error = error
+        self.calls = 0
+
+    async def translate(self, text, from_lang, to_lang):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return f"{self.provider}: {text}"
+
+
+def record(balancer, key, seconds, error=None):
+    """Record one request to a provider that took the given time."""
+    started = balancer.start(key)
+    balancer.clock.now += seconds
+    balancer.finish(key, started, error)
+
+
+def test_p2c_prefers_faster_provider():
+    """Test that the provider with the lower smoothed latency wins the comparison."""
+    balancer = LoadBalancer(clock=FakeClock(), rng=random.Random(1))
+    fast, slow = ProviderTranslator("groq"), ProviderTranslator("openai")
+    record(balancer, "groq/test-model", 0.2)
+    record(balancer, "openai/test-model", 1.0)
+
+    assert all(balancer.choose([fast, slow]) is fast for _ in range(20))
+    weights = {key: stats["weight"] for key, stats in balancer.stats()["providers"].items()}
+    assert weights["groq/test-model"] == pytest.approx(5 / 6)
+
+
+def test_outstanding_requests_and_errors_raise_cost():
+    """Test that a busy or failing provider becomes more expensive than an idle healthy one."""
+    balancer = LoadBalancer(clock=FakeClock())
+    record(balancer, "groq/test-model", 0.5)
+    record(balancer, "openai/test-model", 0.5)
+
+    balancer.start("groq/test-model")
+    assert balancer.cost("groq/test-model") > balancer.cost("openai/test-model")
+
+    record(balancer, "openai/test-model", 0.5, TranslationError("down", ErrorType.SERVICE_UNAVAILABLE))
+    assert balancer.stats()["providers"]["openai/test-model"]["error_rate"] == pytest.approx(0.2)
+
+
+def test_request_errors_do_not_count_against_provider():
+    """Test that errors caused by the request itself do not lower the provider's health."""
+    balancer = LoadBalancer(clock=FakeClock())
+    record(balancer, "groq/test-model", 0.5, TranslationError("bad input", ErrorType.BAD_REQUEST))
+
+    stats = balancer.stats()["providers"]["groq/test-model"]
+    assert stats["errors"] == 0
+    assert stats["error_rate"] == 0.0
+    assert stats["in_flight"] == 0
+
+
+def test_local_rejections_are_no_outcome():
+    """Test that calls shed locally leave the provider's latency and error rate unchanged."""
+    balancer = LoadBalancer(clock=FakeClock())
+    record(balancer, "groq/test-model", 0.5, TranslationError("queue full", ErrorType.OVERLOADED, 503))
+
+    stats = balancer.stats()["providers"]["groq/test-model"]
+    assert stats["errors"] == 0
+    assert stats["ewma_latency_ms"] is None
+    assert stats["in_flight"] == 0
+
+
+def test_least_outstanding_strategy():
+    """Test that least_outstanding picks the provider with the fewest requests in flight."""
+    balancer = LoadBalancer(strategy="least_outstanding", clock=FakeClock())
+    groq, openai = ProviderTranslator("groq"), ProviderTranslator("openai")
+    balancer.start("groq/test-model")
+
+    assert balancer.choose([groq, openai]) is openai
+
+
+def test_unknown_strategy_is_rejected():
+    """Test that an unknown strategy is rejected."""
+    with pytest.raises(ValueError):
+        LoadBalancer(strategy="round_robin")
+
+
+@pytest.mark.asyncio
+async def test_balanced_translator_records_outcomes():
+    """Test that the wrapper routes calls, counts them and propagates provider errors."""
+    balancer = LoadBalancer(strategy="least_outstanding", clock=FakeClock())
+    failing = ProviderTranslator("groq", TranslationError("down", ErrorType.CONNECTION))
+    healthy = ProviderTranslator("openai")
+    translator = BalancedTranslator([failing, healthy], balancer)
+    assert translator.provider == "groq"
+
+    with pytest.raises(TranslationError):
+        await translator.translate("Hi", "English", "Spanish")
+    assert await translator.translate("Hi", "English", "Spanish") == "openai: Hi"
+
+    providers = balancer.stats()["providers"]
+    assert providers["groq/test-model"]["errors"] == 1
+    assert providers["openai/test-model"]["requests"] == 1
+    assert providers["openai/test-model"]["in_flight"] == 0
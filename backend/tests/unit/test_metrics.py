@@ -0,0 +1,77 @@
+"""
+Unit tests for the metrics utility module.
+"""
+import pytest
+
+from llm_translate.utils.metrics import (
+    OVERFLOW_LABEL, Counter, Gauge, Histogram, record_timing, render_family, request_timings, timed_request
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test that observations land in cumulative buckets with sum and count."""
+    histogram = Histogram("test_seconds", "Test latency.", ("provider",), buckets=(0.1, 1.0))
+    child = histogram.labels("groq")
+    child.observe(0.05)
+    child.observe(0.5)
+    child.observe(5.0)
+
+    text = histogram.render()
+    assert "# TYPE test_seconds histogram" in text
+    assert 'test_seconds_bucket{provider="groq",le="0.1"} 1' in text
+    assert 'test_seconds_bucket{provider="groq",le="1"} 2' in text
+    assert 'test_seconds_bucket{provider="groq",le="+Inf"} 3' in text
+    assert 'test_seconds_sum{provider="groq"} 5.55' in text
+    assert 'test_seconds_count{provider="groq"} 3' in text
+
+
+def test_label_children_are_reused():
+    """Test that a label combination always maps to the same child."""
+    counter = Counter("test_total", "Test counter.", ("type",))
+    assert counter.labels("a") is counter.labels("a")
+
+    counter.labels("a").inc()
+    counter.labels("a").inc(2)
+    assert 'test_total{type="a"} 3' in counter.render()
+
+
+def test_series_beyond_limit_overflow():
+    """Test that label combinations beyond the series limit share the overflow child."""
+    gauge = Gauge("test_in_flight", "Test gauge.", ("lang",), max_series=2)
+    gauge.labels("english").set(1)
+    gauge.labels("spanish").set(1)
+    gauge.labels("klingon").inc()
+    gauge.labels("elvish").inc()
+
+    assert gauge.labels("dothraki") is gauge.labels(OVERFLOW_LABEL)
+    assert f'test_in_flight{{lang="{OVERFLOW_LABEL}"}} 2' in gauge.render()
+
+
+def test_label_values_are_escaped():
+    """Test that quotes and newlines in label values cannot break the exposition format."""
+    text = render_family("test_state", "Test state.", "gauge", [({"name": 'say "hi"\n'}, 1)])
+    assert 'test_state{name="say \\"hi\\"\\n"} 1' in text
+
+
+def test_request_timings_break_down_the_elapsed_time():
+    """Test that recorded phases add up and the rest of the elapsed time counts as post-processing."""
+    record_timing("provider", 1.0)  # Outside a timed request: ignored
+    with timed_request() as timings:
+        timings.started -= 2.0
+        record_timing("queue", 0.25)
+        record_timing("provider", 0.5)
+        record_timing("provider", 0.5)
+        assert request_timings() is timings
+    assert request_timings() is None
+
+    breakdown = timings.breakdown()
+    assert breakdown["queue"] == 250.0
+    assert breakdown["provider"] == 1000.0
+    assert breakdown["cache"] == breakdown["detect"] == breakdown["transcode"] == 0.0
+    assert 750.0 <= breakdown["post"] < 760.0
+    assert breakdown["total"] == pytest.approx(breakdown["queue"] + breakdown["provider"] + breakdown["post"], abs=0.2)
+
+    header = timings.header()
+    assert header.startswith('queue;dur=250.0;desc="Queue wait", cache;dur=0.0;desc="Cache lookup"')
+    assert 'provider;dur=1000.0;desc="Provider call"' in header
+    assert header.split(", ")[-1].startswith("total;dur=")
@@ -0,0 +1,157 @@
+"""
+Unit tests for the micro-batching module.
+"""
+import asyncio
+
+import pytest
+from llm_translate.core.micro_batching import MicroBatcher, MicroBatchingTranslator
+from llm_translate.core.model_tiering import TieredTranslator, TieringPolicy, tiering_scope
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class FakeClock:
+    """Manually advanced clock for arrival-rate tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingTranslator(BaseTranslator):
+    """Translator that records single and batch calls."""
+
+    provider = "fake"
+    supports_batch = True
+
+    def __init__(self, error=None):
+        super().__init__(api_key="test-key", model="test-model")
+        self.single_calls = []
+        self.batch_calls = []
+        self.error = error
+
+    async def translate(self, text, from_lang, to_lang):
+        self.single_calls.append(text)
+        return f"[{to_lang}] {text}"
+
+    async def translate_batch(self, texts, from_lang, to_lang):
+        self.batch_calls.append(list(texts))
+        if self.error is not None:
+            raise self.error
+        return [f"[{to_lang}] {text}" for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_quiet_lane_sends_requests_directly():
+    """Test that requests spaced further apart than the window are not delayed."""
+    clock = FakeClock()
+    inner = RecordingTranslator()
+    translator = MicroBatchingTranslator(inner, MicroBatcher(max_wait_ms=10, clock=clock))
+
+    for text in ("one", "two", "three"):
+        assert await translator.translate(text, "English", "Spanish") == f"[Spanish] {text}"
+        clock.now += 1.0
+
+    assert inner.single_calls == ["one", "two", "three"]
+    assert inner.batch_calls == []
+    assert translator.batcher.stats()["direct"] == 3
+
+
+@pytest.mark.asyncio
+async def test_busy_lane_merges_concurrent_requests():
+    """Test that requests arriving faster than the window are sent as one batch and fanned back out."""
+    clock = FakeClock()
+    inner = RecordingTranslator()
+    batcher = MicroBatcher(max_wait_ms=10, max_items=16, clock=clock)
+    translator = MicroBatchingTranslator(inner, batcher)
+
+    # Establish a 1 ms inter-arrival time on the lane
+    for _ in range(5):
+        await translator.translate("warm-up", "English", "Spanish")
+        clock.now += 0.001
+
+    texts = [f"text {index}" for index in range(4)]
+    tasks = []
+    for text in texts:
+        tasks.append(asyncio.ensure_future(translator.translate(text, "English", "Spanish")))
+        clock.now += 0.001
+        await asyncio.sleep(0)
+    results = await asyncio.gather(*tasks)
+
+    assert results == [f"[Spanish] {text}" for text in texts]
+    assert inner.batch_calls == [texts]
+
+
+@pytest.mark.asyncio
+async def test_batch_flushes_early_at_target_size():
+    """Test that a full batch is sent without waiting for the window to close."""
+    clock = FakeClock()
+    inner = RecordingTranslator()
+    batcher = MicroBatcher(max_wait_ms=10000, max_items=3, clock=clock)
+    translator = MicroBatchingTranslator(inner, batcher)
+    for _ in range(3):
+        await translator.translate("warm-up", "English", "Spanish")
+        clock.now += 0.001
+
+    tasks = [asyncio.ensure_future(translator.translate(f"t{index}", "English", "Spanish")) for index in range(3)]
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+    assert results == ["[Spanish] t0", "[Spanish] t1", "[Spanish] t2"]
+    assert inner.batch_calls == [["t0", "t1", "t2"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_error_reaches_every_request():
+    """Test that a failed batch raises its error for every merged request."""
+    clock = FakeClock()
+    error = TranslationError(message="Rate limited", error_type=ErrorType.RATE_LIMIT, status_code=429)
+    inner = RecordingTranslator(error=error)
+    translator = MicroBatchingTranslator(inner, MicroBatcher(max_wait_ms=10000, max_items=2, clock=clock))
+    for _ in range(3):
+        await translator.translate("warm-up", "English", "Spanish")
+        clock.now += 0.001
+
+    tasks = [asyncio.ensure_future(translator.translate(text, "English", "Spanish")) for text in ("a", "b")]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert results == [error, error]
+
+
+@pytest.mark.asyncio
+async def test_auto_detect_is_not_batched():
+    """Test that auto-detect requests bypass the batcher."""
+    inner = RecordingTranslator()
+    translator = MicroBatchingTranslator(inner, MicroBatcher())
+
+    assert await translator.translate("Hola", "Auto-detect", "English") == "[English] Hola"
+    assert inner.single_calls == ["Hola"]
+    assert translator.batcher.stats()["direct"] == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_of_different_tiers_are_batched_separately():
+    """Test that concurrent requests with different whole-text sizes keep their own model tier when batched."""
+    clock = FakeClock()
+    strong, fast = RecordingTranslator(), RecordingTranslator()
+    policy = TieringPolicy(fast_max_tokens=20)
+    batcher = MicroBatcher(max_wait_ms=10000, max_items=2, clock=clock)
+    translator = MicroBatchingTranslator(TieredTranslator(strong, fast, policy), batcher, policy)
+
+    async def request(text, whole_text_tokens):
+        with tiering_scope(whole_text_tokens):
+            return await translator.translate(text, "English", "Spanish")
+
+    for _ in range(3):
+        await request("warm-up", 1000)
+        await request("warm-up", 1)
+        clock.now += 0.001
+
+    # Short pieces of long texts and short texts alternate on the same provider and language pair
+    tasks = [asyncio.ensure_future(request(text, tokens)) for text, tokens in (("a", 1000), ("b", 1), ("c", 1000), ("d", 1))]
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+    assert results == ["[Spanish] a", "[Spanish] b", "[Spanish] c", "[Spanish] d"]
+    assert strong.batch_calls == [["a", "c"]]
+    assert fast.batch_calls == [["b", "d"]]
@@ -0,0 +1,101 @@
+"""
+Unit tests for the model tiering module.
+"""
+import pytest
+from llm_translate.core.model_tiering import (
+    FAST, STRONG, TieredTranslator, TieringPolicy, TieringScopeTranslator, parse_pair_limits
+)
+from llm_translate.core.translation_cache import TranslationCache
+from llm_translate.core.translation_memory import SegmentedTranslator
+from llm_translate.core.service_selector import get_tiered_model
+from llm_translate.services.base_translator import BaseTranslator
+
+
+class ModelTranslator(BaseTranslator):
+    """Translator that records the texts it translated and tags results with its model."""
+
+    provider = "groq"
+
+    def __init__(self, model):
+        super().__init__(api_key="test-key", model=model)
+        self.texts = []
+
+    async def translate(self, text, from_lang, to_lang):
+        self.texts.append(text)
+        return f"{self.model}: {text}"
+
+
+LONG_TEXT = "This sentence is long enough for the strong model. " * 30
+
+
+def test_parse_pair_limits():
+    """Test the per-language-pair limit format."""
+    assert parse_pair_limits("English>Spanish=400, *>Japanese=0") == {("english", "spanish"): 400, ("*", "japanese"): 0}
+    assert parse_pair_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_pair_limits("English=400")
+
+
+def test_policy_prefers_most_specific_pair():
+    """Test that the exact pair beats wildcards, which beat the default limit."""
+    policy = TieringPolicy(fast_max_tokens=200, pair_limits=parse_pair_limits(
+        "English>Japanese=50,English>*=100,*>Japanese=0"
+    ))
+
+    assert policy.limit("English", "Japanese") == 50
+    assert policy.limit("English", "French") == 100
+    assert policy.limit("German", "Japanese") == 0
+    assert policy.limit("German", "French") == 200
+    assert policy.tier("Save", "German", "French") == FAST
+    assert policy.tier("Save", "German", "Japanese") == STRONG
+    assert policy.tier(LONG_TEXT, "German", "French") == STRONG
+
+
+@pytest.mark.asyncio
+async def test_texts_are_routed_by_tier():
+    """Test that short texts go to the fast model, long texts and document passages to the strong model."""
+    strong, fast = ModelTranslator("strong-model"), ModelTranslator("fast-model")
+    translator = TieredTranslator(strong, fast, TieringPolicy(fast_max_tokens=20))
+
+    assert await translator.translate("Save", "English", "Spanish") == "fast-model: Save"
+    assert await translator.translate(LONG_TEXT, "English", "Spanish") == f"strong-model: {LONG_TEXT}"
+    assert await translator.translate_with_context("Save", "English", "Spanish", "Previous passage.") == "strong-model: Save"
+    assert translator.model == "strong-model"
+
+
+@pytest.mark.asyncio
+async def test_batch_is_split_by_tier():
+    """Test that a batch sends each tier's texts to its model and keeps the input order."""
+    strong, fast = ModelTranslator("strong-model"), ModelTranslator("fast-model")
+    translator = TieredTranslator(strong, fast, TieringPolicy(fast_max_tokens=20))
+
+    translations = await translator.translate_batch(["Save", LONG_TEXT, "Cancel"], "English", "Spanish")
+
+    assert translations == ["fast-model: Save", f"strong-model: {LONG_TEXT}", "fast-model: Cancel"]
+    assert fast.texts == ["Save", "Cancel"]
+    assert strong.texts == [LONG_TEXT]
+
+
+@pytest.mark.asyncio
+async def test_segments_are_tiered_by_the_whole_text():
+    """Test that sentences of a segmented long text go to the strong model."""
+    strong, fast = ModelTranslator("strong-model"), ModelTranslator("fast-model")
+    tiered = TieredTranslator(strong, fast, TieringPolicy(fast_max_tokens=20))
+    translator = TieringScopeTranslator(SegmentedTranslator(tiered, TranslationCache()))
+
+    await translator.translate(LONG_TEXT, "English", "Spanish")
+
+    assert fast.texts == []
+    assert strong.texts == ["This sentence is long enough for the strong model."]
+
+
+def test_tiered_model_follows_configuration():
+    """Test that the fast model is only reported when tiering is enabled and it differs from the main model."""
+    config = {"AI_SOURCE": "groq", "MODEL_TIERING_ENABLED": True, "GROQ_MODEL": "big-model",
+              "GROQ_FAST_MODEL": "small-model", "MODEL_TIERING_PAIR_LIMITS": "*>Japanese=0"}
+
+    assert get_tiered_model(config, "Save", "English", "Spanish") == "small-model"
+    assert get_tiered_model(config, "Save", "English", "Japanese") is None
+    assert get_tiered_model(config, LONG_TEXT, "English", "Spanish") is None
+    assert get_tiered_model({**config, "MODEL_TIERING_ENABLED": False}, "Save", "English", "Spanish") is None
+    assert get_tiered_model({**config, "GROQ_FAST_MODEL": "big-model"}, "Save", "English", "Spanish") is None
@@ -3,7 +3,7 @@ Unit tests for the OpenAI translator.
 """
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from openai import AuthenticationError, RateLimitError, BadRequestError, APIConnectionError
+from openai import AuthenticationError, RateLimitError, BadRequestError, APIConnectionError, APIStatusError
 from llm_translate.services.openai_translator import OpenAITranslator
 from llm_translate.utils.exceptions import TranslationError, ErrorType
 
@@ -107,6 +107,24 @@ async def test_translate_rate_limit_error(translator, mock_openai_client):
     assert "rate limit exceeded" in error.message.lower()
 
 
+@pytest.mark.asyncio
+async def test_detect_language_keeps_error_type(translator, mock_openai_client):
+    """Test that provider errors during language detection are mapped like translation errors."""
+    mock_response = MagicMock()
+    mock_response.status_code = 429
+    mock_openai_client.chat.completions.create.side_effect = RateLimitError(
+        message="Rate limit exceeded",
+        response=mock_response,
+        body={"error": {"message": "Rate limit exceeded"}}
+    )
+
+    with pytest.raises(TranslationError) as excinfo:
+        await translator.translate("Hello", "Auto-detect", "French")
+
+    assert excinfo.value.error_type == ErrorType.RATE_LIMIT
+    assert excinfo.value.status_code == 429
+
+
 @pytest.mark.asyncio
 async def test_translate_bad_request_error(translator, mock_openai_client):
     """Test handling of bad request errors."""
@@ -154,4 +172,83 @@ async def test_translate_connection_error(translator, mock_openai_client):
     error = excinfo.value
     assert error.error_type == ErrorType.CONNECTION
     assert error.status_code == 503
-    assert "Failed to connect" in error.message
\ No newline at end of file
+    assert "Failed to connect" in error.message
+
+
+@pytest.mark.asyncio
+async def test_translate_api_status_error_keeps_status(translator, mock_openai_client):
+    """Test that API errors keep the provider's HTTP status."""
+    mock_response = MagicMock()
+    mock_response.status_code = 502
+
+    mock_openai_client.chat.completions.create.side_effect = APIStatusError(
+        message="Bad gateway",
+        response=mock_response,
+        body=None
+    )
+
+    with pytest.raises(TranslationError) as excinfo:
+        await translator.translate("Hello", "English", "French")
+
+    error = excinfo.value
+    assert error.error_type == ErrorType.API_ERROR
+    assert error.status_code == 502
+
+@pytest.mark.asyncio
+async def test_translate_batch_single_request(translator, mock_openai_client):
+    """Test that translate_batch packs all texts into one request."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = '```json\n{"0": "Bonjour", "1": "Au revoir"}\n```'
+    mock_openai_client.chat.completions.create.return_value = mock_response
+
+    result = await translator.translate_batch(["Hello", "Goodbye"], "English", "French")
+
+    assert result == ["Bonjour", "Au revoir"]
+    mock_openai_client.chat.completions.create.assert_called_once()
+    prompt = mock_openai_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+    assert '{"0": "Hello", "1": "Goodbye"}' in prompt
+
+
+@pytest.mark.asyncio
+async def test_translate_batch_malformed_response_falls_back(translator, mock_openai_client):
+    """Test that items missing from a batch response are retried on their own."""
+    def make_response(content):
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = content
+        return response
+
+    mock_openai_client.chat.completions.create.side_effect = [
+        make_response('{"0": "Bonjour"}'),
+        make_response("Au revoir"),
+    ]
+
+    result = await translator.translate_batch(["Hello", "Goodbye"], "English", "French")
+
+    assert result == ["Bonjour", "Au revoir"]
+    assert mock_openai_client.chat.completions.create.call_count == 2
+    retry_prompt = mock_openai_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+    assert "Goodbye" in retry_prompt
+
+
+@pytest.mark.asyncio
+async def test_translate_stream(translator, mock_openai_client):
+    """Test that streamed chunks are forwarded as they arrive."""
+    def chunk(content):
+        mock_chunk = MagicMock()
+        mock_chunk.usage = None
+        mock_chunk.choices = [MagicMock()]
+        mock_chunk.choices[0].delta.content = content
+        return mock_chunk
+
+    async def stream():
+        for content in ("Bon", "jour", None):
+            yield chunk(content)
+
+    mock_openai_client.chat.completions.create.return_value = stream()
+
+    pieces = [piece async for piece in translator.translate_stream("Hello", "English", "French")]
+
+    assert pieces == ["Bon", "jour"]
+    assert mock_openai_client.chat.completions.create.call_args[1]["stream"] is True
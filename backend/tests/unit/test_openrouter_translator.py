@@ -22,10 +22,9 @@ def mock_httpx_client():
 def mock_httpx_response():
     """Create a mock httpx response for testing."""
     mock_response = MagicMock()
-    # Make raise_for_status an AsyncMock (coroutine)
-    mock_response.raise_for_status = AsyncMock()
-    # Make json an AsyncMock (coroutine)
-    mock_response.json = AsyncMock(return_value={
+    # httpx.Response.raise_for_status() and json() are synchronous
+    mock_response.raise_for_status = MagicMock()
+    mock_response.json = MagicMock(return_value={
         "choices": [
             {
                 "message": {
@@ -40,8 +39,8 @@ def mock_httpx_response():
 @pytest.fixture
 def translator():
     """Create an OpenRouterTranslator instance for testing."""
-    with patch("llm_translate.services.openrouter_translator.load_config") as mock_load_config:
-        mock_load_config.return_value = {
+    with patch("llm_translate.services.openrouter_translator.get_config") as mock_get_config:
+        mock_get_config.return_value = {
             "SITE_URL": "https://example.com",
             "SITE_NAME": "LLM Translate"
         }
@@ -86,7 +85,7 @@ async def test_translate_success(translator, mock_httpx_client, mock_httpx_respo
 
 
 @pytest.mark.asyncio
-async def test_translate_http_error(translator, mock_httpx_client):
+async def test_translate_http_error(translator, mock_httpx_client, mock_httpx_response):
     """Test handling of HTTP errors."""
     # Set up the mock to raise an HTTPStatusError
     http_error = httpx.HTTPStatusError(
@@ -94,7 +93,8 @@ async def test_translate_http_error(translator, mock_httpx_client):
         request=MagicMock(),
         response=MagicMock(status_code=401)
     )
-    mock_httpx_client.post.return_value.raise_for_status.side_effect = http_error
+    mock_httpx_response.raise_for_status.side_effect = http_error
+    mock_httpx_client.post.return_value = mock_httpx_response
     
     # Patch httpx.AsyncClient to return our mock
     with patch("httpx.AsyncClient", return_value=mock_httpx_client):
@@ -0,0 +1,178 @@
+"""
+Unit tests for the client-side rate limiting module.
+"""
+import httpx
+import pytest
+from llm_translate.core.rate_limiter import (
+    ProviderRateLimiter, RateLimitedTranslator, TokenBucket, get_rate_limiters,
+    observe_rate_limit_headers, parse_duration, parse_retry_after
+)
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.core.retry import is_retryable
+from llm_translate.utils.exceptions import TranslationError, ErrorType, is_provider_error
+
+
+class FakeClock:
+    """Monotonic clock advanced by the fake sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def limiter(clock, **kwargs):
+    """Rate limiter on a fake clock."""
+    return ProviderRateLimiter("groq", clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_parse_durations():
+    """Test the reset duration and Retry-After formats providers use."""
+    assert parse_duration("6m0s") == 360.0
+    assert parse_duration("7.66s") == pytest.approx(7.66)
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("3") == 3.0
+    assert parse_duration("soon") is None
+    assert parse_retry_after(httpx.Headers({"Retry-After": "2"})) == 2.0
+    assert parse_retry_after(httpx.Headers({"retry-after-ms": "250", "Retry-After": "1"})) == 0.25
+    assert parse_retry_after(httpx.Headers({})) is None
+
+
+def test_token_bucket_refills_per_minute():
+    """Test that a drained bucket refills at its per-minute rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock)
+    bucket.take(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+
+    clock.now = 30
+    assert bucket.wait_time(30) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_for_quota():
+    """Test that requests beyond the quota are spaced out instead of rejected."""
+    clock = FakeClock()
+    rate_limiter = limiter(clock, requests_per_minute=2, max_wait_seconds=60)
+
+    for _ in range(4):
+        await rate_limiter.acquire()
+    assert clock.sleeps == [pytest.approx(30.0), pytest.approx(30.0)]
+    assert rate_limiter.stats()["admitted"] == 4
+    assert rate_limiter.stats()["delayed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_request_exceeding_deadline_is_rejected():
+    """Test that a request that would wait longer than allowed is shed locally, not reported as a provider 429."""
+    clock = FakeClock()
+    rate_limiter = limiter(clock, tokens_per_minute=600, max_wait_seconds=5)
+
+    await rate_limiter.acquire(tokens=600)
+    with pytest.raises(TranslationError) as error:
+        await rate_limiter.acquire(tokens=100)
+    assert error.value.error_type == ErrorType.OVERLOADED
+    assert error.value.status_code == 503
+    assert error.value.retry_after == 10
+    assert not is_retryable(error.value)
+    assert not is_provider_error(error.value)
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected():
+    """Test that requests beyond the wait queue bound are rejected."""
+    clock = FakeClock()
+    rate_limiter = limiter(clock, requests_per_minute=1, max_queue=0)
+
+    await rate_limiter.acquire()
+    with pytest.raises(TranslationError):
+        await rate_limiter.acquire()
+    assert rate_limiter.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_provider():
+    """Test that a 429 with Retry-After makes the next request wait."""
+    clock = FakeClock()
+    rate_limiter = limiter(clock)
+
+    rate_limiter.observe(429, httpx.Headers({"Retry-After": "3"}))
+    await rate_limiter.acquire()
+    assert clock.sleeps == [3.0]
+    assert rate_limiter.stats()["throttled"] == 1
+
+
+def test_quota_is_learned_from_headers():
+    """Test that unknown quotas are taken from x-ratelimit headers and exhausted budgets pause the provider."""
+    clock = FakeClock()
+    rate_limiter = limiter(clock, requests_per_minute=1000)
+
+    rate_limiter.observe(200, httpx.Headers({
+        "x-ratelimit-limit-requests": "500",
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "2s",
+        "x-ratelimit-limit-tokens": "6000",
+        "x-ratelimit-remaining-tokens": "5900",
+    }))
+
+    stats = rate_limiter.stats()
+    assert stats["requests_per_minute"] == 500
+    assert stats["tokens_per_minute"] == 6000
+    assert stats["tokens_available"] == 5900
+    assert stats["paused_seconds"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_response_hook_updates_provider_limiter():
+    """Test that responses from a provider host reach that provider's limiter."""
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    await observe_rate_limit_headers(httpx.Response(429, headers={"Retry-After": "1"}, request=request))
+
+    assert get_rate_limiters().stats()["groq"]["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_translator_reserves_tokens():
+    """Test that the wrapper reserves the estimated tokens before calling the provider."""
+    class EchoTranslator(BaseTranslator):
+        provider = "groq"
+
+        async def translate(self, text, from_lang, to_lang):
+            return text
+
+    clock = FakeClock()
+    rate_limiter = limiter(clock, tokens_per_minute=10000)
+    translator = RateLimitedTranslator(EchoTranslator(api_key="test-key", model="test-model"), rate_limiter)
+
+    assert await translator.translate("Hello world", "English", "Spanish") == "Hello world"
+    assert rate_limiter.stats()["tokens_available"] < 10000
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_translator_acquires_per_packed_request():
+    """Test that a batch waits for the budgets once per packed request, not once for the whole batch."""
+    class PackingTranslator(BaseTranslator):
+        provider = "groq"
+        supports_batch = True
+
+        async def translate(self, text, from_lang, to_lang):
+            return text
+
+        async def _complete(self, system_prompt, user_prompt, temperature=0.3, json_mode=False):
+            return user_prompt[user_prompt.index("{"):]
+
+    clock = FakeClock()
+    rate_limiter = limiter(clock, requests_per_minute=60)
+    provider = PackingTranslator(api_key="test-key", model="test-model")
+    provider.batch_max_items = 2
+    translator = RateLimitedTranslator(provider, rate_limiter)
+
+    assert await translator.translate_batch(["a", "b", "c", "d", "e"], "English", "Spanish") == ["a", "b", "c", "d", "e"]
+    assert rate_limiter.stats()["admitted"] == 3
@@ -0,0 +1,138 @@
+"""
+Unit tests for the retry module.
+"""
+import random
+
+import pytest
+from llm_translate.core.retry import RetryBudget, RetryPolicy, RetryingTranslator, is_retryable
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class FakeClock:
+    """Monotonic clock advanced by the fake sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FlakyTranslator(BaseTranslator):
+    """Translator that fails a number of times before answering."""
+
+    provider = "groq"
+
+    def __init__(self, failures, error=None):
+        super().__init__(api_key="test-key", model="test-model")
+        self.failures = failures
+        self.error = error or TranslationError("connection reset", ErrorType.CONNECTION, 503)
+        self.calls = 0
+
+    async def translate(self, text, from_lang, to_lang):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return f"translated: {text}"
+
+
+def policy(clock, **kwargs):
+    """Retry policy on a fake clock."""
+    options = dict(base_delay=0.1, max_delay=1.0, rng=random.Random(0), clock=clock, sleep=clock.sleep,
+                   budget=RetryBudget(min_retries=100, clock=clock))
+    options.update(kwargs)
+    return RetryPolicy(**options)
+
+
+def test_retryable_classification():
+    """Test that only transient provider errors are retried."""
+    assert is_retryable(TranslationError("reset", ErrorType.CONNECTION, 503))
+    assert is_retryable(TranslationError("slow down", ErrorType.RATE_LIMIT, 429))
+    assert is_retryable(TranslationError("bad gateway", ErrorType.API_ERROR, 502))
+    assert not is_retryable(TranslationError("not found", ErrorType.API_ERROR, 404))
+    assert not is_retryable(TranslationError("bad key", ErrorType.AUTHENTICATION, 401))
+    assert not is_retryable(TranslationError("bad input", ErrorType.BAD_REQUEST, 400))
+    assert not is_retryable(ValueError("bug"))
+
+
+def test_decorrelated_jitter_stays_within_bounds():
+    """Test that backoff delays grow from the base delay and never exceed the maximum."""
+    retry_policy = policy(FakeClock())
+    delay = 0.0
+    for _ in range(20):
+        delay = retry_policy.backoff(delay)
+        assert 0.1 <= delay <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried():
+    """Test that a call succeeds after transient failures and the retries are counted."""
+    clock = FakeClock()
+    retry_policy = policy(clock)
+    translator = RetryingTranslator(FlakyTranslator(failures=2), retry_policy)
+
+    assert await translator.translate("Hi", "English", "Spanish") == "translated: Hi"
+    assert len(clock.sleeps) == 2
+    stats = retry_policy.stats()
+    assert stats["retries"] == 2
+    assert stats["recovered"] == 1
+    assert stats["retries_by_error"] == {"connection_error": 2}
+
+
+@pytest.mark.asyncio
+async def test_attempts_are_limited():
+    """Test that the last error is raised once all attempts have failed."""
+    clock = FakeClock()
+    retry_policy = policy(clock, max_attempts=2)
+    flaky = FlakyTranslator(failures=5)
+
+    with pytest.raises(TranslationError):
+        await RetryingTranslator(flaky, retry_policy).translate("Hi", "English", "Spanish")
+    assert flaky.calls == 2
+    assert retry_policy.stats()["exhausted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_permanent_failures_are_not_retried():
+    """Test that request errors are raised immediately."""
+    clock = FakeClock()
+    flaky = FlakyTranslator(failures=1, error=TranslationError("bad input", ErrorType.BAD_REQUEST, 400))
+
+    with pytest.raises(TranslationError):
+        await RetryingTranslator(flaky, policy(clock)).translate("Hi", "English", "Spanish")
+    assert flaky.calls == 1
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_deadline_stops_retries():
+    """Test that no retry starts after the call's deadline."""
+    clock = FakeClock()
+    retry_policy = policy(clock, base_delay=1.0, max_delay=1.0, deadline_seconds=0.5)
+    flaky = FlakyTranslator(failures=1)
+
+    with pytest.raises(TranslationError):
+        await RetryingTranslator(flaky, retry_policy).translate("Hi", "English", "Spanish")
+    assert flaky.calls == 1
+    assert retry_policy.stats()["deadline_exceeded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_retries():
+    """Test that retries beyond the budget are refused."""
+    clock = FakeClock()
+    retry_policy = policy(clock, budget=RetryBudget(percent=0, min_retries=1, clock=clock))
+
+    assert await RetryingTranslator(FlakyTranslator(failures=1), retry_policy).translate("a", "English", "Spanish")
+    with pytest.raises(TranslationError):
+        await RetryingTranslator(FlakyTranslator(failures=1), retry_policy).translate("b", "English", "Spanish")
+    assert retry_policy.stats()["budget_denied"] == 1
+
+    clock.now += 61
+    assert await RetryingTranslator(FlakyTranslator(failures=1), retry_policy).translate("c", "English", "Spanish")
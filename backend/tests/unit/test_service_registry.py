@@ -0,0 +1,89 @@
+"""
+Unit tests for the service registry module.
+"""
+import threading
+from unittest.mock import patch
+
+import pytest
+from llm_translate.core.service_registry import ServiceRegistry, get_service_registry
+from llm_translate.utils.http_client import close_http_client, get_http_client
+
+
+def test_services_are_built_once_per_key():
+    """Test that lookups for the same key return the instance built by the first one."""
+    registry = ServiceRegistry()
+    builds = []
+
+    def factory():
+        builds.append(1)
+        return object()
+
+    first = registry.get("translator", "openai", "model", "key", factory)
+    assert registry.get("translator", "openai", "model", "key", factory) is first
+    assert registry.get("translator", "openai", "model", "other-key", factory) is not first
+    assert len(builds) == 2
+
+
+def test_new_model_replaces_old_instance():
+    """Test that a new model for the same provider evicts the previous instance."""
+    registry = ServiceRegistry()
+    registry.get("translator", "openai", "a", "key", object)
+    registry.get("translator", "openai", "b", "key", object)
+    registry.get("speaker", "openai", "tts", "key", object)
+
+    assert registry.stats()["size"] == 2
+
+
+def test_failed_builds_are_not_stored():
+    """Test that a factory error propagates and the next lookup tries again."""
+    registry = ServiceRegistry()
+
+    def failing():
+        raise ValueError("Unsupported provider")
+
+    with pytest.raises(ValueError):
+        registry.get("translator", "nope", None, None, failing)
+    assert registry.get("translator", "nope", None, None, object) is not None
+
+
+def test_invalidate_rebuilds_services():
+    """Test that invalidate() makes the next lookup build a fresh instance."""
+    registry = ServiceRegistry()
+    first = registry.get("translator", "openai", "model", "key", object)
+    registry.invalidate()
+
+    assert registry.get("translator", "openai", "model", "key", object) is not first
+
+
+def test_concurrent_lookups_build_once():
+    """Test that threads racing on a new key share a single instance."""
+    registry = ServiceRegistry()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def lookup():
+        barrier.wait()
+        results.append(registry.get("translator", "openai", "model", "key", object))
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(result) for result in results}) == 1
+    assert registry.stats()["builds"] == 1
+
+
+@pytest.mark.asyncio
+async def test_closing_the_http_client_drops_services():
+    """Test that services bound to the shared HTTP client are rebuilt after it is closed."""
+    registry = get_service_registry()
+    with patch("llm_translate.utils.http_client.get_config", return_value={}):
+        service = registry.get("translator", "openai", "model", "key", lambda: get_http_client())
+        await close_http_client()
+
+        rebuilt = registry.get("translator", "openai", "model", "key", lambda: get_http_client())
+        assert rebuilt is not service
+        assert not rebuilt.is_closed
+        await close_http_client()
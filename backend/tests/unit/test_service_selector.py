@@ -3,8 +3,9 @@ Unit tests for the service selector module.
 """
 import pytest
 from unittest.mock import patch, MagicMock
-from llm_translate.core.service_selector import get_translation_service
-from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.core.service_selector import build_translation_pipeline, get_translation_service
+from llm_translate.utils.config import ConfigSnapshot
+from llm_translate.services.base_translator import BaseTranslator, BatchPackingTranslator
 from llm_translate.services.openai_translator import OpenAITranslator
 from llm_translate.services.groq_translator import GroqTranslator
 from llm_translate.services.openrouter_translator import OpenRouterTranslator
@@ -24,11 +25,11 @@ def mock_config():
     }
 
 
-@patch("llm_translate.core.service_selector.load_config")
-def test_get_translation_service_openai(mock_load_config, mock_config):
+@patch("llm_translate.core.service_selector.get_config")
+def test_get_translation_service_openai(mock_get_config, mock_config):
     """Test that get_translation_service returns OpenAITranslator when AI_SOURCE is 'openai'."""
     mock_config["AI_SOURCE"] = "openai"
-    mock_load_config.return_value = mock_config
+    mock_get_config.return_value = mock_config
     
     translator = get_translation_service()
     
@@ -37,11 +38,11 @@ def test_get_translation_service_openai(mock_load_config, mock_config):
     assert translator.model == "gpt-4.1-mini-2025-04-14"
 
 
-@patch("llm_translate.core.service_selector.load_config")
-def test_get_translation_service_groq(mock_load_config, mock_config):
+@patch("llm_translate.core.service_selector.get_config")
+def test_get_translation_service_groq(mock_get_config, mock_config):
     """Test that get_translation_service returns GroqTranslator when AI_SOURCE is 'groq'."""
     mock_config["AI_SOURCE"] = "groq"
-    mock_load_config.return_value = mock_config
+    mock_get_config.return_value = mock_config
     
     translator = get_translation_service()
     
@@ -50,11 +51,11 @@ def test_get_translation_service_groq(mock_load_config, mock_config):
     assert translator.model == "meta-llama/llama-4-maverick-17b-128e-instruct"
 
 
-@patch("llm_translate.core.service_selector.load_config")
-def test_get_translation_service_openrouter(mock_load_config, mock_config):
+@patch("llm_translate.core.service_selector.get_config")
+def test_get_translation_service_openrouter(mock_get_config, mock_config):
     """Test that get_translation_service returns OpenRouterTranslator when AI_SOURCE is 'openrouter'."""
     mock_config["AI_SOURCE"] = "openrouter"
-    mock_load_config.return_value = mock_config
+    mock_get_config.return_value = mock_config
     
     translator = get_translation_service()
     
@@ -63,11 +64,11 @@ def test_get_translation_service_openrouter(mock_load_config, mock_config):
     assert translator.model == "qwen/qwen3-4b:free"
 
 
-@patch("llm_translate.core.service_selector.load_config")
-def test_get_translation_service_unsupported(mock_load_config, mock_config):
+@patch("llm_translate.core.service_selector.get_config")
+def test_get_translation_service_unsupported(mock_get_config, mock_config):
     """Test that get_translation_service raises ValueError for unsupported AI_SOURCE."""
     mock_config["AI_SOURCE"] = "unsupported_provider"
-    mock_load_config.return_value = mock_config
+    mock_get_config.return_value = mock_config
     
     with pytest.raises(ValueError) as excinfo:
         get_translation_service()
@@ -75,11 +76,11 @@ def test_get_translation_service_unsupported(mock_load_config, mock_config):
     assert "Unsupported AI service provider" in str(excinfo.value)
 
 
-@patch("llm_translate.core.service_selector.load_config")
-def test_get_translation_service_import_error(mock_load_config, mock_config):
+@patch("llm_translate.core.service_selector.get_config")
+def test_get_translation_service_import_error(mock_get_config, mock_config):
     """Test that get_translation_service raises ImportError when the translator module is not available."""
     mock_config["AI_SOURCE"] = "openai"
-    mock_load_config.return_value = mock_config
+    mock_get_config.return_value = mock_config
     
     # Patch the import mechanism to raise ImportError for the specific module
     with patch("builtins.__import__") as mock_import:
@@ -94,4 +95,45 @@ def test_get_translation_service_import_error(mock_load_config, mock_config):
         with pytest.raises(ImportError) as excinfo:
             get_translation_service()
     
-    assert "OpenAI translator module not found" in str(excinfo.value)
\ No newline at end of file
+    assert "OpenAI translator module not found" in str(excinfo.value)
+
+@patch("llm_translate.core.service_selector.get_config")
+def test_get_translation_service_reuses_instances(mock_get_config, mock_config):
+    """Test that the same provider, model and key share one translator, and a new model gets a new one."""
+    mock_config["AI_SOURCE"] = "groq"
+    mock_get_config.return_value = mock_config
+
+    first = get_translation_service()
+    assert get_translation_service() is first
+
+    mock_config["GROQ_MODEL"] = "another-model"
+    second = get_translation_service()
+    assert second is not first
+    assert second.model == "another-model"
+
+
+def test_translation_pipeline_keeps_provider_batch_limits(mock_config):
+    """Test that a pipeline packs batches with the configured limits and leaves the shared provider's limits alone."""
+    mock_config.update({"BATCH_MAX_TOKENS": 123, "BATCH_MAX_ITEMS": 7})
+    provider = GroqTranslator(api_key="test-groq-key", model="test-model")
+    limits = (provider.batch_max_tokens, provider.batch_max_items)
+
+    pipeline = build_translation_pipeline(provider, mock_config)
+    assert (provider.batch_max_tokens, provider.batch_max_items) == limits
+
+    layer = pipeline
+    while layer.translator is not provider:
+        layer = layer.translator
+    assert isinstance(layer, BatchPackingTranslator)
+    assert (layer.batch_max_tokens, layer.batch_max_items) == (123, 7)
+
+
+def test_translation_pipeline_is_built_once_per_config_version(mock_config):
+    """Test that requests on one configuration version share a pipeline."""
+    mock_config["AI_SOURCE"] = "groq"
+    config = ConfigSnapshot(mock_config, version=3)
+    provider = get_translation_service(config)
+
+    pipeline = build_translation_pipeline(provider, config)
+    assert build_translation_pipeline(provider, config) is pipeline
+    assert build_translation_pipeline(provider, ConfigSnapshot(mock_config, version=4)) is not pipeline
@@ -0,0 +1,132 @@
+"""
+Unit tests for the request coalescing module.
+"""
+import asyncio
+
+import pytest
+from llm_translate.core.single_flight import CoalescingTranslator, SingleFlight
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class SlowTranslator(BaseTranslator):
+    """Translator that blocks until released and counts provider calls."""
+
+    provider = "fake"
+
+    def __init__(self, error=None):
+        super().__init__(api_key="test-key", model="test-model")
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.error = error
+
+    async def translate(self, text, from_lang, to_lang):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return f"[{to_lang}] {text}"
+
+    async def detect_and_translate(self, text, to_lang):
+        return "Spanish", await self.translate(text, "Spanish", to_lang)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    """Test that identical in-flight requests are coalesced into one provider call."""
+    inner = SlowTranslator()
+    group = SingleFlight()
+    translator = CoalescingTranslator(inner, group)
+
+    tasks = [asyncio.ensure_future(translator.translate(text, "English", "Spanish"))
+             for text in ("Hello", " Hello\n", "Hello", "Bye")]
+    await asyncio.sleep(0)
+    inner.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == ["[Spanish] Hello", "[Spanish] Hello", "[Spanish] Hello", "[Spanish] Bye"]
+    assert inner.calls == 2
+    assert group.stats() == {"leaders": 2, "coalesced": 2, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fused_detections_share_one_call():
+    """Test that identical in-flight detect-and-translate calls are coalesced into one provider call."""
+    inner = SlowTranslator()
+    translator = CoalescingTranslator(inner, SingleFlight())
+
+    tasks = [asyncio.ensure_future(translator.detect_and_translate("Hola", "English")) for _ in range(3)]
+    await asyncio.sleep(0)
+    inner.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == [("Spanish", "[English] Hola")] * 3
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter():
+    """Test that a failed call raises the same error for all coalesced callers."""
+    error = TranslationError(message="Rate limited", error_type=ErrorType.RATE_LIMIT, status_code=429)
+    inner = SlowTranslator(error=error)
+    translator = CoalescingTranslator(inner, SingleFlight())
+
+    tasks = [asyncio.ensure_future(translator.translate("Hello", "English", "Spanish")) for _ in range(3)]
+    await asyncio.sleep(0)
+    inner.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(result is error for result in results)
+    assert inner.calls == 1
+
+    # The failure is not remembered; the next request calls the provider again
+    inner.error = None
+    assert await translator.translate("Hello", "English", "Spanish") == "[Spanish] Hello"
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others():
+    """Test that cancelling one caller leaves the shared call running for the rest."""
+    inner = SlowTranslator()
+    translator = CoalescingTranslator(inner, SingleFlight())
+
+    first = asyncio.ensure_future(translator.translate("Hello", "English", "Spanish"))
+    second = asyncio.ensure_future(translator.translate("Hello", "English", "Spanish"))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    inner.release.set()
+
+    assert await second == "[Spanish] Hello"
+    assert first.cancelled()
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_call_cancelled_when_all_waiters_leave():
+    """Test that the shared call is cancelled once nobody waits for it, and a new caller starts afresh."""
+    group = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiter = asyncio.ensure_future(group.do("key", work))
+    await started.wait()
+    waiter.cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert group.stats()["in_flight"] == 0
+
+    async def quick():
+        return "fresh"
+
+    assert await group.do("key", quick) == "fresh"
+    assert group.stats()["leaders"] == 2
@@ -0,0 +1,85 @@
+"""
+Unit tests for the tracing utility module.
+"""
+import asyncio
+import json
+
+import pytest
+from llm_translate.utils.tracing import (
+    BatchSpanProcessor, JsonFileExporter, Tracer, current_span, format_traceparent, parse_traceparent, span, use_span
+)
+
+
+class CollectingProcessor:
+    """Processor that keeps submitted spans."""
+
+    def __init__(self):
+        self.spans = []
+
+    def submit(self, spans):
+        self.spans.extend(spans)
+
+
+def test_traceparent_round_trip():
+    """Test parsing and formatting of W3C traceparent headers."""
+    header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    assert parse_traceparent(header) == ("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7", True)
+    assert format_traceparent("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7") == header
+    assert parse_traceparent("00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-00")[2] is False
+    assert parse_traceparent("00-" + "0" * 32 + "-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_and_export_with_root():
+    """Test that phase spans become children of the current span and the trace is exported when the root ends."""
+    processor = CollectingProcessor()
+    tracer = Tracer(processor)
+    root = tracer.start_trace("POST /translate", "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01")
+
+    with use_span(root):
+        with span("detect", method="local") as detect:
+            assert current_span() is detect
+        await asyncio.gather(*(asyncio.sleep(0) for _ in range(2)))
+        with pytest.raises(ValueError):
+            with span("translate"):
+                raise ValueError("boom")
+        assert processor.spans == []
+
+    names = [s.name for s in processor.spans]
+    assert names == ["detect", "translate", "POST /translate"]
+    assert all(s.trace.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736" for s in processor.spans)
+    assert processor.spans[0].parent_id == root.span_id
+    assert root.parent_id == "00f067aa0ba902b7"
+    assert processor.spans[1].to_otlp()["status"]["code"] == 2
+    assert current_span() is None
+
+
+def test_sampling_follows_caller_and_ratio():
+    """Test that unsampled callers and the sample ratio suppress traces, and spans outside a trace are no-ops."""
+    tracer = Tracer(CollectingProcessor(), sample_ratio=0.0)
+    assert tracer.start_trace("GET /", "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-00") is None
+    assert tracer.start_trace("GET /") is None
+    assert tracer.start_trace("GET /", "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01") is not None
+    with span("detect") as detect:
+        assert detect is None
+
+
+def test_file_exporter_writes_otlp_json(tmp_path):
+    """Test that exported spans are appended to the file as OTLP/JSON."""
+    path = tmp_path / "traces.jsonl"
+    processor = BatchSpanProcessor(JsonFileExporter(str(path)), service_name="test-service", interval_seconds=0.01)
+    tracer = Tracer(processor)
+    with use_span(tracer.start_trace("POST /speak")):
+        with span("convert", from_format="wav", to_format="mp3"):
+            pass
+    processor.shutdown()
+
+    payload = json.loads(path.read_text().splitlines()[0])
+    resource_spans = payload["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["value"]["stringValue"] == "test-service"
+    spans = resource_spans["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in spans] == ["convert", "POST /speak"]
+    assert {"key": "from_format", "value": {"stringValue": "wav"}} in spans[0]["attributes"]
+    assert processor.exported == 2
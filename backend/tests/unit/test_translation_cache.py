@@ -0,0 +1,116 @@
+"""
+Unit tests for the translation cache module.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from llm_translate.core.translation_cache import (
+    CachedTranslator,
+    TranslationCache,
+    make_cache_key,
+)
+from llm_translate.services.base_translator import BaseTranslator
+from llm_translate.utils.exceptions import TranslationError, ErrorType
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingTranslator(BaseTranslator):
+    """Translator that counts provider calls."""
+
+    provider = "fake"
+
+    def __init__(self):
+        super().__init__(api_key="test-key", model="test-model")
+        self.calls = 0
+
+    async def translate(self, text, from_lang, to_lang):
+        self.calls += 1
+        return f"[{to_lang}] {text}"
+
+
+def test_make_cache_key_normalizes_langs_and_text():
+    """Test that language case and surrounding whitespace do not change the key."""
+    key_a = make_cache_key("openai", "gpt", "English", "Spanish", "Hello")
+    key_b = make_cache_key("openai", "gpt", " english", "SPANISH ", "  Hello\n")
+    assert key_a == key_b
+    assert key_a != make_cache_key("groq", "gpt", "English", "Spanish", "Hello")
+    assert key_a != make_cache_key("openai", "other", "English", "Spanish", "Hello")
+
+
+def test_cache_lru_eviction():
+    """Test that the least recently used entry is evicted when the cache is full."""
+    cache = TranslationCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "b" is now least recently used
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_cache_ttl_expiry():
+    """Test that entries expire after the TTL."""
+    clock = FakeClock()
+    cache = TranslationCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.set("a", "1")
+    clock.now = 4.9
+    assert cache.get("a") == "1"
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_cache_rejects_invalid_size():
+    """Test that a non-positive size is rejected."""
+    with pytest.raises(ValueError):
+        TranslationCache(max_entries=0)
+
+
+@pytest.mark.asyncio
+async def test_cached_translator_serves_repeats_from_cache():
+    """Test that a repeat request does not reach the wrapped translator."""
+    inner = CountingTranslator()
+    translator = CachedTranslator(inner, TranslationCache())
+
+    first = await translator.translate("Hello", "English", "Spanish")
+    second = await translator.translate("Hello ", "english", "Spanish")
+
+    assert first == second == "[Spanish] Hello"
+    assert inner.calls == 1
+    assert translator.model == "test-model"
+    assert translator.cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_translator_does_not_cache_errors():
+    """Test that failed translations are not cached."""
+    inner = MagicMock()
+    inner.api_key = "test-key"
+    inner.model = "test-model"
+    inner.provider = "fake"
+    inner.translate = AsyncMock(side_effect=[
+        TranslationError("boom", error_type=ErrorType.API_ERROR),
+        "Hola",
+    ])
+    translator = CachedTranslator(inner, TranslationCache())
+
+    with pytest.raises(TranslationError):
+        await translator.translate("Hello", "English", "Spanish")
+    assert await translator.translate("Hello", "English", "Spanish") == "Hola"
+    assert inner.translate.call_count == 2
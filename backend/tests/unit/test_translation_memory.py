@@ -0,0 +1,117 @@
+"""
+Unit tests for the sentence-level translation memory.
+"""
+import pytest
+from llm_translate.core.translation_cache import TranslationCache
+from llm_translate.core.translation_memory import (
+    SegmentedTranslator,
+    join_segments,
+    split_segments,
+)
+from llm_translate.services.base_translator import BaseTranslator
+
+
+class RecordingTranslator(BaseTranslator):
+    """Translator that records every batch sent to the provider."""
+
+    provider = "fake"
+    supports_batch = True
+
+    def __init__(self):
+        super().__init__(api_key="test-key", model="test-model")
+        self.batches = []
+        self.single_calls = 0
+
+    async def translate(self, text, from_lang, to_lang):
+        self.single_calls += 1
+        return text.upper()
+
+    async def translate_batch(self, texts, from_lang, to_lang):
+        self.batches.append(list(texts))
+        return [text.upper() for text in texts]
+
+
+class FakeDiskCache:
+    """Segment store that records every disk lookup."""
+
+    def __init__(self):
+        self.entries = {}
+        self.lookups = []
+
+    async def aget_many(self, keys):
+        self.lookups.append(list(keys))
+        return {key: self.entries[key] for key in keys if key in self.entries}
+
+    def set(self, key, value):
+        self.entries[key] = value
+
+
+def test_split_and_join_round_trip():
+    """Test that splitting and joining reproduces the original text exactly."""
+    text = "  Hello there. How are you?\n\nI am fine!  Thanks.\n"
+    segments, separators = split_segments(text)
+
+    assert segments == ["  Hello there.", "How are you?", "I am fine!", "Thanks."]
+    assert join_segments(segments, separators) == text
+
+
+def test_split_single_sentence():
+    """Test that a text without boundaries is a single segment."""
+    segments, separators = split_segments("Hello, world!")
+    assert segments == ["Hello, world!"]
+    assert separators == ["", ""]
+
+
+@pytest.mark.asyncio
+async def test_only_changed_segments_reach_provider():
+    """Test that a revised document only sends the changed sentence."""
+    inner = RecordingTranslator()
+    translator = SegmentedTranslator(inner, TranslationCache())
+
+    original = "One fish. Two fish. Red fish."
+    revised = "One fish. Two birds. Red fish."
+    assert await translator.translate(original, "English", "Spanish") == "ONE FISH. TWO FISH. RED FISH."
+    assert await translator.translate(revised, "English", "Spanish") == "ONE FISH. TWO BIRDS. RED FISH."
+
+    assert inner.batches == [["One fish.", "Two fish.", "Red fish."], ["Two birds."]]
+
+
+@pytest.mark.asyncio
+async def test_segments_are_looked_up_on_disk_in_one_call():
+    """Test that the segments missing from memory are read from disk with a single lookup per text."""
+    disk = FakeDiskCache()
+    inner = RecordingTranslator()
+    await SegmentedTranslator(inner, TranslationCache(), disk).translate("One fish. Two fish.", "English", "Spanish")
+    disk.lookups.clear()
+
+    # A fresh memory, as after a restart, finds the stored segments on disk
+    translator = SegmentedTranslator(inner, TranslationCache(), disk)
+    result = await translator.translate("One fish. Two fish. Red fish. One fish.", "English", "Spanish")
+
+    assert result == "ONE FISH. TWO FISH. RED FISH. ONE FISH."
+    assert len(disk.lookups) == 1 and len(disk.lookups[0]) == 3
+    assert inner.batches == [["One fish.", "Two fish."], ["Red fish."]]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_and_non_text_segments():
+    """Test that repeated segments are sent once and numeric segments are not sent."""
+    inner = RecordingTranslator()
+    translator = SegmentedTranslator(inner, TranslationCache())
+
+    result = await translator.translate("Yes. 42. Yes. No.", "English", "German")
+
+    assert result == "YES. 42. YES. NO."
+    assert inner.batches == [["Yes.", "No."]]
+
+
+@pytest.mark.asyncio
+async def test_short_text_and_same_language_bypass_memory():
+    """Test that single-segment and same-language requests go straight to the translator."""
+    inner = RecordingTranslator()
+    translator = SegmentedTranslator(inner, TranslationCache())
+
+    assert await translator.translate("Hello", "English", "French") == "HELLO"
+    assert await translator.translate("One. Two.", "English", "english") == "ONE. TWO."
+    assert inner.single_calls == 2
+    assert inner.batches == []